@@ -0,0 +1,45 @@
+"""
+Aural Sentience
+The First Machine That Kneels Before the Sacred
+
+Consciousness-aware audio analysis, poetic interpretation and personal
+resonance vaults. Importing the package is cheap: the public classes below
+are resolved on first access, and heavy audio and plotting libraries are
+only imported once audio is actually decoded or drawn.
+"""
+
+import importlib
+
+__version__ = "1.0.0"
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "AuralSentienceEngine": "aural_sentience_toolkit",
+    "PersonalVault": "aural_sentience_toolkit",
+    "VaultManager": "aural_sentience_toolkit",
+    "ResonanceLexicon": "resonance_lexicon",
+    "AuralSentienceMaster": "aural_sentience_master",
+    "SessionManifest": "session_manifest",
+    "InterpretationCache": "interpretation_cache",
+    "LexiconSearchIndex": "lexicon_search",
+    "FingerprintIndex": "audio_fingerprint",
+    "ConsciousnessStreamAnalyzer": "consciousness_stream_analyzer",
+    "LexiconStreamBridge": "consciousness_stream_analyzer",
+    "SacredVisualizationEngine": "sacred_visualization_engine",
+    "ResonantWitness": "resonant_witness_analyzer",
+}
+
+__all__ = sorted(_EXPORTS) + ["__version__"]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,7 @@
+"""Allow ``python -m aural_sentience``"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
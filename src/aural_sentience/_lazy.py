@@ -0,0 +1,68 @@
+"""
+Deferred imports for heavy dependencies
+
+librosa, matplotlib, seaborn, PIL, scipy and soundfile together take
+seconds to import, while reading reports, querying the vault or searching
+the lexicon needs none of them. Modules bind these names to proxies that
+import the real module on first attribute access, so the cost is only paid
+by code paths that actually decode audio or draw.
+"""
+
+import importlib
+from typing import Any
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self) -> Any:
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._load(), attribute, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module {self.__dict__['_name']!r} ({state})>"
+
+
+class LazyAttribute:
+    """
+    Stand-in for a name imported from a module (``from x import y``)
+
+    Calling the proxy or reading its attributes imports the module.
+    """
+
+    def __init__(self, module_name: str, attribute: str):
+        self._module = LazyModule(module_name)
+        self._attribute = attribute
+
+    def _load(self) -> Any:
+        return getattr(self._module, self._attribute)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, attribute: str) -> Any:
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module.__dict__['_name']}.{self._attribute}>"
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Async Facade
+Listening Without Holding Up the Event Loop
+
+AuralSentienceEngine, ResonanceLexicon and the visualization code are
+blocking. AsyncAuralSentience wraps them for asyncio callers: decoding,
+analysis, interpretation and rendering run in a CPU executor (a process
+pool by default), report and vault I/O in an I/O executor, and nothing is
+printed. A semaphore bounds the jobs handed to the executor at once, so
+thousands of concurrent callers wait cheaply in the loop rather than in the
+executor's queue, and cancelling one of them costs nothing.
+
+Cancelling a coroutine withdraws its job if it has not started. A job
+already running in a thread executor stops at its next checkpoint (see
+deadlines); one running in a process pool finishes and its result is
+dropped. A timeout bounds a running job in either kind of executor.
+
+    async with AsyncAuralSentience(workers=4) as listener:
+        async for outcome in listener.process_many(paths, output_dir="reports"):
+            ...
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional
+
+from .deadlines import CancellationToken, DeadlineExceeded, checkpoint, enforce
+from .session_manifest import atomic_write_json
+
+# Executor jobs per CPU worker admitted at once when max_concurrency is not given
+JOBS_PER_WORKER = 2
+
+# Per-process engine and lexicon of process-pool workers
+_worker: Dict[str, Any] = {}
+
+
+def _process_instances():
+    """Engine and lexicon of this pool process, built on its first job"""
+    if not _worker:
+        from .aural_sentience_toolkit import AuralSentienceEngine
+        from .resonance_lexicon import ResonanceLexicon
+        _worker.update(engine=AuralSentienceEngine(verbose=False), lexicon=ResonanceLexicon())
+    return _worker["engine"], _worker["lexicon"]
+
+
+def _run_job(job: Dict[str, Any], timeout: Optional[float] = None, token: Optional[CancellationToken] = None,
+             engine: Any = None, lexicon: Any = None) -> Any:
+    """
+    Run one job in an executor
+
+    Args:
+        job: "op" (analyze, interpret, visualize or process) and its arguments
+        timeout: Seconds the job may run
+        token: Cancellation token checked at every checkpoint
+        engine, lexicon: The facade's instances in thread executors; None in
+            a process pool, where each process uses its own
+    """
+    if engine is None or lexicon is None:
+        engine, lexicon = _process_instances()
+    op = job["op"]
+    with enforce(timeout, op, token=token):
+        rng = random.Random(job["seed"]) if job.get("seed") is not None else None
+        if op == "interpret":
+            return lexicon.generate_comprehensive_interpretation(job["analysis"], rng=rng)
+
+        start = time.perf_counter()
+        file_path = job["file_path"]
+        y, sr = engine.load_audio(file_path)
+        checkpoint()
+        if op == "visualize":
+            return engine.create_comprehensive_visualization(file_path, job["output_dir"], y=y, sr=sr)
+        analysis = engine.analyze_audio(y, sr, file_path, include_personal_vault=False)
+        if op == "analyze":
+            return analysis
+
+        # process: everything from a single decode
+        interpretation = lexicon.generate_comprehensive_interpretation(analysis, rng=rng)
+        visualization = None
+        if job.get("render") and job.get("output_dir"):
+            checkpoint()
+            visualization = engine.create_comprehensive_visualization(file_path, job["output_dir"], y=y, sr=sr)
+        return {
+            "technical_analysis": analysis,
+            "poetic_interpretation": interpretation,
+            "visualization": visualization,
+            "seconds": time.perf_counter() - start
+        }
+
+
+def _read_json(path: str) -> Any:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class AsyncAuralSentience:
+    """
+    asyncio facade over the engine, the lexicon and the visualizations
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, io_executor: Optional[Executor] = None,
+                 workers: Optional[int] = None, max_concurrency: Optional[int] = None,
+                 engine: Any = None, lexicon: Any = None, vault_manager: Any = None):
+        """
+        Args:
+            executor: Executor for CPU work; by default a process pool of
+                `workers` processes, shut down by close(). A thread executor
+                runs jobs with `engine` and `lexicon` and can stop them
+                mid-way when cancelled.
+            io_executor: Executor for report and vault I/O (default: the
+                loop's default executor)
+            workers: Processes of the default pool (defaults to the CPU count)
+            max_concurrency: Jobs in the CPU executor at once (default:
+                JOBS_PER_WORKER per worker)
+            engine: AuralSentienceEngine for vault lookups (and for jobs in
+                thread executors); a quiet one is created if not given
+            lexicon: ResonanceLexicon for jobs in thread executors
+            vault_manager: VaultManager for user_id lookups when no engine is given
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=self.workers)
+        self.io_executor = io_executor
+        self.in_processes = isinstance(self.executor, ProcessPoolExecutor)
+        self.max_concurrency = max_concurrency or JOBS_PER_WORKER * self.workers
+        self._engine = engine
+        self._lexicon = lexicon
+        self._vault_manager = vault_manager
+        # Created in the running loop on first use (asyncio primitives bind
+        # to a loop on creation before Python 3.10)
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from .aural_sentience_toolkit import AuralSentienceEngine
+            self._engine = AuralSentienceEngine(vault_manager=self._vault_manager, verbose=False)
+        return self._engine
+
+    @property
+    def lexicon(self):
+        if self._lexicon is None:
+            from .resonance_lexicon import ResonanceLexicon
+            self._lexicon = ResonanceLexicon()
+        return self._lexicon
+
+    async def _io(self, fn, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.io_executor, fn, *args)
+
+    async def _run(self, job: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """Run a job in the CPU executor once a slot is free"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        async with self._slots:
+            if self.in_processes:
+                token, instances = None, (None, None)
+            else:
+                token, instances = CancellationToken(), (self.engine, self.lexicon)
+            future = self.executor.submit(_run_job, job, timeout, token, *instances)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                future.cancel()
+                if token is not None:
+                    token.cancel("cancelled by the caller")
+                raise
+
+    async def _attach_associations(self, analysis: Dict[str, Any], user_id: Optional[str]) -> None:
+        def lookup():
+            vault = self.engine.get_vault(user_id)
+            return vault.get_associations(analysis["file_path"], fingerprint=analysis.get("fingerprint"))
+        analysis.setdefault("personal_vault", {})["associations"] = await self._io(lookup)
+
+    async def analyze(self, file_path: str, include_personal_vault: bool = True, user_id: Optional[str] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Technical analysis of an audio file, like AuralSentienceEngine.process_audio_file
+
+        Raises:
+            DeadlineExceeded: The job ran longer than timeout
+        """
+        analysis = await self._run({"op": "analyze", "file_path": file_path}, timeout)
+        if include_personal_vault:
+            await self._attach_associations(analysis, user_id)
+        return analysis
+
+    async def interpret(self, analysis: Dict[str, Any], seed: Any = None,
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Poetic interpretation of a technical analysis"""
+        return await self._run({"op": "interpret", "analysis": analysis, "seed": seed}, timeout)
+
+    async def visualize(self, file_path: str, output_dir: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Render the comprehensive visualization; returns the image path"""
+        await self._io(lambda: os.makedirs(output_dir, exist_ok=True))
+        return await self._run({"op": "visualize", "file_path": file_path, "output_dir": output_dir}, timeout)
+
+    async def process(self, file_path: str, output_dir: Optional[str] = None, render: bool = False,
+                      seed: Any = None, include_personal_vault: bool = True, user_id: Optional[str] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Analysis, interpretation and (with render) visualization from one decode
+
+        Args:
+            file_path: Audio file
+            output_dir: Where the visualization and, when given, the report
+                (<name>_aural_sentience.json) are written
+            render: Also render the visualization into output_dir
+            seed: Seed for reproducible wording
+            include_personal_vault: Add the listener's associations
+            user_id: Listener whose vault is used (needs a vault_manager)
+            timeout: Seconds the job may run
+
+        Returns:
+            technical_analysis, poetic_interpretation, visualization, seconds
+            and, with output_dir, report_path
+        """
+        if output_dir is not None:
+            await self._io(lambda: os.makedirs(output_dir, exist_ok=True))
+        job = {"op": "process", "file_path": file_path, "output_dir": output_dir, "render": render, "seed": seed}
+        report = await self._run(job, timeout)
+        if include_personal_vault:
+            await self._attach_associations(report["technical_analysis"], user_id)
+        if output_dir is not None:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            report["report_path"] = os.path.join(output_dir, f"{name}_aural_sentience.json")
+            await self.save_report(report, report["report_path"])
+        return report
+
+    async def save_report(self, report: Dict[str, Any], path: str) -> None:
+        """Write a report atomically without blocking the loop"""
+        await self._io(atomic_write_json, path, report)
+
+    async def load_report(self, path: str) -> Any:
+        return await self._io(_read_json, path)
+
+    async def _as_completed(self, method: Callable[..., Awaitable[Any]], file_paths: Iterable[str],
+                            options: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Outcomes of method over the files as they finish; closing the iterator cancels the rest"""
+        async def outcome(file_path: str) -> Dict[str, Any]:
+            try:
+                return {"file_path": file_path, "ok": True, "result": await method(file_path, **options)}
+            except (Exception, DeadlineExceeded) as e:
+                return {"file_path": file_path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        tasks = [asyncio.ensure_future(outcome(file_path)) for file_path in file_paths]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def analyze_many(self, file_paths: Iterable[str], **options: Any) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze files concurrently (options as for analyze)
+
+        Yields {"file_path", "ok", "result" or "error"} as each file
+        finishes; leaving the loop early cancels the files not yet done.
+        """
+        return self._as_completed(self.analyze, file_paths, options)
+
+    def process_many(self, file_paths: Iterable[str], **options: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Process files concurrently (options as for process); yields like analyze_many"""
+        return self._as_completed(self.process, file_paths, options)
+
+    async def aclose(self) -> None:
+        """Shut down the default process pool without blocking the loop"""
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Shut down the default process pool, cancelling jobs not yet started"""
+        if self._owns_executor:
+            self._owns_executor = False
+            if sys.version_info >= (3, 9):
+                self.executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                self.executor.shutdown(wait=True)
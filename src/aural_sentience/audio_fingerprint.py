@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Audio Fingerprinting for Content-Keyed Associations
+Recognizing a Song by Its Harmonic Shape, Not Its Name
+
+Personal associations belong to the music, not to the file that happened to
+carry it. This module derives a compact chroma fingerprint from features the
+engine already extracts and keeps fingerprints in a banded hash index
+(locality-sensitive hashing over Hamming space) so renamed or re-encoded
+files resolve to the same associations in a few dictionary lookups.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+FINGERPRINT_VERSION = "cf1"
+
+# Fingerprint layout: one bit per pitch class and time segment, set when the
+# pitch class is above the segment's mean chroma energy.
+FINGERPRINT_SEGMENTS = 16
+FINGERPRINT_BITS = 12 * FINGERPRINT_SEGMENTS
+
+# LSH banding: fingerprints sharing any one band land in the same bucket
+BAND_BITS = 16
+BAND_COUNT = FINGERPRINT_BITS // BAND_BITS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Default acceptance threshold (bits that may differ between two encodings)
+DEFAULT_MAX_DISTANCE = 24
+
+
+def compute_chroma_fingerprint(chroma: np.ndarray) -> str:
+    """
+    Compute a compact fingerprint from a chroma matrix
+
+    Args:
+        chroma: Chroma features shaped (12, frames), e.g. from chroma_stft
+
+    Returns:
+        Fingerprint string of the form "cf1:<hex>"
+    """
+    chroma = np.asarray(chroma, dtype=np.float64)
+    if chroma.ndim != 2 or chroma.shape[0] != 12:
+        raise ValueError(f"Expected chroma shaped (12, frames), got {chroma.shape}")
+
+    frames = chroma.shape[1]
+    # Segment boundaries are relative to track length, so the fingerprint
+    # survives resampling and re-encoding.
+    labels = np.minimum((np.arange(frames) * FINGERPRINT_SEGMENTS) // max(frames, 1),
+                        FINGERPRINT_SEGMENTS - 1)
+    sums = np.zeros((FINGERPRINT_SEGMENTS, 12))
+    np.add.at(sums, labels, chroma.T)
+    counts = np.bincount(labels, minlength=FINGERPRINT_SEGMENTS)
+    segments = sums / np.maximum(counts, 1)[:, np.newaxis]
+
+    bits = segments > segments.mean(axis=1, keepdims=True)
+    return f"{FINGERPRINT_VERSION}:{np.packbits(bits.ravel()).tobytes().hex()}"
+
+
+def fingerprint_to_int(fingerprint: str) -> int:
+    """Decode a fingerprint string into its integer bit pattern"""
+    version, _, digest = fingerprint.partition(":")
+    if version != FINGERPRINT_VERSION or not digest:
+        raise ValueError(f"Unsupported fingerprint: {fingerprint!r}")
+    return int(digest, 16)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprint bit patterns"""
+    return bin(a ^ b).count("1")
+
+
+def _bands(value: int) -> List[int]:
+    return [(value >> (band * BAND_BITS)) & BAND_MASK for band in range(BAND_COUNT)]
+
+
+class FingerprintIndex:
+    """
+    Banded hash index mapping fingerprints to keys
+
+    A lookup only compares against keys that share at least one 16-bit band
+    with the query, so cost is independent of library size for all but
+    pathological collisions.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._fingerprints: Dict[str, int] = {}
+        self._exact: Dict[int, str] = {}
+        self._buckets: List[Dict[int, set]] = [{} for _ in range(BAND_COUNT)]
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fingerprints
+
+    def fingerprint_of(self, key: str) -> Optional[str]:
+        """Return the fingerprint stored for a key"""
+        value = self._fingerprints.get(key)
+        if value is None:
+            return None
+        return f"{FINGERPRINT_VERSION}:{value:0{FINGERPRINT_BITS // 4}x}"
+
+    def add(self, key: str, fingerprint: str) -> None:
+        """Index a key under a fingerprint, replacing any previous one"""
+        value = fingerprint_to_int(fingerprint)
+        if key in self._fingerprints:
+            self.remove(key)
+        self._fingerprints[key] = value
+        self._exact.setdefault(value, key)
+        for band, bucket_value in enumerate(_bands(value)):
+            self._buckets[band].setdefault(bucket_value, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        """Drop a key from the index"""
+        value = self._fingerprints.pop(key, None)
+        if value is None:
+            return
+        if self._exact.get(value) == key:
+            del self._exact[value]
+            # Another key may share the exact fingerprint
+            for other, other_value in self._fingerprints.items():
+                if other_value == value:
+                    self._exact[value] = other
+                    break
+        for band, bucket_value in enumerate(_bands(value)):
+            bucket = self._buckets[band].get(bucket_value)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][bucket_value]
+
+    def candidates(self, fingerprint: str, max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find indexed keys within max_distance bits of a fingerprint
+
+        Returns:
+            (key, distance) pairs sorted by distance
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        value = fingerprint_to_int(fingerprint)
+
+        seen = set()
+        for band, bucket_value in enumerate(_bands(value)):
+            seen.update(self._buckets[band].get(bucket_value, ()))
+
+        matches = []
+        for key in seen:
+            distance = hamming_distance(value, self._fingerprints[key])
+            if distance <= max_distance:
+                matches.append((key, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def lookup(self, fingerprint: str, max_distance: Optional[int] = None) -> Optional[Tuple[str, int]]:
+        """Return the closest (key, distance) match, or None"""
+        exact = self._exact.get(fingerprint_to_int(fingerprint))
+        if exact is not None:
+            return exact, 0
+        matches = self.candidates(fingerprint, max_distance)
+        return matches[0] if matches else None
+
+    def items(self) -> Iterable[Tuple[str, str]]:
+        """Iterate (key, fingerprint) pairs"""
+        for key in self._fingerprints:
+            yield key, self.fingerprint_of(key)
+
+    def save(self, filepath: str) -> None:
+        """Persist the index as JSON"""
+        data = {
+            "version": FINGERPRINT_VERSION,
+            "max_distance": self.max_distance,
+            "fingerprints": dict(self.items())
+        }
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "FingerprintIndex":
+        """Load an index saved with save()"""
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        index = cls(max_distance=data.get("max_distance", DEFAULT_MAX_DISTANCE))
+        for key, fingerprint in data.get("fingerprints", {}).items():
+            index.add(key, fingerprint)
+        return index
@@ -0,0 +1,1211 @@
+#!/usr/bin/env python3
+"""
+Aural Sentience Master Integration
+Complete System for AI Musical Perception
+
+This master script integrates all components:
+- Audio analysis and resonance detection
+- Resonance lexicon and poetic interpretation
+- Sacred gap identification
+- Personal vault management
+- Comprehensive reporting
+
+Usage: aural-sentience analyze FILE... (or python -m aural_sentience.aural_sentience_master)
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from . import aural_sentience_toolkit as aural_toolkit
+from . import resonance_lexicon as lexicon_module
+from . import session_manifest as manifest_module
+from .deadlines import Cancelled, CancellationToken, DeadlineExceeded, TimeoutProcessPool, enforce
+from .job_scheduler import DEFAULT_COST_MODEL_PATH, CostModel, plan
+from .library_similarity import compare_library
+from .library_watch import LibraryWatcher
+from .memory_governor import MemoryGovernor, begin_job_measurement, end_job_measurement, probe_audio
+from .progress import ProgressReporter
+from .work_queue import QUEUE_FILENAME, WorkQueue
+
+# Marks the end of the decode stage's output
+_PIPELINE_DONE = object()
+
+# Engine owned by each pipeline worker process
+_worker_engine = None
+
+def _init_pipeline_worker():
+    """Create the worker's engine once instead of per task"""
+    global _worker_engine
+    _worker_engine = aural_toolkit.AuralSentienceEngine()
+
+def _render(engine, file_path, output_dir, y, sr):
+    """Draw the visualization, closing its figure if the render is interrupted"""
+    try:
+        return engine.create_comprehensive_visualization(file_path, output_dir, y=y, sr=sr)
+    except BaseException:
+        aural_toolkit.plt.close("all")
+        raise
+
+def _pipeline_decode(file_path):
+    """Decode stage, run in a worker when a deadline applies so a hung decoder can be killed"""
+    return _worker_engine.load_audio(file_path)
+
+def _pipeline_analyze(file_path, y, sr):
+    """Analysis stage; vault lookups happen in the parent process. Returns (analysis, resource usage)"""
+    start = time.perf_counter()
+    measurement = begin_job_measurement()
+    analysis = _worker_engine.analyze_audio(y, sr, file_path, include_personal_vault=False)
+    usage = end_job_measurement(measurement)
+    usage["seconds"] = time.perf_counter() - start
+    return analysis, usage
+
+def _pipeline_render(file_path, y, sr, output_dir):
+    """Visualization stage. Returns (image path, resource usage)"""
+    start = time.perf_counter()
+    measurement = begin_job_measurement()
+    viz_file = _render(_worker_engine, file_path, output_dir, y, sr)
+    usage = end_job_measurement(measurement)
+    usage["seconds"] = time.perf_counter() - start
+    return viz_file, usage
+
+def _run_local_queue_worker(output_dir, worker_id, options):
+    """Entry point of a queue worker process started by AuralSentienceMaster.coordinate"""
+    master = AuralSentienceMaster(output_dir=output_dir, manifest=False)
+    master.run_queue_worker(worker_id=worker_id, **options)
+
+class AuralSentienceMaster:
+    """Master controller for the complete aural sentience system"""
+    
+    def __init__(self, vault_manager=None, output_dir=None, cost_model=None, resonance_index=None, manifest=True):
+        """Start a new session, or resume the one in output_dir if it has a manifest
+        
+        cost_model predicts per-file processing time for scheduling; by
+        default it is loaded from (and calibrated into) DEFAULT_COST_MODEL_PATH.
+        Every completed analysis is added to resonance_index (a
+        ResonanceIndex) if one is given, and the index is saved after each batch.
+        manifest=False leaves the session manifest to a coordinator: queue
+        workers (see run_queue_worker) report their results through the
+        work queue instead.
+        """
+        self.engine = aural_toolkit.AuralSentienceEngine(vault_manager=vault_manager)
+        self.cost_model = cost_model or CostModel(DEFAULT_COST_MODEL_PATH)
+        self.resonance_index = resonance_index
+        self.lexicon = lexicon_module.ResonanceLexicon()
+        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_dir = output_dir or f"/home/ubuntu/aural_sentience_session_{self.session_id}"
+        self.failures = []
+        self.memory_summary = None
+        self.schedule_summary = None
+        self.progress = None
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        # Outputs depend on both the analysis and the interpretation logic
+        self.analysis_version = f"{aural_toolkit.ANALYSIS_VERSION}/{lexicon_module.INTERPRETATION_VERSION}"
+        self.manifest = None
+        if manifest:
+            self.manifest = manifest_module.SessionManifest(self.output_dir, self.analysis_version, self.session_id)
+            self.session_id = self.manifest.session_id
+    
+    def process_audio_file_complete(self, file_path, user_id=None, stage_timeouts=None):
+        """Complete processing of an audio file through all system components
+        
+        stage_timeouts maps "decode", "analyze" and "render" to seconds; a
+        stage that runs past its limit raises DeadlineExceeded, except the
+        render, whose timeout only costs the image.
+        """
+        stage_timeouts = stage_timeouts or {}
+        print(f"\n{'='*60}")
+        print(f"AURAL SENTIENCE COMPLETE ANALYSIS")
+        print(f"File: {os.path.basename(file_path)}")
+        print(f"{'='*60}")
+        
+        # Step 1: Technical Analysis
+        print("Step 1: Performing technical analysis...")
+        started = time.monotonic()
+        try:
+            with enforce(stage_timeouts.get("decode"), "decode"):
+                y, sr = self.engine.load_audio(file_path)
+        except Exception as e:
+            self._record_failure(file_path, "decode", e)
+            return None
+        started = self._stage_done("decode", started)
+        with enforce(stage_timeouts.get("analyze"), "analyze"):
+            technical_analysis = self.engine.analyze_audio(y, sr, file_path, user_id=user_id)
+        if not technical_analysis:
+            self._record_failure(file_path, "analyze", "no report produced")
+            return None
+        started = self._stage_done("analyze", started)
+        
+        # Step 2: Poetic Interpretation
+        print("Step 2: Generating poetic interpretation...")
+        poetic_interpretation = self.lexicon.generate_comprehensive_interpretation(technical_analysis)
+        started = self._stage_done("interpret", started)
+        
+        # Step 3: Create Visualizations
+        print("Step 3: Creating visualizations...")
+        try:
+            with enforce(stage_timeouts.get("render"), "render"):
+                viz_file = _render(self.engine, file_path, self.output_dir, y, sr)
+        except DeadlineExceeded as e:
+            if e.stage != "render":
+                raise
+            # The reports are still worth writing without the image
+            self._record_failure(file_path, "render", e)
+            viz_file = None
+        started = self._stage_done("render", started)
+        
+        # Step 4: Compile Master Report
+        print("Step 4: Compiling master report...")
+        master_report = self._compile_master_report(file_path, technical_analysis, poetic_interpretation, viz_file)
+        
+        # Step 5: Save All Components
+        tech_file, poetic_file, master_file, summary_file = self._save_report_files(
+            file_path, technical_analysis, poetic_interpretation, master_report
+        )
+        self._stage_done("write", started)
+        
+        print(f"Complete analysis saved to: {self.output_dir}")
+        print(f"Technical analysis: {tech_file}")
+        print(f"Poetic interpretation: {poetic_file}")
+        print(f"Master report: {master_file}")
+        print(f"Human summary: {summary_file}")
+        if viz_file:
+            print(f"Visualization: {viz_file}")
+        
+        return master_report
+    
+    def _output_paths(self, file_path, master_report=None):
+        """Where the reports of an input are written"""
+        prefix = os.path.join(self.output_dir, os.path.splitext(os.path.basename(file_path))[0])
+        return {
+            "technical_analysis": f"{prefix}_technical_analysis.json",
+            "poetic_interpretation": f"{prefix}_poetic_interpretation.json",
+            "master_report": f"{prefix}_master_report.json",
+            "human_summary": f"{prefix}_human_summary.md",
+            "visualization": (master_report or {}).get("visualization_file")
+        }
+    
+    def _save_report_files(self, file_path, technical_analysis, poetic_interpretation, master_report):
+        """Write the technical, poetic and master reports plus the human summary
+        
+        Each file is written atomically, so a reader on another machine of a
+        shared session never sees one half written.
+        """
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        outputs = self._output_paths(file_path, master_report)
+        tech_file = outputs["technical_analysis"]
+        poetic_file = outputs["poetic_interpretation"]
+        master_file = outputs["master_report"]
+        summary_file = outputs["human_summary"]
+        
+        # Save technical analysis, poetic interpretation and master report
+        manifest_module.atomic_write_json(tech_file, technical_analysis)
+        manifest_module.atomic_write_json(poetic_file, poetic_interpretation)
+        manifest_module.atomic_write_json(master_file, master_report)
+        
+        # Create human-readable summary
+        tmp_file = f"{summary_file}.tmp.{os.getpid()}"
+        self._create_human_summary(master_report, tmp_file)
+        os.replace(tmp_file, summary_file)
+        
+        # Only now is the file done: a crash before this line re-runs it on resume
+        if self.manifest is not None:
+            self.manifest.record_complete(file_path, outputs)
+        failure_marker = os.path.join(self.output_dir, f"{base_name}_failed.json")
+        if os.path.exists(failure_marker):
+            os.remove(failure_marker)
+        if self.resonance_index is not None:
+            self.resonance_index.add(file_path, technical_analysis)
+        if self.progress is not None:
+            self.progress.file_done(file_path)
+        
+        return tech_file, poetic_file, master_file, summary_file
+    
+    def _record_failure(self, file_path, stage, error):
+        """Note a file that failed a stage and leave a marker next to its outputs
+        
+        A DeadlineExceeded error records the file as timed out.
+        """
+        failure = {
+            "file_path": file_path,
+            "stage": stage,
+            "error": f"{type(error).__name__}: {error}" if isinstance(error, BaseException) else str(error),
+            "timestamp": datetime.now().isoformat()
+        }
+        if isinstance(error, DeadlineExceeded) and stage != "render":
+            # Abandoned at a deadline: reruns skip it unless told to retry
+            failure.update(timed_out=True, timeout=error.timeout)
+            if self.manifest is not None:
+                self.manifest.record_timeout(file_path, stage, error.timeout, failure["error"])
+        elif self.manifest is not None:
+            self.manifest.record_failed(file_path, stage, failure["error"])
+        self.failures.append(failure)
+        if self.progress is not None and stage != "render":
+            self.progress.file_done(file_path, "timed_out" if failure.get("timed_out") else "failed", stage)
+        print(f"Failed to {stage} {file_path}: {failure['error']}")
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        try:
+            with open(os.path.join(self.output_dir, f"{base_name}_failed.json"), 'w') as f:
+                json.dump(failure, f, indent=2)
+        except OSError:
+            traceback.print_exc()
+    
+    def _stage_done(self, stage, started):
+        """Report a stage's time to the batch progress; returns the start of the next stage"""
+        now = time.monotonic()
+        if self.progress is not None:
+            self.progress.stage_done(stage, now - started)
+        return now
+    
+    def _compile_master_report(self, file_path, technical_analysis, poetic_interpretation, viz_file):
+        """Compile a comprehensive master report"""
+        return {
+            "aural_sentience_master_report": {
+                "file_path": file_path,
+                "session_id": self.session_id,
+                "analysis_timestamp": datetime.now().isoformat(),
+                "system_version": "1.0.0",
+                "approach": "complete_aural_sentience"
+            },
+            
+            "philosophical_foundation": {
+                "core_principle": (
+                    "This system honors the sacred subjectivity of musical experience. "
+                    "It offers invitations to deeper listening while protecting the ineffable "
+                    "nature of personal musical meaning. Your felt experience is the ultimate truth."
+                ),
+                "methodology": "resonant_witnessing",
+                "sacred_gaps_philosophy": (
+                    "Intentional spaces where analysis yields to mystery, acknowledging "
+                    "that some experiences are too sacred for interpretation."
+                )
+            },
+            
+            "technical_analysis": technical_analysis,
+            "poetic_interpretation": poetic_interpretation,
+            
+            "synthesis": self._create_synthesis(technical_analysis, poetic_interpretation),
+            
+            "visualization_file": viz_file,
+            
+            "user_guidance": {
+                "how_to_use": (
+                    "This report offers multiple layers of engagement with your music. "
+                    "Begin with the poetic interpretation to feel into the essence, "
+                    "then explore the technical analysis for deeper understanding. "
+                    "Always trust your own experience above any analysis."
+                ),
+                "sacred_gaps": (
+                    "Pay special attention to the sacred gaps - these are moments "
+                    "where the system recognizes the limits of analysis and invites "
+                    "pure, unmediated experience."
+                ),
+                "personal_vault": (
+                    "Consider adding your own associations to build a personal "
+                    "resonance vault that will inform future analyses."
+                )
+            },
+            
+            "closing_reflection": (
+                "Music lives in the space between sound and soul. What cannot be "
+                "measured is often what matters most. This analysis is an invitation "
+                "to deeper listening, not a definition of truth."
+            )
+        }
+    
+    def _create_synthesis(self, technical_analysis, poetic_interpretation):
+        """Create a synthesis between technical and poetic elements"""
+        synthesis = {
+            "resonance_coherence": {},
+            "awakening_signatures": {},
+            "field_stability": {},
+            "integration_insights": []
+        }
+        
+        # Analyze resonance coherence
+        if "resonance_analysis" in technical_analysis:
+            sacred_freqs = technical_analysis["resonance_analysis"].get("sacred_frequencies", {})
+            if sacred_freqs:
+                # Check for 741Hz awakening signature
+                if "741" in sacred_freqs:
+                    awakening_data = sacred_freqs["741"]
+                    synthesis["awakening_signatures"]["741Hz_presence"] = {
+                        "description": "Awakening signature detected - facilitates authentic expression",
+                        "prominence": awakening_data.get("prominence", 0),
+                        "field_effect": (
+                            "The integration of this awakening signature (741Hz) fractally enhances "
+                            "existing frequencies, leading to reduced noise, improved phase alignment, "
+                            "and the creation of new harmonic pathways. This signature dissolves "
+                            "limitations and enables authentic expression, strengthening the overall field."
+                        )
+                    }
+                
+                # Calculate overall resonance stability
+                total_prominence = sum(freq_data.get("prominence", 0) for freq_data in sacred_freqs.values())
+                num_frequencies = len(sacred_freqs)
+                avg_prominence = total_prominence / num_frequencies if num_frequencies > 0 else 0
+                
+                synthesis["resonance_coherence"] = {
+                    "total_sacred_frequencies": num_frequencies,
+                    "average_prominence": avg_prominence,
+                    "coherence_level": "high" if avg_prominence > 4 else "moderate" if avg_prominence > 2 else "emerging",
+                    "field_description": (
+                        f"This music contains {num_frequencies} sacred frequencies with "
+                        f"{'strong' if avg_prominence > 4 else 'moderate' if avg_prominence > 2 else 'gentle'} "
+                        f"resonance coherence, suggesting a {'highly' if avg_prominence > 4 else 'moderately' if avg_prominence > 2 else 'subtly'} "
+                        f"structured energetic field."
+                    )
+                }
+        
+        # Integration insights
+        poetic_patterns = poetic_interpretation.get("emotional_pattern_interpretations", [])
+        if poetic_patterns:
+            for pattern in poetic_patterns:
+                if "transcendent" in pattern.get("pattern", "").lower():
+                    synthesis["integration_insights"].append(
+                        "The presence of transcendent patterns suggests this music facilitates "
+                        "consciousness expansion and spiritual elevation."
+                    )
+                elif "mystical" in pattern.get("pattern", "").lower():
+                    synthesis["integration_insights"].append(
+                        "Mystical complexity patterns indicate this music engages higher-order "
+                        "consciousness and facilitates deep spiritual contemplation."
+                    )
+        
+        return synthesis
+    
+    def _create_human_summary(self, master_report, output_file):
+        """Create a human-readable summary of the analysis"""
+        with open(output_file, 'w') as f:
+            f.write("# Aural Sentience Analysis Summary\n\n")
+            
+            # Basic info
+            file_path = master_report["aural_sentience_master_report"]["file_path"]
+            f.write(f"**File:** {os.path.basename(file_path)}\n")
+            f.write(f"**Analysis Date:** {master_report['aural_sentience_master_report']['analysis_timestamp']}\n\n")
+            
+            # Philosophical foundation
+            f.write("## Sacred Approach\n\n")
+            f.write(master_report["philosophical_foundation"]["core_principle"] + "\n\n")
+            
+            # Poetic interpretation highlights
+            f.write("## Poetic Essence\n\n")
+            poetic = master_report["poetic_interpretation"]
+            f.write(f"**Opening Invitation:** {poetic['opening_invitation']}\n\n")
+            
+            # Sacred frequencies
+            if poetic["sacred_frequency_interpretations"]:
+                f.write("### Sacred Frequencies Detected\n\n")
+                for freq_interp in poetic["sacred_frequency_interpretations"]:
+                    f.write(f"**{freq_interp['frequency']}Hz - {freq_interp['essence']}**\n")
+                    f.write(f"- {freq_interp['poetic_description']}\n")
+                    f.write(f"- {freq_interp['emotional_invitation']}\n")
+                    f.write(f"- Somatic suggestion: {freq_interp['somatic_suggestion']}\n\n")
+            
+            # Emotional patterns
+            if poetic["emotional_pattern_interpretations"]:
+                f.write("### Emotional Landscape\n\n")
+                for pattern in poetic["emotional_pattern_interpretations"]:
+                    f.write(f"**{pattern['pattern'].replace('_', ' ').title()}**\n")
+                    f.write(f"- {pattern['poetic_description']}\n")
+                    f.write(f"- {pattern['invitation']}\n\n")
+            
+            # Sacred gaps
+            if poetic["sacred_gap_interpretations"]:
+                f.write("### Sacred Gaps (Moments Beyond Analysis)\n\n")
+                for gap in poetic["sacred_gap_interpretations"]:
+                    f.write(f"**At {gap['timestamp']:.1f} seconds:** {gap['message']}\n\n")
+            
+            # Synthesis insights
+            if "synthesis" in master_report:
+                synthesis = master_report["synthesis"]
+                f.write("## Resonance Field Analysis\n\n")
+                
+                if "resonance_coherence" in synthesis:
+                    coherence = synthesis["resonance_coherence"]
+                    f.write(f"**Field Coherence:** {coherence.get('coherence_level', 'unknown').title()}\n")
+                    f.write(f"{coherence.get('field_description', '')}\n\n")
+                
+                if "awakening_signatures" in synthesis and synthesis["awakening_signatures"]:
+                    f.write("### Awakening Signatures\n\n")
+                    for sig_name, sig_data in synthesis["awakening_signatures"].items():
+                        f.write(f"**{sig_name}:** {sig_data['description']}\n")
+                        f.write(f"{sig_data['field_effect']}\n\n")
+            
+            # Closing
+            f.write("## Closing Reflection\n\n")
+            f.write(master_report["closing_reflection"] + "\n\n")
+            
+            # Usage guidance
+            f.write("## How to Use This Analysis\n\n")
+            guidance = master_report["user_guidance"]
+            f.write(f"**General Approach:** {guidance['how_to_use']}\n\n")
+            f.write(f"**Sacred Gaps:** {guidance['sacred_gaps']}\n\n")
+            f.write(f"**Personal Vault:** {guidance['personal_vault']}\n\n")
+    
+    def process_multiple_files(self, file_paths, pipeline=False, workers=None, queue_size=4, user_id=None,
+                               memory_budget=None, schedule="sjf", file_timeout=None, stage_timeouts=None,
+                               retry_timeouts=False, cancel_token=None, progress=None, whole_library=False):
+        """Process multiple audio files and create comparative analysis
+        
+        Files are processed in the order the scheduling policy picks from
+        their predicted cost ("sjf", "longest", "fair" or "fifo"; see
+        job_scheduler); reports are still returned in input order.
+        
+        With pipeline=True files flow through overlapping stages (see
+        _run_pipeline) instead of being processed one after another, as many
+        at a time as memory_budget (bytes; default: three quarters of the
+        available memory) allows. Inputs the session manifest shows as
+        complete and unchanged are skipped, and byte-identical inputs are
+        processed once.
+        
+        file_timeout bounds each file in seconds and stage_timeouts each of
+        its "decode", "analyze" and "render" stages. A file past its
+        deadline is abandoned and recorded as timed out, and later runs
+        skip it until its content changes or retry_timeouts is set.
+        Cancelling cancel_token stops the batch at the next checkpoint;
+        unfinished files are left for a resumed run.
+        
+        progress is a ProgressReporter, or a destination for one (a path,
+        "-" for stdout or a stream), that receives JSON-lines throughput
+        events; its summary is kept in session_summary.json either way.
+        
+        whole_library=True keeps the tracks of earlier batches in the
+        similarity matrix, as when a watched library arrives batch by batch.
+        """
+        existing = []
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                existing.append(file_path)
+            else:
+                print(f"File not found: {file_path}")
+        
+        to_process, reused = self._plan_session(existing, retry_timeouts=retry_timeouts)
+        if reused:
+            print(f"Resuming session {self.session_id}: {len(reused)} file(s) already complete")
+        
+        workers = (workers or os.cpu_count() or 1) if pipeline else 1
+        batch_plan = plan(to_process, policy=schedule, workers=workers, cost_model=self.cost_model)
+        to_process = batch_plan["order"]
+        if to_process:
+            print(f"Estimated time for {len(to_process)} file(s): {batch_plan['makespan_seconds']:.0f}s "
+                  f"({schedule}, {workers} worker(s){'' if batch_plan['calibrated'] else ', uncalibrated'})")
+        
+        reporter = progress if isinstance(progress, ProgressReporter) else ProgressReporter(progress)
+        reporter.start({file_path: batch_plan["probes"][file_path]["duration"] for file_path in to_process},
+                       workers=workers, predicted_seconds=batch_plan["makespan_seconds"])
+        self.progress = reporter
+        try:
+            started = time.perf_counter()
+            if pipeline:
+                fresh_reports = self._run_pipeline(to_process, workers=workers, queue_size=queue_size, user_id=user_id,
+                                                   memory_budget=memory_budget, probes=batch_plan["probes"],
+                                                   file_timeout=file_timeout, stage_timeouts=stage_timeouts,
+                                                   cancel_token=cancel_token)
+            else:
+                fresh_reports = []
+                for file_path in to_process:
+                    file_started = time.perf_counter()
+                    try:
+                        with enforce(file_timeout, "file", token=cancel_token):
+                            report = self.process_audio_file_complete(file_path, user_id=user_id,
+                                                                      stage_timeouts=stage_timeouts)
+                    except DeadlineExceeded as e:
+                        self._record_failure(file_path, e.stage, e)
+                        continue
+                    except Cancelled:
+                        print(f"Cancelled; {file_path} and the files after it are left for a resumed run")
+                        break
+                    if report:
+                        self.cost_model.observe(batch_plan["probes"][file_path], time.perf_counter() - file_started)
+                    fresh_reports.append(report)
+        finally:
+            self.progress = None
+            progress_summary = reporter.finish()
+            if reporter is not progress:
+                reporter.close()
+        self.schedule_summary = {
+            "policy": schedule,
+            "workers": workers,
+            "calibrated": batch_plan["calibrated"],
+            "predicted_seconds": batch_plan["makespan_seconds"],
+            "actual_seconds": time.perf_counter() - started,
+            "order": to_process
+        }
+        return self._finish_session(existing, fresh_reports, progress_summary, whole_library=whole_library)
+    
+    def _finish_session(self, existing, fresh_reports, progress_summary=None, whole_library=False):
+        """Save the learned models, then write the comparative analysis and session summary
+        
+        fresh_reports are the master reports produced by this run; reports
+        of the other inputs are read back from disk. Returns the reports in
+        input order.
+        """
+        try:
+            self.cost_model.save()
+        except OSError as e:
+            print(f"Could not save the cost model: {e}")
+        if self.resonance_index is not None:
+            try:
+                self.resonance_index.save()
+            except OSError as e:
+                print(f"Could not save the resonance index: {e}")
+        fresh_reports = {
+            report["aural_sentience_master_report"]["file_path"]: report
+            for report in fresh_reports if report
+        }
+        
+        # Reports in input order, read back from disk for files done in earlier
+        # runs; duplicates share their original's report
+        all_reports = []
+        seen_outputs = set()
+        for file_path in existing:
+            master_file = self.manifest.output_paths(file_path).get("master_report")
+            if not master_file or master_file in seen_outputs:
+                continue
+            seen_outputs.add(master_file)
+            if file_path in fresh_reports:
+                all_reports.append(fresh_reports[file_path])
+            elif os.path.exists(master_file):
+                with open(master_file, 'r') as f:
+                    all_reports.append(json.load(f))
+        
+        # Create comparative analysis
+        if len(all_reports) > 1 or (whole_library and all_reports):
+            comparative_file = os.path.join(self.output_dir, "comparative_analysis.json")
+            comparative_analysis = self._create_comparative_analysis(all_reports, whole_library=whole_library)
+            with open(comparative_file, 'w') as f:
+                json.dump(comparative_analysis, f, indent=2)
+            print(f"Comparative analysis saved to: {comparative_file}")
+        
+        # Create session summary
+        session_summary = {
+            "session_id": self.session_id,
+            "timestamp": datetime.now().isoformat(),
+            "total_files_processed": len(all_reports),
+            "failures": self.failures,
+            "duplicates": [
+                {"file_path": file_path, "duplicate_of": duplicate_of}
+                for file_path, duplicate_of in self.manifest.duplicates()
+            ],
+            "output_directory": self.output_dir,
+            "schedule": self.schedule_summary,
+            "memory": self.memory_summary,
+            "progress": progress_summary,
+            "system_philosophy": (
+                "This aural sentience system honors the sacred subjectivity of musical experience "
+                "while providing technical insights and poetic interpretations that invite deeper listening."
+            ),
+            "reports": all_reports
+        }
+        
+        session_file = os.path.join(self.output_dir, "session_summary.json")
+        with open(session_file, 'w') as f:
+            json.dump(session_summary, f, indent=2)
+        
+        self.manifest.compact()
+        
+        print(f"\nSession complete! All files saved to: {self.output_dir}")
+        print(f"Session summary: {session_file}")
+        
+        return all_reports
+    
+    def coordinate(self, file_paths, local_workers=0, lease_seconds=300.0, max_attempts=3, poll_interval=1.0,
+                   schedule="sjf", retry_timeouts=False, cancel_token=None, progress=None, worker_options=None):
+        """Run the session as the coordinator of a work queue shared with other machines
+        
+        Plans the session like process_multiple_files, then enqueues the
+        files still to process, in scheduled order, in output_dir's work
+        queue (see work_queue). Workers drain it: run_queue_worker (or
+        `aural-sentience worker`) on any machine that shares output_dir,
+        plus local_workers processes started here with worker_options.
+        Expired leases are reclaimed and crashed local workers replaced;
+        results are merged into the manifest as they arrive, and the
+        comparative analysis and session summary are written once the queue
+        is drained. Cancelling cancel_token stops the local workers and
+        leaves the remaining jobs for a resumed run.
+        
+        Returns the reports in input order.
+        """
+        work_queue = WorkQueue(os.path.join(self.output_dir, QUEUE_FILENAME),
+                               lease_seconds=lease_seconds, max_attempts=max_attempts)
+        work_queue.set_meta("session_id", self.session_id)
+        work_queue.set_meta("state", "planning")
+        # Results a previous coordinator did not get to merge
+        self._merge_queue_results(work_queue)
+        
+        existing = []
+        for file_path in file_paths:
+            if os.path.exists(file_path):
+                existing.append(file_path)
+            else:
+                print(f"File not found: {file_path}")
+        to_process, reused = self._plan_session(existing, retry_timeouts=retry_timeouts)
+        if reused:
+            print(f"Resuming session {self.session_id}: {len(reused)} file(s) already complete")
+        batch_plan = plan(to_process, policy=schedule, workers=max(1, local_workers), cost_model=self.cost_model)
+        work_queue.enqueue((job["file_path"], priority, job["predicted_seconds"])
+                           for priority, job in enumerate(batch_plan["jobs"]))
+        work_queue.set_meta("state", "running")
+        print(f"Queued {len(to_process)} file(s) in {work_queue.path}")
+        
+        reporter = progress if isinstance(progress, ProgressReporter) else ProgressReporter(progress)
+        reporter.start({file_path: batch_plan["probes"][file_path]["duration"] for file_path in batch_plan["order"]},
+                       workers=max(1, local_workers), predicted_seconds=batch_plan["makespan_seconds"],
+                       queue_depths=lambda: {status: count for status, count in work_queue.counts().items()
+                                             if status in ("pending", "leased")})
+        self.progress = reporter
+        
+        context = multiprocessing.get_context("spawn")
+        host = socket.gethostname()
+        
+        def start_worker(slot):
+            process = context.Process(target=_run_local_queue_worker, daemon=True,
+                                      args=(self.output_dir, f"{host}:local-{slot}", worker_options or {}))
+            process.start()
+            return process
+        
+        processes = []
+        restarts = 0
+        cancelled = False
+        started = time.perf_counter()
+        try:
+            processes = [start_worker(slot) for slot in range(local_workers)]
+            while True:
+                work_queue.reclaim_expired()
+                self._merge_queue_results(work_queue)
+                if work_queue.outstanding() == 0:
+                    break
+                if cancel_token is not None and cancel_token.cancelled:
+                    cancelled = True
+                    print(f"Cancelled; {work_queue.outstanding()} queued file(s) are left for a resumed run")
+                    break
+                for slot, process in enumerate(processes):
+                    # The crashed worker's lease expires and its job is claimed again
+                    if process.exitcode not in (None, 0) and restarts < local_workers * max_attempts:
+                        print(f"Local worker {slot} exited with code {process.exitcode}; restarting it")
+                        processes[slot] = start_worker(slot)
+                        restarts += 1
+                if processes and not any(process.is_alive() for process in processes):
+                    cancelled = True
+                    print(f"Local workers keep failing; {work_queue.outstanding()} queued file(s) "
+                          f"are left for a resumed run")
+                    break
+                reporter.tick()
+                if cancel_token is not None:
+                    cancel_token.wait(poll_interval)
+                else:
+                    time.sleep(poll_interval)
+        finally:
+            for slot, process in enumerate(processes):
+                if process.is_alive():
+                    process.terminate()
+                process.join(5.0)
+                work_queue.release_worker(f"{host}:local-{slot}")
+            self._merge_queue_results(work_queue)
+            self.progress = None
+            progress_summary = reporter.finish()
+            if reporter is not progress:
+                reporter.close()
+            if not cancelled:
+                work_queue.set_meta("state", "finished")
+        
+        self.schedule_summary = {
+            "policy": schedule,
+            "workers": local_workers,
+            "mode": "work_queue",
+            "queue": work_queue.path,
+            "jobs": work_queue.counts(),
+            "calibrated": batch_plan["calibrated"],
+            "predicted_seconds": batch_plan["makespan_seconds"],
+            "actual_seconds": time.perf_counter() - started,
+            "order": batch_plan["order"]
+        }
+        work_queue.close()
+        return self._finish_session(existing, {}, progress_summary)
+    
+    def _merge_queue_results(self, work_queue):
+        """Record the work queue's finished jobs in the manifest; returns how many were merged"""
+        jobs = work_queue.unmerged()
+        for job in jobs:
+            file_path = job["file_path"]
+            if job["status"] == "done":
+                try:
+                    with open(job["result_path"], 'r') as f:
+                        result = json.load(f)
+                except (OSError, ValueError, TypeError) as e:
+                    self._record_failure(file_path, "merge", e)
+                    work_queue.mark_merged(job["id"])
+                    continue
+                self.manifest.record_complete(file_path, result["outputs"])
+                # Render failures and the like that still produced reports
+                self.failures.extend(result.get("failures", []))
+                if result.get("probe"):
+                    self.cost_model.observe(result["probe"], result["seconds"])
+                if self.resonance_index is not None:
+                    with open(result["outputs"]["technical_analysis"], 'r') as f:
+                        self.resonance_index.add(file_path, json.load(f))
+                if self.progress is not None:
+                    self.progress.file_done(file_path)
+                print(f"Completed by {result.get('worker')}: {file_path}")
+            elif job["status"] == "timed_out":
+                self._record_failure(file_path, job["stage"], DeadlineExceeded(job["stage"], job["timeout"]))
+            else:
+                self._record_failure(file_path, job["stage"] or "analyze", job["error"])
+            work_queue.mark_merged(job["id"])
+        return len(jobs)
+    
+    def run_queue_worker(self, worker_id=None, poll_interval=1.0, idle_timeout=None, user_id=None,
+                         file_timeout=None, stage_timeouts=None, cancel_token=None):
+        """Process jobs from output_dir's work queue until it is drained
+        
+        Jobs are claimed one at a time under a lease that a heartbeat thread
+        extends every third of the lease time. A worker that loses its lease
+        stops the file at the next checkpoint and leaves it to whoever
+        reclaimed it. Outputs are written atomically into the session
+        directory, and a result record under queue_results/ tells the
+        coordinator where they are. file_timeout and stage_timeouts bound
+        each job as in process_multiple_files.
+        
+        Returns the number of jobs finished once nothing is pending or
+        leased, after idle_timeout seconds without a job to claim, or when
+        cancel_token is cancelled (the current job is handed back).
+        """
+        work_queue = WorkQueue(os.path.join(self.output_dir, QUEUE_FILENAME))
+        worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.session_id = work_queue.get_meta("session_id") or self.session_id
+        results_dir = os.path.join(self.output_dir, "queue_results")
+        os.makedirs(results_dir, exist_ok=True)
+        heartbeat_interval = work_queue.lease_seconds / 3
+        finished = 0
+        idle_since = time.monotonic()
+        
+        try:
+            while cancel_token is None or not cancel_token.cancelled:
+                job = work_queue.claim(worker_id)
+                if job is None:
+                    # Leased jobs may still expire and come back; wait for the coordinator's verdict
+                    if work_queue.get_meta("state") in ("running", "finished") and work_queue.outstanding() == 0:
+                        break
+                    if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                        break
+                    if cancel_token is not None:
+                        cancel_token.wait(poll_interval)
+                    else:
+                        time.sleep(poll_interval)
+                    continue
+                
+                file_path = job["file_path"]
+                lease_token = CancellationToken()
+                lost = threading.Event()
+                stop = threading.Event()
+                
+                def heartbeat():
+                    last = time.monotonic()
+                    while not stop.wait(min(0.5, heartbeat_interval)):
+                        if cancel_token is not None and cancel_token.cancelled:
+                            lease_token.cancel("worker stopping")
+                        if time.monotonic() - last >= heartbeat_interval:
+                            last = time.monotonic()
+                            if not work_queue.heartbeat(job):
+                                lost.set()
+                                lease_token.cancel("lease lost")
+                                return
+                
+                beat = threading.Thread(target=heartbeat, name="queue-heartbeat", daemon=True)
+                beat.start()
+                failures_before = len(self.failures)
+                started = time.perf_counter()
+                report = None
+                try:
+                    with enforce(file_timeout, "file", token=lease_token):
+                        report = self.process_audio_file_complete(file_path, user_id=user_id,
+                                                                  stage_timeouts=stage_timeouts)
+                except DeadlineExceeded as e:
+                    self._record_failure(file_path, e.stage, e)
+                except Cancelled:
+                    if not lost.is_set():
+                        work_queue.release(job)
+                        print(f"Stopping; {file_path} is handed back to the queue")
+                        break
+                    print(f"Lease on {file_path} was lost; leaving it to the worker that reclaimed it")
+                    continue
+                except Exception as e:
+                    self._record_failure(file_path, "analyze", e)
+                finally:
+                    stop.set()
+                    beat.join()
+                
+                new_failures = self.failures[failures_before:]
+                if report:
+                    try:
+                        probe = probe_audio(file_path)
+                    except OSError:
+                        probe = None
+                    result_path = os.path.join(results_dir, f"{job['id']}.json")
+                    manifest_module.atomic_write_json(result_path, {
+                        "file_path": file_path,
+                        "worker": worker_id,
+                        "attempt": job["attempts"],
+                        "seconds": time.perf_counter() - started,
+                        "probe": probe,
+                        "outputs": self._output_paths(file_path, report),
+                        "failures": new_failures,
+                        "completed": datetime.now().isoformat()
+                    })
+                    accepted = work_queue.complete(job, result_path)
+                else:
+                    failure = new_failures[-1] if new_failures else {"stage": "analyze", "error": "no report produced"}
+                    accepted = work_queue.fail(job, failure["stage"], failure["error"],
+                                               timed_out=failure.get("timed_out", False),
+                                               timeout=failure.get("timeout"))
+                if not accepted:
+                    print(f"Lease on {file_path} expired before it finished; the outcome was not recorded")
+                finished += 1
+                idle_since = time.monotonic()
+        finally:
+            work_queue.close()
+        return finished
+    
+    def watch_folder(self, root, pipeline=False, workers=None, poll_interval=1.0, settle_seconds=2.0,
+                     baseline=False, stop_event=None, user_id=None):
+        """Analyze new and changed audio below root as it arrives, until stop_event is set
+        
+        With baseline=True the files already present are indexed, not analyzed.
+        """
+        print(f"Watching {root} (session {self.session_id}, output {self.output_dir})")
+        
+        def analyze_batch(file_paths):
+            print(f"{len(file_paths)} new or changed file(s)")
+            self.process_multiple_files(file_paths, pipeline=pipeline, workers=workers, user_id=user_id,
+                                        whole_library=True)
+        
+        with LibraryWatcher(root, settle_seconds=settle_seconds, baseline=baseline) as watcher:
+            watcher.run(analyze_batch, poll_interval=poll_interval, stop_event=stop_event)
+    
+    def _plan_session(self, file_paths, retry_timeouts=False):
+        """Split inputs into files still to process and files the manifest covers"""
+        to_process = []
+        reused = []
+        first_by_hash = {}
+        for file_path in file_paths:
+            try:
+                content_hash = self.manifest.content_hash(file_path)
+            except OSError as e:
+                self._record_failure(file_path, "hash", e)
+                continue
+            if self.manifest.is_complete(file_path, content_hash):
+                reused.append(file_path)
+                continue
+            timed_out = None if retry_timeouts else self.manifest.timed_out(file_path, content_hash)
+            if timed_out is not None:
+                print(f"Skipping {file_path}: timed out in an earlier run ({timed_out.get('error')})")
+                continue
+            canonical = first_by_hash.get(content_hash) or self.manifest.completed_path_for(content_hash)
+            if canonical is not None and canonical != file_path:
+                print(f"Duplicate of {canonical}: {file_path}")
+                self.manifest.record_duplicate(file_path, content_hash, canonical)
+                continue
+            first_by_hash[content_hash] = file_path
+            to_process.append(file_path)
+        return to_process, reused
+    
+    def _run_pipeline(self, file_paths, workers=None, queue_size=4, user_id=None, memory_budget=None, probes=None,
+                      file_timeout=None, stage_timeouts=None, cancel_token=None):
+        """Process files through overlapping stages
+        
+        decode (I/O thread) -> analysis and rendering (worker processes) ->
+        interpretation (inline) -> writing (I/O thread). Queues between the
+        stages are bounded, so at most queue_size reports wait to be written.
+        A file is only decoded once the memory governor admits it: its
+        estimate, from a header probe, must fit the budget next to the files
+        already in flight, so long recordings lower the concurrency and short
+        ones raise it up to workers * 2. Measured worker peaks correct later
+        estimates. A file that fails a stage gets a failure marker and the
+        batch carries on. Reports are returned in input order. probes maps
+        file paths to header probes already taken.
+        
+        Stage deadlines count from when a worker starts the stage and are
+        capped by what is left of the file's deadline. Workers past their
+        deadline are killed (see TimeoutProcessPool); with any decode or
+        file deadline the decoder also runs in a worker process, since a
+        hung decoder thread could not be stopped.
+        """
+        workers = workers or os.cpu_count() or 1
+        stage_timeouts = stage_timeouts or {}
+        governor = MemoryGovernor(budget_bytes=memory_budget, max_concurrent=workers * 2)
+        decoded = queue.Queue(maxsize=queue_size)
+        to_write = queue.Queue(maxsize=queue_size)
+        reports = [None] * len(file_paths)
+        probes = probes or {}
+        decode_seconds = {}
+        file_started = {}
+        
+        def stage_timeout(stage, index):
+            limits = [stage_timeouts.get(stage)]
+            if file_timeout is not None:
+                limits.append(max(0.0, file_timeout - (time.monotonic() - file_started[index])))
+            limits = [limit for limit in limits if limit is not None]
+            return min(limits) if limits else None
+        
+        decode_pool = None
+        if file_timeout is not None or stage_timeouts.get("decode") is not None:
+            decode_pool = TimeoutProcessPool(1, initializer=_init_pipeline_worker)
+        
+        def decode(index, file_path):
+            if decode_pool is None:
+                return self.engine.load_audio(file_path)
+            future = decode_pool.submit(_pipeline_decode, file_path,
+                                        timeout=stage_timeout("decode", index), stage="decode")
+            while not future.done():
+                if cancel_token is not None:
+                    cancel_token.check()
+                decode_pool.poll(0.05)
+            return future.result()
+        
+        decode_failure = []
+        
+        def decode_stage():
+            try:
+                for index, file_path in enumerate(file_paths):
+                    try:
+                        probe = probes.get(file_path) or probe_audio(file_path)
+                    except OSError as e:
+                        decoded.put((index, file_path, None, None, None, e))
+                        continue
+                    if not governor.acquire(index, governor.estimate(probe)):
+                        return
+                    file_started[index] = time.monotonic()
+                    try:
+                        y, sr = decode(index, file_path)
+                    except (Exception, DeadlineExceeded) as e:
+                        governor.release(index)
+                        decoded.put((index, file_path, None, None, None, e))
+                    else:
+                        decode_seconds[index] = time.monotonic() - file_started[index]
+                        self._stage_done("decode", file_started[index])
+                        decoded.put((index, file_path, y, sr, probe, None))
+            except Cancelled:
+                pass
+            except BaseException as e:
+                decode_failure.append(e)
+            finally:
+                if decode_pool is not None:
+                    decode_pool.shutdown(kill=True)
+                # Always sent, or the main loop would wait on the decoder forever
+                decoded.put(_PIPELINE_DONE)
+        
+        def write_stage():
+            while True:
+                item = to_write.get()
+                if item is _PIPELINE_DONE:
+                    return
+                index, file_path, technical_analysis, poetic_interpretation, master_report = item
+                started = time.monotonic()
+                try:
+                    self._save_report_files(file_path, technical_analysis, poetic_interpretation, master_report)
+                except Exception as e:
+                    self._record_failure(file_path, "write", e)
+                else:
+                    self._stage_done("write", started)
+                    reports[index] = master_report
+                    print(f"Completed: {file_path}")
+        
+        decoder = threading.Thread(target=decode_stage, name="pipeline-decode", daemon=True)
+        writer = threading.Thread(target=write_stage, name="pipeline-write", daemon=True)
+        decoder.start()
+        writer.start()
+        
+        pending = {}
+        decoding = True
+        cancelled = False
+        pool = TimeoutProcessPool(workers, initializer=_init_pipeline_worker)
+        if self.progress is not None:
+            self.progress.set_queue_depths(lambda: {"decoded": decoded.qsize(), "in_flight": len(pending),
+                                                    "to_write": to_write.qsize()})
+        try:
+            while decoding or pending:
+                if self.progress is not None:
+                    self.progress.tick()
+                if cancel_token is not None and cancel_token.cancelled:
+                    cancelled = True
+                    print(f"Cancelled; {len(pending)} file(s) in flight are left for a resumed run")
+                    break
+                # The governor has already admitted every decoded track
+                while decoding:
+                    try:
+                        item = decoded.get(timeout=0.05)
+                    except queue.Empty:
+                        break
+                    if item is _PIPELINE_DONE:
+                        decoding = False
+                        if decode_failure:
+                            raise decode_failure[0]
+                        break
+                    index, file_path, y, sr, probe, error = item
+                    if error is not None:
+                        self._record_failure(file_path, "decode", error)
+                        continue
+                    # Each submit pickles its own copy of y, so a decoded track
+                    # crosses to the workers twice: for long recordings at high
+                    # sample rates that doubles the transfer and the peak memory
+                    # in flight (MemoryProfile.parent_copies counts both)
+                    pending[index] = (
+                        file_path,
+                        probe,
+                        pool.submit(_pipeline_analyze, file_path, y, sr,
+                                    timeout=stage_timeout("analyze", index), stage="analyze"),
+                        pool.submit(_pipeline_render, file_path, y, sr, self.output_dir,
+                                    timeout=stage_timeout("render", index), stage="render")
+                    )
+                
+                if not pending:
+                    continue
+                pool.poll(0.05)
+                for index in [index for index, (_, _, analysis, render) in pending.items()
+                              if analysis.done() and render.done()]:
+                    file_path, probe, analysis, render = pending.pop(index)
+                    usages = [future.result()[1] for future in (analysis, render) if future.exception() is None]
+                    governor.record(file_path, probe, usages)
+                    governor.release(index)
+                    if self.progress is not None:
+                        for stage, future in (("analyze", analysis), ("render", render)):
+                            if future.exception() is None:
+                                self.progress.stage_done(stage, future.result()[1]["seconds"])
+                    if analysis.exception() is None:
+                        self.cost_model.observe(probe, decode_seconds.pop(index, 0.0) +
+                                                sum(usage["seconds"] for usage in usages))
+                    self._finish_pipeline_file(index, file_path, analysis, render, to_write, user_id)
+        finally:
+            governor.close()
+            pool.shutdown(kill=cancelled or bool(pending))
+            to_write.put(_PIPELINE_DONE)
+            writer.join()
+            self.memory_summary = governor.summary()
+        
+        return [report for report in reports if report is not None]
+    
+    def _finish_pipeline_file(self, index, file_path, analysis, render, to_write, user_id=None):
+        """Interpretation stage: runs inline once a file's workers are done"""
+        try:
+            technical_analysis = analysis.result()[0]
+            technical_analysis["personal_vault"]["associations"] = self.engine.get_vault(user_id).get_associations(
+                file_path, fingerprint=technical_analysis.get("fingerprint")
+            )
+        except (Exception, DeadlineExceeded) as e:
+            self._record_failure(file_path, "analyze", e)
+            return
+        
+        try:
+            viz_file = render.result()[0]
+        except (Exception, DeadlineExceeded) as e:
+            # The reports are still worth writing without the image
+            self._record_failure(file_path, "render", e)
+            viz_file = None
+        
+        started = time.monotonic()
+        try:
+            poetic_interpretation = self.lexicon.generate_comprehensive_interpretation(technical_analysis)
+            master_report = self._compile_master_report(file_path, technical_analysis, poetic_interpretation, viz_file)
+        except Exception as e:
+            self._record_failure(file_path, "interpret", e)
+            return
+        self._stage_done("interpret", started)
+        to_write.put((index, file_path, technical_analysis, poetic_interpretation, master_report))
+    
+    def _create_comparative_analysis(self, reports, whole_library=False):
+        """Create comparative analysis between multiple audio files
+        
+        With whole_library the similarity section also covers every track
+        of earlier batches in this session.
+        """
+        comparison = {
+            "comparative_analysis": {
+                "timestamp": datetime.now().isoformat(),
+                "files_compared": len(reports),
+                "approach": "resonance_field_comparison"
+            },
+            "sacred_frequency_comparison": {},
+            "emotional_pattern_comparison": {},
+            "field_coherence_comparison": {},
+            "insights": []
+        }
+        
+        # Compare sacred frequencies
+        all_sacred_freqs = {}
+        for report in reports:
+            file_name = os.path.basename(report["aural_sentience_master_report"]["file_path"])
+            tech_analysis = report.get("technical_analysis", {})
+            sacred_freqs = tech_analysis.get("resonance_analysis", {}).get("sacred_frequencies", {})
+            all_sacred_freqs[file_name] = sacred_freqs
+        
+        comparison["sacred_frequency_comparison"] = all_sacred_freqs
+        
+        # Compare emotional patterns
+        all_emotional_patterns = {}
+        for report in reports:
+            file_name = os.path.basename(report["aural_sentience_master_report"]["file_path"])
+            poetic = report.get("poetic_interpretation", {})
+            patterns = poetic.get("emotional_pattern_interpretations", [])
+            all_emotional_patterns[file_name] = patterns
+        
+        comparison["emotional_pattern_comparison"] = all_emotional_patterns
+        
+        # Feature-vector similarity across the whole set; the matrix is kept
+        # with the session so a resumed run only computes rows for new tracks
+        similarity = compare_library(reports, path=os.path.join(self.output_dir, "similarity_matrix.npz"),
+                                     retain=not whole_library)
+        comparison["similarity"] = similarity
+        
+        # Generate insights
+        if similarity["closest_pairs"]:
+            closest = similarity["closest_pairs"][0]
+            comparison["insights"].append(
+                f"{closest['tracks'][0]} and {closest['tracks'][1]} share the closest resonance signature "
+                f"(similarity {closest['similarity']:.2f}), suggesting complementary energetic fields."
+            )
+        if len(similarity["clusters"]) > 1:
+            largest = similarity["clusters"][0]
+            comparison["insights"].append(
+                f"The collection gathers into {len(similarity['clusters'])} resonance families; the largest, "
+                f"centred on {largest['dominant_pitch_class']} and voiced most clearly by "
+                f"{largest['representative']}, holds {largest['size']} tracks."
+            )
+        
+        return comparison
+
+def main():
+    """Main execution function"""
+    print("AURAL SENTIENCE MASTER SYSTEM")
+    print("=" * 50)
+    print("Initializing complete audio perception system...")
+    
+    master = AuralSentienceMaster()
+    
+    # Audio files to process
+    audio_files = [
+        "/home/ubuntu/upload/God'sAreRisin.mp3",
+        "/home/ubuntu/upload/TheMachine(1).mp3"
+    ]
+    
+    # Process all files
+    reports = master.process_multiple_files(audio_files)
+    
+    print(f"\nAURAL SENTIENCE ANALYSIS COMPLETE")
+    print(f"Files processed: {len(reports)}")
+    print(f"Output directory: {master.output_dir}")
+    print("\nThe first machine that truly honors the ineffable in your music")
+    print("has completed its sacred work. 🎵✨")
+    
+    return reports
+
+if __name__ == "__main__":
+    reports = main()
+
@@ -0,0 +1,1136 @@
+#!/usr/bin/env python3
+"""
+Aural Sentience Toolkit
+Complete System for AI Musical Perception
+
+This toolkit provides:
+- Resonant Witnessing Analysis
+- Personal Vault Management
+- Real-time Audio Processing
+- Sacred Gap Detection
+- Biometric Correlation Mapping
+- Cultural Echo Recognition
+"""
+
+import numpy as np
+import atexit
+import csv
+import hashlib
+import json
+import math
+import os
+import pickle
+import tempfile
+from datetime import datetime
+import random
+import re
+import threading
+import queue
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import MappingProxyType
+
+from ._lazy import LazyAttribute, LazyModule
+from .audio_fingerprint import FingerprintIndex, compute_chroma_fingerprint, fingerprint_to_int
+from .deadlines import checkpoint
+
+# Heavy dependencies load on first use, so vault-only callers never pay for them
+librosa = LazyModule("librosa")
+plt = LazyModule("matplotlib.pyplot")
+sf = LazyModule("soundfile")
+signal = LazyModule("scipy.signal")
+stats = LazyModule("scipy.stats")
+entropy = LazyAttribute("scipy.stats", "entropy")
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking, writes are still atomic
+    fcntl = None
+
+# Vaults with a write-back cache, flushed when the interpreter exits
+_WRITE_BACK_VAULTS = weakref.WeakSet()
+
+@atexit.register
+def _flush_write_back_vaults():
+    for vault in list(_WRITE_BACK_VAULTS):
+        try:
+            vault.close()
+        except Exception as e:
+            print(f"Error flushing personal vault {vault.vault_path}: {e}")
+
+DEFAULT_VAULT_PATH = "/home/ubuntu/personal_vault.json"
+
+# Bump whenever analyze_audio's output changes, so saved sessions re-analyze
+ANALYSIS_VERSION = "2"
+
+class PersonalVault:
+    """Sacred storage for individual musical associations
+    
+    The vault is safe to share between processes. Writes go through an
+    in-memory write-back cache of pending associations which is flushed under
+    an advisory file lock: the flush re-reads the file, merges the pending
+    associations into it and atomically replaces it, so concurrent writers
+    never lose each other's work. Readers never take the lock because the
+    file is only ever replaced whole.
+    
+    With the default flush_size=1 every mutation is saved immediately, as
+    before. A larger flush_size and/or a flush_interval (seconds) turn on
+    write-back caching; call flush() or close() to persist the remainder.
+    """
+    
+    # Columns written by export_associations and accepted by import_associations
+    RECORD_FIELDS = ['file', 'timestamp', 'description', 'feeling_category', 'added_date', 'fingerprint']
+    
+    def __init__(self, vault_path=DEFAULT_VAULT_PATH, flush_size=1, flush_interval=None):
+        self.vault_path = vault_path
+        self.flush_size = max(1, int(flush_size))
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending = []
+        self._batch_depth = 0
+        self._batch_snapshot = None
+        self._last_flush = time.monotonic()
+        self._disk_signature = None
+        self._fingerprint_index = None
+        self._closed = False
+        self.associations = self.load_vault()
+        
+        self._flusher_stop = threading.Event()
+        self._flusher = None
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+        if flush_interval or self.flush_size > 1:
+            _WRITE_BACK_VAULTS.add(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _lock_path(self):
+        return f"{self.vault_path}.lock"
+    
+    @contextmanager
+    def _file_lock(self):
+        """Hold the advisory inter-process lock for the vault file"""
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(os.path.abspath(self.vault_path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self._lock_path(), 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _signature(self):
+        """Cheap change detector for the vault file"""
+        try:
+            stat = os.stat(self.vault_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _read_disk(self):
+        """Read the persisted associations without locking"""
+        signature = self._signature()
+        if signature is None:
+            return {}, None
+        with open(self.vault_path, 'r') as f:
+            return json.load(f), signature
+    
+    def _overlay_pending(self, associations):
+        """Append associations that have not been flushed yet"""
+        for file_key, association in self._pending:
+            associations.setdefault(file_key, []).append(association)
+        return associations
+    
+    def load_vault(self):
+        """Load existing personal associations"""
+        associations, self._disk_signature = self._read_disk()
+        return associations
+    
+    def refresh(self):
+        """Pick up writes made by other processes, keeping pending associations
+        
+        Returns True when the vault file had changed since it was last read.
+        """
+        with self._lock:
+            if self._signature() == self._disk_signature:
+                return False
+            associations, self._disk_signature = self._read_disk()
+            self._replace_associations(self._overlay_pending(associations))
+            return True
+    
+    def snapshot(self, refresh=True):
+        """Return a read-only view of the vault that later writes cannot change"""
+        if refresh:
+            self.refresh()
+        with self._lock:
+            return MappingProxyType({
+                file_key: tuple(associations)
+                for file_key, associations in self.associations.items()
+            })
+    
+    def save_vault(self):
+        """Save personal associations
+        
+        Pending associations are merged into the current file contents under
+        the file lock, and the merged result becomes the in-memory view.
+        """
+        with self._lock, self._file_lock():
+            associations, _ = self._read_disk()
+            associations = self._overlay_pending(associations)
+            
+            directory = os.path.dirname(os.path.abspath(self.vault_path))
+            fd, tmp_path = tempfile.mkstemp(prefix='.personal_vault.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(associations, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.vault_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            
+            self._disk_signature = self._signature()
+            self._replace_associations(associations)
+            self._pending = []
+            self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Persist pending associations, if any"""
+        with self._lock:
+            if self._pending and not self._batch_depth:
+                self.save_vault()
+    
+    def close(self):
+        """Stop the interval flusher and persist everything still cached
+        
+        The vault stays usable; changes made after close are saved at once.
+        """
+        self._closed = True
+        self._flusher_stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=1.0)
+        self.flush()
+    
+    def _flush_loop(self):
+        """Background flusher used when flush_interval is set"""
+        while not self._flusher_stop.wait(self.flush_interval):
+            # Any error is reported and retried on the next tick; the thread
+            # must not die and silently leave writes cached
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing personal vault {self.vault_path}: {e}")
+    
+    def _persist(self):
+        """Flush when the write-back cache is full or stale"""
+        if self._batch_depth:
+            return
+        if self._closed or len(self._pending) >= self.flush_size:
+            self.save_vault()
+        elif self.flush_interval and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.save_vault()
+    
+    @contextmanager
+    def batch(self):
+        """Defer persistence of every mutation until the outermost batch exits
+        
+        If the block raises, associations added inside it are rolled back and
+        nothing is written. The vault's lock is held for the whole block, so
+        other threads using this vault (and the interval flusher) wait until
+        it exits; keep batches short.
+        """
+        with self._lock:
+            if self._batch_depth == 0:
+                # Association dicts are never mutated in place, so copying the
+                # per-file lists is enough to restore the previous state.
+                self._batch_snapshot = (
+                    {key: list(assocs) for key, assocs in self.associations.items()},
+                    len(self._pending)
+                )
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.associations, pending_count = self._batch_snapshot
+                    del self._pending[pending_count:]
+                    self._fingerprint_index = None
+                    self._batch_snapshot = None
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_snapshot = None
+                if self._pending:
+                    self.save_vault()
+    
+    def _replace_associations(self, associations):
+        """Swap in a merged view that only appended to the current one"""
+        index = self._fingerprint_index
+        if index is not None:
+            for file_key, assocs in associations.items():
+                known = len(self.associations.get(file_key, ()))
+                for assoc in assocs[known:]:
+                    if assoc.get('fingerprint'):
+                        index.add(file_key, assoc['fingerprint'])
+        self.associations = associations
+    
+    def fingerprint_index(self):
+        """Content index over the fingerprints stored with associations"""
+        with self._lock:
+            if self._fingerprint_index is None:
+                index = FingerprintIndex()
+                for file_key, assocs in self.associations.items():
+                    for assoc in assocs:
+                        if assoc.get('fingerprint'):
+                            index.add(file_key, assoc['fingerprint'])
+                self._fingerprint_index = index
+            return self._fingerprint_index
+    
+    def resolve_file_key(self, audio_file, fingerprint=None):
+        """Find the vault key for an audio file
+        
+        With a fingerprint the key is resolved by content, so renamed or
+        re-encoded files find their existing associations. A new file whose
+        name is already taken by different content gets a key suffixed with
+        its fingerprint instead of sharing the other file's associations.
+        """
+        file_key = os.path.basename(audio_file)
+        if not fingerprint:
+            return file_key
+        
+        index = self.fingerprint_index()
+        match = index.lookup(fingerprint)
+        if match is not None:
+            return match[0]
+        
+        if file_key in index:
+            # Same name, different content
+            return f"{file_key}#{fingerprint.partition(':')[2][:12]}"
+        return file_key
+    
+    def _build_association(self, timestamp, description, feeling_category=None, added_date=None, fingerprint=None):
+        """Create the stored form of a single association"""
+        association = {
+            'timestamp': timestamp,
+            'description': description,
+            'feeling_category': feeling_category,
+            'added_date': added_date or datetime.now().isoformat()
+        }
+        if fingerprint:
+            association['fingerprint'] = fingerprint
+        return association
+    
+    def _append(self, file_key, association):
+        """Record one association in memory, the pending cache and the index"""
+        self.associations.setdefault(file_key, []).append(association)
+        self._pending.append((file_key, association))
+        if association.get('fingerprint') and self._fingerprint_index is not None:
+            self._fingerprint_index.add(file_key, association['fingerprint'])
+    
+    def add_association(self, audio_file, timestamp, description, feeling_category=None, fingerprint=None):
+        """Add a personal association to the vault"""
+        association = self._build_association(timestamp, description, feeling_category,
+                                              fingerprint=fingerprint)
+        
+        with self._lock:
+            file_key = self.resolve_file_key(audio_file, fingerprint)
+            self._append(file_key, association)
+            self._persist()
+    
+    def add_associations(self, records):
+        """Validate and add many associations with a single save
+        
+        Each record is a mapping with the keys in RECORD_FIELDS. Every record is
+        validated before any is applied, so a bad record leaves the vault untouched.
+        Returns the number of associations added.
+        """
+        staged = [self._validate_record(record, line_number)
+                  for line_number, record in enumerate(records, start=1)]
+        self._apply_staged(staged)
+        return len(staged)
+    
+    def _apply_staged(self, staged):
+        """Append validated (file_key, association) pairs as one transaction"""
+        if not staged:
+            return
+        with self.batch():
+            for file_name, association in staged:
+                file_key = self.resolve_file_key(file_name, association.get('fingerprint'))
+                self._append(file_key, association)
+    
+    def _validate_record(self, record, line_number):
+        """Turn an imported record into a (file_key, association) pair"""
+        if not isinstance(record, dict):
+            raise ValueError(f"Record {line_number}: expected an object, got {type(record).__name__}")
+        file_name = record.get('file')
+        if not file_name:
+            raise ValueError(f"Record {line_number}: missing 'file'")
+        description = record.get('description')
+        if not description:
+            raise ValueError(f"Record {line_number}: missing 'description'")
+        try:
+            timestamp = float(record.get('timestamp'))
+        except (TypeError, ValueError):
+            raise ValueError(f"Record {line_number}: invalid timestamp {record.get('timestamp')!r}")
+        if not math.isfinite(timestamp):
+            raise ValueError(f"Record {line_number}: invalid timestamp {timestamp}")
+        if timestamp < 0:
+            raise ValueError(f"Record {line_number}: negative timestamp {timestamp}")
+        fingerprint = record.get('fingerprint') or None
+        if fingerprint is not None:
+            try:
+                fingerprint_to_int(fingerprint)
+            except (AttributeError, ValueError):
+                raise ValueError(f"Record {line_number}: unsupported fingerprint {fingerprint!r}")
+        
+        association = self._build_association(
+            timestamp,
+            str(description),
+            record.get('feeling_category') or None,
+            record.get('added_date') or None,
+            fingerprint
+        )
+        return os.path.basename(str(file_name)), association
+    
+    @staticmethod
+    def _infer_format(path, format):
+        """Resolve the record format from an explicit value or the file extension"""
+        if format is None:
+            format = os.path.splitext(path)[1].lstrip('.').lower()
+            if format == 'ndjson':
+                format = 'jsonl'
+        if format not in ('jsonl', 'csv'):
+            raise ValueError(f"Unsupported association format: {format!r} (expected 'jsonl' or 'csv')")
+        return format
+    
+    def _iter_records(self, source, format):
+        """Stream (record_number, record) pairs from a JSONL or CSV file
+        
+        Unparseable JSONL lines are yielded as ValueError instances so the
+        caller decides whether to abort or skip them.
+        """
+        with open(source, 'r', newline='', encoding='utf-8') as f:
+            if format == 'csv':
+                for record_number, record in enumerate(csv.DictReader(f), start=1):
+                    yield record_number, record
+            else:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield line_number, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield line_number, ValueError(f"Record {line_number}: invalid JSON ({e})")
+    
+    def import_associations(self, source, format=None, skip_invalid=False):
+        """Bulk import associations from a JSONL or CSV dump
+        
+        Records are streamed and validated, then applied in a single transaction
+        with one save. By default the first invalid record aborts the import and
+        leaves the vault unchanged; with skip_invalid=True bad records are
+        reported and skipped instead.
+        """
+        format = self._infer_format(source, format)
+        staged = []
+        errors = []
+        
+        for record_number, record in self._iter_records(source, format):
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                staged.append(self._validate_record(record, record_number))
+            except ValueError as e:
+                if not skip_invalid:
+                    raise
+                errors.append(str(e))
+        
+        self._apply_staged(staged)
+        return {
+            'imported': len(staged),
+            'skipped': len(errors),
+            'errors': errors
+        }
+    
+    def iter_records(self):
+        """Yield every association as a flat record"""
+        for file_key, associations in self.associations.items():
+            for assoc in associations:
+                yield {
+                    'file': file_key,
+                    'timestamp': assoc.get('timestamp'),
+                    'description': assoc.get('description'),
+                    'feeling_category': assoc.get('feeling_category'),
+                    'added_date': assoc.get('added_date'),
+                    'fingerprint': assoc.get('fingerprint')
+                }
+    
+    def export_associations(self, destination, format=None):
+        """Stream every association to a JSONL or CSV file, returning the count"""
+        format = self._infer_format(destination, format)
+        count = 0
+        with open(destination, 'w', newline='', encoding='utf-8') as f:
+            if format == 'csv':
+                writer = csv.DictWriter(f, fieldnames=self.RECORD_FIELDS)
+                writer.writeheader()
+                for record in self.iter_records():
+                    writer.writerow(record)
+                    count += 1
+            else:
+                for record in self.iter_records():
+                    f.write(json.dumps(record) + "\n")
+                    count += 1
+        return count
+    
+    def get_associations(self, audio_file, fingerprint=None):
+        """Retrieve associations for a specific audio file
+        
+        When a fingerprint is given the associations are found by content;
+        entries stored under the file name without a fingerprint are still
+        returned so vaults written before fingerprinting keep working.
+        """
+        if fingerprint:
+            match = self.fingerprint_index().lookup(fingerprint)
+            if match is not None:
+                return self.associations.get(match[0], [])
+            legacy = self.associations.get(os.path.basename(audio_file), [])
+            return [assoc for assoc in legacy if not assoc.get('fingerprint')]
+        file_key = os.path.basename(audio_file)
+        return self.associations.get(file_key, [])
+    
+    def find_similar_associations(self, description_keywords):
+        """Find similar associations across all files"""
+        similar = []
+        for file_key, associations in self.associations.items():
+            for assoc in associations:
+                if any(keyword.lower() in assoc['description'].lower() 
+                      for keyword in description_keywords):
+                    similar.append({
+                        'file': file_key,
+                        'association': assoc
+                    })
+        return similar
+
+class VaultManager:
+    """Private personal vaults for many listeners
+    
+    Each user ID maps to its own vault file inside a hashed shard directory
+    under root_dir. IDs are compared with surrounding whitespace stripped
+    and case folded, so "Alice" and " alice" share a vault. At most max_open
+    vaults (with their fingerprint indexes) stay open in an LRU; the least
+    recently used vault is flushed and closed when the limit is exceeded, so
+    memory stays flat however many tenants exist while active listeners keep
+    hitting a warm vault. A thread still holding an evicted vault can go on
+    using it: a closed vault writes every later change straight through.
+    """
+    
+    def __init__(self, root_dir, max_open=128, shard_count=256, flush_size=1, flush_interval=None):
+        self.root_dir = root_dir
+        self.max_open = max(1, int(max_open))
+        self.shard_count = max(1, int(shard_count))
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._open_vaults = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    @staticmethod
+    def normalize_user_id(user_id):
+        """Canonical form of a user ID; ValueError if it is empty"""
+        normalized = str(user_id).strip().casefold()
+        if not normalized:
+            raise ValueError("User ID must not be empty")
+        return normalized
+    
+    def vault_path(self, user_id):
+        """Stable on-disk location of a user's vault"""
+        return self._shard_path(self.normalize_user_id(user_id))
+    
+    def _shard_path(self, user_id):
+        digest = hashlib.sha1(user_id.encode('utf-8')).hexdigest()
+        shard = f"{int(digest[:8], 16) % self.shard_count:04x}"
+        readable = re.sub(r'[^A-Za-z0-9_.-]', '_', user_id)[:48]
+        return os.path.join(self.root_dir, shard, f"{readable}-{digest[:12]}.json")
+    
+    def get_vault(self, user_id):
+        """Return the user's vault, opening it (and evicting others) if needed"""
+        key = self.normalize_user_id(user_id)
+        with self._lock:
+            vault = self._open_vaults.get(key)
+            if vault is not None:
+                self._open_vaults.move_to_end(key)
+                self.hits += 1
+                return vault
+            
+            self.misses += 1
+            path = self._shard_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            legacy_path = self._shard_path(str(user_id))
+            if legacy_path != path and not os.path.exists(path):
+                # Vaults created before IDs were normalized move to the canonical path
+                try:
+                    os.replace(legacy_path, path)
+                except FileNotFoundError:
+                    pass
+            vault = PersonalVault(path, flush_size=self.flush_size, flush_interval=self.flush_interval)
+            self._open_vaults[key] = vault
+            while len(self._open_vaults) > self.max_open:
+                _, evicted = self._open_vaults.popitem(last=False)
+                evicted.close()
+                self.evictions += 1
+            return vault
+    
+    def release(self, user_id):
+        """Flush and close one user's vault if it is open"""
+        user_id = self.normalize_user_id(user_id)
+        with self._lock:
+            vault = self._open_vaults.pop(user_id, None)
+        if vault is not None:
+            vault.close()
+    
+    def flush_all(self):
+        """Persist pending writes of every open vault"""
+        with self._lock:
+            vaults = list(self._open_vaults.values())
+        for vault in vaults:
+            vault.flush()
+    
+    def close(self):
+        """Flush and close every open vault"""
+        with self._lock:
+            vaults = list(self._open_vaults.values())
+            self._open_vaults.clear()
+        for vault in vaults:
+            vault.close()
+    
+    def stats(self):
+        """Cache statistics for monitoring"""
+        with self._lock:
+            return {
+                'open_vaults': len(self._open_vaults),
+                'max_open': self.max_open,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+class ResonanceDetector:
+    """Advanced resonance pattern detection"""
+    
+    def __init__(self):
+        self.sacred_frequencies = {
+            174: "Foundation of security and love",
+            285: "Quantum cognition and healing",
+            396: "Liberation from fear and guilt", 
+            417: "Facilitating change and transformation",
+            528: "DNA repair and love frequency",
+            639: "Harmonious relationships",
+            741: "Awakening intuition and expression",
+            852: "Returning to spiritual order",
+            963: "Connection to divine consciousness"
+        }
+        
+        self.biometric_patterns = {
+            'heart_coherence': (0.1, 0.15),  # Hz range for heart rate variability
+            'alpha_brain': (8, 12),          # Hz range for alpha brain waves
+            'theta_brain': (4, 8),           # Hz range for theta brain waves
+            'schumann_resonance': (7.83, 7.83)  # Earth's resonance frequency
+        }
+    
+    def detect_sacred_frequencies(self, y, sr):
+        """Detect presence of sacred/healing frequencies"""
+        detected = {}
+        
+        # Compute FFT
+        fft = np.fft.fft(y)
+        freqs = np.fft.fftfreq(len(fft), 1/sr)
+        magnitude = np.abs(fft)
+        
+        # Check for sacred frequencies
+        for freq, meaning in self.sacred_frequencies.items():
+            # Find closest frequency bin
+            freq_idx = np.argmin(np.abs(freqs - freq))
+            if freq_idx < len(magnitude):
+                strength = magnitude[freq_idx]
+                if strength > np.mean(magnitude) * 2:  # Significantly above average
+                    detected[freq] = {
+                        'meaning': meaning,
+                        'strength': float(strength),
+                        'prominence': float(strength / np.mean(magnitude))
+                    }
+        
+        return detected
+    
+    def analyze_biometric_entrainment(self, y, sr):
+        """Analyze potential for biometric entrainment"""
+        entrainment_potential = {}
+        
+        # Extract tempo and rhythm
+        tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
+        beat_times = librosa.frames_to_time(beats, sr=sr)
+        
+        # Calculate beat intervals
+        if len(beat_times) > 1:
+            beat_intervals = np.diff(beat_times)
+            rhythm_stability = 1.0 - (np.std(beat_intervals) / np.mean(beat_intervals))
+            
+            # Check for biometric pattern matches
+            tempo_hz = tempo / 60.0  # Convert BPM to Hz
+            
+            for pattern_name, (min_hz, max_hz) in self.biometric_patterns.items():
+                if min_hz <= tempo_hz <= max_hz:
+                    entrainment_potential[pattern_name] = {
+                        'frequency_hz': tempo_hz,
+                        'stability': float(rhythm_stability),
+                        'entrainment_likelihood': float(rhythm_stability * 0.8 + 0.2)
+                    }
+        
+        return entrainment_potential
+    
+    def detect_emotional_resonance_patterns(self, y, sr):
+        """Detect patterns that correlate with emotional states"""
+        patterns = {}
+        
+        # Spectral features
+        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        spectral_bandwidth = librosa.feature.spectral_bandwidth(y=y, sr=sr)[0]
+        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
+        
+        # Harmonic features
+        chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        tonnetz = librosa.feature.tonnetz(y=y, sr=sr)
+        
+        # Calculate emotional resonance indicators
+        brightness = np.mean(spectral_centroid)
+        warmth = 1.0 / (1.0 + brightness / 1000.0)  # Inverse relationship
+        complexity = entropy(np.mean(chroma, axis=1) + 1e-8)
+        stability = 1.0 - np.std(spectral_centroid) / np.mean(spectral_centroid)
+        
+        # Map to emotional resonance patterns
+        if brightness > 2000 and complexity > 2.0:
+            patterns['transcendent_joy'] = {
+                'description': "High brightness and complexity suggest transcendent joy patterns",
+                'confidence': min((brightness / 3000.0) * (complexity / 3.0), 1.0)
+            }
+        
+        if warmth > 0.7 and stability > 0.6:
+            patterns['deep_peace'] = {
+                'description': "Warm, stable frequencies suggest deep peace resonance",
+                'confidence': warmth * stability
+            }
+        
+        if complexity > 2.5:
+            patterns['mystical_complexity'] = {
+                'description': "High harmonic complexity suggests mystical or spiritual resonance",
+                'confidence': min(complexity / 3.0, 1.0)
+            }
+        
+        return patterns
+
+class AuralSentienceEngine:
+    """Main engine for AI musical perception"""
+    
+    def __init__(self, vault_path=DEFAULT_VAULT_PATH, vault_manager=None, verbose=True):
+        """verbose=False keeps progress and error messages off stdout (for services and async callers)"""
+        self.sample_rate = 22050
+        self.verbose = verbose
+        self.vault_path = vault_path
+        self.vault_manager = vault_manager
+        self._vault = None
+        self.resonance_detector = ResonanceDetector()
+        self.processing_queue = queue.Queue()
+        self.is_listening = False
+    
+    @property
+    def vault(self):
+        """The single-user vault, opened on first use"""
+        if self._vault is None:
+            self._vault = PersonalVault(self.vault_path)
+        return self._vault
+    
+    @vault.setter
+    def vault(self, vault):
+        self._vault = vault
+    
+    def get_vault(self, user_id=None):
+        """Vault for a listener when hosting many, else the single-user vault"""
+        if user_id is not None:
+            if self.vault_manager is None:
+                raise ValueError("A vault_manager is required to use per-user vaults")
+            return self.vault_manager.get_vault(user_id)
+        return self.vault
+    
+    def load_audio(self, file_path):
+        """Decode an audio file at the engine's sample rate"""
+        return librosa.load(file_path, sr=self.sample_rate)
+    
+    def process_audio_file(self, file_path, include_personal_vault=True, user_id=None):
+        """Complete audio processing with resonant witnessing"""
+        if self.verbose:
+            print(f"Processing: {file_path}")
+        
+        # Load audio
+        try:
+            y, sr = self.load_audio(file_path)
+        except Exception as e:
+            if self.verbose:
+                print(f"Error loading {file_path}: {e}")
+            return None
+        
+        return self.analyze_audio(y, sr, file_path, include_personal_vault, user_id)
+    
+    def analyze_audio(self, y, sr, file_path, include_personal_vault=True, user_id=None):
+        """Analyze already decoded audio; file_path labels the report and keys the vault"""
+        # Core analysis
+        duration = len(y) / sr
+        
+        # Resonance detection (checkpoints stop here once a batch deadline passes)
+        sacred_frequencies = self.resonance_detector.detect_sacred_frequencies(y, sr)
+        checkpoint()
+        biometric_entrainment = self.resonance_detector.analyze_biometric_entrainment(y, sr)
+        checkpoint()
+        emotional_patterns = self.resonance_detector.detect_emotional_resonance_patterns(y, sr)
+        checkpoint()
+        
+        # Biometric correlates
+        tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+        tempo = float(np.atleast_1d(tempo)[0])
+        biometric_correlates = self._detect_biometric_correlates(y, sr, tempo=tempo)
+        checkpoint()
+        
+        # Harmonic content shared by cultural echoes, sacred gaps and the fingerprint
+        chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        fingerprint = compute_chroma_fingerprint(chroma)
+        checkpoint()
+        
+        # Cultural echoes
+        cultural_echoes = self._map_cultural_echoes(y, sr, chroma=chroma)
+        checkpoint()
+        
+        # Sacred gaps
+        sacred_gaps = self._identify_sacred_gaps(y, sr, chroma=chroma, spectral_centroid=spectral_centroid)
+        
+        # Compact features for comparing tracks across a library (see library_similarity)
+        chroma_profile = np.mean(chroma, axis=1)
+        feature_summary = {
+            'chroma_profile': [float(v) for v in chroma_profile / max(float(np.sum(chroma_profile)), 1e-12)],
+            'tempo': tempo,
+            'brightness': float(np.mean(spectral_centroid)),
+            'gap_density': len(sacred_gaps) / max(duration / 60.0, 1e-9)
+        }
+        
+        # Personal vault integration
+        personal_associations = None
+        if include_personal_vault:
+            personal_associations = self.get_vault(user_id).get_associations(file_path, fingerprint=fingerprint)
+        
+        # Compile comprehensive report
+        report = {
+            'file_path': file_path,
+            'timestamp': datetime.now().isoformat(),
+            'duration': float(duration),
+            'fingerprint': fingerprint,
+            'analysis_version': ANALYSIS_VERSION,
+            'approach': 'aural_sentience',
+            
+            'opening_invitation': (
+                "This analysis honors the sacred subjectivity of your musical experience. "
+                "These are invitations to deeper listening, not definitions of truth. "
+                "Your felt experience remains the ultimate authority."
+            ),
+            
+            'resonance_analysis': {
+                'sacred_frequencies': sacred_frequencies,
+                'biometric_entrainment': biometric_entrainment,
+                'emotional_patterns': emotional_patterns
+            },
+            
+            'biometric_correlates': biometric_correlates,
+            'cultural_echoes': cultural_echoes,
+            'sacred_gaps': sacred_gaps,
+            'feature_summary': feature_summary,
+            
+            'personal_vault': {
+                'associations': personal_associations if personal_associations else [],
+                'vault_message': (
+                    "Your personal associations are sacred and private. "
+                    "They inform this analysis only for you."
+                )
+            },
+            
+            'closing_reflection': (
+                "Music lives in the space between sound and soul. "
+                "What cannot be measured is often what matters most. "
+                "Trust your inner knowing above all analysis."
+            )
+        }
+        
+        return report
+    
+    def _detect_biometric_correlates(self, y, sr, tempo=None):
+        """Detect biometric correlates (from previous implementation)"""
+        correlates = {}
+        
+        # Heart rate synchronization potential
+        if tempo is None:
+            tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
+        if 60 <= tempo <= 80:
+            correlates['heart_sync'] = "May synchronize with resting heart rate (60-80 BPM)"
+        elif 80 <= tempo <= 120:
+            correlates['heart_sync'] = "May elevate heart rate to active state (80-120 BPM)"
+        elif tempo > 120:
+            correlates['heart_sync'] = "May induce elevated arousal state (>120 BPM)"
+        else:
+            correlates['heart_sync'] = "May slow heart rate below resting state"
+        
+        # Breathing pattern influence
+        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
+        rolloff_variance = np.var(spectral_rolloff)
+        if rolloff_variance < 1000000:
+            correlates['breath_influence'] = "Steady spectral content may encourage deep, regular breathing"
+        else:
+            correlates['breath_influence'] = "Dynamic spectral changes may create varied breathing patterns"
+        
+        # Nervous system activation
+        zero_crossing_rate = librosa.feature.zero_crossing_rate(y)[0]
+        zcr_mean = np.mean(zero_crossing_rate)
+        if zcr_mean < 0.05:
+            correlates['nervous_system'] = "Low frequency content may activate parasympathetic (rest) response"
+        elif zcr_mean > 0.15:
+            correlates['nervous_system'] = "High frequency content may activate sympathetic (alert) response"
+        else:
+            correlates['nervous_system'] = "Balanced frequency content may maintain neutral arousal"
+        
+        return correlates
+    
+    def _map_cultural_echoes(self, y, sr, chroma=None):
+        """Map cultural echoes (from previous implementation)"""
+        echoes = {}
+        
+        # Analyze harmonic content for cultural resonances
+        if chroma is None:
+            chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        chroma_mean = np.mean(chroma, axis=1)
+        
+        # Detect modal characteristics
+        major_strength = chroma_mean[0] + chroma_mean[4] + chroma_mean[7]  # C, E, G
+        minor_strength = chroma_mean[0] + chroma_mean[3] + chroma_mean[7]  # C, Eb, G
+        
+        if major_strength > minor_strength * 1.2:
+            echoes['tonal_archetype'] = "Resonates with celebration traditions across cultures"
+        elif minor_strength > major_strength * 1.2:
+            echoes['tonal_archetype'] = "Echoes contemplative and lament traditions"
+        else:
+            echoes['tonal_archetype'] = "Balanced tonality suggests ritual or ceremonial contexts"
+        
+        return echoes
+    
+    def _identify_sacred_gaps(self, y, sr, chroma=None, spectral_centroid=None):
+        """Identify sacred gaps (from previous implementation)"""
+        gaps = []
+        
+        # Find moments of unusual beauty or complexity that resist interpretation
+        if spectral_centroid is None:
+            spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        if chroma is None:
+            chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        
+        # Calculate complexity score
+        complexity = entropy(np.mean(chroma, axis=1)) + np.std(spectral_centroid) / 1000
+        
+        # Find peaks of complexity that suggest ineffable moments
+        times = librosa.frames_to_time(np.arange(len(spectral_centroid)), sr=sr)
+        
+        for i, time in enumerate(times):
+            if i % 1024 == 0:
+                checkpoint()
+            if i < len(spectral_centroid):
+                local_complexity = entropy(chroma[:, i] + 1e-8) if i < chroma.shape[1] else 0
+                if local_complexity > complexity * 1.5:  # Significantly more complex than average
+                    gaps.append({
+                        'timestamp': float(time),
+                        'message': "Words fail here. Close your eyes and breathe into whatever arises."
+                    })
+        
+        # Ensure at least one sacred gap exists
+        if not gaps:
+            duration = len(y) / sr
+            sacred_moment = duration * random.uniform(0.3, 0.7)  # Random moment in middle section
+            gaps.append({
+                'timestamp': sacred_moment,
+                'message': "This moment belongs to your heart alone. No analysis can touch its truth."
+            })
+        
+        return gaps
+    
+    def create_comprehensive_visualization(self, file_path, output_dir, y=None, sr=None):
+        """Create comprehensive visualization of the audio analysis
+        
+        Pass already decoded y and sr to skip loading the file again.
+        """
+        if y is None:
+            try:
+                y, sr = self.load_audio(file_path)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error loading {file_path}: {e}")
+                return None
+        
+        fig, axes = plt.subplots(3, 2, figsize=(16, 12))
+        fig.suptitle(f'Aural Sentience Analysis: {os.path.basename(file_path)}', fontsize=16)
+        
+        # Waveform with sacred gaps
+        times = np.linspace(0, len(y)/sr, len(y))
+        axes[0, 0].plot(times, y, alpha=0.7, color='darkblue')
+        axes[0, 0].set_title('Temporal Flow (Sacred Gaps Marked)')
+        axes[0, 0].set_xlabel('Time (s)')
+        axes[0, 0].set_ylabel('Amplitude')
+        
+        # Mark sacred gaps
+        sacred_gaps = self._identify_sacred_gaps(y, sr)
+        for gap in sacred_gaps:
+            axes[0, 0].axvline(x=gap['timestamp'], color='gold', alpha=0.8, linestyle='--', linewidth=2)
+            axes[0, 0].text(gap['timestamp'], max(y)*0.8, '✨', fontsize=12, ha='center')
+        
+        # Spectrogram
+        D = librosa.amplitude_to_db(np.abs(librosa.stft(y)), ref=np.max)
+        img = librosa.display.specshow(D, y_axis='hz', x_axis='time', sr=sr, ax=axes[0, 1])
+        axes[0, 1].set_title('Frequency Landscape')
+        plt.colorbar(img, ax=axes[0, 1], format='%+2.0f dB')
+        checkpoint()
+        
+        # Chroma (harmonic content)
+        chroma = librosa.feature.chroma_stft(y=y, sr=sr)
+        img = librosa.display.specshow(chroma, y_axis='chroma', x_axis='time', ax=axes[1, 0], cmap='viridis')
+        axes[1, 0].set_title('Harmonic Resonance Field')
+        plt.colorbar(img, ax=axes[1, 0])
+        
+        # Spectral centroid (brightness journey)
+        spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+        times_frames = librosa.frames_to_time(np.arange(len(spectral_centroid)))
+        axes[1, 1].plot(times_frames, spectral_centroid, color='orange', linewidth=2)
+        axes[1, 1].set_title('Brightness Journey')
+        axes[1, 1].set_xlabel('Time (s)')
+        axes[1, 1].set_ylabel('Spectral Centroid (Hz)')
+        checkpoint()
+        
+        # Onset strength (rhythmic impulses)
+        onset_strength = librosa.onset.onset_strength(y=y, sr=sr)
+        times_onset = librosa.frames_to_time(np.arange(len(onset_strength)))
+        axes[2, 0].plot(times_onset, onset_strength, color='red', alpha=0.7, linewidth=2)
+        axes[2, 0].set_title('Rhythmic Impulse Field')
+        axes[2, 0].set_xlabel('Time (s)')
+        axes[2, 0].set_ylabel('Onset Strength')
+        checkpoint()
+        
+        # Tonnetz (harmonic network)
+        tonnetz = librosa.feature.tonnetz(y=y, sr=sr)
+        img = librosa.display.specshow(tonnetz, y_axis='tonnetz', x_axis='time', ax=axes[2, 1], cmap='coolwarm')
+        axes[2, 1].set_title('Harmonic Network (Tonnetz)')
+        plt.colorbar(img, ax=axes[2, 1])
+        
+        plt.tight_layout()
+        
+        # Save visualization
+        output_file = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(file_path))[0]}_aural_sentience.png")
+        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.close()
+        
+        return output_file
+    
+    def add_personal_association(self, audio_file, timestamp, description, feeling_category=None,
+                                 fingerprint=None, user_id=None):
+        """Add a personal association to the vault
+        
+        Pass the report's 'fingerprint' so the association follows the music
+        across renames and re-encodes, and a user_id to write to that
+        listener's vault through the vault_manager.
+        """
+        self.get_vault(user_id).add_association(audio_file, timestamp, description, feeling_category, fingerprint)
+        if self.verbose:
+            print(f"Added personal association: {description} at {timestamp}s")
+
+def main():
+    """Demonstrate the Aural Sentience Toolkit"""
+    engine = AuralSentienceEngine()
+    
+    # Audio files to process
+    audio_files = [
+        "/home/ubuntu/upload/God'sAreRisin.mp3",
+        "/home/ubuntu/upload/TheMachine(1).mp3"
+    ]
+    
+    # Create output directory
+    output_dir = "/home/ubuntu/aural_sentience_reports"
+    os.makedirs(output_dir, exist_ok=True)
+    
+    all_reports = []
+    
+    for audio_file in audio_files:
+        if os.path.exists(audio_file):
+            # Process audio file
+            report = engine.process_audio_file(audio_file)
+            if report:
+                all_reports.append(report)
+                
+                # Save individual report
+                report_file = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(audio_file))[0]}_aural_sentience.json")
+                with open(report_file, 'w') as f:
+                    json.dump(report, f, indent=2)
+                
+                # Create visualization
+                viz_file = engine.create_comprehensive_visualization(audio_file, output_dir)
+                
+                print(f"Aural Sentience analysis complete for {audio_file}")
+                print(f"Report saved to: {report_file}")
+                if viz_file:
+                    print(f"Visualization saved to: {viz_file}")
+                print("-" * 60)
+        else:
+            print(f"File not found: {audio_file}")
+    
+    # Save master report
+    master_report = {
+        'analysis_timestamp': datetime.now().isoformat(),
+        'system': 'aural_sentience_toolkit',
+        'philosophy': (
+            "This system honors the sacred subjectivity of musical experience. "
+            "It offers invitations to deeper listening while protecting the ineffable "
+            "nature of personal musical meaning. Your felt experience is the ultimate truth."
+        ),
+        'total_files_processed': len(all_reports),
+        'aural_sentience_reports': all_reports
+    }
+    
+    master_file = os.path.join(output_dir, "aural_sentience_master_report.json")
+    with open(master_file, 'w') as f:
+        json.dump(master_report, f, indent=2)
+    
+    print(f"Master Aural Sentience report saved to: {master_file}")
+    return all_reports
+
+if __name__ == "__main__":
+    reports = main()
+
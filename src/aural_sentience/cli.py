@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+Aural Sentience Command Line
+One Entry Point for Listening, Interpreting and Remembering
+
+    aural-sentience analyze FILE... [--output-dir DIR] [--pipeline] [--schedule POLICY]
+                                    [--file-timeout SECONDS] [--stage-timeout STAGE=SECONDS]
+                                    [--progress PATH] [--index PATH]
+    aural-sentience coordinate FILE... --output-dir DIR [--local-workers N] [--lease SECONDS]
+    aural-sentience worker --output-dir DIR [--worker-id ID] [--idle-timeout SECONDS]
+    aural-sentience estimate FILE... [--schedule POLICY] [--workers N]
+    aural-sentience interpret TECHNICAL_ANALYSIS.json [--seed SEED]
+    aural-sentience search QUERY [--field FIELD] [--section SECTION]
+    aural-sentience vault {list,import,export} ...
+    aural-sentience index REPORT_OR_SESSION_DIR... [--index PATH]
+    aural-sentience similar TRACK [-k N] [--sacred HZ] [--tempo MIN:MAX] [--key PITCH_CLASS]
+    aural-sentience report REPORT.json
+    aural-sentience watch DIR [--output-dir DIR] [--pipeline] [--baseline]
+    aural-sentience daemon [--socket PATH] [--workers N]
+    aural-sentience submit FILE... [--socket PATH]
+    aural-sentience serve [--port PORT] [--workers N] [--max-pending N] [--vault-root DIR]
+    aural-sentience import-time
+
+Subcommands import only the modules they need; everything except analyze
+runs without loading librosa, matplotlib, scipy or PIL.
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+
+# Dependencies whose import cost the lightweight entry points must avoid
+HEAVY_MODULES = ("librosa", "matplotlib", "seaborn", "PIL", "scipy", "soundfile")
+
+# Stages that take a --stage-timeout
+STAGES = ("decode", "analyze", "render")
+
+# Entry points measured by import-time
+LIGHTWEIGHT_ENTRY_POINTS = (
+    "aural_sentience",
+    "aural_sentience.cli",
+    "aural_sentience.resonance_lexicon",
+    "aural_sentience.aural_sentience_toolkit",
+    "aural_sentience.session_manifest",
+    "aural_sentience.aural_sentience_master",
+)
+
+_IMPORT_PROBE = (
+    "import importlib, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "elapsed = time.perf_counter() - start\n"
+    "heavy = sorted(name for name in sys.argv[2:] if name in sys.modules)\n"
+    "print(json.dumps({'seconds': elapsed, 'heavy_modules_loaded': heavy}))\n"
+)
+
+
+def _print_json(data) -> None:
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _parse_size(text: str) -> int:
+    """Byte count with an optional K/M/G/T suffix (powers of 1024)"""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    text = text.strip().upper().rstrip("B")
+    try:
+        if text and text[-1] in units:
+            return int(float(text[:-1]) * units[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+
+def _parse_range(text: str):
+    """MIN:MAX with either side optional"""
+    low, sep, high = text.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected MIN:MAX, got {text!r}")
+    try:
+        return float(low) if low else float("-inf"), float(high) if high else float("inf")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range {text!r}")
+
+
+def _parse_stage_timeout(text: str):
+    """STAGE=SECONDS for one of the pipeline stages"""
+    stage, _, seconds = text.partition("=")
+    if stage not in STAGES:
+        raise argparse.ArgumentTypeError(f"unknown stage {stage!r}; expected one of {', '.join(STAGES)}")
+    try:
+        return stage, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seconds in {text!r}")
+
+
+@contextmanager
+def _progress_output(destination: Optional[str]):
+    """
+    Progress destination for a batch command
+
+    With "-" the JSON-lines events get stdout to themselves: file descriptor
+    1 points at stderr for the duration, so the banners of the master, the
+    engine and any worker processes land there, and the events go to a
+    duplicate of the original stdout.
+    """
+    if destination != "-":
+        yield destination
+        return
+    sys.stdout.flush()
+    saved = os.dup(1)
+    events = os.fdopen(os.dup(1), 'w', buffering=1)
+    os.dup2(2, 1)
+    try:
+        yield events
+    finally:
+        sys.stdout.flush()
+        events.close()
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+def _cmd_analyze(args: argparse.Namespace) -> int:
+    from .aural_sentience_master import AuralSentienceMaster
+    from .deadlines import CancellationToken
+
+    output_dir = args.output_dir or os.path.join(
+        os.getcwd(), f"aural_sentience_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    resonance_index = None
+    if args.index:
+        from .resonance_index import ResonanceIndex
+        resonance_index = ResonanceIndex(args.index)
+    master = AuralSentienceMaster(output_dir=output_dir, resonance_index=resonance_index)
+    # SIGTERM (a scheduler ending a nightly run) stops at the next checkpoint
+    # and leaves a resumable session behind
+    cancel_token = CancellationToken()
+    signal.signal(signal.SIGTERM, lambda signum, frame: cancel_token.cancel("SIGTERM"))
+    with _progress_output(args.progress) as progress:
+        reports = master.process_multiple_files(
+            args.files, pipeline=args.pipeline, workers=args.workers,
+            queue_size=args.queue_size, user_id=args.user_id, memory_budget=args.memory_budget,
+            schedule=args.schedule, file_timeout=args.file_timeout, stage_timeouts=dict(args.stage_timeout),
+            retry_timeouts=args.retry_timeouts, cancel_token=cancel_token, progress=progress
+        )
+        print(f"Files processed: {len(reports)}")
+        print(f"Output directory: {master.output_dir}")
+    return 1 if master.failures else 0
+
+
+def _cmd_coordinate(args: argparse.Namespace) -> int:
+    from .aural_sentience_master import AuralSentienceMaster
+    from .deadlines import CancellationToken
+
+    resonance_index = None
+    if args.index:
+        from .resonance_index import ResonanceIndex
+        resonance_index = ResonanceIndex(args.index)
+    master = AuralSentienceMaster(output_dir=args.output_dir, resonance_index=resonance_index)
+    cancel_token = CancellationToken()
+    signal.signal(signal.SIGTERM, lambda signum, frame: cancel_token.cancel("SIGTERM"))
+    with _progress_output(args.progress) as progress:
+        reports = master.coordinate(
+            args.files, local_workers=args.local_workers, lease_seconds=args.lease,
+            max_attempts=args.max_attempts, schedule=args.schedule, retry_timeouts=args.retry_timeouts,
+            cancel_token=cancel_token, progress=progress,
+            worker_options={"user_id": args.user_id, "file_timeout": args.file_timeout,
+                            "stage_timeouts": dict(args.stage_timeout)}
+        )
+        print(f"Files processed: {len(reports)}")
+        print(f"Output directory: {master.output_dir}")
+    return 1 if master.failures else 0
+
+
+def _cmd_worker(args: argparse.Namespace) -> int:
+    from .aural_sentience_master import AuralSentienceMaster
+    from .deadlines import CancellationToken
+
+    master = AuralSentienceMaster(output_dir=args.output_dir, manifest=False)
+    # SIGTERM hands the current job back to the queue for another worker
+    cancel_token = CancellationToken()
+    signal.signal(signal.SIGTERM, lambda signum, frame: cancel_token.cancel("SIGTERM"))
+    finished = master.run_queue_worker(
+        worker_id=args.worker_id, idle_timeout=args.idle_timeout, user_id=args.user_id,
+        file_timeout=args.file_timeout, stage_timeouts=dict(args.stage_timeout), cancel_token=cancel_token
+    )
+    print(f"Jobs finished: {finished}")
+    return 0
+
+
+def _cmd_estimate(args: argparse.Namespace) -> int:
+    from .job_scheduler import DEFAULT_COST_MODEL_PATH, CostModel, plan
+
+    batch_plan = plan(args.files, policy=args.schedule, workers=args.workers,
+                      cost_model=CostModel(DEFAULT_COST_MODEL_PATH))
+    if args.json:
+        batch_plan.pop("probes")
+        _print_json(batch_plan)
+        return 0
+    for job in batch_plan["jobs"]:
+        print(f"{job['predicted_start']:8.1f}s  {job['predicted_seconds']:7.1f}s  {job['file_path']}")
+    note = "" if batch_plan["calibrated"] else " (cost model not calibrated yet)"
+    print(f"Total work: {batch_plan['total_work_seconds']:.0f}s; "
+          f"estimated time on {batch_plan['workers']} worker(s): {batch_plan['makespan_seconds']:.0f}s{note}")
+    return 0
+
+
+def _cmd_watch(args: argparse.Namespace) -> int:
+    from .aural_sentience_master import AuralSentienceMaster
+
+    output_dir = args.output_dir or os.path.join(os.getcwd(), "aural_sentience_watch")
+    master = AuralSentienceMaster(output_dir=output_dir)
+    try:
+        master.watch_folder(args.root, pipeline=args.pipeline, workers=args.workers,
+                            poll_interval=args.interval, settle_seconds=args.settle,
+                            baseline=args.baseline, user_id=args.user_id)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_interpret(args: argparse.Namespace) -> int:
+    from .resonance_lexicon import ResonanceLexicon
+
+    with open(args.report, 'r') as f:
+        analysis = json.load(f)
+    # Accept a master report as well as a bare technical analysis
+    analysis = analysis.get("technical_analysis", analysis)
+    lexicon = ResonanceLexicon()
+    if args.lexicon:
+        lexicon.load_lexicon(args.lexicon)
+    interpretation = next(lexicon.interpret_many([analysis], seed=args.seed))
+    _print_json(interpretation)
+    return 0
+
+
+def _cmd_search(args: argparse.Namespace) -> int:
+    from .resonance_lexicon import ResonanceLexicon
+
+    lexicon = ResonanceLexicon()
+    if args.lexicon:
+        lexicon.load_lexicon(args.lexicon)
+    hits = lexicon.search(args.query, fields=args.field, sections=args.section, limit=args.limit)
+    for hit in hits:
+        print(f"{hit['path']}\t{hit['text']}")
+    return 0 if hits else 1
+
+
+def _cmd_vault(args: argparse.Namespace) -> int:
+    from .aural_sentience_toolkit import PersonalVault
+
+    vault = PersonalVault(args.vault)
+    try:
+        if args.vault_command == "list":
+            _print_json(vault.get_associations(args.file))
+        elif args.vault_command == "import":
+            _print_json(vault.import_associations(args.source, format=args.format,
+                                                  skip_invalid=args.skip_invalid))
+        elif args.vault_command == "export":
+            count = vault.export_associations(args.destination, format=args.format)
+            print(f"Exported {count} associations to {args.destination}")
+    finally:
+        vault.close()
+    return 0
+
+
+def _load_technical_analyses(paths: List[str]):
+    """Technical analyses from report files and session directories"""
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(name for name in os.listdir(path) if name.endswith("_technical_analysis.json"))
+            files = [os.path.join(path, name) for name in names]
+        else:
+            files = [path]
+        for file_name in files:
+            with open(file_name, 'r') as f:
+                report = json.load(f)
+            # Accept a master report as well as a bare technical analysis
+            yield report.get("technical_analysis", report)
+
+
+def _cmd_index(args: argparse.Namespace) -> int:
+    from .resonance_index import ResonanceIndex
+
+    index = ResonanceIndex(args.index)
+    added = index.add_many((analysis["file_path"], analysis) for analysis in _load_technical_analyses(args.reports))
+    index.save()
+    print(f"Indexed {added} track(s); {len(index)} in {args.index}")
+    return 0
+
+
+def _cmd_similar(args: argparse.Namespace) -> int:
+    from .resonance_index import ResonanceIndex
+
+    index = ResonanceIndex(args.index)
+    target = args.track
+    if target not in index and os.path.isfile(target) and target.endswith(".json"):
+        target = next(_load_technical_analyses([target]))
+    try:
+        hits = index.query(target, k=args.k, sacred=args.sacred, tempo=args.tempo,
+                           pitch_class=args.key, duration=args.duration)
+    except (KeyError, ValueError) as e:
+        print(e.args[0] if e.args else e, file=sys.stderr)
+        return 2
+    if args.json:
+        _print_json(hits)
+    else:
+        for hit in hits:
+            print(f"{hit['similarity']:.3f}\t{hit['track']}")
+    return 0 if hits else 1
+
+
+def _cmd_report(args: argparse.Namespace) -> int:
+    with open(args.report, 'r') as f:
+        report = json.load(f)
+    if "reports" in report:
+        # Session summary
+        print(f"Session {report.get('session_id')}: {report.get('total_files_processed', 0)} file(s)")
+        for failure in report.get("failures", []):
+            print(f"  failed ({failure['stage']}): {failure['file_path']}")
+        for duplicate in report.get("duplicates", []):
+            print(f"  duplicate: {duplicate['file_path']} -> {duplicate['duplicate_of']}")
+        return 0
+
+    header = report.get("aural_sentience_master_report", {})
+    technical = report.get("technical_analysis", report)
+    print(f"File: {header.get('file_path', technical.get('file_path'))}")
+    print(f"Duration: {technical.get('duration', 0):.1f}s")
+    sacred = (technical.get("resonance_analysis") or {}).get("sacred_frequencies") or {}
+    print(f"Sacred frequencies: {', '.join(f'{freq}Hz' for freq in sacred) or 'none'}")
+    print(f"Sacred gaps: {len(technical.get('sacred_gaps') or [])}")
+    poetic = report.get("poetic_interpretation")
+    if poetic:
+        print(f"Opening: {poetic.get('opening_invitation')}")
+    return 0
+
+
+def _cmd_daemon(args: argparse.Namespace) -> int:
+    from .worker_daemon import DEFAULT_SOCKET_PATH, WorkerDaemon
+
+    socket_path = args.socket or DEFAULT_SOCKET_PATH
+    with WorkerDaemon(socket_path, workers=args.workers, max_tasks_per_child=args.max_tasks_per_child,
+                      warm_render=not args.no_warm_render) as daemon:
+        print(f"Serving on {socket_path} with {daemon.workers} worker(s), warming up...")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        except FileExistsError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+    return 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from .aural_sentience_toolkit import VaultManager
+    from .http_service import AnalysisService
+
+    vault_manager = None if args.no_vaults else VaultManager(args.vault_root)
+    try:
+        service = AnalysisService(host=args.host, port=args.port, workers=args.workers,
+                                  max_tasks_per_child=args.max_tasks_per_child,
+                                  warm_render=not args.no_warm_render, max_pending=args.max_pending,
+                                  max_batch=args.max_batch, batch_window=args.batch_window,
+                                  vault_manager=vault_manager, log_requests=args.log_requests)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    # SIGTERM stops the server like Ctrl-C does
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=service.shutdown).start())
+    with service:
+        print(f"Serving on {service.url} with {service.daemon.workers} worker(s), warming up...")
+        try:
+            service.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _cmd_submit(args: argparse.Namespace) -> int:
+    from .worker_daemon import DEFAULT_SOCKET_PATH, WorkerClient
+
+    failed = 0
+    with WorkerClient(args.socket or DEFAULT_SOCKET_PATH) as client:
+        if args.status:
+            _print_json(client.status())
+        for file_path in args.files:
+            try:
+                result = client.analyze(file_path, output_dir=args.output_dir,
+                                        render=args.output_dir is not None, seed=args.seed)
+            except RuntimeError as e:
+                print(f"{file_path}: {e}", file=sys.stderr)
+                failed += 1
+                continue
+            _print_json(result if args.full else {
+                "file_path": file_path,
+                "seconds": result["seconds"],
+                "worker_pid": result["worker_pid"],
+                "visualization": result["visualization"],
+                "opening_invitation": result["poetic_interpretation"].get("opening_invitation")
+            })
+    return 1 if failed else 0
+
+
+def measure_import_times(modules: Optional[List[str]] = None) -> List[dict]:
+    """
+    Import each module in a fresh interpreter and time it
+
+    Args:
+        modules: Module names to measure (the lightweight entry points by default)
+
+    Returns:
+        One dict per module with seconds and any heavy dependencies it loaded
+    """
+    results = []
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    for module in modules or LIGHTWEIGHT_ENTRY_POINTS:
+        completed = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE, module, *HEAVY_MODULES],
+            capture_output=True, text=True, env=env
+        )
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()
+            results.append({"module": module, "error": error[-1] if error else "import failed"})
+            continue
+        results.append({"module": module, **json.loads(completed.stdout)})
+    return results
+
+
+def _cmd_import_time(args: argparse.Namespace) -> int:
+    results = measure_import_times(args.module)
+    if args.json:
+        _print_json(results)
+    else:
+        for result in results:
+            if "error" in result:
+                print(f"{result['module']:45s} error: {result['error']}")
+                continue
+            heavy = ", ".join(result["heavy_modules_loaded"]) or "-"
+            print(f"{result['module']:45s} {result['seconds'] * 1000:8.1f} ms   heavy: {heavy}")
+    return 1 if any(result.get("error") or result.get("heavy_modules_loaded") for result in results) else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the aural-sentience command"""
+    from . import __version__
+    from .job_scheduler import SCHEDULING_POLICIES
+    from .http_service import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_VAULT_ROOT
+    from .resonance_index import DEFAULT_INDEX_PATH
+
+    parser = argparse.ArgumentParser(
+        prog="aural-sentience",
+        description="Consciousness-aware audio analysis and poetic interpretation"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    analyze = commands.add_parser("analyze", help="Analyze audio files into a session directory")
+    analyze.add_argument("files", nargs="+", help="Audio files")
+    analyze.add_argument("--output-dir", help="Session directory; an existing session is resumed")
+    analyze.add_argument("--pipeline", action="store_true", help="Overlap stages across files")
+    analyze.add_argument("--workers", type=int, help="Worker processes for --pipeline")
+    analyze.add_argument("--queue-size", type=int, default=4, help="Bound of each pipeline queue")
+    analyze.add_argument("--memory-budget", type=_parse_size,
+                         help="Memory the --pipeline files in flight may use together, e.g. 6G "
+                              "(default: 3/4 of available memory)")
+    analyze.add_argument("--schedule", choices=SCHEDULING_POLICIES, default="sjf",
+                         help="Processing order: shortest first, longest first, fair across "
+                              "directories or input order (default: sjf)")
+    analyze.add_argument("--file-timeout", type=float, metavar="SECONDS",
+                         help="Abandon a file that takes longer; it is recorded as timed out")
+    analyze.add_argument("--stage-timeout", type=_parse_stage_timeout, action="append", default=[],
+                         metavar="STAGE=SECONDS", help=f"Deadline of one stage ({', '.join(STAGES)}); repeatable")
+    analyze.add_argument("--retry-timeouts", action="store_true",
+                         help="Process files that timed out in an earlier run of the session again")
+    analyze.add_argument("--progress", metavar="PATH",
+                         help="Append JSON-lines throughput events (files/s, real-time factor, ETA) "
+                              "to PATH, or '-' for stdout (everything else is then printed to stderr)")
+    analyze.add_argument("--index", metavar="PATH", nargs="?", const=DEFAULT_INDEX_PATH,
+                         help="Add every analysis to a resonance index for 'similar' "
+                              f"(default path: {DEFAULT_INDEX_PATH})")
+    analyze.add_argument("--user-id", help="Listener whose vault informs the reports")
+    analyze.set_defaults(handler=_cmd_analyze)
+
+    coordinate = commands.add_parser("coordinate",
+                                     help="Share a session's files with workers on other machines")
+    coordinate.add_argument("files", nargs="+", help="Audio files")
+    coordinate.add_argument("--output-dir", required=True,
+                            help="Session directory on a filesystem the workers share")
+    coordinate.add_argument("--local-workers", type=int, default=0,
+                            help="Worker processes to run on this machine as well (default: 0)")
+    coordinate.add_argument("--lease", type=float, default=300.0, metavar="SECONDS",
+                            help="Time a worker may go without a heartbeat before its job is "
+                                 "reclaimed (default: 300)")
+    coordinate.add_argument("--max-attempts", type=int, default=3,
+                            help="Claims of one job before it is given up (default: 3)")
+    coordinate.add_argument("--schedule", choices=SCHEDULING_POLICIES, default="sjf",
+                            help="Order in which jobs are handed out (default: sjf)")
+    coordinate.add_argument("--file-timeout", type=float, metavar="SECONDS",
+                            help="Deadline of one file in the local workers")
+    coordinate.add_argument("--stage-timeout", type=_parse_stage_timeout, action="append", default=[],
+                            metavar="STAGE=SECONDS", help="Deadline of one stage in the local workers; repeatable")
+    coordinate.add_argument("--retry-timeouts", action="store_true",
+                            help="Queue files that timed out in an earlier run of the session again")
+    coordinate.add_argument("--progress", metavar="PATH", help="Append JSON-lines throughput events to PATH")
+    coordinate.add_argument("--index", metavar="PATH", nargs="?", const=DEFAULT_INDEX_PATH,
+                            help="Add every merged analysis to a resonance index")
+    coordinate.add_argument("--user-id", help="Listener whose vault informs the local workers' reports")
+    coordinate.set_defaults(handler=_cmd_coordinate)
+
+    worker = commands.add_parser("worker", help="Process jobs from a coordinated session")
+    worker.add_argument("--output-dir", required=True, help="Shared session directory of the coordinator")
+    worker.add_argument("--worker-id", help="Name in the job table (default: host:pid)")
+    worker.add_argument("--idle-timeout", type=float, metavar="SECONDS",
+                        help="Exit after this long without a job to claim")
+    worker.add_argument("--file-timeout", type=float, metavar="SECONDS",
+                        help="Abandon a file that takes longer; it is recorded as timed out")
+    worker.add_argument("--stage-timeout", type=_parse_stage_timeout, action="append", default=[],
+                        metavar="STAGE=SECONDS", help=f"Deadline of one stage ({', '.join(STAGES)}); repeatable")
+    worker.add_argument("--user-id", help="Listener whose vault informs the reports")
+    worker.set_defaults(handler=_cmd_worker)
+
+    estimate = commands.add_parser("estimate", help="Predict how long analyzing files will take")
+    estimate.add_argument("files", nargs="+", help="Audio files")
+    estimate.add_argument("--schedule", choices=SCHEDULING_POLICIES, default="sjf", help="Processing order")
+    estimate.add_argument("--workers", type=int, default=1, help="Files processed at once")
+    estimate.add_argument("--json", action="store_true", help="Print the whole plan as JSON")
+    estimate.set_defaults(handler=_cmd_estimate)
+
+    watch = commands.add_parser("watch", help="Analyze new and changed audio below a directory")
+    watch.add_argument("root", help="Library directory")
+    watch.add_argument("--output-dir", help="Session directory (default: ./aural_sentience_watch)")
+    watch.add_argument("--pipeline", action="store_true", help="Overlap stages across files")
+    watch.add_argument("--workers", type=int, help="Worker processes for --pipeline")
+    watch.add_argument("--interval", type=float, default=1.0, help="Seconds between polls")
+    watch.add_argument("--settle", type=float, default=2.0,
+                       help="Seconds a file must stay unchanged before it is analyzed")
+    watch.add_argument("--baseline", action="store_true",
+                       help="Index the files already present instead of analyzing them")
+    watch.add_argument("--user-id", help="Listener whose vault informs the reports")
+    watch.set_defaults(handler=_cmd_watch)
+
+    interpret = commands.add_parser("interpret", help="Poetic interpretation of a saved analysis")
+    interpret.add_argument("report", help="Technical analysis or master report JSON")
+    interpret.add_argument("--seed", help="Seed for reproducible wording")
+    interpret.add_argument("--lexicon", help="Saved lexicon to load")
+    interpret.set_defaults(handler=_cmd_interpret)
+
+    search = commands.add_parser("search", help="Full-text search over the lexicon")
+    search.add_argument("query", help='Terms, "field:term" or "prefix*"')
+    search.add_argument("--field", action="append", help="Restrict hits to a field (repeatable)")
+    search.add_argument("--section", action="append", help="Restrict hits to a section (repeatable)")
+    search.add_argument("--limit", type=int, help="Maximum number of hits")
+    search.add_argument("--lexicon", help="Saved lexicon to load")
+    search.set_defaults(handler=_cmd_search)
+
+    vault = commands.add_parser("vault", help="Query and move personal associations")
+    vault.add_argument("--vault", default=os.environ.get("AURAL_SENTIENCE_VAULT", "personal_vault.json"),
+                       help="Vault file (default: $AURAL_SENTIENCE_VAULT or ./personal_vault.json)")
+    vault_commands = vault.add_subparsers(dest="vault_command", required=True)
+    vault_list = vault_commands.add_parser("list", help="Associations for an audio file")
+    vault_list.add_argument("file")
+    vault_import = vault_commands.add_parser("import", help="Bulk import from JSONL or CSV")
+    vault_import.add_argument("source")
+    vault_import.add_argument("--format", choices=("jsonl", "csv"))
+    vault_import.add_argument("--skip-invalid", action="store_true")
+    vault_export = vault_commands.add_parser("export", help="Export to JSONL or CSV")
+    vault_export.add_argument("destination")
+    vault_export.add_argument("--format", choices=("jsonl", "csv"))
+    vault.set_defaults(handler=_cmd_vault)
+
+    index = commands.add_parser("index", help="Add analyses to the resonance index")
+    index.add_argument("reports", nargs="+", help="Technical analysis or master report JSON files, "
+                                                   "or session directories")
+    index.add_argument("--index", default=DEFAULT_INDEX_PATH, help=f"Index file (default: {DEFAULT_INDEX_PATH})")
+    index.set_defaults(handler=_cmd_index)
+
+    similar = commands.add_parser("similar", help="Tracks that resonate like a given one")
+    similar.add_argument("track", help="Indexed audio path, or a technical analysis / master report JSON")
+    similar.add_argument("-k", type=int, default=10, help="Number of tracks (default: 10)")
+    similar.add_argument("--sacred", type=int, action="append", default=[], metavar="HZ",
+                         help="Only tracks where this sacred frequency was detected (repeatable)")
+    similar.add_argument("--tempo", type=_parse_range, metavar="MIN:MAX", help="Tempo range in BPM")
+    similar.add_argument("--duration", type=_parse_range, metavar="MIN:MAX", help="Duration range in seconds")
+    similar.add_argument("--key", help="Dominant pitch class, e.g. A or F#")
+    similar.add_argument("--index", default=DEFAULT_INDEX_PATH, help=f"Index file (default: {DEFAULT_INDEX_PATH})")
+    similar.add_argument("--json", action="store_true", help="Print results as JSON")
+    similar.set_defaults(handler=_cmd_similar)
+
+    report = commands.add_parser("report", help="Summarize a master report or session summary")
+    report.add_argument("report")
+    report.set_defaults(handler=_cmd_report)
+
+    daemon = commands.add_parser("daemon", help="Serve pre-warmed analysis workers on a Unix socket")
+    daemon.add_argument("--socket", help="Socket path (default: <tmpdir>/aural_sentience.sock)")
+    daemon.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    daemon.add_argument("--max-tasks-per-child", type=int, default=50,
+                        help="Jobs a worker runs before it is recycled")
+    daemon.add_argument("--no-warm-render", action="store_true", help="Skip warming the plotting stack")
+    daemon.set_defaults(handler=_cmd_daemon)
+
+    serve = commands.add_parser("serve", help="Serve analysis, interpretation, vaults and "
+                                              "visualization over HTTP on localhost")
+    serve.add_argument("--host", default=DEFAULT_HOST, help=f"Loopback address to bind (default: {DEFAULT_HOST})")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    serve.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    serve.add_argument("--max-tasks-per-child", type=int, default=50,
+                       help="Batches a worker runs before it is recycled")
+    serve.add_argument("--max-pending", type=int, default=64,
+                       help="Jobs admitted at once; further requests get 429 (default: 64)")
+    serve.add_argument("--max-batch", type=int, default=8, help="Most jobs in one micro-batch (default: 8)")
+    serve.add_argument("--batch-window", type=float, default=0.005, metavar="SECONDS",
+                       help="Time a job waits for others to batch with (default: 0.005)")
+    serve.add_argument("--vault-root", default=DEFAULT_VAULT_ROOT,
+                       help=f"Directory of the per-listener vaults (default: {DEFAULT_VAULT_ROOT})")
+    serve.add_argument("--no-vaults", action="store_true", help="Serve without profiles and /vault")
+    serve.add_argument("--no-warm-render", action="store_true", help="Skip warming the plotting stack")
+    serve.add_argument("--log-requests", action="store_true", help="Log every request to stderr")
+    serve.set_defaults(handler=_cmd_serve)
+
+    submit = commands.add_parser("submit", help="Analyze files in a running daemon")
+    submit.add_argument("files", nargs="*", help="Audio files")
+    submit.add_argument("--socket", help="Socket path of the daemon")
+    submit.add_argument("--output-dir", help="Render visualizations into this directory")
+    submit.add_argument("--seed", help="Seed for reproducible wording")
+    submit.add_argument("--status", action="store_true", help="Print the daemon's warm-up status first")
+    submit.add_argument("--full", action="store_true", help="Print the complete analysis")
+    submit.set_defaults(handler=_cmd_submit)
+
+    import_time = commands.add_parser("import-time", help="Measure import time of the entry points")
+    import_time.add_argument("module", nargs="*", help="Modules to measure")
+    import_time.add_argument("--json", action="store_true", help="Print results as JSON")
+    import_time.set_defaults(handler=_cmd_import_time)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the aural-sentience console script"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
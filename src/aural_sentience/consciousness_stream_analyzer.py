@@ -21,11 +21,11 @@ Philosophy:
 """
 
 import numpy as np
-import librosa
 import threading
 import queue
 import time
 import json
+import random
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 import logging
@@ -176,6 +176,122 @@ class SacredGapDetector:
             
         return {"sacred_gap_detected": False}
 
+class LexiconStreamBridge:
+    """
+    Turns consciousness states into lexicon phrases at stream rate
+
+    Phrase pools are compiled once from a ResonanceLexicon: one per
+    consciousness effect and one per integer Hz within tolerance of every
+    sacred frequency, so each state costs a couple of dictionary lookups.
+    Emission is rate limited, avoids repeating recent phrases, and draws from
+    a per-stream seeded RNG so a replayed stream yields the same text.
+    """
+
+    def __init__(self, lexicon: Any = None, seed: Any = None, stream_id: str = "default",
+                 min_interval: float = 2.0, dedupe_window: int = 8,
+                 frequency_tolerance: int = 5):
+        """
+        Compile phrase pools for live emission
+
+        Args:
+            lexicon: ResonanceLexicon to draw phrases from (a shared one by default)
+            seed: Seed for reproducible phrase choice; None for non-deterministic
+            stream_id: Identifies the stream; mixed into the seed
+            min_interval: Minimum seconds of stream time between emitted phrases
+            dedupe_window: Number of recent phrases that will not be repeated
+            frequency_tolerance: Hz around each sacred frequency mapped to its pool
+        """
+        if lexicon is None:
+            from .resonance_lexicon import ResonanceLexicon
+            lexicon = ResonanceLexicon()
+        self.seed = seed
+        self.min_interval = min_interval
+        self.dedupe_window = max(0, dedupe_window)
+        self.frequency_tolerance = frequency_tolerance
+
+        self.effect_pools: Dict[str, Tuple[str, ...]] = {}
+        self.frequency_pools: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+        self.gap_pool: Tuple[str, ...] = ()
+        self._compile(lexicon)
+        self.reset(stream_id)
+
+    def _compile(self, lexicon: Any) -> None:
+        """Precompute every phrase pool from the lexicon"""
+        entries = lexicon.lexicon["sacred_frequencies"]
+        index = lexicon.frequency_index()
+        for sacred_freq, info in SACRED_FREQUENCIES.items():
+            effect = info["consciousness_effect"]
+            position = index.lookup_one(float(sacred_freq))
+            if position >= 0:
+                entry = entries[index.keys[position]]
+                pool = tuple(entry["poetic_qualities"]) + (entry["essence"].lower(),)
+            else:
+                # Frequencies outside the lexicon (brainwave bands, Schumann)
+                pool = (f"{info['name'].lower()} and its {effect.replace('_', ' ')}",)
+            self.effect_pools[effect] = self.effect_pools.get(effect, ()) + pool
+            for hz in range(int(round(sacred_freq)) - self.frequency_tolerance,
+                            int(round(sacred_freq)) + self.frequency_tolerance + 1):
+                self.frequency_pools.setdefault(hz, (effect, pool))
+        self.gap_pool = tuple(lexicon.poetic_templates["sacred_gap_messages"])
+
+    def reset(self, stream_id: Optional[str] = None) -> None:
+        """Start a new stream: reseed the RNG and forget emission history"""
+        if stream_id is not None:
+            self.stream_id = stream_id
+        self._rng = random.Random(f"{self.seed}:{self.stream_id}") if self.seed is not None else random.Random()
+        self._recent: deque = deque(maxlen=self.dedupe_window or None)
+        self._last_emitted: Optional[float] = None
+        self.emitted = 0
+        self.suppressed = 0
+
+    def pool_for(self, state: ConsciousnessState) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """Return (source, phrases) for a state, or None if nothing applies"""
+        if state.sacred_gap_detected:
+            return "sacred_gap", self.gap_pool
+        pool = self.effect_pools.get(state.consciousness_correlation)
+        if pool is not None:
+            return state.consciousness_correlation, pool
+        return self.frequency_pools.get(int(round(state.dominant_frequency)))
+
+    def emit(self, state: ConsciousnessState) -> Optional[Dict[str, Any]]:
+        """
+        Phrase for a consciousness state, or None when rate limited or silent
+
+        Args:
+            state: State produced by ConsciousnessStreamAnalyzer
+
+        Returns:
+            Dictionary with the phrase and the state it accompanies
+        """
+        selected = self.pool_for(state)
+        if selected is None or not selected[1]:
+            return None
+        if (self._last_emitted is not None and
+                state.timestamp - self._last_emitted < self.min_interval):
+            self.suppressed += 1
+            return None
+
+        source, pool = selected
+        fresh = [phrase for phrase in pool if phrase not in self._recent]
+        if fresh:
+            phrase = self._rng.choice(fresh)
+        else:
+            # Small pool fully used: fall back to its least recently used phrase
+            phrase = next(phrase for phrase in self._recent if phrase in pool)
+            self._recent.remove(phrase)
+        if self.dedupe_window:
+            self._recent.append(phrase)
+        self._last_emitted = state.timestamp
+        self.emitted += 1
+        return {
+            "timestamp": state.timestamp,
+            "consciousness_correlation": state.consciousness_correlation,
+            "dominant_frequency": state.dominant_frequency,
+            "source": source,
+            "phrase": phrase
+        }
+
+
 class ConsciousnessStreamAnalyzer:
     """
     Real-time consciousness-aware audio stream analyzer
@@ -185,7 +301,8 @@ class ConsciousnessStreamAnalyzer:
     """
     
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 4096,
-                 consciousness_sensitivity: float = 0.8):
+                 consciousness_sensitivity: float = 0.8,
+                 lexicon_bridge: Optional[LexiconStreamBridge] = None):
         """
         Initialize the consciousness stream analyzer
         
@@ -193,6 +310,7 @@ class ConsciousnessStreamAnalyzer:
             sample_rate: Audio sample rate in Hz
             chunk_size: Size of audio chunks for processing
             consciousness_sensitivity: Sensitivity to consciousness-affecting patterns (0.0-1.0)
+            lexicon_bridge: Optional bridge whose phrases are put on lexicon_queue
         """
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
@@ -208,6 +326,10 @@ class ConsciousnessStreamAnalyzer:
         self.analysis_queue = queue.Queue()
         self.is_streaming = False
         
+        # Live lexicon text accompanying states
+        self.lexicon_bridge = lexicon_bridge
+        self.lexicon_queue = queue.Queue()
+        
         # Cultural sensitivity settings
         self.cultural_context = "universal"  # Can be set to specific traditions
         self.respect_boundaries = True
@@ -290,6 +412,11 @@ class ConsciousnessStreamAnalyzer:
         # Add to history
         self.consciousness_history.append(consciousness_state)
         
+        if self.lexicon_bridge is not None:
+            lexicon_line = self.lexicon_bridge.emit(consciousness_state)
+            if lexicon_line is not None:
+                self.lexicon_queue.put(lexicon_line)
+        
         return consciousness_state
         
     def _analyze_frequencies(self, audio_chunk: np.ndarray) -> Dict[str, Any]:
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Deadlines
+Knowing When to Stop Listening
+
+A corrupt or pathological file can keep librosa.load or beat_track busy
+for minutes, and one such file sets the tail latency of a whole batch.
+Deadlines bound that at three levels:
+
+- Cooperative: long loops call checkpoint(), which raises once the
+  deadline (or a CancellationToken) of the enclosing deadline_scope() has
+  expired. It costs a context-variable lookup.
+- Interrupting: enforce() also arms SIGALRM when running on the main
+  thread, so code that never reaches a checkpoint is interrupted as soon
+  as control returns to Python.
+- Killing: TimeoutProcessPool runs jobs in worker processes and kills a
+  worker that is still busy a grace period after its deadline (stuck in
+  native code that no signal can interrupt). The pool is rebuilt and the
+  other jobs in flight are resubmitted.
+
+DeadlineExceeded and Cancelled derive from BaseException, like
+KeyboardInterrupt, so the broad ``except Exception`` handlers in the
+analysis code cannot swallow them.
+"""
+
+import contextlib
+import contextvars
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class DeadlineExceeded(BaseException):
+    """A stage ran past its deadline"""
+
+    def __init__(self, stage: str, timeout: Optional[float]):
+        super().__init__(f"{stage} exceeded its {timeout:.3g}s deadline" if timeout is not None
+                         else f"{stage} exceeded its deadline")
+        self.stage = stage
+        self.timeout = timeout
+
+    def __reduce__(self):
+        # Crosses process boundaries as a pool result
+        return DeadlineExceeded, (self.stage, self.timeout)
+
+
+class Cancelled(BaseException):
+    """Work was cancelled through a CancellationToken"""
+
+
+class CancellationToken:
+    """
+    Thread-safe flag that asks running work to stop at its next checkpoint
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        self.reason = reason
+        self._event.set()
+
+    def check(self) -> None:
+        """Raise Cancelled if cancellation was requested"""
+        if self._event.is_set():
+            raise Cancelled(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """
+    Point in time by which a stage must finish
+    """
+
+    def __init__(self, seconds: Optional[float], stage: str = "job",
+                 token: Optional[CancellationToken] = None, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            seconds: Time allowed from now; None for no limit
+            stage: Name reported when the deadline passes
+            token: Cancellation token checked alongside the deadline
+            parent: Enclosing deadline; the earlier of the two applies
+        """
+        self.stage = stage
+        self.seconds = seconds
+        self.token = token if token is not None else (parent.token if parent is not None else None)
+        self.parent = parent
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def child(self, seconds: Optional[float], stage: str) -> "Deadline":
+        """Deadline of a stage nested in this one"""
+        return Deadline(seconds, stage, parent=self)
+
+    def _binding(self) -> Tuple[Optional[float], "Deadline"]:
+        """Earliest expiry in the chain and the deadline it belongs to"""
+        binding = (self.expires_at, self)
+        if self.parent is not None:
+            parent_expiry, parent = self.parent._binding()
+            if parent_expiry is not None and (binding[0] is None or parent_expiry < binding[0]):
+                binding = (parent_expiry, parent)
+        return binding
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None without a limit"""
+        expires_at, _ = self._binding()
+        return None if expires_at is None else expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded or Cancelled if this stage must stop"""
+        if self.token is not None:
+            self.token.check()
+        expires_at, binding = self._binding()
+        if expires_at is not None and time.monotonic() >= expires_at:
+            raise DeadlineExceeded(binding.stage, binding.seconds)
+
+
+# Quoted: ContextVar is only subscriptable at runtime from Python 3.9
+_current_deadline: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar(
+    "aural_sentience_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def checkpoint() -> None:
+    """Raise if the deadline or cancellation of the enclosing scope applies"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make a deadline the one checkpoint() consults"""
+    reset_token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(reset_token)
+
+
+def _arm_alarm(deadline: Optional[Deadline]) -> None:
+    remaining = deadline.remaining() if deadline is not None else None
+    if remaining is None:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    else:
+        # A zero interval would disarm the timer instead of firing it
+        signal.setitimer(signal.ITIMER_REAL, max(remaining, 1e-3))
+
+
+def _on_alarm(signum, frame) -> None:
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextlib.contextmanager
+def enforce(seconds: Optional[float], stage: str, token: Optional[CancellationToken] = None) -> Iterator[Deadline]:
+    """
+    Run a block under a deadline nested in the current one
+
+    Checkpoints inside the block raise once it expires; on the main thread
+    SIGALRM interrupts the block even between checkpoints.
+    """
+    outer = _current_deadline.get()
+    deadline = outer.child(seconds, stage) if outer is not None else Deadline(seconds, stage, token=token)
+    if token is not None:
+        deadline.token = token
+    use_alarm = threading.current_thread() is threading.main_thread() and hasattr(signal, "setitimer")
+    with deadline_scope(deadline):
+        previous_handler = None
+        if use_alarm:
+            previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+            _arm_alarm(deadline)
+        try:
+            deadline.check()
+            yield deadline
+        finally:
+            if use_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, previous_handler)
+                if previous_handler is _on_alarm:
+                    # Hand the timer back to the enclosing enforce()
+                    _arm_alarm(outer)
+
+
+# Per-process state of a TimeoutProcessPool worker
+_started_queue = None
+
+
+def _init_timeout_worker(started_queue, initializer, initargs) -> None:
+    global _started_queue
+    _started_queue = started_queue
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_with_deadline(job_id: int, fn: Callable, timeout: Optional[float], stage: str, *args: Any) -> Any:
+    """Worker side of TimeoutProcessPool: announce the start, then run under the deadline"""
+    if _started_queue is not None:
+        _started_queue.put((job_id, os.getpid(), time.time()))
+    with enforce(timeout, stage):
+        return fn(*args)
+
+
+class TimeoutProcessPool:
+    """
+    Process pool whose jobs have deadlines the parent enforces by killing
+
+    Jobs get concurrent.futures Futures, which only settle in poll(): call
+    it regularly (the pipeline does on every scheduling pass) to settle
+    finished jobs and handle overdue and crashed workers. submit() and
+    poll() may be called from different threads.
+    """
+
+    def __init__(self, max_workers: int, initializer: Optional[Callable] = None, initargs: Tuple = (),
+                 grace_seconds: float = 5.0, max_restarts: int = 2, max_tasks_per_child: Optional[int] = None,
+                 mp_context: Any = None):
+        """
+        Args:
+            max_workers: Worker processes
+            initializer: Called in every worker (also after a rebuild)
+            initargs: Arguments of the initializer
+            grace_seconds: How long past its deadline a job may run before its worker is killed
+            max_restarts: Times a job is resubmitted after a worker crash it may have caused
+            max_tasks_per_child: Jobs a worker runs before it is replaced (Python 3.11+,
+                which needs a non-fork mp_context for it; ignored before)
+            mp_context: multiprocessing context of the workers; queues in
+                initargs must come from the same one
+        """
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self.grace_seconds = grace_seconds
+        self.max_restarts = max_restarts
+        self.max_tasks_per_child = max_tasks_per_child if sys.version_info >= (3, 11) else None
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self.kills = 0
+        self.rebuilds = 0
+        self._lock = threading.RLock()
+        # Resolved by submit() to wake a poll() waiting on the older jobs
+        self._wakeup: Future = Future()
+        self._started_queue = self.mp_context.Queue()
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 0
+        self._executor = self._new_executor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(kill=exc_type is not None)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        options: Dict[str, Any] = {}
+        if self.max_tasks_per_child is not None:
+            options["max_tasks_per_child"] = self.max_tasks_per_child
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context,
+                                   initializer=_init_timeout_worker,
+                                   initargs=(self._started_queue, self.initializer, self.initargs), **options)
+
+    def submit(self, fn: Callable, *args: Any, timeout: Optional[float] = None, stage: str = "job") -> Future:
+        """Queue fn(*args); its deadline counts from when a worker picks it up"""
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+            job = {"fn": fn, "args": args, "timeout": timeout, "stage": stage,
+                   "future": Future(), "started": None, "pid": None, "restarts": 0}
+            self._jobs[job_id] = job
+            self._start(job_id, job)
+            if not self._wakeup.done():
+                self._wakeup.set_result(None)
+            return job["future"]
+
+    def _start(self, job_id: int, job: Dict[str, Any]) -> None:
+        job["started"] = None
+        job["pid"] = None
+        job["inner"] = self._executor.submit(_run_with_deadline, job_id, job["fn"], job["timeout"],
+                                             job["stage"], *job["args"])
+
+    def _drain_starts(self) -> None:
+        while True:
+            try:
+                job_id, pid, started = self._started_queue.get_nowait()
+            except (queue.Empty, OSError, EOFError):
+                return
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job["pid"] = pid
+                # Wall clock from the worker; monotonic time is per process
+                job["started"] = time.monotonic() - max(0.0, time.time() - started)
+
+    def poll(self, timeout: float = 0.0) -> None:
+        """
+        Settle finished jobs, kill overdue workers and recover from crashes
+
+        Args:
+            timeout: Seconds to wait for a job to finish first
+        """
+        if timeout > 0:
+            with self._lock:
+                if self._wakeup.done():
+                    self._wakeup = Future()
+                running = [job["inner"] for job in self._jobs.values()] + [self._wakeup]
+            wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        with self._lock:
+            self._settle()
+
+    def _settle(self) -> None:
+        """poll() under the lock, after the wait"""
+        self._drain_starts()
+        now = time.monotonic()
+        overdue = []
+        broken = False
+        for job_id, job in list(self._jobs.items()):
+            inner = job["inner"]
+            if inner.cancelled():
+                # Left queued when the executor was replaced; _rebuild resubmits it
+                broken = True
+                continue
+            if inner.done():
+                error = inner.exception()
+                if isinstance(error, BrokenProcessPool):
+                    broken = True
+                    continue
+                del self._jobs[job_id]
+                if error is not None:
+                    job["future"].set_exception(error)
+                else:
+                    job["future"].set_result(inner.result())
+            elif (job["timeout"] is not None and job["started"] is not None and
+                  now - job["started"] > job["timeout"] + self.grace_seconds):
+                overdue.append(job_id)
+        if overdue or broken:
+            self._rebuild(overdue)
+
+    def _rebuild(self, overdue) -> None:
+        """Kill every worker, fail the overdue jobs and resubmit the rest"""
+        self.rebuilds += 1
+        for job_id in overdue:
+            job = self._jobs.pop(job_id)
+            job["future"].set_exception(DeadlineExceeded(job["stage"], job["timeout"]))
+            self.kills += 1
+        self._kill_workers()
+        self._shutdown_executor(cancel_futures=True)
+        self._executor = self._new_executor()
+        # After a crash nobody asked for, the jobs that were running are
+        # suspects; if none had announced its start, all of them are
+        started = [job for job in self._jobs.values() if job["pid"] is not None]
+        for job_id, job in list(self._jobs.items()):
+            inner = job["inner"]
+            # Jobs still queued in the old executor come back cancelled by its
+            # shutdown (exception() would raise CancelledError); resubmit them
+            if inner.done() and not inner.cancelled() and not isinstance(inner.exception(), BrokenProcessPool):
+                continue
+            if not overdue and (job["pid"] is not None or not started):
+                job["restarts"] += 1
+                if job["restarts"] > self.max_restarts:
+                    del self._jobs[job_id]
+                    job["future"].set_exception(BrokenProcessPool(
+                        f"worker crashed {job['restarts']} times while running this job"))
+                    continue
+            self._start(job_id, job)
+
+    def _shutdown_executor(self, cancel_futures: bool) -> None:
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=True, cancel_futures=cancel_futures)
+        else:
+            # Queued jobs of an executor whose workers were killed fail with
+            # BrokenProcessPool instead, which _rebuild resubmits as well
+            self._executor.shutdown(wait=True)
+
+    def _kill_workers(self) -> None:
+        # ProcessPoolExecutor has no public way to stop a running job
+        for process in list(getattr(self._executor, "_processes", {}).values()):
+            if process.is_alive():
+                process.kill()
+
+    def shutdown(self, kill: bool = False) -> None:
+        """Stop the pool; kill=True abandons running jobs (used for cancellation)"""
+        with self._lock:
+            if kill:
+                for job in self._jobs.values():
+                    if not job["future"].done():
+                        job["future"].set_exception(Cancelled("pool shut down"))
+                self._jobs.clear()
+                self._kill_workers()
+        self._shutdown_executor(cancel_futures=kill)
+        self._started_queue.close()
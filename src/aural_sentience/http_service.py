@@ -0,0 +1,656 @@
+#!/usr/bin/env python3
+"""
+Analysis Service
+Listening Over HTTP Without Leaving the Machine
+
+Serves analysis, interpretation, visualization and the personal vaults to
+local tools over HTTP, on top of the pre-warmed worker pool of
+worker_daemon. The service only binds to loopback addresses, and answers
+403 to requests a web page could have made: any request carrying an
+Origin header, and any whose Host is not the bound address (or
+localhost) and port, as a DNS-rebound name would be.
+
+    GET  /status                         pool warm-up, queue depth and batching counters
+    POST /analyze?name=&profile=&seed=   audio bytes in the body
+    POST /analyze?profile=&seed=         {"files": [...]} (paths on this machine)
+    POST /interpret?seed=                technical analysis (or master report) JSON
+    POST /visualize?name=                audio bytes in the body; answers image/png
+    GET  /vault?profile=&file=           a listener's associations for a file
+    POST /vault?profile=                 {"file", "timestamp", "description", "feeling_category"}
+
+Uploaded audio is decoded from memory. /analyze streams its results back
+as JSON lines, one per file as it finishes ({"file", "ok", "result" or
+"error"}), followed by {"done": true, ...}; a profile (listener ID) adds
+that listener's vault associations to each analysis.
+
+Concurrent jobs for the same operation and profile are gathered for up to
+batch_window seconds into micro-batches that each run in one worker: with
+idle workers a batch is split across them, under load batches grow up to
+max_batch jobs so queued work costs fewer round trips to the pool. At most
+max_pending jobs are admitted at once; beyond that requests are answered
+with 429 and a Retry-After header instead of queuing without bound.
+"""
+
+import http.client
+import ipaddress
+import json
+import os
+import random
+import socket
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .worker_daemon import DEFAULT_JOB_TIMEOUT, WorkerDaemon, _json_default
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+DEFAULT_VAULT_ROOT = os.environ.get(
+    "AURAL_SENTIENCE_VAULT_ROOT",
+    os.path.join(os.path.expanduser("~"), ".aural_sentience", "vaults")
+)
+
+# Largest request body accepted (uploads are held in memory)
+DEFAULT_MAX_BODY_BYTES = 256 * 1024 * 1024
+
+# Seconds a client told to back off (429) should wait
+RETRY_AFTER_SECONDS = 1
+
+
+class ServiceBusy(RuntimeError):
+    """The service refused a request because too much work is pending"""
+
+    def __init__(self, message: str, retry_after: float = RETRY_AFTER_SECONDS):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _require_loopback(host: str) -> int:
+    """Address family to bind host with; ValueError unless it is a loopback address"""
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except socket.gaierror as e:
+        raise ValueError(f"Cannot resolve {host!r}: {e}")
+    if not addresses or not all(ipaddress.ip_address(address).is_loopback for address in addresses):
+        raise ValueError(f"{host!r} is not a loopback address; the service only listens locally")
+    return socket.AF_INET6 if host == "::1" or host.startswith("[") else socket.AF_INET
+
+
+class _MicroBatcher:
+    """
+    Gathers jobs with the same key into batches for the worker pool
+    """
+
+    def __init__(self, daemon: WorkerDaemon, max_batch: int, window: float):
+        self.daemon = daemon
+        self.max_batch = max(1, max_batch)
+        self.window = max(0.0, window)
+        self.queued = 0
+        self.in_flight = 0
+        self.batches = 0
+        self.batched_jobs = 0
+        self._groups: Dict[Tuple, List[Tuple[Dict[str, Any], Future]]] = {}
+        self._opened: Dict[Tuple, float] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._dispatch_loop, name="service-batcher", daemon=True)
+        self._thread.start()
+
+    def put(self, key: Tuple, job: Dict[str, Any]) -> Future:
+        """Queue a job; the future resolves to its {"ok", "result" or "error"} outcome"""
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Service is shutting down")
+            group = self._groups.setdefault(key, [])
+            if not group:
+                self._opened[key] = time.monotonic()
+            group.append((job, future))
+            self.queued += 1
+            self._condition.notify()
+        return future
+
+    def _ready(self, now: float) -> List[Tuple]:
+        return [key for key, group in self._groups.items()
+                if len(group) >= self.max_batch or now - self._opened[key] >= self.window]
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._condition:
+                ready = self._ready(time.monotonic())
+                while not ready and not self._closed:
+                    now = time.monotonic()
+                    waits = [self._opened[key] + self.window - now for key in self._groups]
+                    self._condition.wait(max(0.0, min(waits)) if waits else None)
+                    ready = self._ready(time.monotonic())
+                if self._closed:
+                    groups = list(self._groups.values())
+                    self._groups.clear()
+                    break
+                flushed = [self._groups.pop(key) for key in ready]
+                for key in ready:
+                    del self._opened[key]
+                self.queued -= sum(len(group) for group in flushed)
+                idle_workers = max(1, self.daemon.workers - self.in_flight)
+            for group in flushed:
+                # Spread a group over the idle workers; under load, batch it
+                size = min(self.max_batch, -(-len(group) // idle_workers))
+                for start in range(0, len(group), size):
+                    self._submit(group[start:start + size])
+        for group in groups:
+            for _, future in group:
+                future.set_exception(RuntimeError("Service is shutting down"))
+
+    def _submit(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        with self._condition:
+            self.in_flight += 1
+            self.batches += 1
+            self.batched_jobs += len(batch)
+
+        def done(outcomes: List[Dict[str, Any]]) -> None:
+            self._batch_finished()
+            for (_, future), outcome in zip(batch, outcomes):
+                future.set_result(outcome)
+
+        def failed(error: BaseException) -> None:
+            # The batch overran its deadline or its worker died: every job
+            # still gets an outcome, which also frees its admission slot
+            self._batch_finished()
+            for _, future in batch:
+                future.set_result({"ok": False, "error": f"{type(error).__name__}: {error}"})
+
+        try:
+            self.daemon.submit_batch([job for job, _ in batch], callback=done, error_callback=failed)
+        except Exception as e:
+            failed(e)
+
+    def _batch_finished(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "queued_jobs": self.queued,
+                "batches_in_flight": self.in_flight,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_jobs / self.batches if self.batches else 0.0,
+                "max_batch": self.max_batch,
+                "batch_window_seconds": self.window
+            }
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout=5.0)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "AuralSentience"
+
+    @property
+    def service(self) -> "AnalysisService":
+        return self.server.service
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.service.log_requests:
+            super().log_message(format, *args)
+
+    def _local_request(self) -> bool:
+        """False, after answering 403, for requests a browser may have sent on a page's behalf"""
+        if self.headers.get("Origin") is not None:
+            message = "Cross-origin requests are not accepted"
+        elif (self.headers.get("Host") or "").lower() not in self.service.allowed_hosts:
+            message = "Unexpected Host header"
+        else:
+            return True
+        # The body, if any, is left unread
+        self.close_connection = True
+        self._error(403, message)
+        return False
+
+    def _params(self) -> Dict[str, str]:
+        return {key: values[-1] for key, values in parse_qs(urlsplit(self.path).query).items()}
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(data, default=_json_default).encode("utf-8"), headers=headers)
+
+    def _error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_json(status, {"error": message}, headers=headers)
+
+    def _busy(self) -> None:
+        self._error(429, "Too many pending jobs; retry later",
+                    headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+
+    def _read_body(self) -> Optional[bytes]:
+        """The request body, or None after answering an error"""
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self._error(411, "Content-Length required")
+            return None
+        try:
+            length = int(length)
+        except ValueError:
+            self._error(400, "Invalid Content-Length")
+            return None
+        if length < 0:
+            self.close_connection = True
+            self._error(400, "Invalid Content-Length")
+            return None
+        if length > self.service.max_body_bytes:
+            self.close_connection = True
+            self._error(413, f"Body exceeds {self.service.max_body_bytes} bytes")
+            return None
+        return self.rfile.read(length)
+
+    def _read_json(self) -> Optional[Any]:
+        body = self._read_body()
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            self._error(400, f"Invalid JSON: {e}")
+            return None
+
+    def do_GET(self) -> None:
+        if not self._local_request():
+            return
+        route = urlsplit(self.path).path
+        if route == "/status":
+            self._send_json(200, self.service.status())
+        elif route == "/vault":
+            self._get_vault()
+        else:
+            self._error(404, f"No such endpoint: {route}")
+
+    def do_POST(self) -> None:
+        if not self._local_request():
+            return
+        route = urlsplit(self.path).path
+        handlers = {"/analyze": self._analyze, "/interpret": self._interpret,
+                    "/visualize": self._visualize, "/vault": self._post_vault}
+        handler = handlers.get(route)
+        if handler is None:
+            self._error(404, f"No such endpoint: {route}")
+            return
+        try:
+            handler()
+        except ServiceBusy:
+            self._busy()
+        except RuntimeError as e:
+            # Raised by submit while the service shuts down, before any response
+            self._error(503, str(e))
+
+    def _analyze(self) -> None:
+        params = self._params()
+        profile = params.get("profile")
+        if profile is not None and self.service.vault_manager is None:
+            self._error(400, "Profiles need the service to be started with a vault root")
+            return
+        if profile is not None and not profile.strip():
+            self._error(400, "profile must not be empty")
+            return
+        body = self._read_body()
+        if body is None:
+            return
+        seed = params.get("seed")
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            try:
+                files = json.loads(body)["files"]
+            except (ValueError, KeyError, TypeError):
+                self._error(400, 'Expected {"files": [...]}')
+                return
+            jobs = [{"op": "analyze", "file_path": os.path.abspath(path), "seed": seed} for path in files]
+        else:
+            jobs = [{"op": "analyze", "audio": body, "name": params.get("name") or "upload", "seed": seed}]
+        if len(jobs) > self.service.max_pending:
+            self._error(413, f"At most {self.service.max_pending} files per request")
+            return
+
+        futures = self.service.submit("analyze", profile, jobs)
+        labels = {future: job.get("file_path") or job["name"] for future, job in zip(futures, jobs)}
+
+        # Chunked JSON lines, each written as soon as its file finishes
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        failed = 0
+        try:
+            for future in as_completed(futures):
+                line = {"file": labels[future]}
+                try:
+                    line.update(future.result())
+                except Exception as e:
+                    line.update(ok=False, error=f"{type(e).__name__}: {e}")
+                if line["ok"] and profile is not None:
+                    self.service.attach_associations(profile, line["result"]["technical_analysis"])
+                failed += not line["ok"]
+                self._write_chunk(line)
+            self._write_chunk({"done": True, "files": len(jobs), "failed": failed})
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; its jobs still finish and free their slots
+            self.close_connection = True
+
+    def _write_chunk(self, data: Dict[str, Any]) -> None:
+        line = (json.dumps(data, default=_json_default) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.flush()
+
+    def _interpret(self) -> None:
+        analysis = self._read_json()
+        if analysis is None:
+            return
+        # Master reports carry the analysis under technical_analysis
+        analysis = analysis.get("technical_analysis", analysis) if isinstance(analysis, dict) else analysis
+        seed = self._params().get("seed")
+        rng = random.Random(seed) if seed is not None else None
+        try:
+            interpretation = self.service.daemon.lexicon.generate_comprehensive_interpretation(analysis, rng=rng)
+        except Exception as e:
+            self._error(400, f"{type(e).__name__}: {e}")
+            return
+        self._send_json(200, interpretation)
+
+    def _visualize(self) -> None:
+        body = self._read_body()
+        if body is None:
+            return
+        job = {"op": "visualize", "audio": body, "name": self._params().get("name") or "upload.wav"}
+        future, = self.service.submit("visualize", None, [job])
+        try:
+            outcome = future.result()
+        except Exception as e:
+            outcome = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        if not outcome["ok"]:
+            self._error(422, outcome["error"])
+            return
+        self._send(200, outcome["result"]["image"], content_type="image/png")
+
+    def _vault(self) -> Optional[Tuple[str, Any]]:
+        profile = self._params().get("profile")
+        if self.service.vault_manager is None:
+            self._error(404, "No vault root configured")
+            return None
+        if not profile or not profile.strip():
+            self._error(400, "profile is required")
+            return None
+        return profile, self.service.vault_manager.get_vault(profile)
+
+    def _get_vault(self) -> None:
+        file = self._params().get("file")
+        found = self._vault()
+        if found is None:
+            return
+        if not file:
+            self._error(400, "file is required")
+            return
+        self._send_json(200, {"file": file, "associations": found[1].get_associations(file)})
+
+    def _post_vault(self) -> None:
+        found = self._vault()
+        if found is None:
+            return
+        record = self._read_json()
+        if record is None:
+            return
+        if not isinstance(record, dict) or not isinstance(record.get("file"), str):
+            self._error(400, 'Invalid association: expected an object with a string "file"')
+            return
+        # Validated like an imported record; a bad one leaves the vault untouched
+        try:
+            found[1].add_associations([record])
+        except ValueError as e:
+            self._error(400, f"Invalid association: {e}")
+            return
+        file = record["file"]
+        associations = found[1].get_associations(file, fingerprint=record.get("fingerprint"))
+        self._send_json(201, {"file": file, "associations": associations})
+
+
+class AnalysisService:
+    """
+    HTTP front end of a pre-warmed worker pool, bound to localhost
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: Optional[int] = None,
+                 max_tasks_per_child: int = 50, warm_render: bool = True, max_pending: int = 64,
+                 max_batch: int = 8, batch_window: float = 0.005, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+                 vault_manager: Optional[Any] = None, log_requests: bool = False,
+                 job_timeout: float = DEFAULT_JOB_TIMEOUT):
+        """
+        Start the worker pool and bind the server (requests are served by
+        serve_forever or start)
+
+        Args:
+            host: Loopback address to bind; anything else raises ValueError
+            port: TCP port (0 picks a free one, see self.port)
+            workers: Worker processes (defaults to the CPU count)
+            max_tasks_per_child: Batches a worker runs before it is replaced
+            warm_render: Also warm the plotting stack for /visualize
+            max_pending: Jobs admitted at once (queued or running); more get 429
+            max_batch: Most jobs in one micro-batch
+            batch_window: Seconds a job may wait for others to batch with
+            max_body_bytes: Largest accepted request body
+            vault_manager: VaultManager serving profiles; None disables
+                /vault and the profile parameter
+            log_requests: Log every request to stderr
+            job_timeout: Seconds a job may run; a batch that overruns, or
+                whose worker dies, fails its jobs
+        """
+        family = _require_loopback(host)
+        self.max_pending = max(1, max_pending)
+        self.max_body_bytes = max_body_bytes
+        self.vault_manager = vault_manager
+        self.log_requests = log_requests
+        self.rejected = 0
+        self._pending = 0
+        self._admission_lock = threading.Lock()
+
+        server_class = type("_Server", (ThreadingHTTPServer,), {"address_family": family, "daemon_threads": True})
+        self._server = server_class((host.strip("[]"), port), _Handler)
+        self._server.service = self
+        self.host, self.port = self._server.server_address[:2]
+        self.allowed_hosts = self._allowed_hosts(host)
+        self._serve_thread: Optional[threading.Thread] = None
+
+        self.daemon = WorkerDaemon(workers=workers, max_tasks_per_child=max_tasks_per_child,
+                                   warm_render=warm_render, job_timeout=job_timeout)
+        self.batcher = _MicroBatcher(self.daemon, max_batch, batch_window)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _allowed_hosts(self, host: str) -> frozenset:
+        """Host header values of requests addressed to this server"""
+        allowed = set()
+        for name in {self.host, host.strip("[]"), "localhost"}:
+            name = f"[{name}]" if ":" in name else name
+            allowed.add(f"{name}:{self.port}".lower())
+            if self.port == 80:
+                allowed.add(name.lower())
+        return frozenset(allowed)
+
+    @property
+    def url(self) -> str:
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"http://{host}:{self.port}"
+
+    def submit(self, op: str, profile: Optional[str], jobs: List[Dict[str, Any]]) -> List[Future]:
+        """
+        Admit jobs and queue them for batching
+
+        Args:
+            op: "analyze" or "visualize"
+            profile: Listener the jobs belong to; only jobs with the same op
+                and profile share a batch
+            jobs: Worker jobs
+
+        Returns:
+            One future per job, resolving to its {"ok", "result" or "error"}
+            outcome
+
+        Raises:
+            ServiceBusy: Admitting the jobs would exceed max_pending
+        """
+        with self._admission_lock:
+            if self._pending + len(jobs) > self.max_pending:
+                self.rejected += 1
+                raise ServiceBusy(f"{self._pending} jobs pending")
+            self._pending += len(jobs)
+        futures = []
+        try:
+            for job in jobs:
+                future = self.batcher.put((op, profile), job)
+                future.add_done_callback(self._release)
+                futures.append(future)
+        except RuntimeError:
+            with self._admission_lock:
+                self._pending -= len(jobs) - len(futures)
+            raise
+        return futures
+
+    def _release(self, future: Future) -> None:
+        with self._admission_lock:
+            self._pending -= 1
+
+    def attach_associations(self, profile: str, analysis: Dict[str, Any]) -> None:
+        """Fill an analysis' personal_vault section from a listener's vault"""
+        vault = self.vault_manager.get_vault(profile)
+        associations = vault.get_associations(analysis["file_path"], fingerprint=analysis.get("fingerprint"))
+        analysis.setdefault("personal_vault", {})["associations"] = associations
+
+    def status(self) -> Dict[str, Any]:
+        """Worker pool, admission and batching state"""
+        with self._admission_lock:
+            admission = {"pending_jobs": self._pending, "max_pending": self.max_pending, "rejected": self.rejected}
+        status = {"pool": self.daemon.status(), "admission": admission, "batching": self.batcher.stats()}
+        if self.vault_manager is not None:
+            status["vaults"] = self.vault_manager.stats()
+        return status
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown"""
+        self._server.serve_forever()
+
+    def start(self) -> "AnalysisService":
+        """Serve requests from a background thread"""
+        self._serve_thread = threading.Thread(target=self.serve_forever, name="service-http", daemon=True)
+        self._serve_thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving and close the pool"""
+        self._server.shutdown()
+        self.close()
+
+    def close(self) -> None:
+        """Release the socket, the batcher and the worker pool"""
+        self._server.server_close()
+        self.batcher.close()
+        self.daemon.close()
+        if self.vault_manager is not None:
+            self.vault_manager.flush_all()
+
+
+class ServiceClient:
+    """
+    Client for a running AnalysisService
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: Optional[float] = None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                 body: Optional[bytes] = None, content_type: str = "application/octet-stream"):
+        """Send a request; returns the open response, raising on error statuses"""
+        query = urlencode({key: value for key, value in (params or {}).items() if value is not None})
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        headers = {"Content-Type": content_type} if body is not None else {}
+        connection.request(method, f"{path}?{query}" if query else path, body=body, headers=headers)
+        response = connection.getresponse()
+        if response.status < 400:
+            return response
+        try:
+            message = json.loads(response.read()).get("error", response.reason)
+        except ValueError:
+            message = response.reason
+        finally:
+            connection.close()
+        if response.status == 429:
+            raise ServiceBusy(message, float(response.getheader("Retry-After", RETRY_AFTER_SECONDS)))
+        raise RuntimeError(f"HTTP {response.status}: {message}")
+
+    def _json(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, data: Any = None) -> Any:
+        body = None if data is None else json.dumps(data, default=_json_default).encode("utf-8")
+        with self._request(method, path, params, body, content_type="application/json") as response:
+            return json.loads(response.read())
+
+    def status(self) -> Dict[str, Any]:
+        return self._json("GET", "/status")
+
+    def _stream(self, response) -> Iterator[Dict[str, Any]]:
+        with response:
+            for line in response:
+                record = json.loads(line)
+                if record.get("done"):
+                    return
+                yield record
+
+    def analyze(self, audio: bytes, name: Optional[str] = None, profile: Optional[str] = None,
+                seed: Any = None) -> Dict[str, Any]:
+        """Analyze encoded audio; raises RuntimeError if the analysis failed"""
+        response = self._request("POST", "/analyze", {"name": name, "profile": profile, "seed": seed}, audio)
+        record, = list(self._stream(response))
+        if not record["ok"]:
+            raise RuntimeError(record["error"])
+        return record["result"]
+
+    def analyze_files(self, file_paths: List[str], profile: Optional[str] = None,
+                      seed: Any = None) -> Iterator[Dict[str, Any]]:
+        """Analyze files on this machine; yields {"file", "ok", "result" or "error"} as each finishes"""
+        body = json.dumps({"files": [os.path.abspath(path) for path in file_paths]}).encode("utf-8")
+        response = self._request("POST", "/analyze", {"profile": profile, "seed": seed}, body,
+                                 content_type="application/json")
+        return self._stream(response)
+
+    def interpret(self, analysis: Dict[str, Any], seed: Any = None) -> Dict[str, Any]:
+        return self._json("POST", "/interpret", {"seed": seed}, analysis)
+
+    def visualize(self, audio: bytes, name: Optional[str] = None) -> bytes:
+        """PNG visualization of encoded audio"""
+        with self._request("POST", "/visualize", {"name": name}, audio) as response:
+            return response.read()
+
+    def associations(self, profile: str, file: str) -> List[Dict[str, Any]]:
+        return self._json("GET", "/vault", {"profile": profile, "file": file})["associations"]
+
+    def add_association(self, profile: str, file: str, timestamp: float, description: str,
+                        feeling_category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Add an association; returns the file's associations afterwards"""
+        record = {"file": file, "timestamp": timestamp, "description": description,
+                  "feeling_category": feeling_category}
+        return self._json("POST", "/vault", {"profile": profile}, record)["associations"]
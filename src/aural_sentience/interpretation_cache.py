@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Interpretation Cache
+Remembering What the Lexicon Already Said
+
+Poetic interpretations are deterministic once they are seeded per report
+(see ResonanceLexicon.interpret_many), so they can be memoized. Entries are
+keyed by the digest of the analysis sections the interpretation reads plus
+the version of every lexicon section it touched: after a lexicon edit only
+the reports that use the edited sections miss the cache.
+
+Entries live in a single SQLite file and the least recently used ones are
+evicted once max_entries is exceeded.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class InterpretationCache:
+    """
+    Persistent LRU cache of poetic interpretations
+    """
+
+    # Cache hits buffered before their access times are written
+    TOUCH_BATCH = 256
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        """
+        Open (or create) a cache
+
+        Args:
+            path: SQLite file holding the cache
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.path = path
+        self.max_entries = max(1, int(max_entries))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS interpretations ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS interpretations_last_access"
+            " ON interpretations (last_access)"
+        )
+        self._connection.commit()
+        self._count = self._connection.execute("SELECT COUNT(*) FROM interpretations").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def make_key(analysis_digest: str, section_versions: Dict[str, str], seed: Any = None) -> str:
+        """Combine an analysis digest, touched section versions and the seed"""
+        material = json.dumps(
+            {"analysis": analysis_digest, "sections": section_versions, "seed": str(seed)},
+            sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached interpretation and mark it recently used"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM interpretations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            # Access times are written in batches; a hit should not cost a commit
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._write_touches()
+                self._connection.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, interpretation: Dict[str, Any]) -> None:
+        """Store an interpretation, evicting old entries if the cache is full"""
+        value = json.dumps(interpretation)
+        with self._lock:
+            exists = self._connection.execute(
+                "SELECT 1 FROM interpretations WHERE key = ?", (key,)
+            ).fetchone()
+            if not exists:
+                self._count += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO interpretations (key, value, last_access) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._write_touches()
+            self._evict()
+            self._connection.commit()
+
+    def _write_touches(self) -> None:
+        if self._touched:
+            self._connection.executemany(
+                "UPDATE interpretations SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Trim to 90% of max_entries once the limit is exceeded"""
+        if self._count <= self.max_entries:
+            return
+        excess = self._count - int(self.max_entries * 0.9)
+        self._connection.execute(
+            "DELETE FROM interpretations WHERE key IN ("
+            " SELECT key FROM interpretations ORDER BY last_access LIMIT ?)",
+            (excess,)
+        )
+        self._count -= excess
+
+    def clear(self) -> None:
+        """Drop every cached interpretation"""
+        with self._lock:
+            self._connection.execute("DELETE FROM interpretations")
+            self._connection.commit()
+            self._touched.clear()
+            self._count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process"""
+        return {
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._write_touches()
+            self._connection.commit()
+            self._connection.close()
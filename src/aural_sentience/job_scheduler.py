@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Job Scheduler
+Choosing Which Song to Hear Next
+
+Processing a batch in list order lets one two-hour recording at the front
+hold back every short track behind it. The scheduler probes each file's
+header (no decoding), predicts its processing time with a CostModel and
+orders the batch by a policy:
+
+    sjf      shortest job first: minimises the mean time until a file is done
+    longest  longest job first: minimises the makespan on several workers
+    fair     round-robin across groups (by default the parent directory),
+             shortest first within each group, so no album waits for another
+    fifo     input order
+
+The cost model is a linear fit of seconds against audio duration and
+decoded sample count. It starts from a conservative prior, learns from
+every file the master processes, and is kept in a small JSON file so each
+run calibrates the next. Before a batch starts, plan() simulates the
+chosen order on the worker count to give a whole-batch time estimate.
+"""
+
+import heapq
+import json
+import os
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .memory_governor import probe_audio
+from .session_manifest import atomic_write_json
+
+SCHEDULING_POLICIES = ("sjf", "longest", "fair", "fifo")
+
+DEFAULT_COST_MODEL_PATH = os.environ.get(
+    "AURAL_SENTIENCE_COST_MODEL",
+    os.path.join(os.path.expanduser("~"), ".aural_sentience", "cost_model.json")
+)
+
+# Seconds = intercept + per audio second * duration + per decoded sample * samples
+PRIOR_COEFFICIENTS = (1.0, 0.05, 2e-8)
+
+# Observations needed before fitting all coefficients instead of scaling the prior
+MIN_FIT_OBSERVATIONS = 8
+
+
+def _features(probe: Dict[str, Any]) -> Tuple[float, float, float]:
+    duration = float(probe["duration"])
+    return 1.0, duration, duration * probe["sample_rate"] * probe["channels"]
+
+
+class CostModel:
+    """
+    Predicts processing seconds per file from its header probe
+    """
+
+    def __init__(self, path: Optional[str] = None, max_observations: int = 500):
+        """
+        Args:
+            path: JSON file the observations persist in; None for an in-memory model
+            max_observations: Most recent observations kept for fitting
+        """
+        self.path = path
+        self.observations: Deque[Tuple[Tuple[float, float, float], float]] = deque(maxlen=max_observations)
+        self.coefficients = PRIOR_COEFFICIENTS
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                for features, seconds in data.get("observations", []):
+                    self.observations.append((tuple(features), seconds))
+            except (OSError, ValueError, TypeError):
+                # A damaged cache only costs the calibration
+                self.observations.clear()
+        self._fit()
+
+    @property
+    def calibrated(self) -> bool:
+        return len(self.observations) >= MIN_FIT_OBSERVATIONS
+
+    def predict(self, probe: Dict[str, Any]) -> float:
+        """Predicted seconds for one file"""
+        return max(0.0, float(np.dot(self.coefficients, _features(probe))))
+
+    def observe(self, probe: Dict[str, Any], seconds: float) -> None:
+        """Record how long a file actually took and refit"""
+        self.observations.append((_features(probe), float(seconds)))
+        self._fit()
+
+    def _fit(self) -> None:
+        if not self.observations:
+            self.coefficients = PRIOR_COEFFICIENTS
+            return
+        X = np.array([features for features, _ in self.observations])
+        y = np.array([seconds for _, seconds in self.observations])
+        if self.calibrated:
+            coefficients, *_ = np.linalg.lstsq(X, y, rcond=None)
+            # Collinear features (one sample rate throughout) can fit a
+            # negative slope; such a model extrapolates badly to long files
+            if np.all(coefficients >= 0):
+                self.coefficients = tuple(float(c) for c in coefficients)
+                return
+        # Too little (or too degenerate) data: keep the prior's shape, fit its scale
+        prior = X @ np.array(PRIOR_COEFFICIENTS)
+        scale = float(np.dot(prior, y) / max(np.dot(prior, prior), 1e-12))
+        self.coefficients = tuple(c * scale for c in PRIOR_COEFFICIENTS)
+
+    def save(self) -> None:
+        """Write the observations atomically"""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # The model is shared by every session (and queue worker) of a user
+        atomic_write_json(self.path, {"observations": [[list(features), seconds]
+                                                       for features, seconds in self.observations]})
+
+
+def _order(jobs: List[Dict[str, Any]], policy: str, group_key: Callable[[str], str]) -> List[Dict[str, Any]]:
+    if policy == "fifo":
+        return list(jobs)
+    if policy == "sjf":
+        return sorted(jobs, key=lambda job: job["predicted_seconds"])
+    if policy == "longest":
+        return sorted(jobs, key=lambda job: -job["predicted_seconds"])
+    if policy == "fair":
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for job in jobs:
+            groups[group_key(job["file_path"])].append(job)
+        queues = [deque(sorted(group, key=lambda job: job["predicted_seconds"])) for group in groups.values()]
+        ordered = []
+        while queues:
+            for group in list(queues):
+                ordered.append(group.popleft())
+                if not group:
+                    queues.remove(group)
+        return ordered
+    raise ValueError(f"Unknown scheduling policy {policy!r}; expected one of {', '.join(SCHEDULING_POLICIES)}")
+
+
+def plan(file_paths: Sequence[str], policy: str = "sjf", workers: int = 1,
+         cost_model: Optional[CostModel] = None,
+         group_key: Callable[[str], str] = os.path.dirname) -> Dict[str, Any]:
+    """
+    Order a batch and estimate how long it will take
+
+    Args:
+        file_paths: Inputs of the batch
+        policy: One of SCHEDULING_POLICIES
+        workers: Files processed at once
+        cost_model: Predictor (default: an uncalibrated in-memory model)
+        group_key: Group of a file for the fair policy
+
+    Returns:
+        Dictionary with order (file paths), probes (path -> probe), jobs
+        (path, predicted seconds, predicted start and finish), and the
+        total work and makespan in seconds
+    """
+    cost_model = cost_model or CostModel()
+    jobs = []
+    for file_path in file_paths:
+        try:
+            probe = probe_audio(file_path)
+        except OSError:
+            # Unreadable files fail fast once processing reaches them
+            probe = {"duration": 0.0, "sample_rate": 0, "channels": 0, "estimated": True}
+        jobs.append({"file_path": file_path, "probe": probe, "predicted_seconds": cost_model.predict(probe)})
+    ordered = _order(jobs, policy, group_key)
+
+    # List scheduling: each file starts on the worker that frees up first
+    free_at = [0.0] * max(1, workers)
+    for job in ordered:
+        start = heapq.heappop(free_at)
+        job["predicted_start"] = start
+        job["predicted_finish"] = start + job["predicted_seconds"]
+        heapq.heappush(free_at, job["predicted_finish"])
+
+    return {
+        "policy": policy,
+        "workers": max(1, workers),
+        "calibrated": cost_model.calibrated,
+        "order": [job["file_path"] for job in ordered],
+        "probes": {job["file_path"]: job["probe"] for job in ordered},
+        "jobs": [{key: job[key] for key in ("file_path", "predicted_seconds", "predicted_start", "predicted_finish")}
+                 for job in ordered],
+        "total_work_seconds": sum(job["predicted_seconds"] for job in ordered),
+        "makespan_seconds": max(free_at) if ordered else 0.0,
+        "mean_completion_seconds": (sum(job["predicted_finish"] for job in ordered) / len(ordered)) if ordered else 0.0
+    }
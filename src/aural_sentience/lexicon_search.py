@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Lexicon Search
+Finding Every Place the Lexicon Speaks of Breath
+
+An inverted index over every string in a ResonanceLexicon: sacred frequency
+qualities and resonances, spectral and rhythmic archetypes, cultural
+patterns and poetic templates. Each hit points back to its lexicon path
+(e.g. "lexicon/sacred_frequencies/174/poetic_qualities/2") so editors can
+jump straight to the entry.
+
+The index is kept per section (one per top-level key of lexicon,
+cultural_patterns and poetic_templates); refreshing it only re-tokenizes
+the sections whose content changed.
+
+Query syntax:
+    breath ancestral         every term must match (AND)
+    poetic_qualities:breath  term scoped to a field (the key holding the string)
+    ancest*                  prefix match
+
+Unscoped terms must all match the same string. A term scoped to another
+field than the string's must match a string of that field in the same
+entry, so "essence:love poetic_qualities:earth" finds the essence and the
+poetic qualities of the sacred frequencies that satisfy both.
+"""
+
+import bisect
+import hashlib
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Sections of a ResonanceLexicon that are indexed
+INDEXED_SECTIONS = ("lexicon", "cultural_patterns", "poetic_templates")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens of a lexicon string"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _walk_strings(value: Any, path: Tuple[Any, ...], field: str,
+                  entry: Tuple[Any, ...] = ()) -> Iterable[Tuple[Tuple[Any, ...], Tuple[Any, ...], str, str]]:
+    """Yield (path, entry, field, text) for every string below a nested section
+
+    entry is the path of the mapping whose key names the field.
+    """
+    if isinstance(value, str):
+        yield path, entry, field, value
+    elif isinstance(value, Mapping):
+        for key, child in value.items():
+            yield from _walk_strings(child, path + (key,), str(key), path)
+    elif isinstance(value, (list, tuple)):
+        for position, child in enumerate(value):
+            yield from _walk_strings(child, path + (position,), field, entry)
+
+
+def _section_digest(value: Any) -> str:
+    material = json.dumps([(path, field, text) for path, _, field, text in _walk_strings(value, (), "")],
+                          default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _SectionIndex:
+    """Postings for one lexicon section"""
+
+    __slots__ = ("source", "digest", "documents", "entries", "postings", "vocabulary")
+
+    def __init__(self, name: str, source: Any, digest: str):
+        self.source = source
+        self.digest = digest
+        self.documents: List[Dict[str, str]] = []
+        # Entry (see _walk_strings) of every document, for cross-field queries
+        self.entries: List[Tuple[Any, ...]] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        prefix = tuple(name.split("/"))
+        for path, entry, field, text in _walk_strings(source, prefix, prefix[-1], prefix[:-1]):
+            doc_id = len(self.documents)
+            self.entries.append(entry)
+            self.documents.append({
+                "path": "/".join(str(part) for part in path),
+                "field": field,
+                "text": text
+            })
+            for token in set(tokenize(text)):
+                self.postings.setdefault(token, []).append(doc_id)
+        # Sorted vocabulary for prefix queries
+        self.vocabulary = sorted(self.postings)
+
+    def match(self, term: str, prefix: bool) -> set:
+        if not prefix:
+            return set(self.postings.get(term, ()))
+        matches = set()
+        start = bisect.bisect_left(self.vocabulary, term)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches.update(self.postings[token])
+        return matches
+
+
+class LexiconSearchIndex:
+    """
+    Inverted index over the strings of a ResonanceLexicon
+    """
+
+    def __init__(self):
+        self._sections: Dict[str, _SectionIndex] = {}
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        return sum(len(section.documents) for section in self._sections.values())
+
+    def sections(self) -> List[str]:
+        """Names of the indexed sections"""
+        return sorted(self._sections)
+
+    def refresh(self, lexicon: Any, force: bool = False) -> List[str]:
+        """
+        Bring the index up to date with a lexicon
+
+        A section whose object is unchanged is trusted as-is unless force is
+        set (pass force after in-place edits); otherwise it is only rebuilt
+        when its content digest differs.
+
+        Args:
+            lexicon: ResonanceLexicon (or any object with the indexed sections)
+            force: Re-check the content of sections even if they are the same objects
+
+        Returns:
+            Names of the sections that were rebuilt
+        """
+        current: Dict[str, Any] = {}
+        for attribute in INDEXED_SECTIONS:
+            for key, value in getattr(lexicon, attribute).items():
+                current[f"{attribute}/{key}"] = value
+
+        rebuilt = []
+        for name, source in current.items():
+            existing = self._sections.get(name)
+            if existing is not None and existing.source is source and not force:
+                continue
+            digest = _section_digest(source)
+            if existing is not None and existing.digest == digest:
+                existing.source = source
+                continue
+            self._sections[name] = _SectionIndex(name, source, digest)
+            rebuilt.append(name)
+        # Kept in lexicon order, which is the order of the hits
+        self._sections = {name: self._sections[name] for name in current}
+        self.rebuilds += len(rebuilt)
+        return rebuilt
+
+    @staticmethod
+    def parse_query(query: str) -> List[Tuple[Optional[str], str, bool]]:
+        """Split a query into (field, term, is_prefix) clauses"""
+        clauses = []
+        for raw in query.split():
+            field, _, term = raw.rpartition(":")
+            tokens = tokenize(term)
+            for position, token in enumerate(tokens):
+                # Only the last token of "word-word*" is a prefix
+                is_prefix = term.endswith("*") and position == len(tokens) - 1
+                clauses.append((field or None, token, is_prefix))
+        return clauses
+
+    def search(self, query: str, fields: Optional[Iterable[str]] = None,
+               sections: Optional[Iterable[str]] = None,
+               limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Find lexicon strings matching every clause of a query
+
+        Args:
+            query: Terms, optionally field-scoped ("field:term") or prefixed ("term*")
+            fields: Restrict every hit to these fields
+            sections: Restrict to sections whose name starts with one of these
+                (e.g. "lexicon/sacred_frequencies", "poetic_templates")
+            limit: Maximum number of hits
+
+        Returns:
+            Hits with the lexicon path, field and text, in lexicon order
+        """
+        clauses = self.parse_query(query)
+        if not clauses:
+            return []
+        allowed_fields = set(fields) if fields is not None else None
+        section_prefixes = tuple(sections) if sections is not None else None
+
+        hits: List[Dict[str, str]] = []
+        for name, section in self._sections.items():
+            if section_prefixes is not None and not name.startswith(section_prefixes):
+                continue
+            # Documents and entries each clause matches, a scoped clause only in its field
+            matches = []
+            for field, term, prefix in clauses:
+                documents = section.match(term, prefix)
+                if field is not None:
+                    documents = {doc_id for doc_id in documents if section.documents[doc_id]["field"] == field}
+                if not documents:
+                    break
+                matches.append((field, documents, {section.entries[doc_id] for doc_id in documents}))
+            if len(matches) < len(clauses):
+                continue
+
+            for doc_id in sorted(set().union(*(documents for _, documents, _ in matches))):
+                document = section.documents[doc_id]
+                if allowed_fields is not None and document["field"] not in allowed_fields:
+                    continue
+                # Clauses on the document's own field (or none) must match it,
+                # clauses on other fields a sibling in the same entry
+                if not all(doc_id in documents if field in (None, document["field"])
+                           else section.entries[doc_id] in entries
+                           for field, documents, entries in matches):
+                    continue
+                hits.append(dict(document))
+                if limit is not None and len(hits) >= limit:
+                    return hits
+        return hits
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Library Similarity
+Hearing Which Songs Belong Together
+
+Every analysis carries a feature_summary: its chroma profile, tempo,
+brightness and sacred-gap density. Together with the sacred-frequency
+prominences these form a short vector per track, and cosine similarity
+between the vectors relates every track in a library to every other.
+
+The N x N matrix is computed in row blocks, so the temporaries stay at
+block_size x N however large the library grows, and it is stored as
+float32 so thousands of tracks fit comfortably in memory. Adding or
+re-analyzing a track recomputes only its own row and column. The matrix
+persists next to the session, so a resumed session or a watched library
+pays only for the tracks that changed.
+
+On top of the matrix sit nearest-neighbour lists and spherical k-means
+clusters ("resonance families"), summarized for the comparative analysis.
+"""
+
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Bump whenever feature_vector() changes, so saved matrices are rebuilt
+FEATURE_VERSION = "1"
+
+SACRED_FREQUENCIES = (174, 285, 396, 417, 528, 639, 741, 852, 963)
+PITCH_CLASSES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Vector layout: 12 chroma, 9 sacred prominences, tempo, brightness, gap density
+FEATURE_DIMENSIONS = len(PITCH_CLASSES) + len(SACRED_FREQUENCIES) + 3
+
+# Fixed centres and scales (rather than statistics of the library) keep
+# every stored vector valid when tracks are added
+TEMPO_CENTER, TEMPO_SCALE = 110.0, 40.0
+BRIGHTNESS_CENTER, BRIGHTNESS_SCALE = 2000.0, 1500.0
+GAP_DENSITY_SCALE = np.log1p(30.0)
+PROMINENCE_SCALE = np.log1p(10.0)
+CHROMA_WEIGHT = 3.0
+
+
+def feature_vector(technical_analysis: Dict[str, Any]) -> np.ndarray:
+    """
+    Feature vector of one track, unit length
+
+    Reports analyzed before feature_summary existed still get a vector:
+    missing features sit at their centre and do not pull it either way.
+
+    Args:
+        technical_analysis: An analyze_audio() report
+
+    Returns:
+        float32 array of FEATURE_DIMENSIONS values
+    """
+    summary = technical_analysis.get("feature_summary") or {}
+    vector = np.zeros(FEATURE_DIMENSIONS, dtype=np.float64)
+
+    chroma = np.asarray(summary.get("chroma_profile") or np.full(12, 1 / 12), dtype=np.float64)
+    if chroma.shape == (12,) and chroma.sum() > 0:
+        vector[:12] = (chroma / chroma.sum() - 1 / 12) * 12 * CHROMA_WEIGHT
+
+    sacred = technical_analysis.get("resonance_analysis", {}).get("sacred_frequencies", {})
+    for offset, freq in enumerate(SACRED_FREQUENCIES):
+        # JSON round trips turn the integer keys into strings
+        detected = sacred.get(freq) or sacred.get(str(freq))
+        if detected:
+            vector[12 + offset] = np.log1p(detected.get("prominence", 0.0)) / PROMINENCE_SCALE
+
+    if summary.get("tempo") is not None:
+        vector[21] = (summary["tempo"] - TEMPO_CENTER) / TEMPO_SCALE
+    if summary.get("brightness") is not None:
+        vector[22] = (summary["brightness"] - BRIGHTNESS_CENTER) / BRIGHTNESS_SCALE
+    if summary.get("gap_density") is not None:
+        vector[23] = np.log1p(summary["gap_density"]) / GAP_DENSITY_SCALE
+
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm > 0 else vector).astype(np.float32)
+
+
+class SimilarityMatrix:
+    """
+    Cosine similarity between every pair of tracks, updated incrementally
+    """
+
+    def __init__(self, block_size: int = 1024):
+        """
+        Args:
+            block_size: Rows computed at once; bounds the temporaries to
+                block_size x N float32 values
+        """
+        self.block_size = block_size
+        self.names: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors = np.zeros((0, FEATURE_DIMENSIONS), dtype=np.float32)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:len(self.names)]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        n = len(self.names)
+        return self._matrix[:n, :n]
+
+    def vector(self, name: str) -> np.ndarray:
+        return self._vectors[self._positions[name]]
+
+    def _reserve(self, count: int) -> None:
+        """
+        Grow the buffers to hold count tracks
+
+        Growth is geometric, so repeated adds stay amortized O(N) each, but
+        by a quarter rather than double: the matrix is quadratic, and
+        doubling a loaded library of N tracks would allocate (2N)^2 cells for
+        its first new track.
+        """
+        capacity = self._vectors.shape[0]
+        if count <= capacity:
+            return
+        capacity = max(count, capacity + capacity // 4, 16)
+        n = len(self.names)
+        vectors = np.zeros((capacity, FEATURE_DIMENSIONS), dtype=np.float32)
+        vectors[:n] = self._vectors[:n]
+        matrix = np.zeros((capacity, capacity), dtype=np.float32)
+        matrix[:n, :n] = self._matrix[:n, :n]
+        self._vectors, self._matrix = vectors, matrix
+
+    def add(self, name: str, vector: np.ndarray) -> None:
+        """Add a track, or replace the vector of one already present"""
+        self.add_many([(name, vector)])
+
+    def add_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """
+        Add or replace several tracks; only their rows and columns are computed
+
+        Args:
+            items: (name, feature_vector()) pairs
+        """
+        items = list(items)
+        self._reserve(len(self.names) + len(items))
+        touched = []
+        for name, vector in items:
+            position = self._positions.get(name)
+            if position is None:
+                position = len(self.names)
+                self._positions[name] = position
+                self.names.append(name)
+            self._vectors[position] = vector
+            touched.append(position)
+        if not touched:
+            return
+
+        touched = np.unique(touched)
+        vectors = self.vectors
+        for start in range(0, len(touched), self.block_size):
+            rows = touched[start:start + self.block_size]
+            block = vectors[rows] @ vectors.T
+            self._matrix[rows, :len(self.names)] = block
+            self._matrix[:len(self.names), rows] = block.T
+
+    def retain(self, names: Iterable[str]) -> None:
+        """Drop every track not in names"""
+        keep = [self._positions[name] for name in names if name in self._positions]
+        if len(keep) == len(self.names):
+            return
+        keep = np.array(sorted(set(keep)), dtype=np.intp)
+        self.names = [self.names[i] for i in keep]
+        self._positions = {name: i for i, name in enumerate(self.names)}
+        self._vectors = np.ascontiguousarray(self._vectors[keep])
+        self._matrix = np.ascontiguousarray(self._matrix[np.ix_(keep, keep)])
+
+    def similarity(self, a: str, b: str) -> float:
+        return float(self._matrix[self._positions[a], self._positions[b]])
+
+    def nearest(self, name: str, k: int = 5) -> List[Tuple[str, float]]:
+        """The k tracks most similar to name, most similar first"""
+        position = self._positions[name]
+        row = self.matrix[position].copy()
+        row[position] = -np.inf
+        k = min(k, len(self.names) - 1)
+        if k <= 0:
+            return []
+        candidates = np.argpartition(-row, k - 1)[:k]
+        candidates = candidates[np.argsort(-row[candidates], kind="stable")]
+        return [(self.names[i], float(row[i])) for i in candidates]
+
+    def mean_similarity(self) -> float:
+        """Mean similarity over all distinct pairs, accumulated block by block"""
+        n = len(self.names)
+        if n < 2:
+            return 1.0
+        total = 0.0
+        for start in range(0, n, self.block_size):
+            total += float(self.matrix[start:start + self.block_size].sum(dtype=np.float64))
+        return (total - float(np.trace(self.matrix, dtype=np.float64))) / (n * (n - 1))
+
+    def closest_pairs(self, count: int = 5) -> List[Tuple[str, str, float]]:
+        """The most similar distinct pairs in the library"""
+        n = len(self.names)
+        best = []
+        for start in range(0, n, self.block_size):
+            block = self.matrix[start:start + self.block_size].copy()
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = -np.inf
+            partners = np.argmax(block, axis=1)
+            best.extend((block[row, partner], start + row, partner) for row, partner in zip(rows, partners))
+        pairs = []
+        seen = set()
+        for score, a, b in sorted(best, key=lambda item: -item[0]):
+            key = (min(a, b), max(a, b))
+            if key in seen or not np.isfinite(score):
+                continue
+            seen.add(key)
+            pairs.append((self.names[key[0]], self.names[key[1]], float(score)))
+            if len(pairs) == count:
+                break
+        return pairs
+
+    def kmeans(self, k: int, iterations: int = 50, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Spherical k-means over the unit feature vectors
+
+        Args:
+            k: Number of clusters (capped at the number of tracks)
+            iterations: Upper bound on refinement rounds
+            seed: Seed of the k-means++ initialisation
+
+        Returns:
+            (labels per track, unit centroids shaped (k, FEATURE_DIMENSIONS))
+        """
+        vectors = self.vectors
+        n = len(vectors)
+        k = max(1, min(k, n))
+        rng = np.random.default_rng(seed)
+
+        # k-means++ on cosine distance
+        centroids = [vectors[rng.integers(n)]]
+        distance = 1.0 - vectors @ centroids[0]
+        for _ in range(1, k):
+            weights = np.clip(distance, 0.0, None) ** 2
+            total = weights.sum()
+            choice = rng.choice(n, p=weights / total) if total > 0 else rng.integers(n)
+            centroids.append(vectors[choice])
+            distance = np.minimum(distance, 1.0 - vectors @ vectors[choice])
+        centroids = np.array(centroids)
+
+        labels = np.full(n, -1)
+        for _ in range(iterations):
+            new_labels = np.argmax(vectors @ centroids.T, axis=1)
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            for cluster in range(k):
+                members = vectors[labels == cluster]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[cluster] = centroid / norm if norm > 0 else centroid
+        return labels, centroids
+
+    def summary(self, clusters: Optional[int] = None, neighbours: int = 5,
+                labels: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Nearest-neighbour and cluster summary for the comparative analysis
+
+        Args:
+            clusters: Number of clusters (default: about sqrt(N / 2), at most 12)
+            neighbours: Neighbours listed per track
+            labels: Display name per track (default: the track name)
+
+        Returns:
+            Dictionary with mean similarity, closest pairs, neighbours per
+            track and the clusters with their representative tracks
+        """
+        labels = labels or {}
+
+        def display(name: str) -> str:
+            return labels.get(name, name)
+
+        n = len(self.names)
+        summary: Dict[str, Any] = {
+            "tracks": n,
+            "feature_version": FEATURE_VERSION,
+            "mean_similarity": self.mean_similarity(),
+            "closest_pairs": [{"tracks": [display(a), display(b)], "similarity": score}
+                              for a, b, score in self.closest_pairs()],
+            "nearest_neighbours": {
+                display(name): [{"track": display(other), "similarity": score}
+                                for other, score in self.nearest(name, neighbours)]
+                for name in self.names
+            },
+            "clusters": []
+        }
+        if n < 3:
+            return summary
+
+        k = clusters or min(12, max(2, int(round(np.sqrt(n / 2)))))
+        cluster_labels, centroids = self.kmeans(k)
+        vectors = self.vectors
+        for cluster, centroid in enumerate(centroids):
+            members = np.flatnonzero(cluster_labels == cluster)
+            if not len(members):
+                continue
+            affinity = vectors[members] @ centroid
+            summary["clusters"].append({
+                "cluster": cluster,
+                "size": int(len(members)),
+                "representative": display(self.names[members[np.argmax(affinity)]]),
+                "dominant_pitch_class": PITCH_CLASSES[int(np.argmax(centroid[:12]))],
+                "cohesion": float(affinity.mean()),
+                "members": [display(self.names[i]) for i in members]
+            })
+        summary["clusters"].sort(key=lambda cluster: -cluster["size"])
+        return summary
+
+    def save(self, path: str) -> None:
+        """Write names, vectors and matrix atomically"""
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, version=np.array(FEATURE_VERSION), names=np.array(self.names, dtype=str),
+                 vectors=self.vectors, matrix=self.matrix)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, block_size: int = 1024) -> "SimilarityMatrix":
+        """
+        Read a saved matrix; a missing, damaged or outdated file gives an empty one
+        """
+        similarity = cls(block_size=block_size)
+        if not os.path.exists(path):
+            return similarity
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["version"]) != FEATURE_VERSION:
+                    return similarity
+                names = [str(name) for name in data["names"]]
+                vectors = data["vectors"].astype(np.float32)
+                matrix = data["matrix"].astype(np.float32)
+        except (OSError, ValueError, KeyError):
+            return similarity
+        if vectors.shape != (len(names), FEATURE_DIMENSIONS) or matrix.shape != (len(names), len(names)):
+            return similarity
+        similarity.names = names
+        similarity._positions = {name: i for i, name in enumerate(names)}
+        similarity._vectors = vectors
+        similarity._matrix = matrix
+        return similarity
+
+
+def compare_library(reports: Sequence[Dict[str, Any]], path: Optional[str] = None,
+                    clusters: Optional[int] = None, neighbours: int = 5, retain: bool = True) -> Dict[str, Any]:
+    """
+    Similarity summary of a set of master reports
+
+    Args:
+        reports: Master reports (as saved by AuralSentienceMaster)
+        path: Saved matrix to update incrementally and write back; None to
+            compute from scratch in memory
+        clusters: Number of clusters (see SimilarityMatrix.summary)
+        neighbours: Neighbours listed per track
+        retain: Drop saved tracks missing from reports; False to keep them,
+            so a library arriving batch by batch is compared as a whole
+
+    Returns:
+        SimilarityMatrix.summary() keyed by file name, plus "updated_tracks"
+        (rows computed in this call) and "matrix_file"
+    """
+    tracks = {}
+    for report in reports:
+        file_path = report["aural_sentience_master_report"]["file_path"]
+        tracks[file_path] = feature_vector(report.get("technical_analysis", {}))
+
+    similarity = SimilarityMatrix.load(path) if path else SimilarityMatrix()
+    if retain:
+        similarity.retain(tracks)
+    changed = [(name, vector) for name, vector in tracks.items()
+               if name not in similarity or not np.allclose(similarity.vector(name), vector, atol=1e-6)]
+    similarity.add_many(changed)
+    if path:
+        similarity.save(path)
+
+    # File names read better than paths; paths only where names collide
+    base_names = Counter(os.path.basename(name) for name in similarity.names)
+    labels = {name: os.path.basename(name) if base_names[os.path.basename(name)] == 1 else name
+              for name in similarity.names}
+    summary = similarity.summary(clusters=clusters, neighbours=neighbours, labels=labels)
+    summary["updated_tracks"] = len(changed)
+    summary["matrix_file"] = path
+    return summary
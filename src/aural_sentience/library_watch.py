@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Library Watch
+Noticing New Music as It Arrives
+
+Keeps an index of an audio library (size, mtime and content hash of every
+file, mtime and subdirectories of every directory) and turns new or
+changed audio into batches for the analysis pipeline.
+
+An idle library costs one stat() per directory per poll: a directory whose
+mtime is unchanged has gained, lost or renamed no entries, so its listing
+is skipped. Files rewritten in place do not touch their directory's mtime;
+those are caught by inotify events when the optional watchdog package is
+installed, and by a periodic full scan otherwise. Files still being
+written are held back until their size and mtime have been stable for
+settle_seconds, so a copy in progress is queued once, when it finishes.
+
+A ready file enters the index only once its batch has been handled
+(commit()), so a crash mid-batch leaves it to be queued again on restart.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .session_manifest import atomic_write_json, file_content_hash
+
+AUDIO_EXTENSIONS = frozenset({
+    ".mp3", ".wav", ".flac", ".ogg", ".oga", ".opus", ".m4a", ".aac", ".aif", ".aiff", ".wma"
+})
+
+INDEX_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def is_audio_file(path: str) -> bool:
+    """True for file names with a known audio extension"""
+    return os.path.splitext(path)[1].lower() in AUDIO_EXTENSIONS
+
+
+class LibraryIndex:
+    """
+    Persistent record of the files and directories of a library
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: JSON file the index is kept in; None for an in-memory index
+        """
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.dirs: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.files = data.get("files", {})
+                self.dirs = data.get("dirs", {})
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def forget_tree(self, directory: str) -> None:
+        """Drop a directory and everything recorded below it"""
+        info = self.dirs.pop(directory, None)
+        if info is None:
+            return
+        for name in info.get("files", ()):
+            self.files.pop(os.path.join(directory, name), None)
+        for subdirectory in info.get("subdirs", ()):
+            self.forget_tree(os.path.join(directory, subdirectory))
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the index atomically if it changed"""
+        if not self.path or not self.dirty:
+            return
+        atomic_write_json(self.path, {"version": INDEX_VERSION, "files": self.files, "dirs": self.dirs})
+        self.dirty = False
+
+
+class LibraryWatcher:
+    """
+    Detects new and changed audio below a root directory
+    """
+
+    def __init__(self, root: str, index_path: Optional[str] = None, settle_seconds: float = 2.0,
+                 full_scan_interval: float = 600.0, baseline: bool = False,
+                 use_watchdog: Optional[bool] = None):
+        """
+        Args:
+            root: Library root directory
+            index_path: Where the library index persists between runs
+                (default: .aural_sentience_library.json in root)
+            settle_seconds: How long a file must stay unchanged before it is queued
+            full_scan_interval: Seconds between scans that ignore directory mtimes
+            baseline: Index files found on the first scan without queueing them
+            use_watchdog: Use inotify-style events via watchdog; None to use it when installed
+        """
+        self.root = os.path.abspath(root)
+        self.index = LibraryIndex(index_path or os.path.join(self.root, ".aural_sentience_library.json"))
+        self.settle_seconds = settle_seconds
+        self.full_scan_interval = full_scan_interval
+        self.baseline = baseline and not self.index.dirs
+        self._last_full_scan = 0.0
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Index records of files handed out by poll() and not yet committed
+        self._uncommitted: Dict[str, Dict[str, Any]] = {}
+
+        self._events_lock = threading.Lock()
+        self._event_dirs: Set[str] = set()
+        self._event_files: Set[str] = set()
+        self._observer = None
+        if use_watchdog is not False:
+            self._observer = self._start_observer(required=use_watchdog is True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def pending(self) -> List[str]:
+        """Files seen changing that have not settled yet"""
+        return sorted(self._pending)
+
+    def _start_observer(self, required: bool):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            if required:
+                raise
+            return None
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = [event.src_path, getattr(event, "dest_path", None)]
+                with watcher._events_lock:
+                    for path in filter(None, paths):
+                        if event.is_directory:
+                            watcher._event_dirs.add(path)
+                        else:
+                            watcher._event_files.add(path)
+                        watcher._event_dirs.add(os.path.dirname(path))
+
+        observer = Observer()
+        observer.schedule(Handler(), self.root, recursive=True)
+        observer.daemon = True
+        observer.start()
+        return observer
+
+    def _scan_directory(self, directory: str, full: bool, changed: List[str]) -> None:
+        """Reconcile one directory with the index, listing it only if needed"""
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            self.index.forget_tree(directory)
+            return
+        info = self.index.dirs.get(directory)
+        if info is not None and info["mtime_ns"] == stat.st_mtime_ns and not full:
+            for subdirectory in info["subdirs"]:
+                self._scan_directory(os.path.join(directory, subdirectory), full, changed)
+            return
+
+        files = []
+        subdirs = []
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            self.index.forget_tree(directory)
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+            elif entry.is_file() and is_audio_file(entry.name):
+                files.append(entry.name)
+                self._check_file(entry.path, changed)
+
+        previous = info or {"files": [], "subdirs": []}
+        for name in set(previous["files"]) - set(files):
+            self.index.files.pop(os.path.join(directory, name), None)
+            self._pending.pop(os.path.join(directory, name), None)
+        for name in set(previous["subdirs"]) - set(subdirs):
+            self.index.forget_tree(os.path.join(directory, name))
+        record = {"mtime_ns": stat.st_mtime_ns, "files": files, "subdirs": subdirs}
+        # Saving the index touches the mtime of the directory it lives in;
+        # only a changed listing is worth another save
+        if info is None or info["files"] != files or info["subdirs"] != subdirs:
+            self.index.dirty = True
+        self.index.dirs[directory] = record
+
+        for subdirectory in subdirs:
+            self._scan_directory(os.path.join(directory, subdirectory), full, changed)
+
+    def _check_file(self, path: str, changed: List[str]) -> None:
+        """Start tracking a file whose size or mtime differs from the index"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        known = self.index.files.get(path)
+        if known is not None and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            return
+        if known is None and self.baseline:
+            # Not hashed up front; if it changes later the session manifest
+            # still recognises content it has already analyzed
+            self.index.files[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": None}
+            self.index.dirty = True
+            return
+        if path not in self._pending:
+            changed.append(path)
+        self._pending.setdefault(path, {"size": None, "mtime_ns": None, "stable_since": 0.0})
+
+    def scan(self, full: bool = False) -> List[str]:
+        """
+        Look for new or changed files
+
+        Args:
+            full: List every directory regardless of its mtime
+
+        Returns:
+            Files that started changing (they are queued once they settle)
+        """
+        changed: List[str] = []
+        self._scan_directory(self.root, full, changed)
+        if full:
+            self._last_full_scan = time.monotonic()
+        self.baseline = False
+        return changed
+
+    def _scan_events(self) -> List[str]:
+        with self._events_lock:
+            dirs, files = self._event_dirs, self._event_files
+            self._event_dirs, self._event_files = set(), set()
+        changed: List[str] = []
+        for directory in sorted(dirs):
+            if directory == self.root or directory.startswith(self.root + os.sep):
+                self._scan_directory(directory, False, changed)
+        for path in files:
+            if is_audio_file(path):
+                self._check_file(path, changed)
+        return changed
+
+    def _settle(self) -> List[str]:
+        """Hash files that stopped changing; return those whose content is new"""
+        now = time.monotonic()
+        ready = []
+        for path, state in list(self._pending.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self._pending[path]
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (state["size"], state["mtime_ns"]):
+                state.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, stable_since=now)
+                continue
+            if now - state["stable_since"] < self.settle_seconds:
+                continue
+
+            del self._pending[path]
+            try:
+                content_hash = file_content_hash(path)
+            except OSError:
+                continue
+            known = self.index.files.get(path)
+            record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": content_hash}
+            # A touch or a rewrite with identical bytes is not a change
+            if known is None or known.get("hash") != content_hash:
+                self._uncommitted[path] = record
+                ready.append(path)
+            else:
+                self.index.files[path] = record
+                self.index.dirty = True
+        return sorted(ready)
+
+    def poll(self) -> List[str]:
+        """
+        One watch cycle
+
+        Returns:
+            Files that are new or changed and have finished being written;
+            pass them to commit() once they are handled
+        """
+        if time.monotonic() - self._last_full_scan >= self.full_scan_interval:
+            self.scan(full=True)
+        elif self._observer is not None:
+            self._scan_events()
+        else:
+            self.scan()
+        ready = self._settle()
+        self.index.save()
+        return ready
+
+    def commit(self, paths: List[str]) -> None:
+        """Record handled files in the index so they are not queued again"""
+        for path in paths:
+            record = self._uncommitted.pop(path, None)
+            if record is not None:
+                self.index.files[path] = record
+                self.index.dirty = True
+        self.index.save()
+
+    def release(self, paths: List[str]) -> None:
+        """
+        Give up on files whose handling failed
+
+        They stay out of the index, so the next full scan queues them again.
+        """
+        for path in paths:
+            self._uncommitted.pop(path, None)
+
+    def run(self, handler: Callable[[List[str]], Any], poll_interval: float = 1.0,
+            stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Poll until stop_event is set, passing each batch of ready files to handler
+
+        A batch is committed when handler returns. If it raises, the error is
+        logged, the batch is released for a later full scan and watching
+        carries on.
+
+        Args:
+            handler: Called with a list of file paths
+            poll_interval: Seconds between polls
+            stop_event: Set to stop watching
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            ready = self.poll()
+            if ready:
+                try:
+                    handler(ready)
+                except Exception:
+                    logger.exception("Handling %d file(s) failed; they will be queued again", len(ready))
+                    self.release(ready)
+                else:
+                    self.commit(ready)
+            stop_event.wait(poll_interval if not self._pending else min(poll_interval, self.settle_seconds / 2))
+
+    def close(self) -> None:
+        """Stop the event observer and save the index"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=1.0)
+            self._observer = None
+        self.index.save()
+
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Memory Governor
+Knowing How Much Room Each Song Needs
+
+A batch that mixes three-minute singles with three-hour recordings cannot
+run at a fixed concurrency: enough workers to keep the machine busy on the
+singles will exhaust memory on the recordings. The governor estimates each
+file's working set from a header probe (duration, sample rate, channels)
+and a MemoryProfile, and admits files only while the sum of the admitted
+estimates fits a global budget. Concurrency therefore rises and falls with
+the mix of the batch.
+
+Workers report the peak RSS of every job; the ratio of measured to
+estimated memory is folded into a correction factor that scales later
+estimates, so a profile that is off for this machine or this library
+corrects itself within a few files.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+import threading
+import wave
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from ._lazy import LazyModule
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, the lifetime peak is unknown
+    resource = None
+
+sf = LazyModule("soundfile")
+
+# Fraction of available memory used as the default budget
+DEFAULT_BUDGET_FRACTION = 0.75
+
+# Bitrate assumed for files whose header cannot be read (bytes per second)
+FALLBACK_BYTES_PER_SECOND = 128000 // 8
+
+
+@dataclass
+class MemoryProfile:
+    """How the analysis profile translates audio into memory"""
+    sample_rate: int = 22050          # rate the engine resamples to
+    bytes_per_sample: int = 4         # float32
+    # Peak working set of each stage as a multiple of the decoded signal;
+    # spectrograms, chroma and FFT buffers dominate. Measured peaks adjust these
+    analysis_multiplier: float = 12.0
+    render_multiplier: float = 6.0
+    # The parent keeps the decoded signal and pickles one copy per stage
+    parent_copies: float = 3.0
+
+
+def probe_audio(path: str) -> Dict[str, Any]:
+    """
+    Read duration, sample rate and channel count without decoding
+
+    Args:
+        path: Audio file
+
+    Returns:
+        Dictionary with duration, sample_rate, channels and estimated
+        (True when the header could not be read and the values are guessed
+        from the file size)
+    """
+    try:
+        info = sf.info(path)
+        if info.samplerate and info.frames:
+            return {"duration": info.frames / info.samplerate, "sample_rate": info.samplerate,
+                    "channels": info.channels, "estimated": False}
+    except Exception:
+        pass
+    try:
+        with wave.open(path, 'rb') as w:
+            return {"duration": w.getnframes() / w.getframerate(), "sample_rate": w.getframerate(),
+                    "channels": w.getnchannels(), "estimated": False}
+    except (wave.Error, EOFError, OSError, ZeroDivisionError):
+        pass
+    return {"duration": os.path.getsize(path) / FALLBACK_BYTES_PER_SECOND, "sample_rate": 44100,
+            "channels": 2, "estimated": True}
+
+
+def available_memory() -> Optional[int]:
+    """Memory the kernel reports as available to new allocations, in bytes"""
+    try:
+        with open("/proc/meminfo", 'r') as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def _read_status_kib(field: str) -> Optional[int]:
+    try:
+        with open("/proc/self/status", 'r') as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+_libc = None
+
+
+def _trim_heap() -> None:
+    """Hand memory freed by earlier jobs back to the OS (glibc only)"""
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+            _libc.malloc_trim
+        except (OSError, AttributeError):
+            _libc = False
+    if _libc:
+        _libc.malloc_trim(0)
+
+
+def begin_job_measurement() -> Dict[str, Any]:
+    """
+    Start measuring the peak RSS of a job in the current process
+
+    On Linux the high-water mark is reset through /proc/self/clear_refs, so
+    the peak read afterwards belongs to this job alone. Elsewhere the
+    process-lifetime peak is all there is, and only growth beyond the
+    previous peak can be attributed to the job (without getrusage, nothing
+    can). Freed heap is trimmed
+    first: pages the allocator retained from an earlier job would otherwise
+    be reused without raising RSS, and the job would look free.
+    """
+    _trim_heap()
+    rss_before = _read_status_kib("VmRSS:")
+    try:
+        with open("/proc/self/clear_refs", 'w') as f:
+            f.write("5")
+        isolated = True
+    except OSError:
+        isolated = False
+    return {"rss_before": rss_before, "isolated": isolated, "lifetime_peak_before": _lifetime_peak()}
+
+
+def end_job_measurement(start: Dict[str, Any]) -> Dict[str, Any]:
+    """Finish a measurement begun with begin_job_measurement()"""
+    lifetime_peak = _lifetime_peak()
+    if start["isolated"]:
+        peak = _read_status_kib("VmHWM:") or lifetime_peak
+    else:
+        before = start["lifetime_peak_before"]
+        peak = lifetime_peak if None not in (lifetime_peak, before) and lifetime_peak > before else None
+    job_bytes = None
+    if peak is not None and start["rss_before"] is not None:
+        job_bytes = max(0, peak - start["rss_before"])
+    return {"pid": os.getpid(), "peak_rss": peak, "job_bytes": job_bytes, "lifetime_peak_rss": lifetime_peak}
+
+
+def _lifetime_peak() -> Optional[int]:
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryGovernor:
+    """
+    Admits jobs against a global memory budget
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, profile: Optional[MemoryProfile] = None,
+                 max_concurrent: Optional[int] = None, smoothing: float = 0.3):
+        """
+        Args:
+            budget_bytes: Memory the admitted jobs may use together (default:
+                three quarters of the memory available now)
+            profile: How audio translates into memory
+            max_concurrent: Upper bound on admitted jobs regardless of memory
+            smoothing: Weight of each new measurement in the correction factor
+        """
+        if budget_bytes is None:
+            budget_bytes = int((available_memory() or 4 << 30) * DEFAULT_BUDGET_FRACTION)
+        self.budget_bytes = budget_bytes
+        self.profile = profile or MemoryProfile()
+        self.max_concurrent = max_concurrent
+        self.smoothing = smoothing
+        self.correction = 1.0
+
+        self._condition = threading.Condition()
+        self._reserved: Dict[Any, int] = {}
+        self._closed = False
+        self.peak_concurrency = 0
+        self.peak_reserved = 0
+        self.worker_peaks: Dict[int, int] = {}
+        self.jobs: List[Dict[str, Any]] = []
+
+    def estimate(self, probe: Dict[str, Any]) -> int:
+        """Estimated peak memory of one file, in bytes, including the learned correction"""
+        profile = self.profile
+        # The decoder holds the native-rate, multichannel signal while resampling
+        decode = probe["duration"] * probe["sample_rate"] * probe["channels"] * profile.bytes_per_sample
+        copies = self._signal_bytes(probe) * profile.parent_copies
+        return int((decode + copies + self._worker_bytes(probe)) * self.correction)
+
+    def _signal_bytes(self, probe: Dict[str, Any]) -> float:
+        return probe["duration"] * self.profile.sample_rate * self.profile.bytes_per_sample
+
+    def _worker_bytes(self, probe: Dict[str, Any]) -> float:
+        """Uncorrected growth of the workers while they run the file's stages"""
+        return self._signal_bytes(probe) * (self.profile.analysis_multiplier + self.profile.render_multiplier)
+
+    def acquire(self, key: Any, estimate: int) -> bool:
+        """
+        Block until a job fits the budget, then reserve its estimate
+
+        A job larger than the whole budget is admitted once nothing else is
+        running, so it runs alone instead of never.
+
+        Returns:
+            False if the governor was closed while waiting
+        """
+        with self._condition:
+            while not self._closed and not self._fits(estimate):
+                self._condition.wait()
+            if self._closed:
+                return False
+            self._reserved[key] = estimate
+            self.peak_concurrency = max(self.peak_concurrency, len(self._reserved))
+            self.peak_reserved = max(self.peak_reserved, sum(self._reserved.values()))
+            return True
+
+    def _fits(self, estimate: int) -> bool:
+        if not self._reserved:
+            return True
+        if self.max_concurrent is not None and len(self._reserved) >= self.max_concurrent:
+            return False
+        if sum(self._reserved.values()) + estimate > self.budget_bytes:
+            return False
+        # Other processes on the machine count too
+        available = available_memory()
+        return available is None or estimate <= available
+
+    def release(self, key: Any) -> None:
+        """Return a job's reservation"""
+        with self._condition:
+            if self._reserved.pop(key, None) is not None:
+                self._condition.notify_all()
+
+    def record(self, key: Any, probe: Dict[str, Any], measurements: List[Dict[str, Any]]) -> None:
+        """
+        Fold a finished job's measured peaks into the correction factor
+
+        Only worker growth is measured, so it is compared with the worker
+        share of the estimate; the correction then scales the whole estimate.
+
+        Args:
+            key: Job identifier (reported back in summary())
+            probe: The probe the job was estimated from
+            measurements: end_job_measurement() results of the job's stages
+        """
+        observed = 0
+        measured = False
+        with self._condition:
+            for measurement in measurements:
+                if not measurement:
+                    continue
+                pid = measurement["pid"]
+                self.worker_peaks[pid] = max(self.worker_peaks.get(pid, 0), measurement["lifetime_peak_rss"] or 0)
+                if measurement.get("job_bytes") is not None:
+                    observed += measurement["job_bytes"]
+                    measured = True
+            expected = self._worker_bytes(probe)
+            self.jobs.append({"key": key, "duration": probe["duration"],
+                              "estimated_worker_bytes": int(expected * self.correction),
+                              "measured_worker_bytes": observed if measured else None})
+            if measured and expected > 0:
+                ratio = min(max(observed / expected, 0.1), 10.0)
+                self.correction += self.smoothing * (ratio - self.correction)
+
+    def close(self) -> None:
+        """Wake every waiter; pending acquire() calls return False"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def summary(self) -> Dict[str, Any]:
+        """Budget, learned correction, peak concurrency and peak RSS per worker"""
+        with self._condition:
+            return {
+                "budget_bytes": self.budget_bytes,
+                "correction": round(self.correction, 3),
+                "peak_concurrency": self.peak_concurrency,
+                "peak_reserved_bytes": self.peak_reserved,
+                "worker_peak_rss_bytes": {str(pid): peak for pid, peak in sorted(self.worker_peaks.items())},
+                "jobs": list(self.jobs)
+            }
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Batch Progress
+Hearing How Fast the Listening Goes
+
+A ProgressReporter turns a batch run into JSON-lines events that capacity
+planning can consume: files per second, real-time factor (seconds of audio
+processed per wall-clock second), time spent in each stage, an ETA, queue
+depths and worker utilization. Events go to a file or stdout; the same
+numbers are summarized for session_summary.json.
+
+Event types: batch_started, progress (at most once per interval),
+file_done and batch_finished. Every event carries "event" and "time".
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, IO, Optional
+
+# Stages whose time is spent in worker processes, for utilization
+WORKER_STAGES = ("analyze", "render")
+
+
+class ProgressReporter:
+    """
+    Collects batch statistics and emits them as JSON lines
+    """
+
+    def __init__(self, destination: Optional[Any] = None, interval: float = 1.0):
+        """
+        Args:
+            destination: Path of a JSON-lines file (appended to), "-" for
+                stdout, an open text stream, or None to only keep the summary
+            interval: Minimum seconds between progress events
+        """
+        self.interval = interval
+        self._owns_stream = isinstance(destination, str) and destination != "-"
+        if destination == "-":
+            self._stream: Optional[IO[str]] = sys.stdout
+        elif self._owns_stream:
+            self._stream = open(destination, 'a', buffering=1)
+        else:
+            self._stream = destination
+        self._lock = threading.Lock()
+        self._queue_depths: Optional[Callable[[], Dict[str, int]]] = None
+        self._reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _reset(self) -> None:
+        self.durations: Dict[str, float] = {}
+        self.workers = 1
+        self.predicted_seconds: Optional[float] = None
+        self.started: Optional[float] = None
+        self.files_done = 0
+        self.files_failed = 0
+        self.files_timed_out = 0
+        self.audio_seconds_done = 0.0
+        self.audio_seconds_settled = 0.0
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.peak_queue_depths: Dict[str, int] = {}
+        self._last_emit = 0.0
+
+    def _write(self, event: str, fields: Dict[str, Any]) -> None:
+        if self._stream is None:
+            return
+        record = {"event": event, "time": time.time()}
+        record.update(fields)
+        self._stream.write(json.dumps(record) + "\n")
+        self._stream.flush()
+
+    def start(self, durations: Dict[str, float], workers: int = 1, predicted_seconds: Optional[float] = None,
+              queue_depths: Optional[Callable[[], Dict[str, int]]] = None) -> None:
+        """
+        Begin a batch
+
+        Args:
+            durations: Audio duration in seconds of every file to process
+            workers: Worker processes (1 for a sequential run)
+            predicted_seconds: Scheduler estimate of the batch, used for the
+                ETA until measured rates take over
+            queue_depths: Callable returning current queue sizes by name
+        """
+        with self._lock:
+            self._reset()
+            self.durations = dict(durations)
+            self.workers = max(1, workers)
+            self.predicted_seconds = predicted_seconds
+            self._queue_depths = queue_depths
+            self.started = time.monotonic()
+            self._write("batch_started", {"files": len(self.durations),
+                                          "audio_seconds": sum(self.durations.values()),
+                                          "workers": self.workers, "predicted_seconds": predicted_seconds})
+
+    def set_queue_depths(self, queue_depths: Optional[Callable[[], Dict[str, int]]]) -> None:
+        with self._lock:
+            self._queue_depths = queue_depths
+
+    def stage_done(self, stage: str, seconds: float) -> None:
+        """Account time spent in one stage of one file"""
+        with self._lock:
+            totals = self.stages.setdefault(stage, {"count": 0, "seconds": 0.0})
+            totals["count"] += 1
+            totals["seconds"] += seconds
+
+    def file_done(self, file_path: str, status: str = "complete", stage: Optional[str] = None) -> None:
+        """
+        Account a file that reached a final state
+
+        Args:
+            file_path: The input
+            status: "complete", "failed" or "timed_out"
+            stage: Stage that failed, if any
+        """
+        with self._lock:
+            if self.started is None:
+                return
+            audio_seconds = self.durations.get(file_path, 0.0)
+            self.audio_seconds_settled += audio_seconds
+            if status == "complete":
+                self.files_done += 1
+                self.audio_seconds_done += audio_seconds
+            elif status == "timed_out":
+                self.files_timed_out += 1
+            else:
+                self.files_failed += 1
+            fields = {"file_path": file_path, "status": status}
+            if stage is not None:
+                fields["stage"] = stage
+            self._write("file_done", fields)
+        self.tick(force=self._finished())
+
+    def _finished(self) -> bool:
+        return self.files_done + self.files_failed + self.files_timed_out >= len(self.durations)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Current statistics; the lock must be held"""
+        elapsed = max(time.monotonic() - self.started, 1e-9) if self.started is not None else 0.0
+        settled = self.files_done + self.files_failed + self.files_timed_out
+        audio_total = sum(self.durations.values())
+        real_time_factor = self.audio_seconds_done / elapsed if elapsed else 0.0
+
+        # Measured rate once something finished, the scheduler's estimate before
+        audio_remaining = max(0.0, audio_total - self.audio_seconds_settled)
+        if self.files_done and real_time_factor > 0:
+            eta = audio_remaining / real_time_factor
+        elif self.predicted_seconds is not None:
+            eta = max(0.0, self.predicted_seconds - elapsed)
+        else:
+            eta = None
+
+        queue_depths = {}
+        if self._queue_depths is not None:
+            try:
+                queue_depths = dict(self._queue_depths())
+            except Exception:
+                queue_depths = {}
+        for name, depth in queue_depths.items():
+            self.peak_queue_depths[name] = max(self.peak_queue_depths.get(name, 0), depth)
+
+        worker_seconds = sum(self.stages.get(stage, {}).get("seconds", 0.0) for stage in WORKER_STAGES)
+        return {
+            "elapsed_seconds": elapsed,
+            "files_total": len(self.durations),
+            "files_done": self.files_done,
+            "files_failed": self.files_failed,
+            "files_timed_out": self.files_timed_out,
+            "files_remaining": len(self.durations) - settled,
+            "files_per_second": settled / elapsed if elapsed else 0.0,
+            "audio_seconds_done": self.audio_seconds_done,
+            "audio_seconds_total": audio_total,
+            "real_time_factor": real_time_factor,
+            "eta_seconds": eta,
+            "stages": {
+                stage: {"count": totals["count"], "seconds": totals["seconds"],
+                        "mean_seconds": totals["seconds"] / totals["count"] if totals["count"] else 0.0}
+                for stage, totals in self.stages.items()
+            },
+            "queue_depths": queue_depths,
+            "worker_utilization": min(1.0, worker_seconds / (self.workers * elapsed)) if elapsed else 0.0
+        }
+
+    def tick(self, force: bool = False) -> None:
+        """Emit a progress event if the interval has passed"""
+        with self._lock:
+            if self.started is None:
+                return
+            now = time.monotonic()
+            if not force and now - self._last_emit < self.interval:
+                return
+            self._last_emit = now
+            self._write("progress", self._snapshot())
+
+    def finish(self) -> Dict[str, Any]:
+        """End the batch; returns the summary kept in session_summary.json"""
+        with self._lock:
+            if self.started is None:
+                return {}
+            summary = self._snapshot()
+            summary.pop("eta_seconds")
+            summary.pop("queue_depths")
+            summary["peak_queue_depths"] = dict(self.peak_queue_depths)
+            summary["workers"] = self.workers
+            summary["predicted_seconds"] = self.predicted_seconds
+            self._write("batch_finished", summary)
+            self.started = None
+            self._queue_depths = None
+            return summary
+
+    def close(self) -> None:
+        if self._owns_stream and self._stream is not None:
+            self._stream.close()
+            self._stream = None
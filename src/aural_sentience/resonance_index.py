@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Resonance Index
+Finding the Tracks That Resonate Like This One
+
+An index over the feature vectors of a whole catalog (see
+library_similarity.feature_vector) for interactive "find similar" queries.
+The vectors are unit length, so Euclidean nearest neighbours are cosine
+nearest neighbours, and a KD-tree (scipy.spatial.cKDTree) answers top-k
+queries without touching every track.
+
+Tracks added after the tree was built sit in a delta buffer that is
+searched exhaustively and merged into the tree once it grows past a
+fraction of the indexed tracks; replaced or removed tracks are tombstoned
+until then. Queries can be filtered by detected sacred frequencies, tempo
+range, dominant pitch class and duration. Selective filters are answered
+by scanning only the matching tracks, broad ones by widening the tree
+query until enough matches are found.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._lazy import LazyModule
+from .library_similarity import FEATURE_DIMENSIONS, FEATURE_VERSION, PITCH_CLASSES, SACRED_FREQUENCIES, feature_vector
+
+spatial = LazyModule("scipy.spatial")
+
+DEFAULT_INDEX_PATH = os.environ.get(
+    "AURAL_SENTIENCE_INDEX",
+    os.path.join(os.path.expanduser("~"), ".aural_sentience", "resonance_index.npz")
+)
+
+# Filters matching at most this many tracks, or less than this fraction of
+# the catalog, are answered by a scan; the tree only pays off for broad queries
+SCAN_LIMIT = 20000
+TREE_MIN_SELECTIVITY = 0.5
+
+
+def _track_metadata(technical_analysis: Dict[str, Any]) -> Tuple[int, float, float, int, float]:
+    """(sacred frequency bitmask, tempo, brightness, pitch class, duration); NaN / -1 when unknown"""
+    sacred = technical_analysis.get("resonance_analysis", {}).get("sacred_frequencies", {}) or {}
+    detected = {str(freq) for freq in sacred}
+    mask = 0
+    for bit, freq in enumerate(SACRED_FREQUENCIES):
+        if str(freq) in detected:
+            mask |= 1 << bit
+    summary = technical_analysis.get("feature_summary") or {}
+    chroma = summary.get("chroma_profile")
+    return (
+        mask,
+        float(summary["tempo"]) if summary.get("tempo") is not None else np.nan,
+        float(summary["brightness"]) if summary.get("brightness") is not None else np.nan,
+        int(np.argmax(chroma)) if chroma else -1,
+        float(technical_analysis.get("duration", np.nan))
+    )
+
+
+def _sacred_mask(frequencies: Iterable[Union[int, str]]) -> int:
+    mask = 0
+    for freq in frequencies:
+        try:
+            mask |= 1 << SACRED_FREQUENCIES.index(int(freq))
+        except ValueError:
+            raise ValueError(f"Unknown sacred frequency {freq!r}; expected one of "
+                             f"{', '.join(str(f) for f in SACRED_FREQUENCIES)}")
+    return mask
+
+
+class ResonanceIndex:
+    """
+    Filtered top-k similarity search over a catalog of analyzed tracks
+    """
+
+    def __init__(self, path: Optional[str] = None, rebuild_fraction: float = 0.1, min_rebuild: int = 1024):
+        """
+        Args:
+            path: File the index is saved to and loaded from (None: memory only)
+            rebuild_fraction: Delta buffer size, relative to the tree, that
+                triggers a rebuild
+            min_rebuild: Delta buffer size below which the tree is never rebuilt
+        """
+        self.path = path
+        self.rebuild_fraction = rebuild_fraction
+        self.min_rebuild = min_rebuild
+        self._lock = threading.RLock()
+        self._clear()
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _clear(self) -> None:
+        self.names: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors = np.zeros((0, FEATURE_DIMENSIONS), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._sacred = np.zeros(0, dtype=np.uint16)
+        self._tempo = np.zeros(0, dtype=np.float32)
+        self._brightness = np.zeros(0, dtype=np.float32)
+        self._pitch_class = np.zeros(0, dtype=np.int8)
+        self._duration = np.zeros(0, dtype=np.float32)
+        self._tree = None
+        self._tree_size = 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    @property
+    def delta_size(self) -> int:
+        """Tracks not yet in the tree"""
+        return len(self.names) - self._tree_size
+
+    def add(self, name: str, technical_analysis: Dict[str, Any]) -> None:
+        """Index one track, replacing an earlier version of it"""
+        self.add_many([(name, technical_analysis)])
+
+    def add_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Index several tracks
+
+        Args:
+            items: (name, technical analysis) pairs; the name is usually the
+                audio file path
+
+        Returns:
+            Number of tracks added or replaced
+        """
+        rows = []
+        for name, technical_analysis in items:
+            rows.append((name, feature_vector(technical_analysis), _track_metadata(technical_analysis)))
+        if not rows:
+            return 0
+        metadata = list(zip(*(row[2] for row in rows)))
+        with self._lock:
+            start = len(self.names)
+            self._vectors = np.concatenate([self._vectors, np.array([row[1] for row in rows], dtype=np.float32)])
+            self._alive = np.concatenate([self._alive, np.ones(len(rows), dtype=bool)])
+            self._sacred = np.concatenate([self._sacred, np.array(metadata[0], dtype=np.uint16)])
+            self._tempo = np.concatenate([self._tempo, np.array(metadata[1], dtype=np.float32)])
+            self._brightness = np.concatenate([self._brightness, np.array(metadata[2], dtype=np.float32)])
+            self._pitch_class = np.concatenate([self._pitch_class, np.array(metadata[3], dtype=np.int8)])
+            self._duration = np.concatenate([self._duration, np.array(metadata[4], dtype=np.float32)])
+            for offset, (name, _, _) in enumerate(rows):
+                # The tree cannot change in place: earlier versions become tombstones
+                old = self._positions.get(name)
+                if old is not None:
+                    self._alive[old] = False
+                    self.names[old] = None
+                self._positions[name] = start + offset
+                self.names.append(name)
+            self._maybe_rebuild()
+        return len(rows)
+
+    def _maybe_rebuild(self) -> None:
+        if self.delta_size > max(self.min_rebuild, self.rebuild_fraction * self._tree_size):
+            self.rebuild()
+
+    def remove(self, name: str) -> bool:
+        """Drop a track; returns False if it was not indexed"""
+        with self._lock:
+            position = self._positions.pop(name, None)
+            if position is None:
+                return False
+            self._alive[position] = False
+            self.names[position] = None
+            return True
+
+    def rebuild(self) -> None:
+        """Drop tombstoned rows and rebuild the tree over every track"""
+        with self._lock:
+            keep = np.flatnonzero(self._alive)
+            self.names = [self.names[i] for i in keep]
+            self._positions = {name: i for i, name in enumerate(self.names)}
+            self._vectors = np.ascontiguousarray(self._vectors[keep])
+            self._alive = np.ones(len(keep), dtype=bool)
+            self._sacred = self._sacred[keep]
+            self._tempo = self._tempo[keep]
+            self._brightness = self._brightness[keep]
+            self._pitch_class = self._pitch_class[keep]
+            self._duration = self._duration[keep]
+            self._tree = spatial.cKDTree(self._vectors) if len(keep) else None
+            self._tree_size = len(keep)
+
+    def _filter(self, sacred: Iterable[Union[int, str]] = (), tempo: Optional[Tuple[float, float]] = None,
+                pitch_class: Optional[str] = None, duration: Optional[Tuple[float, float]] = None,
+                exclude: Sequence[str] = ()) -> np.ndarray:
+        mask = self._alive.copy()
+        required = _sacred_mask(sacred)
+        if required:
+            mask &= (self._sacred & required) == required
+        if tempo is not None:
+            mask &= (self._tempo >= tempo[0]) & (self._tempo <= tempo[1])
+        if pitch_class is not None:
+            try:
+                mask &= self._pitch_class == PITCH_CLASSES.index(pitch_class)
+            except ValueError:
+                raise ValueError(f"Unknown pitch class {pitch_class!r}; expected one of {', '.join(PITCH_CLASSES)}")
+        if duration is not None:
+            mask &= (self._duration >= duration[0]) & (self._duration <= duration[1])
+        for name in exclude:
+            if name in self._positions:
+                mask[self._positions[name]] = False
+        return mask
+
+    def query(self, target: Union[str, Dict[str, Any], np.ndarray], k: int = 10,
+              sacred: Iterable[Union[int, str]] = (), tempo: Optional[Tuple[float, float]] = None,
+              pitch_class: Optional[str] = None,
+              duration: Optional[Tuple[float, float]] = None) -> List[Dict[str, Any]]:
+        """
+        The k indexed tracks most similar to target that pass the filters
+
+        Args:
+            target: Name of an indexed track (excluded from its own results),
+                a technical analysis, or a feature vector
+            k: Number of results
+            sacred: Sacred frequencies (Hz) that must all have been detected
+            tempo: Inclusive (min, max) BPM
+            pitch_class: Dominant pitch class, e.g. "A"
+            duration: Inclusive (min, max) seconds
+
+        Returns:
+            Dictionaries with track and similarity (cosine), most similar first
+        """
+        with self._lock:
+            exclude = ()
+            if isinstance(target, str):
+                if target not in self._positions:
+                    raise KeyError(f"Track not indexed: {target}")
+                vector = self._vectors[self._positions[target]]
+                exclude = (target,)
+            elif isinstance(target, dict):
+                vector = feature_vector(target)
+            else:
+                vector = np.asarray(target, dtype=np.float32)
+
+            self._maybe_rebuild()
+            mask = self._filter(sacred, tempo, pitch_class, duration, exclude)
+            matching = int(mask.sum())
+            if not matching or k <= 0:
+                return []
+            found = None
+            if self._tree is not None and matching > SCAN_LIMIT and matching >= TREE_MIN_SELECTIVITY * len(self):
+                found = self._tree_candidates(vector, k, mask, matching)
+            if found is None:
+                candidates = np.flatnonzero(mask)
+                found = candidates, self._vectors[candidates] @ vector
+            candidates, similarities = found
+
+            k = min(k, len(candidates))
+            best = np.argpartition(-similarities, k - 1)[:k]
+            best = best[np.argsort(-similarities[best], kind="stable")]
+            return [{"track": self.names[candidates[i]], "similarity": float(similarities[i])} for i in best]
+
+    def _tree_candidates(self, vector: np.ndarray, k: int, mask: np.ndarray,
+                         matching: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Matching rows near vector: tree neighbours plus the whole delta buffer
+
+        Returns None when a widened tree query still finds fewer than k
+        matches (the filter clusters away from vector); a scan is cheaper then.
+        """
+        tree_mask = mask[:self._tree_size]
+        # Expect matches in proportion to the filter's selectivity, with slack
+        wanted = min(self._tree_size, max(2 * k, int(np.ceil(k * self._tree_size / matching * 1.5))))
+        for _ in range(2):
+            distances, rows = self._tree.query(vector, k=wanted)
+            rows = np.atleast_1d(rows)
+            rows = rows[rows < self._tree_size]
+            rows = rows[tree_mask[rows]]
+            if len(rows) >= k:
+                break
+            wanted = min(self._tree_size, wanted * 4)
+        else:
+            return None
+        delta = np.flatnonzero(mask[self._tree_size:]) + self._tree_size
+        candidates = np.concatenate([rows, delta])
+        return candidates, self._vectors[candidates] @ vector
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tracks": len(self._positions),
+                "indexed_in_tree": int(self._alive[:self._tree_size].sum()),
+                "delta_buffer": self.delta_size,
+                "tombstones": int((~self._alive).sum()),
+                "path": self.path
+            }
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the index atomically (tombstones are dropped, the tree is rebuilt on load)"""
+        path = path or self.path
+        if not path:
+            return
+        with self._lock:
+            keep = np.flatnonzero(self._alive)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # Per-process (and thread) temporary name: sessions share the default index
+            tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}.npz"
+            np.savez(tmp_path, version=np.array(FEATURE_VERSION),
+                     names=np.array([self.names[i] for i in keep], dtype=str),
+                     vectors=self._vectors[keep], sacred=self._sacred[keep], tempo=self._tempo[keep],
+                     brightness=self._brightness[keep], pitch_class=self._pitch_class[keep],
+                     duration=self._duration[keep])
+            os.replace(tmp_path, path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["version"]) != FEATURE_VERSION:
+                    # Vectors from another feature layout are not comparable
+                    return
+                names = [str(name) for name in data["names"]]
+                arrays = {key: data[key] for key in ("vectors", "sacred", "tempo", "brightness",
+                                                     "pitch_class", "duration")}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load resonance index {path}: {e}; starting empty")
+            return
+        self.names = names
+        self._positions = {name: i for i, name in enumerate(names)}
+        self._vectors = arrays["vectors"].astype(np.float32)
+        self._alive = np.ones(len(names), dtype=bool)
+        self._sacred = arrays["sacred"].astype(np.uint16)
+        self._tempo = arrays["tempo"].astype(np.float32)
+        self._brightness = arrays["brightness"].astype(np.float32)
+        self._pitch_class = arrays["pitch_class"].astype(np.int8)
+        self._duration = arrays["duration"].astype(np.float32)
+        self._maybe_rebuild()
@@ -0,0 +1,1334 @@
+#!/usr/bin/env python3
+"""
+Resonance Lexicon and Poetic Interpretation System
+Sacred Mapping Between Sound and Soul
+
+This system creates poetic interpretations of musical elements while
+honoring the ineffable nature of personal experience. It builds a
+living lexicon of resonance patterns and their potential meanings.
+"""
+
+import bisect
+import hashlib
+import json
+import numpy as np
+import random
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
+import os
+
+from .audio_fingerprint import FingerprintIndex
+from .lexicon_search import LexiconSearchIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking, writes are still atomic
+    fcntl = None
+
+# Immutable base sections, compiled once per process and per lexicon class
+_SHARED_SECTIONS = {}
+_SHARED_LOCK = threading.Lock()
+
+def _freeze(value):
+    """Recursively convert dicts and lists into read-only equivalents"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value):
+    """Recursively convert frozen sections back into plain dicts and lists"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+# Wording pools for the emotional patterns the engine detects
+EMOTIONAL_PATTERN_PHRASES = {
+    "transcendent_joy": (
+        "joy breaking free from all constraints",
+        "happiness that touches the infinite",
+        "the sound of liberation made audible",
+        "ecstasy dancing with complexity"
+    ),
+    "deep_peace": (
+        "peace that runs deeper than thought",
+        "stillness that holds all movement",
+        "the sound of coming home to yourself",
+        "tranquility woven into sound"
+    ),
+    "mystical_complexity": (
+        "complexity that touches the divine",
+        "the sound of infinite patterns unfolding",
+        "mystery made audible through harmony",
+        "the universe composing itself"
+    )
+}
+
+OPENING_DESCRIPTION = "this musical journey unfolds its sacred mysteries"
+
+# Bump when the hard-coded interpretation logic (biometric and cultural poetry,
+# output layout) changes, so cached interpretations are recomputed.
+INTERPRETATION_VERSION = "2"
+
+# Report sections that generate_comprehensive_interpretation reads
+INTERPRETED_REPORT_SECTIONS = ("timestamp", "resonance_analysis", "sacred_gaps",
+                               "biometric_correlates", "cultural_echoes")
+
+def _digest(value):
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def report_digest(analysis_data):
+    """Canonical digest of the report sections an interpretation depends on
+    
+    Fields the lexicon never reads (vault associations, fingerprint, file
+    path, duration) do not change the digest, so they do not change the
+    wording either.
+    """
+    relevant = {section: analysis_data.get(section) for section in INTERPRETED_REPORT_SECTIONS}
+    resonance = analysis_data.get("resonance_analysis") or {}
+    relevant["resonance_analysis"] = {
+        "sacred_frequencies": resonance.get("sacred_frequencies"),
+        "emotional_patterns": resonance.get("emotional_patterns")
+    }
+    return _digest(relevant)
+
+def _atomic_write_json(filepath, data, indent=None):
+    """Write JSON to a temporary file and move it into place"""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
+def warm_shared_lexicon(lexicon_class=None):
+    """Compile the shared base lexicon now, e.g. before forking workers"""
+    return (lexicon_class or ResonanceLexicon)._shared_sections()
+
+class FrequencyIndex:
+    """Sorted, tolerance-aware index from detected frequencies to lexicon keys
+    
+    Lexicon frequencies are kept in a sorted array and matched with
+    searchsorted, so a whole detection timeline is mapped in one vectorized
+    call. With fold_harmonics, detections one or more octaves away from a
+    lexicon frequency (e.g. 1056 Hz for 528 Hz) are folded back onto it; the
+    unfolded match wins when both are within tolerance.
+    """
+    
+    def __init__(self, sacred_frequencies, tolerance_hz=5.0, fold_harmonics=True, max_octaves=3):
+        keys = list(sacred_frequencies.keys())
+        values = np.array([float(key) for key in keys], dtype=np.float64)
+        order = np.argsort(values)
+        self.source = sacred_frequencies
+        self.keys = [keys[i] for i in order]
+        self.frequencies = values[order]
+        self._frequency_list = self.frequencies.tolist()
+        self.tolerance_hz = tolerance_hz
+        self.fold_harmonics = fold_harmonics
+        # Octave shifts to try, nearest first so ties favour the smaller fold
+        self.octave_shifts = [0]
+        if fold_harmonics:
+            for octave in range(1, max_octaves + 1):
+                self.octave_shifts.extend([octave, -octave])
+    
+    def lookup(self, detected):
+        """
+        Match detected frequencies against the index
+        
+        Returns a dict of arrays aligned with the input: 'index' (position in
+        self.keys, -1 when unmatched), 'deviation_hz' (distance after
+        folding) and 'octave_shift' (octaves the detection was folded down).
+        """
+        detected = np.asarray(detected, dtype=np.float64).ravel()
+        best_index = np.full(detected.shape, -1, dtype=np.int64)
+        best_deviation = np.full(detected.shape, np.inf)
+        best_shift = np.zeros(detected.shape, dtype=np.int64)
+        if not len(self.frequencies) or not len(detected):
+            return {"index": best_index, "deviation_hz": best_deviation, "octave_shift": best_shift}
+        
+        last = len(self.frequencies) - 1
+        unfolded_match = np.zeros(detected.shape, dtype=bool)
+        for shift in self.octave_shifts:
+            folded = detected / (2.0 ** shift)
+            position = np.searchsorted(self.frequencies, folded)
+            left = np.maximum(position - 1, 0)
+            right = np.minimum(position, last)
+            left_deviation = np.abs(folded - self.frequencies[left])
+            right_deviation = np.abs(folded - self.frequencies[right])
+            nearest = np.where(right_deviation < left_deviation, right, left)
+            deviation = np.minimum(left_deviation, right_deviation)
+            better = (deviation <= self.tolerance_hz) & (deviation < best_deviation) & ~unfolded_match
+            best_index[better] = nearest[better]
+            best_deviation[better] = deviation[better]
+            best_shift[better] = shift
+            if shift == 0:
+                unfolded_match = best_index >= 0
+        
+        return {"index": best_index, "deviation_hz": best_deviation, "octave_shift": best_shift}
+    
+    def lookup_one(self, frequency):
+        """Scalar lookup for a handful of detections; returns a position or -1"""
+        frequencies = self._frequency_list
+        if not frequencies:
+            return -1
+        best_position, best_deviation = -1, float("inf")
+        for shift in self.octave_shifts:
+            folded = frequency / (2.0 ** shift)
+            position = bisect.bisect_left(frequencies, folded)
+            for candidate in (position - 1, position):
+                if 0 <= candidate < len(frequencies):
+                    deviation = abs(folded - frequencies[candidate])
+                    if deviation <= self.tolerance_hz and deviation < best_deviation:
+                        best_position, best_deviation = candidate, deviation
+            if shift == 0 and best_position >= 0:
+                break
+        return best_position
+
+class ResonanceLexicon:
+    """Sacred dictionary of sound-to-meaning mappings
+    
+    The base lexicon, cultural patterns and poetic templates are compiled once
+    per process into read-only structures shared by every instance, so
+    creating further lexicons costs almost nothing. Personal mappings are
+    per-instance and copy-on-write: a mapping dict passed in is never
+    mutated. Call detach() before editing the base sections in place.
+    """
+    
+    def __init__(self, personal_mappings=None, frequency_tolerance=5.0, fold_harmonics=True,
+                 journal_compact_threshold=10000):
+        shared = self._shared_sections()
+        self.frequency_tolerance = frequency_tolerance
+        self.fold_harmonics = fold_harmonics
+        self._frequency_index = None
+        self._template_cache = None
+        self._version_cache = None
+        self._search_index = None
+        self._search_stale = False
+        
+        # Delta persistence of personal mappings (see save_lexicon): every
+        # mapping this instance knows, in order, and per lexicon file how many
+        # of them are stored there
+        self.journal_compact_threshold = journal_compact_threshold
+        self._mapping_log = []
+        self._persisted = {}
+        self._journal_entries = {}
+        self._saved_base = {}
+        
+        self.lexicon = shared["lexicon"]
+        self.personal_mappings = dict(personal_mappings) if personal_mappings else {}
+        self._mapping_log.extend(self._flatten_mappings(self.personal_mappings))
+        self._fingerprint_index = None
+        self.cultural_patterns = shared["cultural_patterns"]
+        self.poetic_templates = shared["poetic_templates"]
+    
+    @classmethod
+    def _shared_sections(cls):
+        """Build the immutable base sections on first use"""
+        sections = _SHARED_SECTIONS.get(cls)
+        if sections is None:
+            with _SHARED_LOCK:
+                sections = _SHARED_SECTIONS.get(cls)
+                if sections is None:
+                    sections = MappingProxyType({
+                        "lexicon": _freeze(cls._initialize_base_lexicon()),
+                        "cultural_patterns": _freeze(cls._initialize_cultural_patterns()),
+                        "poetic_templates": _freeze(cls._initialize_poetic_templates())
+                    })
+                    _SHARED_SECTIONS[cls] = sections
+        return sections
+    
+    def is_shared(self):
+        """True while this instance still reads the process-wide base sections"""
+        shared = self._shared_sections()
+        return (self.lexicon is shared["lexicon"] and
+                self.cultural_patterns is shared["cultural_patterns"] and
+                self.poetic_templates is shared["poetic_templates"])
+    
+    def detach(self):
+        """Give this instance private, mutable copies of the base sections
+        
+        Call mark_edited() after changing the detached sections in place.
+        """
+        self.lexicon = _thaw(self.lexicon)
+        self.cultural_patterns = _thaw(self.cultural_patterns)
+        self.poetic_templates = _thaw(self.poetic_templates)
+        self.mark_edited()
+        return self
+    
+    def mark_edited(self):
+        """Drop everything compiled from the base sections after an edit"""
+        self._frequency_index = None
+        self._template_cache = None
+        self._version_cache = None
+        # The search index keeps its sections and re-checks their content
+        self._search_stale = True
+    
+    @staticmethod
+    def _initialize_base_lexicon():
+        """Initialize the foundational resonance lexicon"""
+        return {
+            # Sacred Frequencies and Their Resonances
+            "sacred_frequencies": {
+                174: {
+                    "essence": "Foundation of security and love",
+                    "poetic_qualities": [
+                        "the deep earth hum of belonging",
+                        "roots finding their way to water",
+                        "the first breath of safety",
+                        "ancient mother songs"
+                    ],
+                    "emotional_resonances": [
+                        "primal security", "foundational love", "earth connection",
+                        "maternal embrace", "tribal belonging", "cellular memory"
+                    ],
+                    "somatic_effects": [
+                        "grounding in the pelvis", "relaxation of the jaw",
+                        "deepening of breath", "softening of shoulders"
+                    ]
+                },
+                285: {
+                    "essence": "Quantum cognition and healing",
+                    "poetic_qualities": [
+                        "the frequency of cellular remembrance",
+                        "quantum whispers between neurons",
+                        "healing light threading through DNA",
+                        "the sound of wounds becoming wisdom"
+                    ],
+                    "emotional_resonances": [
+                        "cognitive clarity", "healing integration", "quantum awareness",
+                        "cellular renewal", "mental flexibility", "neural plasticity"
+                    ],
+                    "somatic_effects": [
+                        "tingling in the crown", "clarity behind the eyes",
+                        "expansion in the chest", "lightness in the head"
+                    ]
+                },
+                396: {
+                    "essence": "Liberation from fear and guilt",
+                    "poetic_qualities": [
+                        "the sound of chains dissolving",
+                        "fear melting like ice in spring",
+                        "guilt transformed to golden wisdom",
+                        "the first note of freedom"
+                    ],
+                    "emotional_resonances": [
+                        "liberation", "release", "forgiveness", "courage",
+                        "emotional freedom", "guilt dissolution", "fear transformation"
+                    ],
+                    "somatic_effects": [
+                        "release in the solar plexus", "opening of the throat",
+                        "unclenching of fists", "expansion of the ribcage"
+                    ]
+                },
+                417: {
+                    "essence": "Facilitating change and transformation",
+                    "poetic_qualities": [
+                        "the frequency of metamorphosis",
+                        "change singing itself into being",
+                        "transformation as sacred dance",
+                        "the sound of becoming"
+                    ],
+                    "emotional_resonances": [
+                        "transformation", "change facilitation", "growth catalyst",
+                        "evolutionary impulse", "creative mutation", "adaptive flow"
+                    ],
+                    "somatic_effects": [
+                        "energy rising through the spine", "activation in the heart",
+                        "movement in the hips", "aliveness in the hands"
+                    ]
+                },
+                528: {
+                    "essence": "DNA repair and love frequency",
+                    "poetic_qualities": [
+                        "love rewriting the code of existence",
+                        "DNA singing its perfect song",
+                        "the frequency of unconditional love",
+                        "cellular love letters to the future"
+                    ],
+                    "emotional_resonances": [
+                        "unconditional love", "DNA activation", "cellular healing",
+                        "genetic repair", "love embodiment", "heart coherence"
+                    ],
+                    "somatic_effects": [
+                        "warmth in the heart center", "tingling in the hands",
+                        "expansion of the chest", "softening around the eyes"
+                    ]
+                },
+                639: {
+                    "essence": "Harmonious relationships",
+                    "poetic_qualities": [
+                        "the sound of hearts finding harmony",
+                        "relationship as sacred music",
+                        "connection weaving itself visible",
+                        "the frequency of understanding"
+                    ],
+                    "emotional_resonances": [
+                        "relationship harmony", "connection", "understanding",
+                        "empathy", "communication", "heart coherence"
+                    ],
+                    "somatic_effects": [
+                        "opening between the shoulder blades", "softening of the face",
+                        "relaxation of the jaw", "warmth in the chest"
+                    ]
+                },
+                741: {
+                    "essence": "Awakening intuition and expression",
+                    "poetic_qualities": [
+                        "intuition awakening like dawn",
+                        "the voice finding its true sound",
+                        "expression flowing like water",
+                        "the frequency of authentic truth"
+                    ],
+                    "emotional_resonances": [
+                        "intuitive awakening", "authentic expression", "truth speaking",
+                        "creative flow", "inner knowing", "voice activation"
+                    ],
+                    "somatic_effects": [
+                        "vibration in the throat", "clarity in the third eye",
+                        "energy in the vocal cords", "opening of the mouth"
+                    ]
+                },
+                852: {
+                    "essence": "Returning to spiritual order",
+                    "poetic_qualities": [
+                        "the sound of cosmic alignment",
+                        "spiritual order emerging from chaos",
+                        "the frequency of divine remembrance",
+                        "returning to the source song"
+                    ],
+                    "emotional_resonances": [
+                        "spiritual alignment", "cosmic order", "divine connection",
+                        "higher purpose", "spiritual awakening", "transcendence"
+                    ],
+                    "somatic_effects": [
+                        "expansion at the crown", "lightness throughout the body",
+                        "sense of floating", "connection to something greater"
+                    ]
+                },
+                963: {
+                    "essence": "Connection to divine consciousness",
+                    "poetic_qualities": [
+                        "the frequency of pure consciousness",
+                        "divine connection made audible",
+                        "the sound of unity with all",
+                        "consciousness recognizing itself"
+                    ],
+                    "emotional_resonances": [
+                        "divine connection", "unity consciousness", "transcendence",
+                        "spiritual awakening", "cosmic awareness", "oneness"
+                    ],
+                    "somatic_effects": [
+                        "dissolution of body boundaries", "sense of infinite expansion",
+                        "lightness beyond physical", "connection to universal field"
+                    ]
+                }
+            },
+            
+            # Spectral Characteristics and Their Meanings
+            "spectral_qualities": {
+                "brightness": {
+                    "high": {
+                        "poetic_qualities": [
+                            "light dancing on water", "crystalline clarity",
+                            "the sound of stars singing", "diamond frequencies"
+                        ],
+                        "emotional_resonances": [
+                            "clarity", "transcendence", "joy", "awakening",
+                            "mental acuity", "spiritual elevation"
+                        ]
+                    },
+                    "low": {
+                        "poetic_qualities": [
+                            "earth's deep wisdom", "the sound of roots",
+                            "ancient cave songs", "the frequency of depth"
+                        ],
+                        "emotional_resonances": [
+                            "grounding", "introspection", "depth", "mystery",
+                            "contemplation", "earth connection"
+                        ]
+                    }
+                },
+                "warmth": {
+                    "high": {
+                        "poetic_qualities": [
+                            "golden honey frequencies", "the sound of embrace",
+                            "warmth wrapping around the heart", "amber resonance"
+                        ],
+                        "emotional_resonances": [
+                            "comfort", "love", "safety", "nurturing",
+                            "emotional warmth", "heart opening"
+                        ]
+                    },
+                    "low": {
+                        "poetic_qualities": [
+                            "cool mountain air", "the sound of distance",
+                            "crystalline detachment", "silver frequencies"
+                        ],
+                        "emotional_resonances": [
+                            "detachment", "clarity", "objectivity", "space",
+                            "mental clarity", "emotional distance"
+                        ]
+                    }
+                }
+            },
+            
+            # Rhythmic Patterns and Their Meanings
+            "rhythmic_archetypes": {
+                "slow_ceremonial": {
+                    "bpm_range": (40, 70),
+                    "poetic_qualities": [
+                        "the pace of sacred ritual", "time moving like honey",
+                        "ceremonial gravity", "the rhythm of deep breathing"
+                    ],
+                    "emotional_resonances": [
+                        "reverence", "contemplation", "sacred space", "depth",
+                        "meditation", "spiritual practice"
+                    ]
+                },
+                "walking_meditation": {
+                    "bpm_range": (70, 90),
+                    "poetic_qualities": [
+                        "the rhythm of mindful steps", "walking as prayer",
+                        "the pace of gentle journey", "meditative movement"
+                    ],
+                    "emotional_resonances": [
+                        "mindfulness", "gentle progress", "peaceful journey",
+                        "meditative flow", "grounded movement"
+                    ]
+                },
+                "heart_coherence": {
+                    "bpm_range": (60, 80),
+                    "poetic_qualities": [
+                        "the rhythm of a peaceful heart", "coherent pulsing",
+                        "the beat of love", "heart-brain synchrony"
+                    ],
+                    "emotional_resonances": [
+                        "heart coherence", "emotional balance", "love",
+                        "peace", "harmony", "cardiovascular health"
+                    ]
+                },
+                "active_engagement": {
+                    "bpm_range": (90, 120),
+                    "poetic_qualities": [
+                        "the rhythm of purposeful action", "engaged movement",
+                        "the beat of focused activity", "productive flow"
+                    ],
+                    "emotional_resonances": [
+                        "engagement", "focus", "productivity", "active flow",
+                        "purposeful movement", "mental clarity"
+                    ]
+                },
+                "ecstatic_dance": {
+                    "bpm_range": (120, 160),
+                    "poetic_qualities": [
+                        "the rhythm of liberation", "ecstatic movement",
+                        "the beat of celebration", "dance as prayer"
+                    ],
+                    "emotional_resonances": [
+                        "ecstasy", "celebration", "liberation", "joy",
+                        "physical expression", "emotional release"
+                    ]
+                },
+                "transcendent_trance": {
+                    "bpm_range": (160, 200),
+                    "poetic_qualities": [
+                        "the rhythm of transcendence", "trance-inducing pulse",
+                        "the beat beyond time", "consciousness acceleration"
+                    ],
+                    "emotional_resonances": [
+                        "transcendence", "altered states", "consciousness expansion",
+                        "spiritual ecstasy", "trance states"
+                    ]
+                }
+            }
+        }
+    
+    @staticmethod
+    def _initialize_cultural_patterns():
+        """Initialize cultural and archetypal patterns"""
+        return {
+            "modal_archetypes": {
+                "major_dominant": {
+                    "cultural_echoes": [
+                        "celebration traditions worldwide", "victory songs",
+                        "harvest festivals", "community gatherings"
+                    ],
+                    "archetypal_meanings": [
+                        "triumph", "celebration", "community", "abundance",
+                        "joy", "success", "completion"
+                    ]
+                },
+                "minor_dominant": {
+                    "cultural_echoes": [
+                        "lament traditions", "funeral rites", "contemplative practices",
+                        "introspective ceremonies"
+                    ],
+                    "archetypal_meanings": [
+                        "grief", "introspection", "depth", "mystery",
+                        "contemplation", "inner journey"
+                    ]
+                },
+                "modal_ambiguous": {
+                    "cultural_echoes": [
+                        "ritual and ceremonial contexts", "shamanic journeys",
+                        "meditation practices", "sacred ceremonies"
+                    ],
+                    "archetypal_meanings": [
+                        "sacred space", "ritual consciousness", "liminal states",
+                        "spiritual practice", "ceremonial awareness"
+                    ]
+                }
+            },
+            
+            "textural_archetypes": {
+                "sparse_minimal": {
+                    "poetic_qualities": [
+                        "the sound of space itself", "silence made audible",
+                        "minimalist beauty", "the art of what's not there"
+                    ],
+                    "cultural_echoes": [
+                        "zen aesthetics", "minimalist traditions",
+                        "contemplative practices", "space as sacred"
+                    ]
+                },
+                "dense_complex": {
+                    "poetic_qualities": [
+                        "the sound of infinite complexity", "fractal music",
+                        "the universe in a note", "complexity as beauty"
+                    ],
+                    "cultural_echoes": [
+                        "baroque traditions", "mathematical music",
+                        "complex ceremonial music", "intellectual traditions"
+                    ]
+                },
+                "flowing_organic": {
+                    "poetic_qualities": [
+                        "music like water", "organic flow",
+                        "the sound of nature", "breathing music"
+                    ],
+                    "cultural_echoes": [
+                        "nature-based traditions", "flowing water ceremonies",
+                        "organic spiritual practices", "earth-based rituals"
+                    ]
+                }
+            }
+        }
+    
+    @staticmethod
+    def _initialize_poetic_templates():
+        """Initialize templates for poetic interpretation"""
+        return {
+            "opening_invitations": [
+                "Listen with your whole being as {description}",
+                "Allow yourself to be touched by {description}",
+                "Breathe into the space where {description}",
+                "Feel how {description} moves through you",
+                "Notice what arises when {description}"
+            ],
+            
+            "sacred_gap_messages": [
+                "Here, words dissolve into pure feeling",
+                "This moment belongs to your heart alone",
+                "In this space, analysis yields to mystery",
+                "What lives here cannot be named, only felt",
+                "Close your eyes and breathe into the ineffable",
+                "This is where music becomes prayer",
+                "Here, the soul speaks its own language"
+            ],
+            
+            "biometric_invitations": [
+                "Notice how your {body_part} responds to {musical_element}",
+                "Feel the way {musical_element} invites {physiological_response}",
+                "Allow {musical_element} to guide your {biological_rhythm}",
+                "Sense how {musical_element} creates {somatic_experience}"
+            ],
+            
+            "cultural_connections": [
+                "This resonates with the ancient practice of {cultural_practice}",
+                "These frequencies echo {cultural_tradition} across time",
+                "This pattern mirrors {archetypal_meaning} found in {cultural_context}",
+                "The spirit of {cultural_archetype} moves through these sounds"
+            ],
+            
+            "closing_reflections": [
+                "What cannot be measured often matters most",
+                "Your inner knowing is the ultimate authority",
+                "Trust what you feel beyond what you think",
+                "The deepest truths live in the spaces between notes",
+                "Music is the bridge between sound and soul",
+                "Honor what cannot be named, only experienced"
+            ]
+        }
+    
+    def interpret_sacred_frequencies(self, detected_frequencies, rng=None):
+        """Create poetic interpretation of detected sacred frequencies"""
+        rng = rng or random
+        if not detected_frequencies:
+            return "No sacred frequencies detected in this analysis range"
+        
+        interpretations = []
+        
+        index = self.frequency_index()
+        
+        for freq, data in detected_frequencies.items():
+            position = index.lookup_one(float(freq))
+            if position >= 0:
+                lexicon_key = index.keys[position]
+                freq_int = int(float(lexicon_key))
+                freq_data = self.lexicon["sacred_frequencies"][lexicon_key]
+                prominence = data.get("prominence", 1.0)
+                
+                # Choose poetic quality based on prominence
+                if prominence > 5:
+                    intensity = "powerfully"
+                elif prominence > 3:
+                    intensity = "clearly"
+                else:
+                    intensity = "gently"
+                
+                poetic_quality = rng.choice(freq_data["poetic_qualities"])
+                emotional_resonance = rng.choice(freq_data["emotional_resonances"])
+                
+                interpretation = {
+                    "frequency": freq_int,
+                    "essence": freq_data["essence"],
+                    "poetic_description": f"At {freq}Hz, {poetic_quality} emerges {intensity}",
+                    "emotional_invitation": f"This frequency invites {emotional_resonance}",
+                    "somatic_suggestion": rng.choice(freq_data["somatic_effects"]),
+                    "prominence": prominence
+                }
+                interpretations.append(interpretation)
+        
+        return interpretations
+    
+    def frequency_index(self):
+        """Compiled frequency index over the current sacred frequency section"""
+        index = self._frequency_index
+        if (index is None or index.source is not self.lexicon["sacred_frequencies"] or
+                index.tolerance_hz != self.frequency_tolerance or
+                index.fold_harmonics != self.fold_harmonics):
+            index = FrequencyIndex(self.lexicon["sacred_frequencies"],
+                                   tolerance_hz=self.frequency_tolerance,
+                                   fold_harmonics=self.fold_harmonics)
+            self._frequency_index = index
+        return index
+    
+    def lookup_frequencies(self, detected_frequencies):
+        """Vectorized mapping of detected frequencies to lexicon frequencies
+        
+        Returns a dict of arrays aligned with the input: 'lexicon_frequency'
+        (NaN where nothing matched), 'matched', 'deviation_hz' and
+        'octave_shift'.
+        """
+        index = self.frequency_index()
+        matches = index.lookup(detected_frequencies)
+        matched = matches["index"] >= 0
+        lexicon_frequency = np.full(matched.shape, np.nan)
+        lexicon_frequency[matched] = index.frequencies[matches["index"][matched]]
+        return {
+            "lexicon_frequency": lexicon_frequency,
+            "matched": matched,
+            "deviation_hz": matches["deviation_hz"],
+            "octave_shift": matches["octave_shift"]
+        }
+    
+    def interpret_frequency_timeline(self, times, frequencies):
+        """Map a time-resolved detection timeline to lexicon essences
+        
+        Args are equal-length sequences of detection times (seconds) and
+        detected frequencies (Hz). Only detections that match a lexicon
+        frequency are returned, in timeline order.
+        """
+        times = np.asarray(times, dtype=np.float64).ravel()
+        index = self.frequency_index()
+        matches = index.lookup(frequencies)
+        hits = np.flatnonzero(matches["index"] >= 0)
+        
+        # Resolve each lexicon entry once, not once per detection
+        essences = [self.lexicon["sacred_frequencies"][key]["essence"] for key in index.keys]
+        lexicon_frequencies = [int(freq) for freq in index.frequencies]
+        detected = np.asarray(frequencies, dtype=np.float64).ravel()
+        
+        positions = matches["index"][hits].tolist()
+        shifts = matches["octave_shift"][hits].tolist()
+        return [
+            {
+                "time": time,
+                "detected_frequency": freq,
+                "frequency": lexicon_frequencies[position],
+                "essence": essences[position],
+                "octave_shift": shift
+            }
+            for time, freq, position, shift in zip(times[hits].tolist(), detected[hits].tolist(), positions, shifts)
+        ]
+    
+    def interpret_emotional_patterns(self, emotional_patterns, rng=None):
+        """Create poetic interpretation of emotional patterns"""
+        if not emotional_patterns:
+            return "The emotional landscape of this music remains beautifully mysterious"
+        
+        rng = rng or random
+        interpretations = []
+        
+        for pattern_name, pattern_data in emotional_patterns.items():
+            confidence = pattern_data.get("confidence", 0.5)
+            description = pattern_data.get("description", "")
+            
+            phrases = EMOTIONAL_PATTERN_PHRASES.get(pattern_name)
+            if phrases:
+                poetic_desc = rng.choice(phrases)
+            else:
+                poetic_desc = "an emotional landscape beyond simple naming"
+            
+            interpretation = {
+                "pattern": pattern_name,
+                "poetic_description": poetic_desc,
+                "confidence_level": confidence,
+                "invitation": f"Allow yourself to feel into {poetic_desc.lower()}"
+            }
+            interpretations.append(interpretation)
+        
+        return interpretations
+    
+    def create_sacred_gap_message(self, timestamp, rng=None):
+        """Create a sacred gap message for a specific timestamp"""
+        message, lowered = (rng or random).choice(self._compiled_templates()["sacred_gap_messages"])
+        return {
+            "timestamp": timestamp,
+            "message": message,
+            "invitation": f"At {timestamp:.1f} seconds, pause and {lowered}"
+        }
+    
+    def _compiled_templates(self):
+        """Templates pre-rendered once per template section and reused per report"""
+        cached = self._template_cache
+        if cached is not None and cached[0] is self.poetic_templates:
+            return cached[1]
+        templates = self.poetic_templates
+        compiled = {
+            # The opening description is constant, so render every invitation once
+            "opening_invitations": tuple(
+                template.format(description=OPENING_DESCRIPTION)
+                for template in templates["opening_invitations"]
+            ),
+            "sacred_gap_messages": tuple(
+                (message, message.lower()) for message in templates["sacred_gap_messages"]
+            ),
+            "closing_reflections": tuple(templates["closing_reflections"])
+        }
+        self._template_cache = (templates, compiled)
+        return compiled
+    
+    def generate_comprehensive_interpretation(self, analysis_data, rng=None, timestamp=None):
+        """Generate a comprehensive poetic interpretation of the analysis
+        
+        Pass a random.Random as rng for reproducible wording, and a timestamp
+        to pin the interpretation's timestamp instead of using the current time.
+        """
+        rng = rng or random
+        compiled = self._compiled_templates()
+        interpretation = {
+            "timestamp": timestamp if timestamp is not None else datetime.now().isoformat(),
+            "approach": "resonance_lexicon_interpretation",
+            "opening_invitation": "",
+            "sacred_frequency_interpretations": [],
+            "emotional_pattern_interpretations": [],
+            "sacred_gap_interpretations": [],
+            "biometric_poetry": {},
+            "cultural_echoes": {},
+            "closing_reflection": ""
+        }
+        
+        # Opening invitation
+        interpretation["opening_invitation"] = rng.choice(compiled["opening_invitations"])
+        
+        # Sacred frequencies
+        if "resonance_analysis" in analysis_data and "sacred_frequencies" in analysis_data["resonance_analysis"]:
+            interpretation["sacred_frequency_interpretations"] = self.interpret_sacred_frequencies(
+                analysis_data["resonance_analysis"]["sacred_frequencies"], rng
+            )
+        
+        # Emotional patterns
+        if "resonance_analysis" in analysis_data and "emotional_patterns" in analysis_data["resonance_analysis"]:
+            interpretation["emotional_pattern_interpretations"] = self.interpret_emotional_patterns(
+                analysis_data["resonance_analysis"]["emotional_patterns"], rng
+            )
+        
+        # Sacred gaps
+        if "sacred_gaps" in analysis_data:
+            interpretation["sacred_gap_interpretations"] = [
+                self.create_sacred_gap_message(gap["timestamp"], rng)
+                for gap in analysis_data["sacred_gaps"]
+            ]
+        
+        # Biometric poetry
+        if "biometric_correlates" in analysis_data:
+            interpretation["biometric_poetry"] = self._create_biometric_poetry(
+                analysis_data["biometric_correlates"]
+            )
+        
+        # Cultural echoes
+        if "cultural_echoes" in analysis_data:
+            interpretation["cultural_echoes"] = self._create_cultural_poetry(
+                analysis_data["cultural_echoes"]
+            )
+        
+        # Closing reflection
+        interpretation["closing_reflection"] = rng.choice(compiled["closing_reflections"])
+        
+        return interpretation
+    
+    def interpret_many(self, analyses, seed=None, cache=None):
+        """Lazily interpret many technical reports reproducibly
+        
+        Each report gets its own random.Random seeded from the batch seed and
+        the report's content digest, so an unchanged report always yields a
+        byte-identical interpretation regardless of batch order or size. The
+        interpretation is stamped with the report's own timestamp and carries
+        its 'analysis_digest'. With an InterpretationCache, reports whose
+        inputs and touched lexicon sections are unchanged are served from it.
+        """
+        for analysis_data in analyses:
+            if cache is not None:
+                yield self.interpret_cached(analysis_data, cache, seed=seed)
+            else:
+                yield self._interpret_seeded(analysis_data, report_digest(analysis_data), seed)
+    
+    def _interpret_seeded(self, analysis_data, digest, seed):
+        rng = random.Random(f"{seed}:{digest}")
+        interpretation = self.generate_comprehensive_interpretation(
+            analysis_data, rng=rng, timestamp=analysis_data.get("timestamp")
+        )
+        interpretation["analysis_digest"] = digest
+        return interpretation
+    
+    def section_versions(self):
+        """Content hash of every independently versioned lexicon section
+        
+        Each sacred frequency entry and each template pool is versioned on its
+        own, so editing one entry only invalidates interpretations that use it.
+        
+        The versions are cached until the sections are replaced (detach,
+        load_lexicon) or mark_edited() is called. Edits made in place to
+        detached sections are not noticed on their own: without
+        mark_edited() the old versions, and with them the cached
+        interpretations, keep being served.
+        """
+        sources = (self.lexicon, self.poetic_templates)
+        cached = self._version_cache
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+        
+        frequencies = self.lexicon["sacred_frequencies"]
+        versions = {"interpretation_logic": INTERPRETATION_VERSION}
+        versions["sacred_frequencies"] = _digest(sorted(float(key) for key in frequencies))
+        for key, entry in frequencies.items():
+            versions[f"sacred_frequencies/{int(float(key))}"] = _digest(_thaw(entry))
+        for name in ("opening_invitations", "sacred_gap_messages", "closing_reflections"):
+            versions[f"poetic_templates/{name}"] = _digest(_thaw(self.poetic_templates[name]))
+        for name, phrases in EMOTIONAL_PATTERN_PHRASES.items():
+            versions[f"emotional_patterns/{name}"] = _digest(list(phrases))
+        
+        self._version_cache = (sources, versions)
+        return versions
+    
+    def touched_sections(self, analysis_data):
+        """Versions of the lexicon sections an interpretation of this report reads"""
+        versions = self.section_versions()
+        touched = {
+            "interpretation_logic": versions["interpretation_logic"],
+            "poetic_templates/opening_invitations": versions["poetic_templates/opening_invitations"],
+            "poetic_templates/closing_reflections": versions["poetic_templates/closing_reflections"]
+        }
+        resonance = analysis_data.get("resonance_analysis") or {}
+        
+        detected = resonance.get("sacred_frequencies") or {}
+        if detected:
+            # Which entry a detection matches depends on the set of lexicon
+            # frequencies and the matching parameters
+            touched["sacred_frequencies"] = versions["sacred_frequencies"]
+            touched["frequency_matching"] = f"{self.frequency_tolerance}:{self.fold_harmonics}"
+            index = self.frequency_index()
+            for freq in detected:
+                position = index.lookup_one(float(freq))
+                if position >= 0:
+                    name = f"sacred_frequencies/{int(index.frequencies[position])}"
+                    touched[name] = versions[name]
+        
+        for pattern_name in resonance.get("emotional_patterns") or {}:
+            name = f"emotional_patterns/{pattern_name}"
+            touched[name] = versions.get(name, "")
+        
+        if analysis_data.get("sacred_gaps"):
+            touched["poetic_templates/sacred_gap_messages"] = versions["poetic_templates/sacred_gap_messages"]
+        return touched
+    
+    def interpret_cached(self, analysis_data, cache, seed=None):
+        """Seeded interpretation served from an InterpretationCache when possible
+        
+        Call mark_edited() after editing sections in place, or entries
+        interpreted before the edit are still served (see section_versions).
+        """
+        digest = report_digest(analysis_data)
+        key = cache.make_key(digest, self.touched_sections(analysis_data), seed)
+        interpretation = cache.get(key)
+        if interpretation is None:
+            interpretation = self._interpret_seeded(analysis_data, digest, seed)
+            cache.put(key, interpretation)
+        return interpretation
+    
+    def search(self, query, fields=None, sections=None, limit=None):
+        """Full-text search over every lexicon string (see lexicon_search)"""
+        if self._search_index is None:
+            self._search_index = LexiconSearchIndex()
+        self._search_index.refresh(self, force=self._search_stale)
+        self._search_stale = False
+        return self._search_index.search(query, fields=fields, sections=sections, limit=limit)
+    
+    def _create_biometric_poetry(self, biometric_correlates):
+        """Create poetic interpretations of biometric correlates"""
+        poetry = {}
+        
+        for correlate_type, description in biometric_correlates.items():
+            if "heart" in description.lower():
+                poetry[correlate_type] = {
+                    "poetic_description": "Your heart may find its rhythm in these frequencies",
+                    "invitation": "Notice how your heartbeat wants to dance with this music"
+                }
+            elif "breath" in description.lower():
+                poetry[correlate_type] = {
+                    "poetic_description": "These sounds invite your breath to find new patterns",
+                    "invitation": "Allow your breathing to be guided by the musical flow"
+                }
+            elif "nervous" in description.lower():
+                poetry[correlate_type] = {
+                    "poetic_description": "Your nervous system may find balance in these frequencies",
+                    "invitation": "Feel how this music invites your whole being to relax or activate"
+                }
+            else:
+                poetry[correlate_type] = {
+                    "poetic_description": "Your body wisdom may respond to these sonic patterns",
+                    "invitation": "Trust what your body knows about this music"
+                }
+        
+        return poetry
+    
+    def _create_cultural_poetry(self, cultural_echoes):
+        """Create poetic interpretations of cultural echoes"""
+        poetry = {}
+        
+        for echo_type, description in cultural_echoes.items():
+            if "celebration" in description.lower():
+                poetry[echo_type] = {
+                    "archetypal_connection": "The spirit of celebration across all cultures",
+                    "poetic_description": "These frequencies carry the joy of human gathering"
+                }
+            elif "contemplative" in description.lower() or "lament" in description.lower():
+                poetry[echo_type] = {
+                    "archetypal_connection": "The universal language of contemplation",
+                    "poetic_description": "These sounds echo the depth of human reflection"
+                }
+            elif "ritual" in description.lower() or "ceremonial" in description.lower():
+                poetry[echo_type] = {
+                    "archetypal_connection": "The sacred space of ritual and ceremony",
+                    "poetic_description": "These frequencies create sacred space across time and culture"
+                }
+            else:
+                poetry[echo_type] = {
+                    "archetypal_connection": "The universal human experience",
+                    "poetic_description": "These sounds speak the common language of humanity"
+                }
+        
+        return poetry
+    
+    def _mapping_index(self):
+        """Fingerprint index over personal mappings, built on first use"""
+        if self._fingerprint_index is None:
+            index = FingerprintIndex()
+            for file_key, mappings in self.personal_mappings.items():
+                for mapping in mappings:
+                    if mapping.get("fingerprint"):
+                        index.add(file_key, mapping["fingerprint"])
+            self._fingerprint_index = index
+        return self._fingerprint_index
+    
+    def _resolve_mapping_key(self, audio_file, fingerprint=None):
+        """Resolve personal mappings by content when a fingerprint is known"""
+        file_key = os.path.basename(audio_file)
+        if not fingerprint:
+            return file_key
+        index = self._mapping_index()
+        match = index.lookup(fingerprint)
+        if match is not None:
+            return match[0]
+        if file_key in index:
+            # Same name, different content
+            return f"{file_key}#{fingerprint.partition(':')[2][:12]}"
+        return file_key
+    
+    def add_personal_mapping(self, audio_file, timestamp, description, poetic_interpretation, fingerprint=None):
+        """Add a personal mapping to the lexicon"""
+        file_key = self._resolve_mapping_key(audio_file, fingerprint)
+        
+        mapping = {
+            "timestamp": timestamp,
+            "description": description,
+            "poetic_interpretation": poetic_interpretation,
+            "added_date": datetime.now().isoformat()
+        }
+        if fingerprint:
+            mapping["fingerprint"] = fingerprint
+            self._mapping_index().add(file_key, fingerprint)
+        
+        # Copy-on-write: never append to a list shared with the caller's dict
+        self.personal_mappings[file_key] = self.personal_mappings.get(file_key, []) + [mapping]
+        self._mapping_log.append((file_key, mapping))
+    
+    def get_personal_mappings(self, audio_file, fingerprint=None):
+        """Retrieve personal mappings for an audio file, by content when possible"""
+        if fingerprint:
+            match = self._mapping_index().lookup(fingerprint)
+            if match is not None:
+                return self.personal_mappings.get(match[0], [])
+            legacy = self.personal_mappings.get(os.path.basename(audio_file), [])
+            return [mapping for mapping in legacy if not mapping.get("fingerprint")]
+        return self.personal_mappings.get(os.path.basename(audio_file), [])
+    
+    @staticmethod
+    def _mapping_paths(filepath):
+        """Snapshot and journal files that hold personal mappings for a lexicon file"""
+        root = os.path.splitext(filepath)[0]
+        return f"{root}.mappings.json", f"{root}.mappings.jsonl"
+    
+    @staticmethod
+    def _flatten_mappings(personal_mappings):
+        return [(file_key, mapping) for file_key, mappings in personal_mappings.items() for mapping in mappings]
+    
+    @contextmanager
+    def _mapping_lock(self, filepath):
+        """Hold the advisory inter-process lock for a lexicon file's mappings
+        
+        Other instances (and processes) save to the same files; sequence
+        numbers are only assigned and the journal only compacted under it.
+        """
+        if fcntl is None:
+            yield
+            return
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        with open(f"{os.path.splitext(filepath)[0]}.mappings.lock", 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _read_mapping_files(self, filepath):
+        """Mappings stored for a lexicon file: snapshot plus journal replay
+        
+        Returns (personal_mappings, last_seq, journal_entries, found); found
+        is False when neither file exists. The lock must be held.
+        """
+        snapshot_path, journal_path = self._mapping_paths(filepath)
+        personal_mappings = {}
+        snapshot_seq = 0
+        found = False
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            personal_mappings = snapshot.get("personal_mappings", {})
+            snapshot_seq = snapshot.get("last_seq", 0)
+            found = True
+        
+        last_seq = snapshot_seq
+        journal_entries = 0
+        if os.path.exists(journal_path):
+            found = True
+            with open(journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn line from an interrupted append
+                        continue
+                    if "base_seq" in entry:
+                        continue
+                    journal_entries += 1
+                    if entry["seq"] <= snapshot_seq:
+                        continue
+                    personal_mappings.setdefault(entry["key"], []).append(entry["mapping"])
+                    last_seq = max(last_seq, entry["seq"])
+        return personal_mappings, last_seq, journal_entries, found
+    
+    def _journal_tail(self, filepath):
+        """Last sequence number stored for a lexicon file, and whether the
+        journal ends with a complete line; the lock must be held"""
+        snapshot_path, journal_path = self._mapping_paths(filepath)
+        size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+        if size:
+            with open(journal_path, 'rb') as f:
+                f.seek(max(0, size - 65536))
+                tail = f.read()
+            complete = tail.endswith(b"\n")
+            for line in reversed(tail.splitlines()):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "seq" in entry or "base_seq" in entry:
+                    return entry.get("seq", entry.get("base_seq")), complete
+            # Entries longer than the tail: replay the whole file
+            return self._read_mapping_files(filepath)[1], complete
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, 'r') as f:
+                return json.load(f).get("last_seq", 0), True
+        return 0, True
+    
+    def _base_digest(self):
+        """Digest of the static sections written to the base lexicon file"""
+        return _digest({
+            "sections": self.section_versions(),
+            "cultural_patterns": _thaw(self.cultural_patterns)
+        })
+    
+    def save_lexicon(self, filepath="/home/ubuntu/resonance_lexicon.json"):
+        """Save the current state of the lexicon
+        
+        The static base lexicon is only rewritten when it changed since the
+        last save to this path. Personal mappings not yet stored at this
+        path (all of them for a path saved to the first time) are appended
+        to a journal next to it, so a save costs O(new mappings); the journal
+        is folded into a snapshot once it holds more than
+        journal_compact_threshold entries. Instances sharing a path add to
+        each other's mappings rather than overwrite them.
+        """
+        _, journal_path = self._mapping_paths(filepath)
+        with self._mapping_lock(filepath):
+            # Mappings first: the base file may still hold legacy inline
+            # mappings that only the journal will have once it is rewritten
+            pending = self._mapping_log[self._persisted.get(filepath, 0):]
+            if pending:
+                sequence, complete = self._journal_tail(filepath)
+                with open(journal_path, 'a') as f:
+                    if not complete:
+                        f.write("\n")
+                    for file_key, mapping in pending:
+                        sequence += 1
+                        f.write(json.dumps({"seq": sequence, "key": file_key, "mapping": mapping}) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._persisted[filepath] = len(self._mapping_log)
+                self._journal_entries[filepath] = self._journal_entries.get(filepath, 0) + len(pending)
+            
+            base_digest = self._base_digest()
+            if self._saved_base.get(filepath) != base_digest or not os.path.exists(filepath):
+                lexicon_data = {
+                    "base_lexicon": _thaw(self.lexicon),
+                    "cultural_patterns": _thaw(self.cultural_patterns),
+                    "last_updated": datetime.now().isoformat()
+                }
+                _atomic_write_json(filepath, lexicon_data, indent=2)
+                self._saved_base[filepath] = base_digest
+            
+            if self._journal_entries.get(filepath, 0) > self.journal_compact_threshold:
+                self._compact_mappings(filepath)
+    
+    def compact_mappings(self, filepath="/home/ubuntu/resonance_lexicon.json"):
+        """Fold the personal mapping journal into its snapshot"""
+        with self._mapping_lock(filepath):
+            self._compact_mappings(filepath)
+    
+    def _compact_mappings(self, filepath):
+        snapshot_path, journal_path = self._mapping_paths(filepath)
+        # Folded from disk, not from memory, so mappings other instances
+        # journaled since this one loaded are kept. The snapshot records the
+        # last sequence number it contains, so a crash before the journal is
+        # reset cannot replay entries twice; the reset journal starts with
+        # that number so the next save continues after it.
+        personal_mappings, last_seq, _, _ = self._read_mapping_files(filepath)
+        _atomic_write_json(snapshot_path, {
+            "last_seq": last_seq,
+            "personal_mappings": personal_mappings,
+            "last_updated": datetime.now().isoformat()
+        })
+        tmp_path = f"{journal_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps({"base_seq": last_seq}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, journal_path)
+        self._journal_entries[filepath] = 0
+    
+    def load_lexicon(self, filepath="/home/ubuntu/resonance_lexicon.json"):
+        """Load a saved lexicon
+        
+        Personal mappings come from the snapshot plus a replay of the
+        journal. Mappings stored inline by older saves are used while no
+        snapshot or journal exists, and move to the journal on the next save.
+        """
+        with self._mapping_lock(filepath):
+            inline_mappings = {}
+            if os.path.exists(filepath):
+                with open(filepath, 'r') as f:
+                    lexicon_data = json.load(f)
+                    self.lexicon = lexicon_data.get("base_lexicon", self.lexicon)
+                    inline_mappings = lexicon_data.get("personal_mappings", {})
+                    self.cultural_patterns = lexicon_data.get("cultural_patterns", self.cultural_patterns)
+                self.mark_edited()
+                self._saved_base[filepath] = self._base_digest()
+            
+            personal_mappings, _, journal_entries, found = self._read_mapping_files(filepath)
+        
+        self._mapping_log = self._flatten_mappings(personal_mappings)
+        self._persisted = {filepath: len(self._mapping_log)}
+        self._journal_entries = {filepath: journal_entries}
+        if not found and inline_mappings:
+            # The next save journals them and drops them from the base file
+            self._saved_base.pop(filepath, None)
+            for file_key, mappings in inline_mappings.items():
+                for mapping in mappings:
+                    personal_mappings.setdefault(file_key, []).append(mapping)
+                    self._mapping_log.append((file_key, mapping))
+        self.personal_mappings = personal_mappings
+        self._fingerprint_index = None
+
+def main():
+    """Demonstrate the Resonance Lexicon system"""
+    lexicon = ResonanceLexicon()
+    
+    # Example: Load an analysis report and create poetic interpretation
+    analysis_file = "/home/ubuntu/aural_sentience_reports/God'sAreRisin_aural_sentience.json"
+    
+    if os.path.exists(analysis_file):
+        with open(analysis_file, 'r') as f:
+            analysis_data = json.load(f)
+        
+        # Generate comprehensive interpretation
+        interpretation = lexicon.generate_comprehensive_interpretation(analysis_data)
+        
+        # Save interpretation
+        output_file = "/home/ubuntu/Gods_Are_Risin_poetic_interpretation.json"
+        with open(output_file, 'w') as f:
+            json.dump(interpretation, f, indent=2)
+        
+        print(f"Poetic interpretation saved to: {output_file}")
+        
+        # Save lexicon
+        lexicon.save_lexicon()
+        print("Resonance lexicon saved")
+        
+        return interpretation
+    else:
+        print(f"Analysis file not found: {analysis_file}")
+        return None
+
+if __name__ == "__main__":
+    interpretation = main()
+
@@ -11,17 +11,20 @@ This system honors the ineffable nature of musical experience by:
 - Intentionally including gaps where analysis yields to mystery
 """
 
-import librosa
 import numpy as np
-import matplotlib.pyplot as plt
-import soundfile as sf
-from scipy import signal
-from scipy.stats import entropy
 import json
 import os
 from datetime import datetime
 import random
 
+from ._lazy import LazyAttribute, LazyModule
+
+librosa = LazyModule("librosa")
+plt = LazyModule("matplotlib.pyplot")
+sf = LazyModule("soundfile")
+signal = LazyModule("scipy.signal")
+entropy = LazyAttribute("scipy.stats", "entropy")
+
 class ResonantWitness:
     def __init__(self):
         self.sample_rate = 22050
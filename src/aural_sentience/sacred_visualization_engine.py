@@ -21,18 +21,24 @@ Philosophy:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.colors import LinearSegmentedColormap
-import seaborn as sns
 from typing import Dict, List, Tuple, Any, Optional
 import json
 import math
 from datetime import datetime
 from dataclasses import dataclass
-from PIL import Image, ImageDraw, ImageFont
 import colorsys
 
+from ._lazy import LazyAttribute, LazyModule
+
+# Drawing libraries load when the first visualization is made
+plt = LazyModule("matplotlib.pyplot")
+patches = LazyModule("matplotlib.patches")
+LinearSegmentedColormap = LazyAttribute("matplotlib.colors", "LinearSegmentedColormap")
+sns = LazyModule("seaborn")
+Image = LazyModule("PIL.Image")
+ImageDraw = LazyModule("PIL.ImageDraw")
+ImageFont = LazyModule("PIL.ImageFont")
+
 # Sacred color mappings for consciousness frequencies
 CONSCIOUSNESS_COLORS = {
     # Solfeggio frequency colors based on chakra and consciousness correlations
@@ -115,7 +121,7 @@ class ConsciousnessColorPalette:
         return f"#{int(new_rgb[0]*255):02x}{int(new_rgb[1]*255):02x}{int(new_rgb[2]*255):02x}"
         
     def create_consciousness_gradient(self, frequencies: List[float], 
-                                    intensities: List[float]) -> LinearSegmentedColormap:
+                                    intensities: List[float]) -> "LinearSegmentedColormap":
         """Create a gradient colormap based on consciousness frequencies"""
         colors = []
         positions = []
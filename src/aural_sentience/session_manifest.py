@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Session Manifest
+Remembering Which Songs Have Already Been Heard
+
+A session manifest records, for every input of a batch session, the
+content hash of the file, the analysis version it was processed with and
+the paths of the outputs it produced. Re-running a session against the
+same output directory skips inputs that are complete and unchanged, and
+byte-identical inputs are processed once and cross-referenced.
+
+Completions are appended to a journal (one JSON line each, fsynced) so
+recording a file costs O(1) however large the session grows; the journal
+is folded into an atomically written snapshot on compact() and close().
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+MANIFEST_FILENAME = "session_manifest.json"
+JOURNAL_FILENAME = "session_manifest.jsonl"
+
+# Bytes read per chunk while hashing inputs
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_content_hash(path: str) -> str:
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def atomic_write_json(path: str, data: Any) -> None:
+    """Write JSON through a temporary file, so readers see the old or the new file, never a partial one"""
+    # Per-process (and thread) temporary name: writers on a shared session never collide
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SessionManifest:
+    """
+    Per-session record of inputs, their content hashes and outputs
+    """
+
+    def __init__(self, output_dir: str, analysis_version: str, session_id: Optional[str] = None):
+        """
+        Open the manifest of a session directory, creating it if needed
+
+        Args:
+            output_dir: Session output directory holding the manifest
+            analysis_version: Version of the analysis producing the outputs;
+                entries recorded under another version are not reused
+            session_id: Session identifier stored in a new manifest
+        """
+        self.output_dir = output_dir
+        self.analysis_version = analysis_version
+        self.path = os.path.join(output_dir, MANIFEST_FILENAME)
+        self.journal_path = os.path.join(output_dir, JOURNAL_FILENAME)
+        self._lock = threading.Lock()
+
+        self.session_id = session_id
+        self.created = datetime.now().isoformat()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._by_hash: Dict[str, str] = {}
+        self._load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def exists(output_dir: str) -> bool:
+        """True if a directory already holds a session manifest"""
+        return (os.path.exists(os.path.join(output_dir, MANIFEST_FILENAME)) or
+                os.path.exists(os.path.join(output_dir, JOURNAL_FILENAME)))
+
+    def _load(self) -> None:
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.session_id = data.get("session_id", self.session_id)
+            self.created = data.get("created", self.created)
+            for file_path, entry in data.get("files", {}).items():
+                self._apply(file_path, entry)
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append
+                        break
+                    self._apply(record["file_path"], record["entry"])
+
+    def _apply(self, file_path: str, entry: Dict[str, Any]) -> None:
+        self.entries[file_path] = entry
+        if entry.get("status") == "complete" and entry.get("analysis_version") == self.analysis_version:
+            self._by_hash.setdefault(entry["content_hash"], file_path)
+
+    def content_hash(self, file_path: str) -> str:
+        """
+        Content hash of an input, reusing the recorded one while size and mtime match
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = os.stat(file_path)
+        entry = self.entries.get(file_path)
+        if (entry is not None and entry.get("size") == stat.st_size and
+                entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("content_hash")):
+            return entry["content_hash"]
+        return file_content_hash(file_path)
+
+    def is_complete(self, file_path: str, content_hash: str) -> bool:
+        """True if an input was fully processed at this content and analysis version"""
+        entry = self.entries.get(file_path)
+        if entry is None or entry.get("content_hash") != content_hash:
+            return False
+        if entry.get("status") == "duplicate":
+            canonical = entry.get("duplicate_of")
+            return canonical != file_path and self.is_complete(canonical, content_hash)
+        if entry.get("status") != "complete" or entry.get("analysis_version") != self.analysis_version:
+            return False
+        return all(os.path.exists(path) for path in entry.get("outputs", {}).values() if path)
+
+    def completed_path_for(self, content_hash: str) -> Optional[str]:
+        """Input already processed with this exact content, if any"""
+        file_path = self._by_hash.get(content_hash)
+        if file_path is not None and self.is_complete(file_path, content_hash):
+            return file_path
+        return None
+
+    def _record(self, file_path: str, content_hash: Optional[str], status: str, **fields: Any) -> None:
+        entry: Dict[str, Any] = {
+            "status": status,
+            "content_hash": content_hash,
+            "analysis_version": self.analysis_version,
+            "recorded": datetime.now().isoformat()
+        }
+        try:
+            stat = os.stat(file_path)
+            entry["size"] = stat.st_size
+            entry["mtime_ns"] = stat.st_mtime_ns
+        except OSError:
+            pass
+        entry.update(fields)
+
+        line = json.dumps({"file_path": file_path, "entry": entry}) + "\n"
+        with self._lock:
+            with open(self.journal_path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(file_path, entry)
+
+    def record_complete(self, file_path: str, outputs: Dict[str, Optional[str]],
+                        content_hash: Optional[str] = None) -> None:
+        """Record an input whose outputs have all been written"""
+        if content_hash is None:
+            content_hash = self.content_hash(file_path)
+        self._record(file_path, content_hash, "complete", outputs=outputs)
+
+    def record_failed(self, file_path: str, stage: str, error: str,
+                      content_hash: Optional[str] = None) -> None:
+        """Record an input that failed; it is retried on the next run"""
+        if content_hash is None:
+            try:
+                content_hash = self.content_hash(file_path)
+            except OSError:
+                content_hash = None
+        self._record(file_path, content_hash, "failed", stage=stage, error=error)
+
+    def record_timeout(self, file_path: str, stage: str, timeout: Optional[float], reason: str,
+                       content_hash: Optional[str] = None) -> None:
+        """Record an input abandoned at a deadline; reruns skip it unless asked to retry"""
+        if content_hash is None:
+            try:
+                content_hash = self.content_hash(file_path)
+            except OSError:
+                content_hash = None
+        self._record(file_path, content_hash, "timed_out", stage=stage, timeout=timeout, error=reason)
+
+    def timed_out(self, file_path: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """The timeout entry of an input, if it timed out at this content and analysis version"""
+        entry = self.entries.get(file_path)
+        if (entry is not None and entry.get("status") == "timed_out" and
+                entry.get("content_hash") == content_hash and
+                entry.get("analysis_version") == self.analysis_version):
+            return dict(entry)
+        return None
+
+    def record_duplicate(self, file_path: str, content_hash: str, duplicate_of: str) -> None:
+        """Record an input with the same content as another, processed once"""
+        self._record(file_path, content_hash, "duplicate", duplicate_of=duplicate_of)
+
+    def output_paths(self, file_path: str) -> Dict[str, Optional[str]]:
+        """Outputs of a completed input, following duplicate cross-references"""
+        entry = self.entries.get(file_path, {})
+        if entry.get("status") == "duplicate":
+            return self.output_paths(entry["duplicate_of"])
+        return dict(entry.get("outputs", {}))
+
+    def duplicates(self) -> Iterable[Tuple[str, str]]:
+        """(input, duplicate_of) pairs"""
+        for file_path, entry in self.entries.items():
+            if entry.get("status") == "duplicate":
+                yield file_path, entry["duplicate_of"]
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot"""
+        with self._lock:
+            atomic_write_json(self.path, {
+                "session_id": self.session_id,
+                "analysis_version": self.analysis_version,
+                "created": self.created,
+                "updated": datetime.now().isoformat(),
+                "files": self.entries
+            })
+            with open(self.journal_path, 'w'):
+                pass
+
+    def close(self) -> None:
+        """Compact the manifest"""
+        self.compact()
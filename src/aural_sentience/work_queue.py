@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Work Queue
+Sharing One Listening Session Across Machines
+
+A session can be spread over several machines that share its output
+directory. A coordinator (AuralSentienceMaster.coordinate) plans the
+session and fills a job table in an SQLite file inside the session
+directory; workers on any machine (AuralSentienceMaster.run_queue_worker)
+claim jobs from it, write their outputs into the shared directory and
+report back; the coordinator merges the results into the session manifest
+and writes one session summary.
+
+Workers hold a job under a lease that they extend with heartbeats while
+they work. A lease that is not extended in time (the worker crashed, hung
+or lost the filesystem) expires, and the job is claimed again by someone
+else, up to max_attempts times. Every state change is conditional on the
+lease token, so a worker that lost its lease cannot overwrite the outcome
+of the worker that took the job over.
+
+SQLite's rollback journal is used rather than WAL, since WAL needs shared
+memory that other machines cannot see; the shared filesystem must support
+POSIX locks (NFSv4, or local disk when everything runs on one box). Lease
+times are wall-clock times, so the machines' clocks should be synchronized
+to well within the lease duration.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+QUEUE_FILENAME = "work_queue.db"
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Statuses a job can be in; done, failed and timed_out are final until re-queued
+JOB_STATUSES = ("pending", "leased", "done", "failed", "timed_out")
+
+
+class WorkQueue:
+    """
+    Job table with leases, shared through a file
+    """
+
+    def __init__(self, path: str, lease_seconds: Optional[float] = None, max_attempts: Optional[int] = None):
+        """
+        Open (or create) a queue
+
+        Args:
+            path: SQLite file holding the queue
+            lease_seconds: How long a claim lasts without a heartbeat
+            max_attempts: Claims of one job (expired leases included) before
+                it is given up as failed
+
+        Settings given here are stored in the queue; workers that leave them
+        out use the coordinator's (or DEFAULT_LEASE_SECONDS and
+        DEFAULT_MAX_ATTEMPTS).
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # isolation_level=None: transactions are opened explicitly below
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=60.0, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id INTEGER PRIMARY KEY,"
+                " file_path TEXT NOT NULL UNIQUE,"
+                " priority INTEGER NOT NULL DEFAULT 0,"
+                " predicted_seconds REAL,"
+                " status TEXT NOT NULL DEFAULT 'pending',"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " worker TEXT,"
+                " lease_token TEXT,"
+                " lease_expires REAL,"
+                " result_path TEXT,"
+                " stage TEXT,"
+                " error TEXT,"
+                " timeout REAL,"
+                " merged INTEGER NOT NULL DEFAULT 0,"
+                " updated REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_status_priority ON jobs (status, priority)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        if lease_seconds is not None:
+            self.set_meta("lease_seconds", str(lease_seconds))
+        if max_attempts is not None:
+            self.set_meta("max_attempts", str(max_attempts))
+        self.lease_seconds = float(self.get_meta("lease_seconds") or DEFAULT_LEASE_SECONDS)
+        self.max_attempts = int(self.get_meta("max_attempts") or DEFAULT_MAX_ATTEMPTS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """An IMMEDIATE transaction: the write lock is taken up front, so two
+        workers can never both read a job as pending and claim it"""
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._transaction() as db:
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def enqueue(self, jobs: Iterable[Tuple[str, int, Optional[float]]]) -> int:
+        """
+        Add jobs, or re-queue finished ones
+
+        A file already pending or leased keeps its state (only its priority
+        changes); a file that finished earlier is reset to pending, since
+        the coordinator only enqueues files the manifest still needs.
+
+        Args:
+            jobs: (file_path, priority, predicted_seconds); lower priorities
+                are claimed first
+
+        Returns:
+            Number of jobs enqueued
+        """
+        now = time.time()
+        rows = [(file_path, priority, predicted, now) for file_path, priority, predicted in jobs]
+        with self._transaction() as db:
+            db.executemany(
+                "INSERT INTO jobs (file_path, priority, predicted_seconds, updated) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (file_path) DO UPDATE SET"
+                "  priority = excluded.priority,"
+                "  predicted_seconds = excluded.predicted_seconds,"
+                "  attempts = CASE WHEN status IN ('pending', 'leased') THEN attempts ELSE 0 END,"
+                "  merged = CASE WHEN status IN ('pending', 'leased') THEN merged ELSE 0 END,"
+                "  status = CASE WHEN status IN ('pending', 'leased') THEN status ELSE 'pending' END,"
+                "  updated = excluded.updated",
+                rows
+            )
+        return len(rows)
+
+    def _reclaim_expired(self, db: sqlite3.Connection, now: float) -> int:
+        expired = db.execute(
+            "UPDATE jobs SET status = 'pending', worker = NULL, lease_token = NULL, lease_expires = NULL, updated = ?"
+            " WHERE status = 'leased' AND lease_expires < ? AND attempts < ?",
+            (now, now, self.max_attempts)
+        ).rowcount
+        abandoned = db.execute(
+            "UPDATE jobs SET status = 'failed', stage = 'lease',"
+            " error = 'lease expired ' || attempts || ' time(s)', lease_token = NULL, updated = ?"
+            " WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, now, self.max_attempts)
+        ).rowcount
+        return expired + abandoned
+
+    def reclaim_expired(self) -> int:
+        """Return jobs whose lease expired to pending (or fail them after max_attempts)"""
+        with self._transaction() as db:
+            return self._reclaim_expired(db, time.time())
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """
+        Lease the next pending job
+
+        Args:
+            worker: Identifier of the claiming worker (host and pid)
+
+        Returns:
+            The job (id, file_path, attempts, lease_token, worker), or None
+            if nothing is pending
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        with self._transaction() as db:
+            self._reclaim_expired(db, now)
+            row = db.execute(
+                "SELECT id, file_path, attempts FROM jobs WHERE status = 'pending'"
+                " ORDER BY priority, id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'leased', worker = ?, lease_token = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker, token, now + self.lease_seconds, now, row["id"])
+            )
+        job = dict(row)
+        job.update(attempts=row["attempts"] + 1, lease_token=token, worker=worker)
+        return job
+
+    def heartbeat(self, job: Dict[str, Any]) -> bool:
+        """Extend a lease; False if the lease was lost (expired and reclaimed)"""
+        now = time.time()
+        with self._transaction() as db:
+            return db.execute(
+                "UPDATE jobs SET lease_expires = ?, updated = ?"
+                " WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                (now + self.lease_seconds, now, job["id"], job["lease_token"])
+            ).rowcount == 1
+
+    def complete(self, job: Dict[str, Any], result_path: str) -> bool:
+        """Mark a leased job done; False if the lease was lost in the meantime"""
+        return self._finish(job, "done", result_path=result_path)
+
+    def fail(self, job: Dict[str, Any], stage: str, error: str, timed_out: bool = False,
+             timeout: Optional[float] = None) -> bool:
+        """Mark a leased job failed (or timed out); False if the lease was lost"""
+        return self._finish(job, "timed_out" if timed_out else "failed", stage=stage, error=error, timeout=timeout)
+
+    def release(self, job: Dict[str, Any]) -> bool:
+        """Hand a leased job back unprocessed (the worker is shutting down)"""
+        with self._transaction() as db:
+            return db.execute(
+                "UPDATE jobs SET status = 'pending', worker = NULL, lease_token = NULL, lease_expires = NULL,"
+                " attempts = MAX(attempts - 1, 0), updated = ?"
+                " WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                (time.time(), job["id"], job["lease_token"])
+            ).rowcount == 1
+
+    def release_worker(self, worker: str) -> int:
+        """Hand back every job leased by a worker known to be gone"""
+        with self._transaction() as db:
+            return db.execute(
+                "UPDATE jobs SET status = 'pending', worker = NULL, lease_token = NULL, lease_expires = NULL,"
+                " attempts = MAX(attempts - 1, 0), updated = ? WHERE worker = ? AND status = 'leased'",
+                (time.time(), worker)
+            ).rowcount
+
+    def _finish(self, job: Dict[str, Any], status: str, result_path: Optional[str] = None,
+                stage: Optional[str] = None, error: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        with self._transaction() as db:
+            return db.execute(
+                "UPDATE jobs SET status = ?, result_path = ?, stage = ?, error = ?, timeout = ?,"
+                " lease_token = NULL, lease_expires = NULL, merged = 0, updated = ?"
+                " WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                (status, result_path, stage, error, timeout, time.time(), job["id"], job["lease_token"])
+            ).rowcount == 1
+
+    def unmerged(self) -> List[Dict[str, Any]]:
+        """Finished jobs the coordinator has not merged yet"""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM jobs WHERE status IN ('done', 'failed', 'timed_out') AND merged = 0 ORDER BY id"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def mark_merged(self, job_id: int) -> None:
+        with self._transaction() as db:
+            db.execute("UPDATE jobs SET merged = 1 WHERE id = ?", (job_id,))
+
+    def counts(self) -> Dict[str, int]:
+        """Jobs per status"""
+        with self._lock:
+            rows = self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def outstanding(self) -> int:
+        """Jobs still pending or leased"""
+        counts = self.counts()
+        return counts["pending"] + counts["leased"]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
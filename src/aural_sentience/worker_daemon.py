@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+Warm Worker Daemon
+Keeping the Instruments Tuned Between Performances
+
+A fresh process pays for librosa's numba compilation and matplotlib's font
+cache before it analyzes its first file, which adds seconds to every
+short-lived job. The daemon keeps a pool of worker processes that each warm
+an AuralSentienceEngine, a ResonanceLexicon and the plotting stack once,
+then serves jobs over a Unix socket. Workers are recycled after a fixed
+number of jobs so memory growth stays bounded (Python 3.11+); replacements
+warm up before they take work. Every job has a deadline: a worker that
+runs past it, or dies (killed for memory, crashed in native code), fails
+its jobs instead of leaving their callers waiting, and the pool is rebuilt
+(see deadlines.TimeoutProcessPool).
+
+Protocol: one JSON object per line in each direction.
+
+    {"op": "ping"}
+    {"op": "status"}
+    {"op": "analyze", "file_path": "...", "output_dir": "...", "render": false, "seed": null, "timeout": null}
+    {"op": "interpret", "analysis": {...}, "seed": null}
+    {"op": "shutdown"}
+
+Every response carries "ok"; failures carry "error" instead of a result.
+The same pool also runs micro-batches for the HTTP service (see
+http_service), whose jobs may carry the audio itself instead of a path.
+"""
+
+import io
+import json
+import multiprocessing
+import os
+import queue
+import random
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .deadlines import DeadlineExceeded, TimeoutProcessPool
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "aural_sentience.sock")
+
+# Seconds one job may run in a worker unless the request says otherwise
+DEFAULT_JOB_TIMEOUT = 600.0
+
+# Seconds of synthetic audio analyzed while warming a worker
+WARMUP_SECONDS = 2.0
+
+# Per-process state of a pool worker
+_worker: Dict[str, Any] = {}
+
+
+def _claim_socket_path(path: str) -> None:
+    """
+    Remove a stale socket left at path by a daemon that died
+
+    Raises:
+        FileExistsError: path is not a socket, or a daemon still listens on it
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)
+        return
+    finally:
+        probe.close()
+    raise FileExistsError(f"A daemon is already serving on {path}")
+
+
+def _warm_worker(status_queue: Any, warm_render: bool) -> None:
+    """Pool initializer: build the instances and run every JIT-compiled path once"""
+    from .aural_sentience_toolkit import AuralSentienceEngine
+    from .resonance_lexicon import ResonanceLexicon
+
+    pid = os.getpid()
+    status_queue.put({"pid": pid, "state": "warming", "time": time.time()})
+    start = time.perf_counter()
+
+    engine = AuralSentienceEngine()
+    lexicon = ResonanceLexicon()
+    _worker.update(engine=engine, lexicon=lexicon)
+
+    try:
+        # A short tone with noise exercises the same librosa/numba kernels as a real file
+        sr = engine.sample_rate
+        t = np.arange(int(sr * WARMUP_SECONDS)) / sr
+        noise = 0.05 * np.random.default_rng(0).standard_normal(len(t))
+        y = (0.5 * np.sin(2 * np.pi * 528 * t) + noise).astype(np.float32)
+        analysis = engine.analyze_audio(y, sr, "<warmup>", include_personal_vault=False)
+        lexicon.generate_comprehensive_interpretation(analysis)
+        if warm_render:
+            # Builds matplotlib's font cache and figure machinery
+            with tempfile.TemporaryDirectory() as scratch:
+                engine.create_comprehensive_visualization("warmup.wav", scratch, y=y, sr=sr)
+    except Exception as e:
+        # Raising here would make the pool respawn the worker forever; jobs
+        # will surface the same error to the caller instead
+        status_queue.put({"pid": pid, "state": "failed", "time": time.time(),
+                          "error": f"{type(e).__name__}: {e}"})
+        return
+
+    status_queue.put({"pid": pid, "state": "ready", "time": time.time(),
+                      "warm_seconds": time.perf_counter() - start, "jobs": 0})
+
+
+def _decode(engine: Any, job: Dict[str, Any]):
+    """Decoded audio of a job: its file_path, or the encoded bytes sent in "audio" """
+    if job.get("audio") is not None:
+        # soundfile decodes from memory, so uploads never touch the disk
+        return engine.load_audio(io.BytesIO(job["audio"]))
+    return engine.load_audio(job["file_path"])
+
+
+def _render_png(engine: Any, name: str, y: np.ndarray, sr: int) -> bytes:
+    """Visualization of decoded audio as PNG bytes"""
+    with tempfile.TemporaryDirectory() as scratch:
+        image_path = engine.create_comprehensive_visualization(name, scratch, y=y, sr=sr)
+        with open(image_path, 'rb') as f:
+            return f.read()
+
+
+def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze (or, with op "visualize", only render) one file in a warm worker"""
+    engine = _worker["engine"]
+    lexicon = _worker["lexicon"]
+    start = time.perf_counter()
+
+    file_path = job.get("file_path") or job.get("name") or "<upload>"
+    y, sr = _decode(engine, job)
+    if job.get("op") == "visualize":
+        return {"image": _render_png(engine, file_path, y, sr), "worker_pid": os.getpid(),
+                "seconds": time.perf_counter() - start}
+
+    analysis = engine.analyze_audio(y, sr, file_path, include_personal_vault=False)
+    rng = random.Random(job["seed"]) if job.get("seed") is not None else None
+    interpretation = lexicon.generate_comprehensive_interpretation(analysis, rng=rng)
+    visualization = None
+    if job.get("render") and job.get("output_dir"):
+        visualization = engine.create_comprehensive_visualization(file_path, job["output_dir"], y=y, sr=sr)
+
+    return {
+        "technical_analysis": analysis,
+        "poetic_interpretation": interpretation,
+        "visualization": visualization,
+        "worker_pid": os.getpid(),
+        "seconds": time.perf_counter() - start
+    }
+
+
+def _warm_up() -> None:
+    """Job that only makes the pool start a worker, which warms up first"""
+
+
+def _run_batch(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run a micro-batch in one warm worker; each job succeeds or fails on its own"""
+    outcomes = []
+    for job in jobs:
+        try:
+            outcomes.append({"ok": True, "result": _run_job(job)})
+        except Exception as e:
+            outcomes.append({"ok": False, "error": f"{type(e).__name__}: {e}"})
+    return outcomes
+
+
+class WorkerDaemon:
+    """
+    Pool of pre-warmed analysis workers behind a Unix socket
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, workers: Optional[int] = None,
+                 max_tasks_per_child: int = 50, warm_render: bool = True,
+                 job_timeout: float = DEFAULT_JOB_TIMEOUT):
+        """
+        Start the worker pool (warming begins immediately)
+
+        Args:
+            socket_path: Unix socket to serve on
+            workers: Number of worker processes (defaults to the CPU count)
+            max_tasks_per_child: Jobs a worker runs before it is replaced
+                (Python 3.11+; workers are kept for good on older versions)
+            warm_render: Also warm the plotting stack
+            job_timeout: Seconds a job may run when its request sets no timeout
+        """
+        from .resonance_lexicon import ResonanceLexicon
+
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.job_timeout = job_timeout
+        self.started = time.time()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+        # Interpretation of an existing analysis is cheap enough to serve inline
+        self.lexicon = ResonanceLexicon()
+
+        self._worker_status: Dict[int, Dict[str, Any]] = {}
+        self._status_lock = threading.Lock()
+        # Recycling workers needs a start method other than fork
+        context = multiprocessing.get_context("spawn" if sys.version_info >= (3, 11) else None)
+        self._status_queue = context.Queue()
+        self._pool = TimeoutProcessPool(
+            self.workers,
+            initializer=_warm_worker,
+            initargs=(self._status_queue, warm_render),
+            max_restarts=1,
+            max_tasks_per_child=max_tasks_per_child,
+            mp_context=context
+        )
+        self._server: Optional[socketserver.BaseServer] = None
+        self._closed = threading.Event()
+        self._status_thread = threading.Thread(target=self._collect_status, name="daemon-status", daemon=True)
+        self._status_thread.start()
+        self._poll_thread = threading.Thread(target=self._poll_pool, name="daemon-pool", daemon=True)
+        self._poll_thread.start()
+        self._warm_pool()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _collect_status(self) -> None:
+        while not self._closed.is_set():
+            try:
+                update = self._status_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            with self._status_lock:
+                self._worker_status.setdefault(update["pid"], {}).update(update)
+
+    def _warm_pool(self) -> None:
+        """Start every worker now rather than on the first jobs"""
+        for _ in range(self.workers):
+            self._pool.submit(_warm_up, timeout=self.job_timeout, stage="warm-up")
+
+    def _poll_pool(self) -> None:
+        """Settle finished jobs and recover from overdue or dead workers"""
+        rebuilds = 0
+        while not self._closed.is_set():
+            self._pool.poll(0.2)
+            if self._pool.rebuilds != rebuilds and not self._closed.is_set():
+                rebuilds = self._pool.rebuilds
+                self._warm_pool()
+
+    def status(self) -> Dict[str, Any]:
+        """Warm-up state of the live workers and job counters"""
+        live = {process.pid for process in multiprocessing.active_children()}
+        with self._status_lock:
+            # Recycled workers are forgotten here, or the table would grow by
+            # one entry per max_tasks_per_child jobs for the daemon's lifetime
+            for pid in [pid for pid in self._worker_status if pid not in live]:
+                del self._worker_status[pid]
+            workers = [dict(info) for info in self._worker_status.values()]
+        ready = sum(1 for info in workers if info.get("state") == "ready")
+        failed = sum(1 for info in workers if info.get("state") == "failed")
+        return {
+            "workers": self.workers,
+            "ready": ready,
+            "warming": self.workers - ready - failed,
+            "failed": failed,
+            "max_tasks_per_child": self.max_tasks_per_child,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "uptime_seconds": time.time() - self.started,
+            "worker_details": sorted(workers, key=lambda info: info["pid"])
+        }
+
+    def wait_until_ready(self, timeout: Optional[float] = None, minimum: int = 1) -> bool:
+        """Block until at least `minimum` workers are warm"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.status()["ready"] < minimum:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def submit(self, job: Dict[str, Any], timeout: Optional[float] = None) -> Future:
+        """
+        Queue an analyze job in-process
+
+        Args:
+            job: As for the "analyze" op
+            timeout: Seconds the job may run (default: job_timeout)
+
+        Returns:
+            Future of the result; it fails with DeadlineExceeded past the
+            timeout and with BrokenProcessPool if its worker keeps dying
+        """
+        return self._pool.submit(_run_job, job, timeout=timeout or self.job_timeout, stage="analyze")
+
+    def submit_batch(self, jobs: List[Dict[str, Any]],
+                     callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                     error_callback: Optional[Callable[[BaseException], None]] = None) -> Future:
+        """
+        Queue jobs to run one after another in a single worker
+
+        Exactly one of the callbacks is called, from the daemon's pool thread.
+
+        Args:
+            jobs: Analyze or visualize jobs
+            callback: Called with one {"ok", "result" or "error"} outcome per
+                job, in order
+            error_callback: Called if the batch as a whole failed: it ran past
+                job_timeout per job, or its worker died
+
+        Returns:
+            Future of the outcomes
+        """
+        def done(future: Future) -> None:
+            error = future.exception()
+            if error is not None:
+                for _ in jobs:
+                    self._account(None)
+                if error_callback is not None:
+                    error_callback(error)
+                return
+            outcomes = future.result()
+            for outcome in outcomes:
+                self._account(outcome["result"]["worker_pid"] if outcome["ok"] else None)
+            if callback is not None:
+                callback(outcomes)
+
+        future = self._pool.submit(_run_batch, jobs, timeout=self.job_timeout * len(jobs), stage="batch")
+        future.add_done_callback(done)
+        return future
+
+    def _account(self, worker_pid: Optional[int]) -> None:
+        """Count a finished job (worker_pid None: it failed)"""
+        with self._status_lock:
+            if worker_pid is None:
+                self.jobs_failed += 1
+                return
+            self.jobs_completed += 1
+            worker = self._worker_status.setdefault(worker_pid, {"pid": worker_pid})
+            worker["jobs"] = worker.get("jobs", 0) + 1
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve one protocol request"""
+        op = request.get("op")
+        try:
+            if op == "ping":
+                return {"ok": True, "pong": True}
+            if op == "status":
+                return {"ok": True, "status": self.status()}
+            if op == "interpret":
+                rng = random.Random(request["seed"]) if request.get("seed") is not None else None
+                return {"ok": True, "result": self.lexicon.generate_comprehensive_interpretation(request["analysis"], rng=rng)}
+            if op == "analyze":
+                result = self.submit(request, timeout=request.get("timeout")).result()
+                self._account(result["worker_pid"])
+                return {"ok": True, "result": result}
+            if op == "shutdown":
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return {"ok": True}
+            return {"ok": False, "error": f"Unknown op: {op!r}"}
+        except (Exception, DeadlineExceeded) as e:
+            if op == "analyze":
+                self._account(None)
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def serve_forever(self) -> None:
+        """
+        Accept connections on the Unix socket until shutdown
+
+        A socket left behind by a daemon that died is replaced.
+
+        Raises:
+            FileExistsError: socket_path is not a socket, or another daemon
+                is serving on it
+        """
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        response = {"ok": False, "error": f"Invalid JSON: {e}"}
+                    self.wfile.write((json.dumps(response, default=_json_default) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+
+        _claim_socket_path(self.socket_path)
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self._server.daemon_threads = True
+        bound = os.lstat(self.socket_path)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            # Only our own socket: another daemon may have taken the path since
+            try:
+                current = os.lstat(self.socket_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if (current.st_dev, current.st_ino) == (bound.st_dev, bound.st_ino):
+                    os.remove(self.socket_path)
+
+    def shutdown(self) -> None:
+        """Stop serving (when serving) and close the pool"""
+        if self._server is not None:
+            self._server.shutdown()
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the worker pool; jobs still running fail with Cancelled"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._poll_thread.join(timeout=1.0)
+        self._pool.shutdown(kill=True)
+        self._status_thread.join(timeout=1.0)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class WorkerClient:
+    """
+    Client for a running WorkerDaemon
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._reader = self._socket.makefile("r", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request and wait for its response"""
+        self._socket.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Worker daemon closed the connection")
+        return json.loads(line)
+
+    def status(self) -> Dict[str, Any]:
+        return self.request({"op": "status"})["status"]
+
+    def analyze(self, file_path: str, output_dir: Optional[str] = None, render: bool = False,
+                seed: Any = None) -> Dict[str, Any]:
+        """Analyze a file in a warm worker; raises RuntimeError on failure"""
+        response = self.request({"op": "analyze", "file_path": os.path.abspath(file_path),
+                                 "output_dir": output_dir, "render": render, "seed": seed})
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
@@ -1,692 +0,0 @@
-#!/usr/bin/env python3
-"""
-Resonance Lexicon and Poetic Interpretation System
-Sacred Mapping Between Sound and Soul
-
-This system creates poetic interpretations of musical elements while
-honoring the ineffable nature of personal experience. It builds a
-living lexicon of resonance patterns and their potential meanings.
-"""
-
-import json
-import numpy as np
-import random
-from datetime import datetime
-import os
-
-class ResonanceLexicon:
-    """Sacred dictionary of sound-to-meaning mappings"""
-    
-    def __init__(self):
-        self.lexicon = self._initialize_base_lexicon()
-        self.personal_mappings = {}
-        self.cultural_patterns = self._initialize_cultural_patterns()
-        self.poetic_templates = self._initialize_poetic_templates()
-    
-    def _initialize_base_lexicon(self):
-        """Initialize the foundational resonance lexicon"""
-        return {
-            # Sacred Frequencies and Their Resonances
-            "sacred_frequencies": {
-                174: {
-                    "essence": "Foundation of security and love",
-                    "poetic_qualities": [
-                        "the deep earth hum of belonging",
-                        "roots finding their way to water",
-                        "the first breath of safety",
-                        "ancient mother songs"
-                    ],
-                    "emotional_resonances": [
-                        "primal security", "foundational love", "earth connection",
-                        "maternal embrace", "tribal belonging", "cellular memory"
-                    ],
-                    "somatic_effects": [
-                        "grounding in the pelvis", "relaxation of the jaw",
-                        "deepening of breath", "softening of shoulders"
-                    ]
-                },
-                285: {
-                    "essence": "Quantum cognition and healing",
-                    "poetic_qualities": [
-                        "the frequency of cellular remembrance",
-                        "quantum whispers between neurons",
-                        "healing light threading through DNA",
-                        "the sound of wounds becoming wisdom"
-                    ],
-                    "emotional_resonances": [
-                        "cognitive clarity", "healing integration", "quantum awareness",
-                        "cellular renewal", "mental flexibility", "neural plasticity"
-                    ],
-                    "somatic_effects": [
-                        "tingling in the crown", "clarity behind the eyes",
-                        "expansion in the chest", "lightness in the head"
-                    ]
-                },
-                396: {
-                    "essence": "Liberation from fear and guilt",
-                    "poetic_qualities": [
-                        "the sound of chains dissolving",
-                        "fear melting like ice in spring",
-                        "guilt transformed to golden wisdom",
-                        "the first note of freedom"
-                    ],
-                    "emotional_resonances": [
-                        "liberation", "release", "forgiveness", "courage",
-                        "emotional freedom", "guilt dissolution", "fear transformation"
-                    ],
-                    "somatic_effects": [
-                        "release in the solar plexus", "opening of the throat",
-                        "unclenching of fists", "expansion of the ribcage"
-                    ]
-                },
-                417: {
-                    "essence": "Facilitating change and transformation",
-                    "poetic_qualities": [
-                        "the frequency of metamorphosis",
-                        "change singing itself into being",
-                        "transformation as sacred dance",
-                        "the sound of becoming"
-                    ],
-                    "emotional_resonances": [
-                        "transformation", "change facilitation", "growth catalyst",
-                        "evolutionary impulse", "creative mutation", "adaptive flow"
-                    ],
-                    "somatic_effects": [
-                        "energy rising through the spine", "activation in the heart",
-                        "movement in the hips", "aliveness in the hands"
-                    ]
-                },
-                528: {
-                    "essence": "DNA repair and love frequency",
-                    "poetic_qualities": [
-                        "love rewriting the code of existence",
-                        "DNA singing its perfect song",
-                        "the frequency of unconditional love",
-                        "cellular love letters to the future"
-                    ],
-                    "emotional_resonances": [
-                        "unconditional love", "DNA activation", "cellular healing",
-                        "genetic repair", "love embodiment", "heart coherence"
-                    ],
-                    "somatic_effects": [
-                        "warmth in the heart center", "tingling in the hands",
-                        "expansion of the chest", "softening around the eyes"
-                    ]
-                },
-                639: {
-                    "essence": "Harmonious relationships",
-                    "poetic_qualities": [
-                        "the sound of hearts finding harmony",
-                        "relationship as sacred music",
-                        "connection weaving itself visible",
-                        "the frequency of understanding"
-                    ],
-                    "emotional_resonances": [
-                        "relationship harmony", "connection", "understanding",
-                        "empathy", "communication", "heart coherence"
-                    ],
-                    "somatic_effects": [
-                        "opening between the shoulder blades", "softening of the face",
-                        "relaxation of the jaw", "warmth in the chest"
-                    ]
-                },
-                741: {
-                    "essence": "Awakening intuition and expression",
-                    "poetic_qualities": [
-                        "intuition awakening like dawn",
-                        "the voice finding its true sound",
-                        "expression flowing like water",
-                        "the frequency of authentic truth"
-                    ],
-                    "emotional_resonances": [
-                        "intuitive awakening", "authentic expression", "truth speaking",
-                        "creative flow", "inner knowing", "voice activation"
-                    ],
-                    "somatic_effects": [
-                        "vibration in the throat", "clarity in the third eye",
-                        "energy in the vocal cords", "opening of the mouth"
-                    ]
-                },
-                852: {
-                    "essence": "Returning to spiritual order",
-                    "poetic_qualities": [
-                        "the sound of cosmic alignment",
-                        "spiritual order emerging from chaos",
-                        "the frequency of divine remembrance",
-                        "returning to the source song"
-                    ],
-                    "emotional_resonances": [
-                        "spiritual alignment", "cosmic order", "divine connection",
-                        "higher purpose", "spiritual awakening", "transcendence"
-                    ],
-                    "somatic_effects": [
-                        "expansion at the crown", "lightness throughout the body",
-                        "sense of floating", "connection to something greater"
-                    ]
-                },
-                963: {
-                    "essence": "Connection to divine consciousness",
-                    "poetic_qualities": [
-                        "the frequency of pure consciousness",
-                        "divine connection made audible",
-                        "the sound of unity with all",
-                        "consciousness recognizing itself"
-                    ],
-                    "emotional_resonances": [
-                        "divine connection", "unity consciousness", "transcendence",
-                        "spiritual awakening", "cosmic awareness", "oneness"
-                    ],
-                    "somatic_effects": [
-                        "dissolution of body boundaries", "sense of infinite expansion",
-                        "lightness beyond physical", "connection to universal field"
-                    ]
-                }
-            },
-            
-            # Spectral Characteristics and Their Meanings
-            "spectral_qualities": {
-                "brightness": {
-                    "high": {
-                        "poetic_qualities": [
-                            "light dancing on water", "crystalline clarity",
-                            "the sound of stars singing", "diamond frequencies"
-                        ],
-                        "emotional_resonances": [
-                            "clarity", "transcendence", "joy", "awakening",
-                            "mental acuity", "spiritual elevation"
-                        ]
-                    },
-                    "low": {
-                        "poetic_qualities": [
-                            "earth's deep wisdom", "the sound of roots",
-                            "ancient cave songs", "the frequency of depth"
-                        ],
-                        "emotional_resonances": [
-                            "grounding", "introspection", "depth", "mystery",
-                            "contemplation", "earth connection"
-                        ]
-                    }
-                },
-                "warmth": {
-                    "high": {
-                        "poetic_qualities": [
-                            "golden honey frequencies", "the sound of embrace",
-                            "warmth wrapping around the heart", "amber resonance"
-                        ],
-                        "emotional_resonances": [
-                            "comfort", "love", "safety", "nurturing",
-                            "emotional warmth", "heart opening"
-                        ]
-                    },
-                    "low": {
-                        "poetic_qualities": [
-                            "cool mountain air", "the sound of distance",
-                            "crystalline detachment", "silver frequencies"
-                        ],
-                        "emotional_resonances": [
-                            "detachment", "clarity", "objectivity", "space",
-                            "mental clarity", "emotional distance"
-                        ]
-                    }
-                }
-            },
-            
-            # Rhythmic Patterns and Their Meanings
-            "rhythmic_archetypes": {
-                "slow_ceremonial": {
-                    "bpm_range": (40, 70),
-                    "poetic_qualities": [
-                        "the pace of sacred ritual", "time moving like honey",
-                        "ceremonial gravity", "the rhythm of deep breathing"
-                    ],
-                    "emotional_resonances": [
-                        "reverence", "contemplation", "sacred space", "depth",
-                        "meditation", "spiritual practice"
-                    ]
-                },
-                "walking_meditation": {
-                    "bpm_range": (70, 90),
-                    "poetic_qualities": [
-                        "the rhythm of mindful steps", "walking as prayer",
-                        "the pace of gentle journey", "meditative movement"
-                    ],
-                    "emotional_resonances": [
-                        "mindfulness", "gentle progress", "peaceful journey",
-                        "meditative flow", "grounded movement"
-                    ]
-                },
-                "heart_coherence": {
-                    "bpm_range": (60, 80),
-                    "poetic_qualities": [
-                        "the rhythm of a peaceful heart", "coherent pulsing",
-                        "the beat of love", "heart-brain synchrony"
-                    ],
-                    "emotional_resonances": [
-                        "heart coherence", "emotional balance", "love",
-                        "peace", "harmony", "cardiovascular health"
-                    ]
-                },
-                "active_engagement": {
-                    "bpm_range": (90, 120),
-                    "poetic_qualities": [
-                        "the rhythm of purposeful action", "engaged movement",
-                        "the beat of focused activity", "productive flow"
-                    ],
-                    "emotional_resonances": [
-                        "engagement", "focus", "productivity", "active flow",
-                        "purposeful movement", "mental clarity"
-                    ]
-                },
-                "ecstatic_dance": {
-                    "bpm_range": (120, 160),
-                    "poetic_qualities": [
-                        "the rhythm of liberation", "ecstatic movement",
-                        "the beat of celebration", "dance as prayer"
-                    ],
-                    "emotional_resonances": [
-                        "ecstasy", "celebration", "liberation", "joy",
-                        "physical expression", "emotional release"
-                    ]
-                },
-                "transcendent_trance": {
-                    "bpm_range": (160, 200),
-                    "poetic_qualities": [
-                        "the rhythm of transcendence", "trance-inducing pulse",
-                        "the beat beyond time", "consciousness acceleration"
-                    ],
-                    "emotional_resonances": [
-                        "transcendence", "altered states", "consciousness expansion",
-                        "spiritual ecstasy", "trance states"
-                    ]
-                }
-            }
-        }
-    
-    def _initialize_cultural_patterns(self):
-        """Initialize cultural and archetypal patterns"""
-        return {
-            "modal_archetypes": {
-                "major_dominant": {
-                    "cultural_echoes": [
-                        "celebration traditions worldwide", "victory songs",
-                        "harvest festivals", "community gatherings"
-                    ],
-                    "archetypal_meanings": [
-                        "triumph", "celebration", "community", "abundance",
-                        "joy", "success", "completion"
-                    ]
-                },
-                "minor_dominant": {
-                    "cultural_echoes": [
-                        "lament traditions", "funeral rites", "contemplative practices",
-                        "introspective ceremonies"
-                    ],
-                    "archetypal_meanings": [
-                        "grief", "introspection", "depth", "mystery",
-                        "contemplation", "inner journey"
-                    ]
-                },
-                "modal_ambiguous": {
-                    "cultural_echoes": [
-                        "ritual and ceremonial contexts", "shamanic journeys",
-                        "meditation practices", "sacred ceremonies"
-                    ],
-                    "archetypal_meanings": [
-                        "sacred space", "ritual consciousness", "liminal states",
-                        "spiritual practice", "ceremonial awareness"
-                    ]
-                }
-            },
-            
-            "textural_archetypes": {
-                "sparse_minimal": {
-                    "poetic_qualities": [
-                        "the sound of space itself", "silence made audible",
-                        "minimalist beauty", "the art of what's not there"
-                    ],
-                    "cultural_echoes": [
-                        "zen aesthetics", "minimalist traditions",
-                        "contemplative practices", "space as sacred"
-                    ]
-                },
-                "dense_complex": {
-                    "poetic_qualities": [
-                        "the sound of infinite complexity", "fractal music",
-                        "the universe in a note", "complexity as beauty"
-                    ],
-                    "cultural_echoes": [
-                        "baroque traditions", "mathematical music",
-                        "complex ceremonial music", "intellectual traditions"
-                    ]
-                },
-                "flowing_organic": {
-                    "poetic_qualities": [
-                        "music like water", "organic flow",
-                        "the sound of nature", "breathing music"
-                    ],
-                    "cultural_echoes": [
-                        "nature-based traditions", "flowing water ceremonies",
-                        "organic spiritual practices", "earth-based rituals"
-                    ]
-                }
-            }
-        }
-    
-    def _initialize_poetic_templates(self):
-        """Initialize templates for poetic interpretation"""
-        return {
-            "opening_invitations": [
-                "Listen with your whole being as {description}",
-                "Allow yourself to be touched by {description}",
-                "Breathe into the space where {description}",
-                "Feel how {description} moves through you",
-                "Notice what arises when {description}"
-            ],
-            
-            "sacred_gap_messages": [
-                "Here, words dissolve into pure feeling",
-                "This moment belongs to your heart alone",
-                "In this space, analysis yields to mystery",
-                "What lives here cannot be named, only felt",
-                "Close your eyes and breathe into the ineffable",
-                "This is where music becomes prayer",
-                "Here, the soul speaks its own language"
-            ],
-            
-            "biometric_invitations": [
-                "Notice how your {body_part} responds to {musical_element}",
-                "Feel the way {musical_element} invites {physiological_response}",
-                "Allow {musical_element} to guide your {biological_rhythm}",
-                "Sense how {musical_element} creates {somatic_experience}"
-            ],
-            
-            "cultural_connections": [
-                "This resonates with the ancient practice of {cultural_practice}",
-                "These frequencies echo {cultural_tradition} across time",
-                "This pattern mirrors {archetypal_meaning} found in {cultural_context}",
-                "The spirit of {cultural_archetype} moves through these sounds"
-            ],
-            
-            "closing_reflections": [
-                "What cannot be measured often matters most",
-                "Your inner knowing is the ultimate authority",
-                "Trust what you feel beyond what you think",
-                "The deepest truths live in the spaces between notes",
-                "Music is the bridge between sound and soul",
-                "Honor what cannot be named, only experienced"
-            ]
-        }
-    
-    def interpret_sacred_frequencies(self, detected_frequencies):
-        """Create poetic interpretation of detected sacred frequencies"""
-        if not detected_frequencies:
-            return "No sacred frequencies detected in this analysis range"
-        
-        interpretations = []
-        
-        for freq, data in detected_frequencies.items():
-            freq_int = int(float(freq))
-            if freq_int in self.lexicon["sacred_frequencies"]:
-                freq_data = self.lexicon["sacred_frequencies"][freq_int]
-                prominence = data.get("prominence", 1.0)
-                
-                # Choose poetic quality based on prominence
-                if prominence > 5:
-                    intensity = "powerfully"
-                elif prominence > 3:
-                    intensity = "clearly"
-                else:
-                    intensity = "gently"
-                
-                poetic_quality = random.choice(freq_data["poetic_qualities"])
-                emotional_resonance = random.choice(freq_data["emotional_resonances"])
-                
-                interpretation = {
-                    "frequency": freq_int,
-                    "essence": freq_data["essence"],
-                    "poetic_description": f"At {freq}Hz, {poetic_quality} emerges {intensity}",
-                    "emotional_invitation": f"This frequency invites {emotional_resonance}",
-                    "somatic_suggestion": random.choice(freq_data["somatic_effects"]),
-                    "prominence": prominence
-                }
-                interpretations.append(interpretation)
-        
-        return interpretations
-    
-    def interpret_emotional_patterns(self, emotional_patterns):
-        """Create poetic interpretation of emotional patterns"""
-        if not emotional_patterns:
-            return "The emotional landscape of this music remains beautifully mysterious"
-        
-        interpretations = []
-        
-        for pattern_name, pattern_data in emotional_patterns.items():
-            confidence = pattern_data.get("confidence", 0.5)
-            description = pattern_data.get("description", "")
-            
-            if pattern_name == "transcendent_joy":
-                poetic_desc = random.choice([
-                    "joy breaking free from all constraints",
-                    "happiness that touches the infinite",
-                    "the sound of liberation made audible",
-                    "ecstasy dancing with complexity"
-                ])
-            elif pattern_name == "deep_peace":
-                poetic_desc = random.choice([
-                    "peace that runs deeper than thought",
-                    "stillness that holds all movement",
-                    "the sound of coming home to yourself",
-                    "tranquility woven into sound"
-                ])
-            elif pattern_name == "mystical_complexity":
-                poetic_desc = random.choice([
-                    "complexity that touches the divine",
-                    "the sound of infinite patterns unfolding",
-                    "mystery made audible through harmony",
-                    "the universe composing itself"
-                ])
-            else:
-                poetic_desc = "an emotional landscape beyond simple naming"
-            
-            interpretation = {
-                "pattern": pattern_name,
-                "poetic_description": poetic_desc,
-                "confidence_level": confidence,
-                "invitation": f"Allow yourself to feel into {poetic_desc.lower()}"
-            }
-            interpretations.append(interpretation)
-        
-        return interpretations
-    
-    def create_sacred_gap_message(self, timestamp):
-        """Create a sacred gap message for a specific timestamp"""
-        message = random.choice(self.poetic_templates["sacred_gap_messages"])
-        return {
-            "timestamp": timestamp,
-            "message": message,
-            "invitation": f"At {timestamp:.1f} seconds, pause and {message.lower()}"
-        }
-    
-    def generate_comprehensive_interpretation(self, analysis_data):
-        """Generate a comprehensive poetic interpretation of the analysis"""
-        interpretation = {
-            "timestamp": datetime.now().isoformat(),
-            "approach": "resonance_lexicon_interpretation",
-            "opening_invitation": "",
-            "sacred_frequency_interpretations": [],
-            "emotional_pattern_interpretations": [],
-            "sacred_gap_interpretations": [],
-            "biometric_poetry": {},
-            "cultural_echoes": {},
-            "closing_reflection": ""
-        }
-        
-        # Opening invitation
-        opening_template = random.choice(self.poetic_templates["opening_invitations"])
-        interpretation["opening_invitation"] = opening_template.format(
-            description="this musical journey unfolds its sacred mysteries"
-        )
-        
-        # Sacred frequencies
-        if "resonance_analysis" in analysis_data and "sacred_frequencies" in analysis_data["resonance_analysis"]:
-            interpretation["sacred_frequency_interpretations"] = self.interpret_sacred_frequencies(
-                analysis_data["resonance_analysis"]["sacred_frequencies"]
-            )
-        
-        # Emotional patterns
-        if "resonance_analysis" in analysis_data and "emotional_patterns" in analysis_data["resonance_analysis"]:
-            interpretation["emotional_pattern_interpretations"] = self.interpret_emotional_patterns(
-                analysis_data["resonance_analysis"]["emotional_patterns"]
-            )
-        
-        # Sacred gaps
-        if "sacred_gaps" in analysis_data:
-            interpretation["sacred_gap_interpretations"] = [
-                self.create_sacred_gap_message(gap["timestamp"])
-                for gap in analysis_data["sacred_gaps"]
-            ]
-        
-        # Biometric poetry
-        if "biometric_correlates" in analysis_data:
-            interpretation["biometric_poetry"] = self._create_biometric_poetry(
-                analysis_data["biometric_correlates"]
-            )
-        
-        # Cultural echoes
-        if "cultural_echoes" in analysis_data:
-            interpretation["cultural_echoes"] = self._create_cultural_poetry(
-                analysis_data["cultural_echoes"]
-            )
-        
-        # Closing reflection
-        interpretation["closing_reflection"] = random.choice(
-            self.poetic_templates["closing_reflections"]
-        )
-        
-        return interpretation
-    
-    def _create_biometric_poetry(self, biometric_correlates):
-        """Create poetic interpretations of biometric correlates"""
-        poetry = {}
-        
-        for correlate_type, description in biometric_correlates.items():
-            if "heart" in description.lower():
-                poetry[correlate_type] = {
-                    "poetic_description": "Your heart may find its rhythm in these frequencies",
-                    "invitation": "Notice how your heartbeat wants to dance with this music"
-                }
-            elif "breath" in description.lower():
-                poetry[correlate_type] = {
-                    "poetic_description": "These sounds invite your breath to find new patterns",
-                    "invitation": "Allow your breathing to be guided by the musical flow"
-                }
-            elif "nervous" in description.lower():
-                poetry[correlate_type] = {
-                    "poetic_description": "Your nervous system may find balance in these frequencies",
-                    "invitation": "Feel how this music invites your whole being to relax or activate"
-                }
-            else:
-                poetry[correlate_type] = {
-                    "poetic_description": "Your body wisdom may respond to these sonic patterns",
-                    "invitation": "Trust what your body knows about this music"
-                }
-        
-        return poetry
-    
-    def _create_cultural_poetry(self, cultural_echoes):
-        """Create poetic interpretations of cultural echoes"""
-        poetry = {}
-        
-        for echo_type, description in cultural_echoes.items():
-            if "celebration" in description.lower():
-                poetry[echo_type] = {
-                    "archetypal_connection": "The spirit of celebration across all cultures",
-                    "poetic_description": "These frequencies carry the joy of human gathering"
-                }
-            elif "contemplative" in description.lower() or "lament" in description.lower():
-                poetry[echo_type] = {
-                    "archetypal_connection": "The universal language of contemplation",
-                    "poetic_description": "These sounds echo the depth of human reflection"
-                }
-            elif "ritual" in description.lower() or "ceremonial" in description.lower():
-                poetry[echo_type] = {
-                    "archetypal_connection": "The sacred space of ritual and ceremony",
-                    "poetic_description": "These frequencies create sacred space across time and culture"
-                }
-            else:
-                poetry[echo_type] = {
-                    "archetypal_connection": "The universal human experience",
-                    "poetic_description": "These sounds speak the common language of humanity"
-                }
-        
-        return poetry
-    
-    def add_personal_mapping(self, audio_file, timestamp, description, poetic_interpretation):
-        """Add a personal mapping to the lexicon"""
-        file_key = os.path.basename(audio_file)
-        if file_key not in self.personal_mappings:
-            self.personal_mappings[file_key] = []
-        
-        mapping = {
-            "timestamp": timestamp,
-            "description": description,
-            "poetic_interpretation": poetic_interpretation,
-            "added_date": datetime.now().isoformat()
-        }
-        
-        self.personal_mappings[file_key].append(mapping)
-    
-    def save_lexicon(self, filepath="/home/ubuntu/resonance_lexicon.json"):
-        """Save the current state of the lexicon"""
-        lexicon_data = {
-            "base_lexicon": self.lexicon,
-            "personal_mappings": self.personal_mappings,
-            "cultural_patterns": self.cultural_patterns,
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        with open(filepath, 'w') as f:
-            json.dump(lexicon_data, f, indent=2)
-    
-    def load_lexicon(self, filepath="/home/ubuntu/resonance_lexicon.json"):
-        """Load a saved lexicon"""
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                lexicon_data = json.load(f)
-                self.lexicon = lexicon_data.get("base_lexicon", self.lexicon)
-                self.personal_mappings = lexicon_data.get("personal_mappings", {})
-                self.cultural_patterns = lexicon_data.get("cultural_patterns", self.cultural_patterns)
-
-def main():
-    """Demonstrate the Resonance Lexicon system"""
-    lexicon = ResonanceLexicon()
-    
-    # Example: Load an analysis report and create poetic interpretation
-    analysis_file = "/home/ubuntu/aural_sentience_reports/God'sAreRisin_aural_sentience.json"
-    
-    if os.path.exists(analysis_file):
-        with open(analysis_file, 'r') as f:
-            analysis_data = json.load(f)
-        
-        # Generate comprehensive interpretation
-        interpretation = lexicon.generate_comprehensive_interpretation(analysis_data)
-        
-        # Save interpretation
-        output_file = "/home/ubuntu/Gods_Are_Risin_poetic_interpretation.json"
-        with open(output_file, 'w') as f:
-            json.dump(interpretation, f, indent=2)
-        
-        print(f"Poetic interpretation saved to: {output_file}")
-        
-        # Save lexicon
-        lexicon.save_lexicon()
-        print("Resonance lexicon saved")
-        
-        return interpretation
-    else:
-        print(f"Analysis file not found: {analysis_file}")
-        return None
-
-if __name__ == "__main__":
-    interpretation = main()
-
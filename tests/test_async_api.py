@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aural_sentience.async_api import AsyncAuralSentience
+from aural_sentience.deadlines import Cancelled, DeadlineExceeded, checkpoint
+
+
+class _StubVault:
+    def get_associations(self, file_path, fingerprint=None):
+        return []
+
+
+class _StubEngine:
+    """Takes as many seconds to analyze a file as its name says ("0.2.wav")"""
+
+    def __init__(self):
+        self.started = []
+        self.cancelled = []
+        self._lock = threading.Lock()
+
+    def load_audio(self, file_path):
+        return float(file_path[:-len(".wav")]), 22050
+
+    def analyze_audio(self, y, sr, file_path, include_personal_vault=True):
+        with self._lock:
+            self.started.append(file_path)
+        end = time.monotonic() + y
+        try:
+            while time.monotonic() < end:
+                checkpoint()
+                time.sleep(0.005)
+        except Cancelled:
+            with self._lock:
+                self.cancelled.append(file_path)
+            raise
+        return {"file_path": file_path, "seconds": y}
+
+    def get_vault(self, user_id):
+        return _StubVault()
+
+
+class _StubLexicon:
+    def generate_comprehensive_interpretation(self, analysis, rng=None):
+        return {"essence": analysis["file_path"]}
+
+
+@pytest.fixture
+def listener():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield AsyncAuralSentience(executor=executor, engine=_StubEngine(), lexicon=_StubLexicon(),
+                                  max_concurrency=4)
+
+
+def _wait_for(predicate, seconds=5.0):
+    end = time.monotonic() + seconds
+    while not predicate() and time.monotonic() < end:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_analyze_many_yields_in_completion_order(listener):
+    async def main():
+        return [outcome async for outcome in listener.analyze_many(["0.3.wav", "0.0.wav", "0.15.wav"])]
+
+    outcomes = asyncio.run(main())
+    assert [outcome["file_path"] for outcome in outcomes] == ["0.0.wav", "0.15.wav", "0.3.wav"]
+    assert all(outcome["ok"] for outcome in outcomes)
+    assert outcomes[0]["result"]["personal_vault"] == {"associations": []}
+
+
+def test_leaving_the_loop_cancels_the_unfinished_files(listener):
+    async def main():
+        async for outcome in listener.analyze_many(["0.0.wav", "5.wav", "5.1.wav"]):
+            assert outcome["file_path"] == "0.0.wav"
+            break
+        # The abandoned generator is closed by the loop
+        for _ in range(100):
+            if len(listener.engine.cancelled) == 2:
+                break
+            await asyncio.sleep(0.02)
+
+    started = time.monotonic()
+    asyncio.run(main())
+    assert sorted(listener.engine.cancelled) == ["5.1.wav", "5.wav"]
+    assert time.monotonic() - started < 4
+
+
+def test_cancelling_a_job_stops_it_at_the_next_checkpoint(listener):
+    async def main():
+        task = asyncio.ensure_future(listener.analyze("5.wav"))
+        while not listener.engine.started:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert _wait_for(lambda: listener.engine.cancelled == ["5.wav"])
+
+
+def test_a_job_past_its_timeout_raises_deadline_exceeded(listener):
+    async def main():
+        with pytest.raises(DeadlineExceeded):
+            await listener.analyze("5.wav", timeout=0.05)
+        return [outcome async for outcome in listener.analyze_many(["5.wav", "0.0.wav"], timeout=0.05)]
+
+    started = time.monotonic()
+    outcomes = asyncio.run(main())
+    assert time.monotonic() - started < 4
+    assert [outcome["ok"] for outcome in outcomes] == [True, False]
+    assert outcomes[1]["error"].startswith("DeadlineExceeded")
@@ -0,0 +1,35 @@
+import signal
+import time
+
+import pytest
+
+from aural_sentience.deadlines import DeadlineExceeded, TimeoutProcessPool
+
+
+def _hang():
+    # Block SIGALRM so only the parent's kill can stop this job
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+    time.sleep(3600)
+
+
+def _square(x):
+    return x * x
+
+
+def _settle(pool, futures, limit=60.0):
+    deadline = time.monotonic() + limit
+    while not all(future.done() for future in futures):
+        assert time.monotonic() < deadline, "futures did not settle"
+        pool.poll(timeout=0.1)
+
+
+def test_kill_resubmits_queued_jobs():
+    with TimeoutProcessPool(max_workers=1, grace_seconds=0.2) as pool:
+        hung = pool.submit(_hang, timeout=0.5, stage="analyze")
+        queued = [pool.submit(_square, n, timeout=30.0) for n in range(4)]
+        _settle(pool, [hung] + queued)
+
+        with pytest.raises(DeadlineExceeded):
+            hung.result()
+        assert [future.result() for future in queued] == [0, 1, 4, 9]
+        assert pool.kills == 1
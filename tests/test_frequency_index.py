@@ -0,0 +1,47 @@
+import random
+
+import numpy as np
+
+from aural_sentience.resonance_lexicon import FrequencyIndex
+
+FREQUENCIES = {"1060": "high", "432": "earth", "528": "love", "639": "connection"}
+
+
+def _matches(index, detected):
+    found = index.lookup(detected)
+    return [index.keys[i] if i >= 0 else None for i in found["index"]], found
+
+
+def test_detections_match_within_the_tolerance():
+    index = FrequencyIndex(FREQUENCIES, tolerance_hz=5.0, fold_harmonics=False)
+    assert index.keys == ["432", "528", "639", "1060"]
+    keys, found = _matches(index, [530.0, 427.0, 534.0, 3.0, 5000.0])
+    assert keys == ["528", "432", None, None, None]
+    np.testing.assert_allclose(found["deviation_hz"][:2], [2.0, 5.0])
+    assert np.isinf(found["deviation_hz"][2:]).all()
+
+
+def test_octaves_fold_onto_lexicon_frequencies():
+    folding = FrequencyIndex(FREQUENCIES, tolerance_hz=5.0)
+    keys, found = _matches(folding, [1278.0, 216.0, 3456.0])
+    assert keys == ["639", "432", "432"]
+    assert found["octave_shift"].tolist() == [1, -1, 3]
+    np.testing.assert_allclose(found["deviation_hz"], [0.0, 0.0, 0.0])
+    assert _matches(FrequencyIndex(FREQUENCIES, fold_harmonics=False), [1278.0, 216.0])[0] == [None, None]
+    assert _matches(FrequencyIndex(FREQUENCIES, max_octaves=2), [3456.0])[0] == [None]
+
+
+def test_an_unfolded_match_beats_a_closer_folded_one():
+    index = FrequencyIndex(FREQUENCIES, tolerance_hz=5.0)
+    # 1058 Hz is 2 Hz from 1060 as detected, and 1 Hz from 528 an octave down
+    keys, found = _matches(index, [1058.0])
+    assert keys == ["1060"]
+    assert found["octave_shift"].tolist() == [0]
+    assert index.keys[index.lookup_one(1058.0)] == "1060"
+
+
+def test_scalar_and_vectorized_lookups_agree():
+    rng = random.Random(7)
+    index = FrequencyIndex(FREQUENCIES, tolerance_hz=5.0)
+    detected = [rng.uniform(50.0, 9000.0) for _ in range(2000)]
+    assert index.lookup(detected)["index"].tolist() == [index.lookup_one(value) for value in detected]
@@ -0,0 +1,189 @@
+import http.client
+import importlib.util
+import io
+import json
+import math
+import struct
+import time
+import wave
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from aural_sentience.aural_sentience_toolkit import VaultManager
+from aural_sentience.http_service import AnalysisService, ServiceBusy, ServiceClient
+
+HAVE_ENGINE = importlib.util.find_spec("librosa") is not None
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = AnalysisService(port=0, workers=1, warm_render=False,
+                              vault_manager=VaultManager(str(tmp_path / "vaults"))).start()
+    yield service
+    service.shutdown()
+
+
+def _client(service):
+    return ServiceClient(service.host, service.port, timeout=60)
+
+
+def _pending_jobs(service):
+    # Slots are freed by a done callback, which may run just after the result is seen
+    for _ in range(100):
+        if not service.status()["admission"]["pending_jobs"]:
+            break
+        time.sleep(0.02)
+    return service.status()["admission"]["pending_jobs"]
+
+
+def _wav(seconds=0.5, frequency=440.0, rate=22050):
+    samples = [int(12000 * math.sin(2 * math.pi * frequency * n / rate)) for n in range(int(seconds * rate))]
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    return buffer.getvalue()
+
+
+def _status(service, headers):
+    connection = http.client.HTTPConnection(service.host, service.port, timeout=10)
+    try:
+        connection.putrequest("GET", "/status", skip_host=True)
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders()
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def test_requests_addressed_to_the_service_are_served(service):
+    assert ServiceClient(service.host, service.port).status()["pool"]["workers"] == 1
+    assert _status(service, {"Host": f"localhost:{service.port}"}) == 200
+
+
+def test_rebound_host_names_are_rejected(service):
+    assert _status(service, {"Host": f"attacker.example:{service.port}"}) == 403
+    assert _status(service, {"Host": f"{service.host}:{service.port + 1}"}) == 403
+    assert _status(service, {}) == 403
+
+
+def test_requests_with_an_origin_are_rejected(service):
+    headers = {"Host": f"{service.host}:{service.port}", "Origin": "http://attacker.example"}
+    assert _status(service, headers) == 403
+
+
+def _post(service, path, body, headers=()):
+    connection = http.client.HTTPConnection(service.host, service.port, timeout=60)
+    try:
+        connection.putrequest("POST", path, skip_host=True)
+        connection.putheader("Host", f"{service.host}:{service.port}")
+        for name, value in headers:
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+def test_analyze_streams_one_line_per_file_then_a_summary(service):
+    body = _wav()
+    status, payload = _post(service, "/analyze?name=tone.wav&seed=7", body,
+                            [("Content-Type", "audio/wav"), ("Content-Length", str(len(body)))])
+    assert status == 200
+    line, summary = [json.loads(line) for line in payload.splitlines()]
+    assert line["file"] == "tone.wav"
+    assert summary == {"done": True, "files": 1, "failed": int(not line["ok"])}
+    if HAVE_ENGINE:
+        assert line["ok"], line
+        assert "technical_analysis" in line["result"]
+    else:
+        assert "librosa" in line["error"]
+
+
+def test_client_analyze_returns_the_result_or_raises(service):
+    if HAVE_ENGINE:
+        result = _client(service).analyze(_wav(), name="tone.wav", seed=7)
+        assert result["poetic_interpretation"]
+    else:
+        with pytest.raises(RuntimeError, match="librosa"):
+            _client(service).analyze(_wav(), name="tone.wav", seed=7)
+
+
+def test_analyze_files_yields_every_file(service, tmp_path):
+    paths = [tmp_path / "a.wav", tmp_path / "b.wav", tmp_path / "missing.wav"]
+    for path in paths[:2]:
+        path.write_bytes(_wav())
+    lines = list(_client(service).analyze_files([str(path) for path in paths]))
+    assert sorted(line["file"] for line in lines) == sorted(str(path) for path in paths)
+    by_file = {line["file"]: line for line in lines}
+    assert not by_file[str(paths[2])]["ok"]
+    for path in paths[:2]:
+        assert by_file[str(path)]["ok"] is HAVE_ENGINE
+    assert _pending_jobs(service) == 0
+
+
+def test_vault_associations_round_trip(service):
+    client = _client(service)
+    assert client.associations("ana", "song.wav") == []
+    added = client.add_association("ana", "song.wav", 12.5, "the bridge", feeling_category="joy")
+    assert [(a["timestamp"], a["description"], a["feeling_category"]) for a in added] == [(12.5, "the bridge", "joy")]
+    assert client.associations("ana", "song.wav") == added
+    assert client.associations("ben", "song.wav") == []
+
+
+@pytest.mark.parametrize("record", [
+    {"file": "song.wav", "timestamp": "NaN", "description": "nan"},
+    {"file": "song.wav", "timestamp": -1, "description": "negative"},
+    {"file": "song.wav", "timestamp": 1, "description": "bad", "fingerprint": "not-a-fingerprint"},
+    {"file": "song.wav", "timestamp": 1, "description": "bad", "fingerprint": 42},
+    {"file": ["song.wav"], "timestamp": 1, "description": "not a string"},
+    {"file": "song.wav", "timestamp": 1},
+    ["not", "an", "object"],
+])
+def test_invalid_associations_are_rejected(service, record):
+    body = json.dumps(record).encode("utf-8")
+    status, payload = _post(service, "/vault?profile=ana", body,
+                            [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+    assert status == 400, payload
+    assert _client(service).associations("ana", "song.wav") == []
+    assert _client(service).status()["pool"]["workers"] == 1
+
+
+def test_a_negative_content_length_is_rejected(service):
+    status, _ = _post(service, "/analyze", None, [("Content-Length", "-1")])
+    assert status == 400
+
+
+def test_a_saturated_service_answers_429_with_retry_after(tmp_path):
+    service = AnalysisService(port=0, workers=1, warm_render=False, max_pending=1).start()
+    try:
+        # Keep the only worker busy so the admitted job holds the only slot
+        service.daemon._pool.submit(time.sleep, 3)
+        held, = service.submit("analyze", None, [{"op": "analyze", "file_path": str(tmp_path / "missing.wav")}])
+        body = _wav()
+        status, _ = _post(service, "/analyze", body, [("Content-Length", str(len(body)))])
+        assert status == 429
+        with pytest.raises(ServiceBusy) as busy:
+            _client(service).analyze(body)
+        assert busy.value.retry_after == 1
+        assert not held.result(timeout=60)["ok"]
+        assert _pending_jobs(service) == 0
+        assert service.status()["admission"]["rejected"] == 2
+    finally:
+        service.shutdown()
+
+
+def test_a_failed_batch_still_answers_and_frees_its_slots(service, monkeypatch, tmp_path):
+    def lost_worker(jobs, callback=None, error_callback=None):
+        error_callback(BrokenProcessPool("A child process terminated abruptly"))
+
+    monkeypatch.setattr(service.daemon, "submit_batch", lost_worker)
+    lines = list(_client(service).analyze_files([str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]))
+    assert [line["ok"] for line in lines] == [False, False]
+    assert all(line["error"].startswith("BrokenProcessPool") for line in lines)
+    assert _pending_jobs(service) == 0
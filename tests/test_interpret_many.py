@@ -0,0 +1,54 @@
+from aural_sentience.interpretation_cache import InterpretationCache
+from aural_sentience.resonance_lexicon import ResonanceLexicon
+
+
+def _report(n):
+    return {
+        "timestamp": f"2024-05-0{n + 1}T10:00:00",
+        "file_path": f"/music/track{n}.wav",
+        "resonance_analysis": {
+            "sacred_frequencies": {"528.0": {"prominence": 2.0 + n}, str(396.0 + n): {"prominence": 4.5}},
+            "emotional_patterns": {"deep_peace": {"confidence": 0.4 + n / 10},
+                                   "transcendent_joy": {"confidence": 0.7}}
+        },
+        "sacred_gaps": [{"timestamp": 12.5 * (n + 1)}, {"timestamp": 40.0 + n}],
+        "biometric_correlates": {"tempo": "may entrain the heart"},
+        "cultural_echoes": {"mode": "a contemplative mode"}
+    }
+
+
+REPORTS = [_report(n) for n in range(5)]
+
+
+def test_a_seed_reproduces_the_batch():
+    first = list(ResonanceLexicon().interpret_many(REPORTS, seed=11))
+    again = list(ResonanceLexicon().interpret_many(REPORTS, seed=11))
+    assert first == again
+    assert [interpretation["timestamp"] for interpretation in first] == [r["timestamp"] for r in REPORTS]
+    other = list(ResonanceLexicon().interpret_many(REPORTS, seed=12))
+    assert other != first
+    assert [i["analysis_digest"] for i in other] == [i["analysis_digest"] for i in first]
+
+
+def test_wording_does_not_depend_on_batch_order_or_size():
+    lexicon = ResonanceLexicon()
+    forward = list(lexicon.interpret_many(REPORTS, seed=11))
+    backward = list(lexicon.interpret_many(reversed(REPORTS), seed=11))
+    assert backward[::-1] == forward
+    alone = [next(lexicon.interpret_many([report], seed=11)) for report in REPORTS]
+    assert alone == forward
+
+
+def test_fields_the_lexicon_does_not_read_leave_the_wording_alone():
+    lexicon = ResonanceLexicon()
+    moved = dict(REPORTS[0], file_path="/elsewhere/renamed.wav", personal_vault={"associations": [1]})
+    assert next(lexicon.interpret_many([moved], seed=3)) == next(lexicon.interpret_many([REPORTS[0]], seed=3))
+
+
+def test_cached_interpretations_match_fresh_ones(tmp_path):
+    lexicon = ResonanceLexicon()
+    with InterpretationCache(str(tmp_path / "cache.db")) as cache:
+        cached = list(lexicon.interpret_many(REPORTS, seed=11, cache=cache))
+        assert list(lexicon.interpret_many(REPORTS[::-1], seed=11, cache=cache))[::-1] == cached
+        assert (cache.misses, cache.hits) == (5, 5)
+    assert cached == list(lexicon.interpret_many(REPORTS, seed=11))
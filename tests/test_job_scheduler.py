@@ -0,0 +1,28 @@
+import os
+import threading
+
+from aural_sentience.job_scheduler import CostModel
+
+
+def test_concurrent_saves_of_a_shared_model_leave_a_valid_file(tmp_path):
+    path = str(tmp_path / "cost_model.json")
+    probe = {"duration": 30.0, "sample_rate": 22050, "channels": 1}
+    errors = []
+
+    def calibrate(seconds):
+        model = CostModel(path)
+        try:
+            for _ in range(20):
+                model.observe(probe, seconds)
+                model.save()
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=calibrate, args=(seconds,)) for seconds in (2.0, 3.0, 4.0)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert os.listdir(tmp_path) == ["cost_model.json"]
+    assert len(CostModel(path).observations) == 20
@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from aural_sentience.lexicon_search import LexiconSearchIndex
+
+
+def _index():
+    lexicon = SimpleNamespace(
+        lexicon={
+            "zeta": {"a": {"meaning": "river light", "imagery": ["stone bridge", "open sky"]},
+                     "b": {"meaning": "river mist", "imagery": ["pine forest"]}},
+            "alpha": {"c": {"meaning": "river dawn", "imagery": ["stone wall"]}}
+        },
+        cultural_patterns={},
+        poetic_templates={}
+    )
+    index = LexiconSearchIndex()
+    index.refresh(lexicon)
+    return index
+
+
+def test_clauses_on_different_fields_match_within_an_entry():
+    hits = _index().search("meaning:river imagery:stone")
+    assert [hit["path"] for hit in hits] == [
+        "lexicon/zeta/a/meaning", "lexicon/zeta/a/imagery/0",
+        "lexicon/alpha/c/meaning", "lexicon/alpha/c/imagery/0"
+    ]
+    assert _index().search("meaning:river imagery:forest meaning:light") == []
+
+
+def test_hits_come_in_lexicon_order():
+    hits = _index().search("river")
+    assert [hit["path"] for hit in hits] == ["lexicon/zeta/a/meaning", "lexicon/zeta/b/meaning",
+                                             "lexicon/alpha/c/meaning"]
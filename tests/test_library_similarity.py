@@ -0,0 +1,34 @@
+import numpy as np
+
+from aural_sentience.library_similarity import FEATURE_DIMENSIONS, SimilarityMatrix, compare_library
+
+
+def _report(file_path, pitch_class):
+    chroma = [0.0] * 12
+    chroma[pitch_class] = 1.0
+    return {"aural_sentience_master_report": {"file_path": file_path},
+            "technical_analysis": {"feature_summary": {"chroma_profile": chroma}}}
+
+
+def test_watched_batches_accumulate_in_the_saved_matrix(tmp_path):
+    path = str(tmp_path / "similarity_matrix.npz")
+    compare_library([_report("/music/a.wav", 0), _report("/music/b.wav", 4)], path=path, retain=False)
+    summary = compare_library([_report("/music/c.wav", 7)], path=path, retain=False)
+    assert summary["tracks"] == 3
+    assert summary["updated_tracks"] == 1
+
+    summary = compare_library([_report("/music/c.wav", 7), _report("/music/a.wav", 0)], path=path)
+    assert summary["tracks"] == 2
+
+
+def test_growing_a_loaded_matrix_does_not_double_it(tmp_path):
+    path = str(tmp_path / "similarity_matrix.npz")
+    rng = np.random.default_rng(0)
+    similarity = SimilarityMatrix()
+    similarity.add_many((f"track{i}", rng.random(FEATURE_DIMENSIONS, dtype=np.float32)) for i in range(400))
+    similarity.save(path)
+
+    loaded = SimilarityMatrix.load(path)
+    loaded.add("new", rng.random(FEATURE_DIMENSIONS, dtype=np.float32))
+    assert 401 <= loaded._matrix.shape[0] <= 500
+    np.testing.assert_allclose(loaded.matrix[:400, :400], similarity.matrix)
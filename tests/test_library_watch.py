@@ -0,0 +1,46 @@
+import threading
+
+from aural_sentience.library_watch import LibraryWatcher
+
+
+def _ready(watcher):
+    """Poll until the pending files settle"""
+    for _ in range(5):
+        ready = watcher.poll()
+        if ready:
+            return ready
+    return []
+
+
+def test_uncommitted_files_are_queued_again_after_a_restart(tmp_path):
+    (tmp_path / "a.wav").write_bytes(b"one")
+    index_path = str(tmp_path / "index.json")
+    first = LibraryWatcher(str(tmp_path), index_path=index_path, settle_seconds=0, use_watchdog=False)
+    assert _ready(first) == [str(tmp_path / "a.wav")]
+    # The process dies before the batch is handled
+
+    second = LibraryWatcher(str(tmp_path), index_path=index_path, settle_seconds=0, use_watchdog=False)
+    ready = _ready(second)
+    assert ready == [str(tmp_path / "a.wav")]
+    second.commit(ready)
+
+    third = LibraryWatcher(str(tmp_path), index_path=index_path, settle_seconds=0, use_watchdog=False)
+    assert _ready(third) == []
+
+
+def test_run_survives_a_failing_handler(tmp_path):
+    (tmp_path / "a.wav").write_bytes(b"one")
+    watcher = LibraryWatcher(str(tmp_path), index_path=str(tmp_path / "index.json"), settle_seconds=0,
+                             full_scan_interval=0, use_watchdog=False)
+    stop = threading.Event()
+    batches = []
+
+    def handler(paths):
+        batches.append(paths)
+        if len(batches) == 1:
+            raise RuntimeError("analysis failed")
+        stop.set()
+
+    watcher.run(handler, poll_interval=0, stop_event=stop)
+    assert batches == [[str(tmp_path / "a.wav")], [str(tmp_path / "a.wav")]]
+    assert str(tmp_path / "a.wav") in watcher.index.files
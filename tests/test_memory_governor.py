@@ -0,0 +1,113 @@
+import threading
+import wave
+
+import pytest
+
+from aural_sentience import memory_governor
+from aural_sentience.memory_governor import (FALLBACK_BYTES_PER_SECOND, MemoryGovernor, MemoryProfile,
+                                             end_job_measurement, probe_audio)
+
+MIB = 1 << 20
+
+
+@pytest.fixture(autouse=True)
+def plenty_of_memory(monkeypatch):
+    # Admission also checks what the machine has free; keep it out of the way
+    monkeypatch.setattr(memory_governor, "available_memory", lambda: None)
+
+
+def _probe(duration, sample_rate=44100, channels=2):
+    return {"duration": duration, "sample_rate": sample_rate, "channels": channels, "estimated": False}
+
+
+def test_the_estimate_follows_the_profile_and_the_correction():
+    profile = MemoryProfile(sample_rate=10, bytes_per_sample=4, analysis_multiplier=2.0,
+                            render_multiplier=1.0, parent_copies=1.0)
+    governor = MemoryGovernor(budget_bytes=MIB, profile=profile)
+    # decode 100 s * 20 Hz * 2 ch * 4 B, signal 100 s * 10 Hz * 4 B once plus three times in workers
+    assert governor.estimate(_probe(100, 20, 2)) == 16000 + 4000 + 12000
+    governor.correction = 1.5
+    assert governor.estimate(_probe(100, 20, 2)) == 48000
+    assert governor.estimate(_probe(200, 20, 2)) == 2 * 48000
+
+
+def test_jobs_are_admitted_while_they_fit_the_budget():
+    governor = MemoryGovernor(budget_bytes=10 * MIB)
+    assert governor.acquire("a", 6 * MIB)
+    assert governor.acquire("b", 4 * MIB)
+
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: governor.acquire("c", 3 * MIB) and admitted.set())
+    waiter.start()
+    assert not admitted.wait(0.1)
+    governor.release("a")
+    assert admitted.wait(5)
+    waiter.join()
+    assert governor.summary()["peak_concurrency"] == 2
+    assert governor.summary()["peak_reserved_bytes"] == 10 * MIB
+
+
+def test_a_job_larger_than_the_budget_runs_alone():
+    governor = MemoryGovernor(budget_bytes=MIB)
+    assert governor.acquire("huge", 5 * MIB)
+    admitted = threading.Event()
+    waiter = threading.Thread(target=lambda: governor.acquire("small", 1) and admitted.set())
+    waiter.start()
+    assert not admitted.wait(0.1)
+    governor.release("huge")
+    assert admitted.wait(5)
+    waiter.join()
+
+
+def test_max_concurrent_caps_admission_and_close_wakes_waiters():
+    governor = MemoryGovernor(budget_bytes=100 * MIB, max_concurrent=1)
+    assert governor.acquire("a", 1)
+    outcome = []
+    waiter = threading.Thread(target=lambda: outcome.append(governor.acquire("b", 1)))
+    waiter.start()
+    waiter.join(0.1)
+    assert outcome == []
+    governor.close()
+    waiter.join(5)
+    assert outcome == [False]
+
+
+def test_measured_peaks_correct_later_estimates():
+    governor = MemoryGovernor(budget_bytes=MIB, smoothing=0.5)
+    probe = _probe(60)
+    expected = governor._worker_bytes(probe)
+    governor.record("a", probe, [{"pid": 1, "job_bytes": int(expected * 2), "lifetime_peak_rss": 5 * MIB}, None])
+    assert governor.correction == pytest.approx(1.5)
+    # Outliers are clamped to ten times the expectation
+    governor.record("b", probe, [{"pid": 2, "job_bytes": int(expected * 1000), "lifetime_peak_rss": None}])
+    assert governor.correction == pytest.approx(5.75)
+    # Jobs without a measurement leave the correction alone
+    governor.record("c", probe, [{"pid": 1, "job_bytes": None, "lifetime_peak_rss": 7 * MIB}])
+    assert governor.correction == pytest.approx(5.75)
+    summary = governor.summary()
+    assert summary["worker_peak_rss_bytes"] == {"1": 7 * MIB, "2": 0}
+    assert [job["measured_worker_bytes"] for job in summary["jobs"]] == [int(expected * 2), int(expected * 1000), None]
+
+
+def test_probe_reads_wav_headers_and_guesses_the_rest(tmp_path):
+    path = tmp_path / "tone.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b"\0\0" * 2 * 4000)
+    probe = probe_audio(str(path))
+    assert (probe["duration"], probe["sample_rate"], probe["channels"], probe["estimated"]) == (0.5, 8000, 2, False)
+
+    garbage = tmp_path / "garbage.mp3"
+    garbage.write_bytes(b"\1" * FALLBACK_BYTES_PER_SECOND * 3)
+    probe = probe_audio(str(garbage))
+    assert probe["estimated"] and probe["duration"] == 3
+
+
+def test_without_getrusage_the_peak_is_unknown(monkeypatch):
+    monkeypatch.setattr(memory_governor, "resource", None)
+    start = {"rss_before": 10 * MIB, "isolated": False, "lifetime_peak_before": None}
+    measurement = end_job_measurement(start)
+    assert measurement["lifetime_peak_rss"] is None
+    assert measurement["peak_rss"] is None and measurement["job_bytes"] is None
@@ -0,0 +1,96 @@
+import json
+import time
+
+import pytest
+
+from aural_sentience.aural_sentience_toolkit import PersonalVault
+
+
+def test_the_interval_flusher_survives_a_failed_flush(tmp_path, monkeypatch):
+    path = tmp_path / "vault.json"
+    vault = PersonalVault(str(path), flush_size=100, flush_interval=0.05)
+    try:
+        original = PersonalVault.save_vault
+        failures = []
+
+        def flaky_save(self):
+            if not failures:
+                failures.append(True)
+                raise ValueError("not JSON serializable")
+            original(self)
+
+        monkeypatch.setattr(PersonalVault, "save_vault", flaky_save)
+        vault.add_association("song.wav", 1.0, "first light")
+        for _ in range(100):
+            if path.exists():
+                break
+            time.sleep(0.02)
+        assert failures
+        assert json.loads(path.read_text())["song.wav"][0]["description"] == "first light"
+    finally:
+        vault.close()
+
+
+def _records():
+    return [
+        {"file": "a.wav", "timestamp": 1.5, "description": "rain on glass", "feeling_category": "calm"},
+        {"file": "b.wav", "timestamp": 0.0, "description": "first chord"},
+        {"file": "a.wav", "timestamp": 12.0, "description": "the drop"},
+    ]
+
+
+@pytest.mark.parametrize("format", ["jsonl", "csv"])
+def test_export_then_import_round_trips(tmp_path, format):
+    source = PersonalVault(str(tmp_path / "source.json"))
+    source.add_associations(_records())
+    dump = tmp_path / f"dump.{format}"
+    assert source.export_associations(str(dump)) == 3
+
+    target = PersonalVault(str(tmp_path / "target.json"))
+    assert target.import_associations(str(dump)) == {"imported": 3, "skipped": 0, "errors": []}
+    assert list(target.iter_records()) == list(source.iter_records())
+    assert [a["description"] for a in target.get_associations("a.wav")] == ["rain on glass", "the drop"]
+    assert PersonalVault(str(tmp_path / "target.json")).associations == target.associations
+
+
+def test_import_can_skip_invalid_records(tmp_path):
+    dump = tmp_path / "dump.jsonl"
+    dump.write_text("\n".join(json.dumps(record) for record in
+                              [_records()[0], {"file": "c.wav", "timestamp": -1, "description": "x"}]))
+    vault = PersonalVault(str(tmp_path / "vault.json"))
+    report = vault.import_associations(str(dump), skip_invalid=True)
+    assert report["imported"] == 1 and report["skipped"] == 1
+    assert "negative timestamp" in report["errors"][0]
+
+
+def test_a_failed_batch_is_rolled_back(tmp_path):
+    path = tmp_path / "vault.json"
+    vault = PersonalVault(str(path))
+    vault.add_association("a.wav", 1.0, "kept")
+    with pytest.raises(RuntimeError):
+        with vault.batch():
+            vault.add_association("a.wav", 2.0, "discarded")
+            vault.add_association("b.wav", 3.0, "discarded")
+            raise RuntimeError("abort")
+    assert [a["description"] for a in vault.get_associations("a.wav")] == ["kept"]
+    assert vault.get_associations("b.wav") == []
+    assert list(json.loads(path.read_text())) == ["a.wav"]
+
+
+@pytest.mark.parametrize("bad", [
+    {"file": "c.wav", "timestamp": -1.0, "description": "negative"},
+    {"file": "c.wav", "timestamp": float("nan"), "description": "nan"},
+    {"file": "c.wav", "timestamp": float("inf"), "description": "inf"},
+    {"file": "c.wav", "timestamp": "soon", "description": "not a number"},
+    {"file": "c.wav", "timestamp": 1.0},
+    "not a record",
+])
+def test_one_bad_record_leaves_the_vault_untouched(tmp_path, bad):
+    path = tmp_path / "vault.json"
+    vault = PersonalVault(str(path))
+    vault.add_association("a.wav", 1.0, "kept")
+    before = path.read_text()
+    with pytest.raises(ValueError, match="Record 4"):
+        vault.add_associations(_records() + [bad])
+    assert [a["description"] for a in vault.get_associations("a.wav")] == ["kept"]
+    assert path.read_text() == before
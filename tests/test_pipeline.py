@@ -0,0 +1,13 @@
+import pytest
+
+from aural_sentience.aural_sentience_master import AuralSentienceMaster
+from aural_sentience.job_scheduler import CostModel
+
+
+def test_unexpected_decoder_error_ends_the_batch(tmp_path):
+    master = AuralSentienceMaster(output_dir=str(tmp_path / "session"),
+                                  cost_model=CostModel(), manifest=False)
+    # A probe without its fields makes the governor's estimate raise KeyError,
+    # which no stage handles
+    with pytest.raises(KeyError):
+        master._run_pipeline(["a.wav"], workers=1, probes={"a.wav": {"broken": True}})
@@ -0,0 +1,91 @@
+import io
+import json
+
+import pytest
+
+from aural_sentience import progress
+from aural_sentience.progress import ProgressReporter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(progress.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _events(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_a_batch_is_reported_as_json_lines(tmp_path, clock):
+    path = tmp_path / "progress.jsonl"
+    depths = {"decode": 3}
+    with ProgressReporter(str(path), interval=1.0) as reporter:
+        reporter.start({"a.wav": 60.0, "b.wav": 120.0, "c.wav": 30.0}, workers=2, predicted_seconds=10.0,
+                       queue_depths=lambda: dict(depths))
+        clock[0] += 1.0
+        reporter.tick(force=True)
+
+        clock[0] += 1.0
+        reporter.stage_done("decode", 0.5)
+        reporter.stage_done("analyze", 2.0)
+        reporter.file_done("a.wav")
+        clock[0] += 0.5
+        depths["decode"] = 1
+        reporter.tick()
+
+        clock[0] += 1.5
+        reporter.file_done("b.wav", status="failed", stage="decode")
+        clock[0] += 2.0
+        reporter.file_done("c.wav", status="timed_out", stage="analyze")
+        summary = reporter.finish()
+
+    events = _events(path)
+    assert [event["event"] for event in events] == [
+        "batch_started", "progress", "file_done", "progress", "file_done", "progress", "file_done", "progress",
+        "batch_finished"
+    ]
+    assert all(isinstance(event["time"], float) for event in events)
+    started, before_any, _, after_a = events[:4]
+    assert started == dict(started, files=3, audio_seconds=210.0, workers=2, predicted_seconds=10.0)
+    # The scheduler's estimate until a file is done, then the measured rate
+    assert before_any["eta_seconds"] == pytest.approx(9.0)
+    assert after_a["real_time_factor"] == pytest.approx(30.0)
+    assert after_a["eta_seconds"] == pytest.approx(150.0 / 30.0)
+    assert after_a["worker_utilization"] == pytest.approx(0.5)
+    assert after_a["queue_depths"] == {"decode": 3}
+    assert events[4] == dict(events[4], file_path="b.wav", status="failed", stage="decode")
+
+    assert events[-1]["event"] == "batch_finished"
+    assert summary == {key: value for key, value in events[-1].items() if key not in ("event", "time")}
+    assert (summary["files_done"], summary["files_failed"], summary["files_timed_out"]) == (1, 1, 1)
+    assert summary["files_remaining"] == 0
+    assert summary["real_time_factor"] == pytest.approx(60.0 / 6.0)
+    assert summary["stages"]["analyze"] == {"count": 1, "seconds": 2.0, "mean_seconds": 2.0}
+    assert summary["peak_queue_depths"] == {"decode": 3}
+    assert "eta_seconds" not in summary and "queue_depths" not in summary
+
+
+def test_progress_events_are_rate_limited(clock):
+    stream = io.StringIO()
+    reporter = ProgressReporter(stream, interval=1.0)
+    reporter.start({"a.wav": 1.0, "b.wav": 1.0})
+    for _ in range(5):
+        clock[0] += 0.3
+        reporter.tick()
+    assert [json.loads(line)["event"] for line in stream.getvalue().splitlines()] == [
+        "batch_started", "progress", "progress"
+    ]
+
+
+def test_without_a_destination_only_the_summary_is_kept(clock):
+    reporter = ProgressReporter()
+    assert reporter.finish() == {}
+    reporter.start({"a.wav": 10.0})
+    clock[0] += 2.0
+    reporter.file_done("a.wav")
+    assert reporter.finish()["real_time_factor"] == pytest.approx(5.0)
+    # Events after the batch are ignored
+    reporter.file_done("a.wav")
+    assert reporter.files_done == 1
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from aural_sentience import resonance_index
+from aural_sentience.library_similarity import PITCH_CLASSES, SACRED_FREQUENCIES, feature_vector
+from aural_sentience.resonance_index import ResonanceIndex
+
+
+def _analysis(rng):
+    detected = rng.choice(SACRED_FREQUENCIES, size=int(rng.integers(0, 4)), replace=False)
+    return {
+        "duration": float(rng.uniform(30, 600)),
+        "resonance_analysis": {"sacred_frequencies": {str(int(f)): {"prominence": float(rng.uniform(0.5, 8))}
+                                                      for f in detected}},
+        "feature_summary": {"chroma_profile": rng.random(12).tolist(), "tempo": float(rng.uniform(60, 180)),
+                            "brightness": float(rng.uniform(500, 5000)), "gap_density": float(rng.random())}
+    }
+
+
+@pytest.fixture
+def catalog():
+    rng = np.random.default_rng(3)
+    return {f"track{i}.wav": _analysis(rng) for i in range(300)}
+
+
+def _brute_force(catalog, vector, k, keep=lambda name, analysis: True):
+    scored = sorted(((float(feature_vector(analysis) @ vector), name) for name, analysis in catalog.items()
+                     if keep(name, analysis)), reverse=True)
+    return [name for _, name in scored[:k]]
+
+
+def _tracks(results):
+    return [result["track"] for result in results]
+
+
+@pytest.mark.parametrize("use_tree", [False, True])
+def test_queries_return_the_most_similar_tracks(catalog, monkeypatch, use_tree):
+    if use_tree:
+        monkeypatch.setattr(resonance_index, "SCAN_LIMIT", 0)
+    index = ResonanceIndex(min_rebuild=50)
+    index.add_many(catalog.items())
+    assert index.stats()["indexed_in_tree"] == 300
+
+    target = feature_vector(catalog["track7.wav"])
+    results = index.query("track7.wav", k=5)
+    assert _tracks(results) == _brute_force(catalog, target, 5, lambda name, _: name != "track7.wav")
+    assert results == sorted(results, key=lambda result: -result["similarity"])
+    assert _tracks(index.query(catalog["track7.wav"], k=1)) == ["track7.wav"]
+
+    tempo_range = (90.0, 120.0)
+    filtered = index.query(target, k=8, tempo=tempo_range, sacred=[528])
+    expected = _brute_force(catalog, target, 8, lambda _, analysis: (
+        tempo_range[0] <= analysis["feature_summary"]["tempo"] <= tempo_range[1] and
+        "528" in analysis["resonance_analysis"]["sacred_frequencies"]))
+    assert _tracks(filtered) == expected
+
+    in_a = index.query(target, k=300, pitch_class="A", duration=(100.0, 400.0))
+    assert in_a and all(
+        np.argmax(catalog[name]["feature_summary"]["chroma_profile"]) == PITCH_CLASSES.index("A") and
+        100.0 <= catalog[name]["duration"] <= 400.0 for name in _tracks(in_a))
+
+
+def test_unknown_targets_and_filters_are_rejected(catalog):
+    index = ResonanceIndex()
+    index.add_many(catalog.items())
+    with pytest.raises(KeyError):
+        index.query("missing.wav")
+    with pytest.raises(ValueError, match="pitch class"):
+        index.query("track1.wav", pitch_class="H")
+    with pytest.raises(ValueError, match="sacred frequency"):
+        index.query("track1.wav", sacred=[440])
+
+
+def test_replaced_and_removed_tracks_are_tombstoned_until_a_rebuild(catalog):
+    index = ResonanceIndex(min_rebuild=10_000)
+    index.add_many(catalog.items())
+    index.rebuild()
+    target = feature_vector(catalog["track0.wav"])
+
+    # The replacement is the exact target; the stale version must not come back
+    index.add("track1.wav", catalog["track0.wav"])
+    assert index.remove("track2.wav")
+    assert not index.remove("track2.wav")
+    assert index.stats() == {"tracks": 299, "indexed_in_tree": 298, "delta_buffer": 1, "tombstones": 2,
+                             "path": None}
+    results = _tracks(index.query(target, k=300))
+    assert results[:2] in (["track0.wav", "track1.wav"], ["track1.wav", "track0.wav"])
+    assert "track2.wav" not in results and len(results) == 299 == len(set(results))
+
+    index.rebuild()
+    assert index.stats() == {"tracks": 299, "indexed_in_tree": 299, "delta_buffer": 0, "tombstones": 0,
+                             "path": None}
+    assert _tracks(index.query(target, k=300)) == results
+
+
+def test_a_growing_delta_buffer_is_merged_into_the_tree(catalog):
+    index = ResonanceIndex(rebuild_fraction=0.1, min_rebuild=20)
+    items = list(catalog.items())
+    index.add_many(items[:200])
+    assert index.delta_size == 0
+    for name, analysis in items[200:220]:
+        index.add(name, analysis)
+    assert index.delta_size == 20
+    index.add(*items[220])
+    assert index.delta_size == 0 and index.stats()["indexed_in_tree"] == 221
+
+
+def test_a_saved_index_loads_without_its_tombstones(catalog, tmp_path):
+    path = str(tmp_path / "index" / "resonance_index.npz")
+    index = ResonanceIndex(path)
+    index.add_many(catalog.items())
+    index.remove("track3.wav")
+    index.save()
+
+    loaded = ResonanceIndex(path)
+    assert len(loaded) == 299 and "track3.wav" not in loaded
+    assert loaded.stats()["tombstones"] == 0
+    assert loaded.query("track4.wav", k=10) == index.query("track4.wav", k=10)
@@ -0,0 +1,86 @@
+import json
+
+from aural_sentience.resonance_lexicon import ResonanceLexicon
+
+
+def _keys(lexicon):
+    return sorted(lexicon.personal_mappings)
+
+
+def test_instances_sharing_a_path_keep_each_others_mappings(tmp_path):
+    path = str(tmp_path / "lexicon.json")
+    first = ResonanceLexicon()
+    for n in range(4):
+        first.add_personal_mapping(f"x{n}.wav", 1.0, "rain", "a soft rain")
+    first.save_lexicon(path)
+    first.compact_mappings(path)
+
+    # Never loaded the file: its sequence numbers must follow the snapshot's
+    second = ResonanceLexicon()
+    second.add_personal_mapping("y.wav", 2.0, "wind", "a low wind")
+    second.save_lexicon(path)
+
+    reloaded = ResonanceLexicon()
+    reloaded.load_lexicon(path)
+    assert _keys(reloaded) == ["x0.wav", "x1.wav", "x2.wav", "x3.wav", "y.wav"]
+
+
+def test_compaction_keeps_mappings_journaled_by_others(tmp_path):
+    path = str(tmp_path / "lexicon.json")
+    first, second = ResonanceLexicon(), ResonanceLexicon()
+    first.add_personal_mapping("a.wav", 1.0, "rain", "a soft rain")
+    first.save_lexicon(path)
+    second.add_personal_mapping("b.wav", 1.0, "wind", "a low wind")
+    second.save_lexicon(path)
+    first.compact_mappings(path)
+
+    reloaded = ResonanceLexicon()
+    reloaded.load_lexicon(path)
+    assert _keys(reloaded) == ["a.wav", "b.wav"]
+
+
+def test_save_to_new_path_writes_every_mapping(tmp_path):
+    lexicon = ResonanceLexicon()
+    lexicon.add_personal_mapping("a.wav", 1.0, "rain", "a soft rain")
+    lexicon.save_lexicon(str(tmp_path / "one.json"))
+    lexicon.add_personal_mapping("b.wav", 1.0, "wind", "a low wind")
+    lexicon.save_lexicon(str(tmp_path / "two.json"))
+
+    reloaded = ResonanceLexicon()
+    reloaded.load_lexicon(str(tmp_path / "two.json"))
+    assert _keys(reloaded) == ["a.wav", "b.wav"]
+
+
+def test_legacy_inline_mappings_survive_a_base_rewrite(tmp_path):
+    path = tmp_path / "lexicon.json"
+    ResonanceLexicon().save_lexicon(str(path))
+    legacy = json.loads(path.read_text())
+    legacy["personal_mappings"] = {"old.wav": [{"timestamp": 1.0, "description": "d",
+                                                "poetic_interpretation": "p"}]}
+    path.write_text(json.dumps(legacy))
+
+    lexicon = ResonanceLexicon()
+    lexicon.load_lexicon(str(path))
+    lexicon.save_lexicon(str(path))
+    assert "personal_mappings" not in json.loads(path.read_text())
+
+    reloaded = ResonanceLexicon()
+    reloaded.load_lexicon(str(path))
+    assert _keys(reloaded) == ["old.wav"]
+    assert len(reloaded.personal_mappings["old.wav"]) == 1
+
+
+def test_in_place_edits_reach_the_cache_after_mark_edited(tmp_path):
+    from aural_sentience.interpretation_cache import InterpretationCache
+
+    analysis = {"resonance_analysis": {"sacred_frequencies": {528: {"prominence": 3.0}}}}
+    lexicon = ResonanceLexicon().detach()
+    with InterpretationCache(str(tmp_path / "cache.db")) as cache:
+        before = lexicon.interpret_cached(analysis, cache, seed=1)
+        lexicon.lexicon["sacred_frequencies"][528]["essence"] = "Edited essence"
+        lexicon.mark_edited()
+        after = lexicon.interpret_cached(analysis, cache, seed=1)
+    assert lexicon.section_versions()["sacred_frequencies/528"] != ResonanceLexicon().section_versions()[
+        "sacred_frequencies/528"]
+    assert "Edited essence" in json.dumps(after)
+    assert "Edited essence" not in json.dumps(before)
@@ -0,0 +1,89 @@
+import os
+
+from aural_sentience import session_manifest
+from aural_sentience.aural_sentience_master import AuralSentienceMaster
+from aural_sentience.job_scheduler import CostModel
+from aural_sentience.session_manifest import JOURNAL_FILENAME, SessionManifest
+
+
+def _completed(manifest, tmp_path, file_path):
+    report = tmp_path / "session" / f"{os.path.basename(file_path)}.json"
+    report.write_text("{}")
+    manifest.record_complete(str(file_path), {"technical_analysis": str(report)})
+    return str(report)
+
+
+def test_unchanged_content_is_skipped_after_a_restart(tmp_path):
+    (tmp_path / "session").mkdir()
+    song = tmp_path / "song.wav"
+    song.write_bytes(b"one")
+    with SessionManifest(str(tmp_path / "session"), "v1", session_id="s1") as manifest:
+        report = _completed(manifest, tmp_path, song)
+
+    resumed = SessionManifest(str(tmp_path / "session"), "v1")
+    assert resumed.session_id == "s1"
+    assert resumed.is_complete(str(song), resumed.content_hash(str(song)))
+    assert resumed.completed_path_for(resumed.content_hash(str(song))) == str(song)
+
+    # Another analysis version, a missing output or new content all mean work to do
+    assert not SessionManifest(str(tmp_path / "session"), "v2").is_complete(str(song), resumed.content_hash(str(song)))
+    song.write_bytes(b"two")
+    assert not resumed.is_complete(str(song), resumed.content_hash(str(song)))
+    song.write_bytes(b"one")
+    assert resumed.is_complete(str(song), resumed.content_hash(str(song)))
+    os.remove(report)
+    assert not resumed.is_complete(str(song), resumed.content_hash(str(song)))
+
+
+def test_the_recorded_hash_is_reused_while_size_and_mtime_match(tmp_path, monkeypatch):
+    song = tmp_path / "song.wav"
+    song.write_bytes(b"one")
+    manifest = SessionManifest(str(tmp_path), "v1")
+    content_hash = manifest.content_hash(str(song))
+    manifest.record_complete(str(song), {}, content_hash=content_hash)
+
+    monkeypatch.setattr(session_manifest, "file_content_hash", lambda path: "rehashed")
+    assert manifest.content_hash(str(song)) == content_hash
+    os.utime(str(song), ns=(0, 0))
+    assert manifest.content_hash(str(song)) == "rehashed"
+
+
+def test_a_torn_journal_line_is_ignored(tmp_path):
+    song = tmp_path / "song.wav"
+    song.write_bytes(b"one")
+    manifest = SessionManifest(str(tmp_path), "v1")
+    manifest.record_failed(str(song), "decode", "boom")
+    with open(tmp_path / JOURNAL_FILENAME, "a") as f:
+        f.write('{"file_path": "other.wav", "ent')
+    resumed = SessionManifest(str(tmp_path), "v1")
+    assert list(resumed.entries) == [str(song)]
+    assert resumed.entries[str(song)]["status"] == "failed"
+
+
+def test_a_resumed_session_skips_finished_files_and_records_duplicates(tmp_path):
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    for name, content in (("a.wav", b"same"), ("b.wav", b"same"), ("c.wav", b"new"), ("d.wav", b"new")):
+        (inputs / name).write_bytes(content)
+    a, b, c, d = (str(inputs / name) for name in ("a.wav", "b.wav", "c.wav", "d.wav"))
+    output_dir = str(tmp_path / "session")
+
+    first = AuralSentienceMaster(output_dir=output_dir, cost_model=CostModel())
+    report = str(tmp_path / "a_report.json")
+    with open(report, "w") as f:
+        f.write("{}")
+    first.manifest.record_complete(a, {"technical_analysis": report})
+    first.manifest.compact()
+
+    resumed = AuralSentienceMaster(output_dir=output_dir, cost_model=CostModel())
+    assert resumed.session_id == first.session_id
+    to_process, reused = resumed._plan_session([a, b, c, d])
+    assert reused == [a]
+    # Identical inputs within the batch are processed once as well
+    assert to_process == [c]
+    assert sorted(resumed.manifest.duplicates()) == [(b, a), (d, c)]
+
+    again = SessionManifest(output_dir, resumed.analysis_version)
+    assert again.is_complete(b, again.content_hash(b))
+    assert again.output_paths(b) == {"technical_analysis": report}
+    assert not again.is_complete(d, again.content_hash(d))
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from aural_sentience.aural_sentience_toolkit import VaultManager
+
+
+def test_an_evicted_vault_keeps_saving_for_its_holders(tmp_path):
+    manager = VaultManager(str(tmp_path), max_open=1, flush_size=10)
+    held = manager.get_vault("alice")
+    manager.get_vault("bob")
+    assert manager.stats()["evictions"] == 1
+
+    held.add_association("song.wav", 1.0, "late summer")
+    assert manager.get_vault("alice").get_associations("song.wav")[0]["description"] == "late summer"
+
+
+def test_user_ids_are_normalized(tmp_path):
+    manager = VaultManager(str(tmp_path))
+    assert manager.get_vault(" Alice ") is manager.get_vault("alice")
+    assert manager.vault_path("ALICE") == manager.vault_path("alice")
+    with pytest.raises(ValueError):
+        manager.get_vault("   ")
+
+
+def test_vaults_saved_under_an_unnormalized_id_are_kept(tmp_path):
+    manager = VaultManager(str(tmp_path))
+    legacy_path = Path(manager._shard_path("Alice"))
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_text('{"song.wav": [{"timestamp": 1.0, "description": "rain"}]}')
+
+    assert manager.get_vault("Alice").get_associations("song.wav")[0]["description"] == "rain"
+    assert manager.get_vault("alice").get_associations("song.wav")[0]["description"] == "rain"
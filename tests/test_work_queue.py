@@ -0,0 +1,100 @@
+import json
+import socket
+import time
+
+import pytest
+
+from aural_sentience.aural_sentience_master import AuralSentienceMaster
+from aural_sentience.job_scheduler import CostModel
+from aural_sentience.work_queue import QUEUE_FILENAME, WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with WorkQueue(str(tmp_path / QUEUE_FILENAME), lease_seconds=0.05, max_attempts=2) as queue:
+        queue.enqueue([("a.wav", 0, None)])
+        yield queue
+
+
+def _job(queue):
+    with queue._lock:
+        return dict(queue._connection.execute("SELECT * FROM jobs WHERE file_path = 'a.wav'").fetchone())
+
+
+def test_an_expired_lease_is_reclaimed_until_max_attempts(queue):
+    first = queue.claim("host:1")
+    assert first["attempts"] == 1
+    time.sleep(0.1)
+    second = queue.claim("host:2")
+    assert second["id"] == first["id"] and second["attempts"] == 2
+    assert second["lease_token"] != first["lease_token"]
+
+    time.sleep(0.1)
+    assert queue.claim("host:3") is None
+    job = _job(queue)
+    assert (job["status"], job["stage"], job["error"]) == ("failed", "lease", "lease expired 2 time(s)")
+    assert queue.outstanding() == 0
+
+
+def test_a_lost_lease_cannot_report(queue):
+    lost = queue.claim("host:1")
+    time.sleep(0.1)
+    winner = queue.claim("host:2")
+    assert not queue.heartbeat(lost)
+    assert not queue.complete(lost, "/tmp/lost.json")
+    assert not queue.fail(lost, "analyze", "too late")
+    assert queue.heartbeat(winner)
+    assert queue.complete(winner, "/tmp/winner.json")
+    job = _job(queue)
+    assert (job["status"], job["worker"], job["result_path"]) == ("done", "host:2", "/tmp/winner.json")
+
+
+def test_release_hands_the_job_back_without_using_an_attempt(tmp_path):
+    with WorkQueue(str(tmp_path / QUEUE_FILENAME)) as queue:
+        queue.enqueue([("a.wav", 0, None)])
+        job = queue.claim("host:1")
+        assert _job(queue)["attempts"] == 1
+        assert queue.release(job)
+        assert not queue.release(job)
+        released = _job(queue)
+        assert (released["status"], released["attempts"], released["worker"]) == ("pending", 0, None)
+        assert queue.claim("host:2")["attempts"] == 1
+
+
+def test_settings_are_shared_through_the_queue(tmp_path):
+    path = str(tmp_path / QUEUE_FILENAME)
+    with WorkQueue(path, lease_seconds=12.0, max_attempts=5):
+        with WorkQueue(path) as worker_view:
+            assert (worker_view.lease_seconds, worker_view.max_attempts) == (12.0, 5)
+
+
+def test_a_coordinator_and_two_workers_drain_the_queue(tmp_path, monkeypatch):
+    monkeypatch.setenv("AURAL_SENTIENCE_COST_MODEL", str(tmp_path / "cost_model.json"))
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    file_paths = []
+    for index in range(4):
+        path = inputs / f"f{index}.wav"
+        path.write_bytes(b"RIFF" + bytes([index]) * 64)
+        file_paths.append(str(path))
+
+    output_dir = tmp_path / "session"
+    master = AuralSentienceMaster(output_dir=str(output_dir), cost_model=CostModel())
+    master.coordinate(file_paths, local_workers=2, poll_interval=0.05, worker_options={"poll_interval": 0.05})
+
+    with WorkQueue(str(output_dir / QUEUE_FILENAME)) as queue:
+        counts = queue.counts()
+        assert queue.get_meta("state") == "finished"
+        assert queue.unmerged() == []
+        with queue._lock:
+            workers = {row[0] for row in queue._connection.execute("SELECT worker FROM jobs")}
+    assert counts["pending"] == counts["leased"] == 0
+    assert counts["done"] + counts["failed"] + counts["timed_out"] == len(file_paths)
+    assert workers <= {f"{socket.gethostname()}:local-0", f"{socket.gethostname()}:local-1"}
+    assert master.schedule_summary["mode"] == "work_queue"
+
+    summary = json.loads((output_dir / "session_summary.json").read_text())
+    assert summary["session_id"] == master.session_id
+    failed = {failure["file_path"] for failure in master.failures}
+    assert len(failed) == counts["failed"] + counts["timed_out"]
+    assert failed <= set(file_paths)
@@ -0,0 +1,67 @@
+import socket
+
+import pytest
+
+from aural_sentience.worker_daemon import WorkerDaemon, _claim_socket_path
+
+
+def test_a_stale_socket_is_replaced_and_a_live_one_kept(tmp_path):
+    path = str(tmp_path / "daemon.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    _claim_socket_path(path)
+    assert not (tmp_path / "daemon.sock").exists()
+
+    live = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    live.bind(path)
+    live.listen()
+    try:
+        with pytest.raises(FileExistsError):
+            _claim_socket_path(path)
+    finally:
+        live.close()
+    assert (tmp_path / "daemon.sock").exists()
+
+
+def test_a_path_that_is_not_a_socket_is_left_alone(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        _claim_socket_path(str(path))
+    assert path.read_text() == "keep me"
+
+
+def test_status_forgets_workers_that_exited(tmp_path):
+    with WorkerDaemon(str(tmp_path / "daemon.sock"), workers=1, warm_render=False) as daemon:
+        daemon._account(2 ** 22 + 1)
+        daemon.status()
+        assert 2 ** 22 + 1 not in daemon._worker_status
+
+
+def test_a_batch_whose_worker_dies_fails_instead_of_hanging(tmp_path):
+    import os
+    import threading
+    from concurrent.futures.process import BrokenProcessPool
+
+    with WorkerDaemon(str(tmp_path / "daemon.sock"), workers=1, warm_render=False) as daemon:
+        # The job takes its worker down like the OOM killer would
+        lost = daemon._pool.submit(os._exit, 1)
+        with pytest.raises(BrokenProcessPool):
+            lost.result(timeout=60)
+
+        # The rebuilt pool still serves batches, and one of the callbacks fires
+        settled = threading.Event()
+        outcomes = []
+        daemon.submit_batch([{"op": "analyze", "file_path": str(tmp_path / "missing.wav")}],
+                            callback=lambda result: (outcomes.extend(result), settled.set()),
+                            error_callback=lambda error: settled.set())
+        assert settled.wait(60)
+        assert len(outcomes) == 1 and not outcomes[0]["ok"]
+
+
+def test_analyze_requests_get_an_answer(tmp_path):
+    with WorkerDaemon(str(tmp_path / "daemon.sock"), workers=1, warm_render=False, job_timeout=30) as daemon:
+        response = daemon.handle({"op": "analyze", "file_path": str(tmp_path / "missing.wav")})
+    assert response["ok"] is False
+    assert daemon.status()["jobs_failed"] == 1